@@ -4,7 +4,9 @@ module.exports = {
   testEnvironment: "jsdom",
   setupFilesAfterEnv: ["<rootDir>/src/__tests__/setup.ts"],
   roots: ["<rootDir>/src"],
-  testPathIgnorePatterns: ["/node_modules/"],
+  // Performance suites are slow and timing-sensitive: they only run through
+  // jest.performance.config.js (npm run test:performance, scripts/bench-*.py)
+  testPathIgnorePatterns: ["/node_modules/", "<rootDir>/src/__tests__/performance/"],
   watchPathIgnorePatterns: ["/node_modules/", "<rootDir>/.claude/"],
   transform: {
     "^.+\\.[tj]s$": "esbuild-jest",
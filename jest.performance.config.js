@@ -0,0 +1,9 @@
+/** @type {import('ts-jest/dist/types').InitialOptionsTsJest} */
+const base = require("./jest.config.js");
+
+// The performance suites that the default config leaves out, and nothing else
+module.exports = {
+  ...base,
+  testPathIgnorePatterns: ["/node_modules/"],
+  testMatch: ["<rootDir>/src/__tests__/performance/**/*.test.(ts|js)"],
+};
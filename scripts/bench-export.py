@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+═══════════════════════════════════════════════════════════════════════════════
+  Projects Plus Export Benchmark
+
+  Generates a vault with generate-test-files.py and times exportRecords
+  (src/lib/export/exportService.ts) for CSV, TSV, JSON and Markdown on
+  growing row counts and widths under Jest
+  (src/__tests__/performance/export.test.ts). The full-size exports are then
+  streamed through `generate-test-files.py verify-export` and checked
+  against the generation manifest. Prints time, peak heap and output size
+  per format and the verifier's result and memory.
+
+  Usage:
+    python bench-export.py [--size 200000] [options]
+
+  Examples:
+    python bench-export.py --size 20000
+    python bench-export.py --preset wide-schema-300-fields
+    python bench-export.py --size 200000 --formats csv json --out export.json
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import bench_common
+from bench_common import GENERATOR, ROOT
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CONFIGURATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+SUITE = "src/__tests__/performance/export.test.ts"
+
+FORMATS = ["csv", "tsv", "json", "markdown"]
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ARGUMENT PARSING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+parser = argparse.ArgumentParser(
+    prog="bench-export",
+    description="Export throughput benchmark with streamed verification of the output.",
+    formatter_class=argparse.RawDescriptionHelpFormatter,
+)
+parser.add_argument(
+    "--size",
+    type=int,
+    default=200_000,
+    help="Vault size (default: 200000)",
+)
+parser.add_argument(
+    "--workdir",
+    default=str(ROOT / ".bench"),
+    help="Where generated vaults and exports are cached (default: .bench/)",
+)
+parser.add_argument(
+    "--seed",
+    type=int,
+    default=42,
+    help="Generator seed (default: 42)",
+)
+parser.add_argument(
+    "--preset",
+    help="Generator scale profile (see scripts/profiles/)",
+)
+parser.add_argument(
+    "--formats",
+    nargs="+",
+    choices=FORMATS,
+    default=FORMATS,
+    help="Exports to verify (default: all; every format is timed)",
+)
+parser.add_argument(
+    "--out",
+    help="Results JSON (default: <workdir>/<vault>.export-result.json)",
+)
+parser.add_argument(
+    "--node-heap-mb",
+    type=int,
+    default=8192,
+    help="--max-old-space-size for the Jest process (default: 8192)",
+)
+parser.add_argument(
+    "--regenerate",
+    action="store_true",
+    help="Regenerate the vault even if a matching cached one exists",
+)
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# VAULT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def ensure_vault(args: argparse.Namespace) -> Path:
+    """Generate (or reuse) the vault and its NDJSON manifest."""
+    options = ["-n", str(args.size), "--seed", str(args.seed), "--yaml-backend", "fast"]
+    if args.preset:
+        options += ["--preset", args.preset]
+    name = f"export-{args.size}-s{args.seed}" + (f"-{args.preset}" if args.preset else "")
+    vault = Path(args.workdir) / name
+    return bench_common.ensure_vault(
+        vault, options, f"{args.size:,} notes", args.regenerate, manifest=vault.with_name(f"{name}.manifest.ndjson"),
+    )
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# JEST RUN & VERIFICATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def run_suite(vault: Path, exports: Path, out: Path, args: argparse.Namespace) -> Dict[str, Any]:
+    """Time every export under Jest and return the suite's measurements."""
+    env = dict(
+        PP_BENCH_VAULT=str(vault.resolve()),
+        PP_BENCH_EXPORT_DIR=str(exports.resolve()),
+        # Dates print in local time; the verifier expects UTC
+        TZ="UTC",
+    )
+    return bench_common.run_suite(SUITE, out, env, args.node_heap_mb)["export"]
+
+
+def verify(vault: Path, export: str, report: Path) -> Dict[str, Any]:
+    """Stream one export through verify-export; returns its JSON report."""
+    manifest = vault.with_name(f"{vault.name}.manifest.ndjson")
+    command = [
+        sys.executable, str(GENERATOR), "verify-export", str(manifest), export, "-o", str(report),
+    ]
+    result = subprocess.run(command, stdout=subprocess.DEVNULL)
+    verified = json.loads(report.read_text(encoding="utf-8"))
+    verified["ok"] = result.returncode == 0
+    return verified
+
+
+def print_cells(cells: List[Dict[str, Any]]) -> None:
+    """Format × rows × width, with time, heap and output size."""
+    print(f"{'format':<10}{'rows':>9}{'cols':>6}{'ms':>11}{'peak MiB':>10}{'out MB':>9}{'rows/s':>11}")
+    for cell in cells:
+        if cell["error"]:
+            print(f"{cell['format']:<10}{cell['rows']:>9,}{cell['width']:>6}  ❌ {cell['error']}")
+            continue
+        print(f"{cell['format']:<10}{cell['rows']:>9,}{cell['width']:>6}{cell['ms']:>11,.1f}"
+              f"{cell['peakMb']:>10,.1f}{cell['outputMb']:>9,.1f}{cell['rowsPerSec'] or 0:>11,}")
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# MAIN EXECUTION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point."""
+    args = parser.parse_args(argv)
+    Path(args.workdir).mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+
+    vault = ensure_vault(args)
+    exports = Path(args.workdir) / f"{vault.name}.exports"
+    out = Path(args.out or Path(args.workdir) / f"{vault.name}.export-result.json")
+    result = run_suite(vault, exports, out, args)
+
+    verified: Dict[str, Dict[str, Any]] = {}
+    for fmt in args.formats:
+        export = result["files"].get(fmt)
+        if export is not None:
+            verified[fmt] = verify(vault, export, exports / f"{fmt}.verify.json")
+
+    failed = [fmt for fmt, report in verified.items() if not report["ok"]]
+    errors = [cell for cell in result["cells"] if cell["error"]]
+
+    # Summary
+    print(f"\n{'═' * 50}")
+    print(f"✨ {len(result['cells'])} exports of up to {result['records']:,} rows × {result['fields']} columns "
+          f"in {time.perf_counter() - started:.1f}s")
+    print(f"{'═' * 50}")
+    print_cells(result["cells"])
+    print(f"{'─' * 50}")
+    for fmt, report in verified.items():
+        mismatched = sum(report["mismatches"].values())
+        print(f"{'✅' if report['ok'] else '❌'} {fmt:<9} {report['matched']:,} rows verified · "
+              f"{mismatched:,} mismatching cells · {report['exportMb']:,.1f} MB in {report['seconds']:.1f}s"
+              + (f" · verifier RSS {report['peakRssMb']:,.0f} MiB" if "peakRssMb" in report else ""))
+    for fmt in args.formats:
+        if fmt not in verified:
+            print(f"⚠️  {fmt:<9} no full-size export to verify")
+    if errors:
+        print(f"❌ {len(errors)} export(s) threw (largest: {max(c['rows'] for c in errors):,} rows)")
+    print(f"🗂️  Results: {out}")
+    print(f"{'═' * 50}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
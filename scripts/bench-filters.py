@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+═══════════════════════════════════════════════════════════════════════════════
+  Projects Plus Filter Operator Benchmark
+
+  Generates a vault with generate-test-files.py, builds its filter corpus
+  (every FilterCondition operator at each selectivity target, with expected
+  match sets) and times applyFilter per case under Jest
+  (src/__tests__/performance/filterOperators.test.ts). Prints the
+  operator × selectivity matrix and writes it to a JSON results file.
+
+  Usage:
+    python bench-filters.py [--size 100000] [options]
+
+  Examples:
+    python bench-filters.py --size 20000
+    python bench-filters.py --preset wide-schema-300-fields --selectivity 0.01 0.5
+    python bench-filters.py --size 200000 --repeat 5 --out filters.json
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import bench_common
+from bench_common import GENERATOR, ROOT
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CONFIGURATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+SUITE = "src/__tests__/performance/filterOperators.test.ts"
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ARGUMENT PARSING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+parser = argparse.ArgumentParser(
+    prog="bench-filters",
+    description="Per-operator, per-selectivity applyFilter benchmark.",
+    formatter_class=argparse.RawDescriptionHelpFormatter,
+)
+parser.add_argument(
+    "--size",
+    type=int,
+    default=100_000,
+    help="Vault size (default: 100000)",
+)
+parser.add_argument(
+    "--workdir",
+    default=str(ROOT / ".bench"),
+    help="Where generated vaults and corpora are cached (default: .bench/)",
+)
+parser.add_argument(
+    "--seed",
+    type=int,
+    default=42,
+    help="Generator seed (default: 42)",
+)
+parser.add_argument(
+    "--preset",
+    help="Generator scale profile (see scripts/profiles/)",
+)
+parser.add_argument(
+    "--selectivity",
+    type=float,
+    nargs="+",
+    default=[0.001, 0.1, 0.9],
+    help="Target match rates per operator (default: 0.001 0.1 0.9)",
+)
+parser.add_argument(
+    "--repeat",
+    type=int,
+    default=3,
+    help="applyFilter runs per case; the median is reported (default: 3)",
+)
+parser.add_argument(
+    "--out",
+    help="Results JSON (default: <workdir>/<vault>.filters-result.json)",
+)
+parser.add_argument(
+    "--node-heap-mb",
+    type=int,
+    default=8192,
+    help="--max-old-space-size for the Jest process (default: 8192)",
+)
+parser.add_argument(
+    "--regenerate",
+    action="store_true",
+    help="Regenerate the vault even if a matching cached one exists",
+)
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# VAULT & CORPUS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def ensure_vault(args: argparse.Namespace) -> Path:
+    """Generate (or reuse) the vault and its NDJSON manifest."""
+    options = ["-n", str(args.size), "--seed", str(args.seed), "--yaml-backend", "fast"]
+    if args.preset:
+        options += ["--preset", args.preset]
+    name = f"filters-{args.size}-s{args.seed}" + (f"-{args.preset}" if args.preset else "")
+    vault = Path(args.workdir) / name
+    return bench_common.ensure_vault(
+        vault, options, f"{args.size:,} notes", args.regenerate, manifest=vault.with_name(f"{name}.manifest.ndjson"),
+    )
+
+
+def build_corpus(vault: Path, args: argparse.Namespace) -> Path:
+    """Run the filter-corpus command at the vault's generation date."""
+    corpus = vault.with_name(f"{vault.name}.filters.json")
+    command = [
+        sys.executable, str(GENERATOR), "filter-corpus", str(vault.with_name(f"{vault.name}.manifest.ndjson")),
+        "-o", str(corpus), "--selectivity", *map(str, args.selectivity),
+    ]
+    subprocess.run(command, check=True)
+    return corpus
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# JEST RUN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def run_suite(vault: Path, corpus: Path, out: Path, args: argparse.Namespace) -> Dict[str, Any]:
+    """Time every corpus case under Jest and return the suite's measurements."""
+    env = dict(
+        PP_BENCH_VAULT=str(vault.resolve()),
+        PP_BENCH_CORPUS=str(corpus.resolve()),
+        PP_BENCH_REPEAT=str(args.repeat),
+    )
+    return bench_common.run_suite(SUITE, out, env, args.node_heap_mb)["filters"]
+
+
+def print_matrix(result: Dict[str, Any], columns: List[str]) -> None:
+    """Operator rows × selectivity columns, slowest operators first."""
+    matrix: Dict[str, Dict[str, float]] = result["matrix"]
+    rows = sorted(matrix, key=lambda op: -max((matrix[op].get(c, 0.0) for c in columns), default=0.0))
+    print(f"{'operator':<18}" + "".join(f"{c:>10}" for c in columns))
+    for op in rows:
+        cells = [matrix[op].get(c) for c in columns]
+        print(f"{op:<18}" + "".join(f"{'—' if v is None else f'{v:,.1f}':>10}" for v in cells))
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# MAIN EXECUTION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point."""
+    args = parser.parse_args(argv)
+    Path(args.workdir).mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+
+    vault = ensure_vault(args)
+    corpus = build_corpus(vault, args)
+    out = Path(args.out or Path(args.workdir) / f"{vault.name}.filters-result.json")
+    result = run_suite(vault, corpus, out, args)
+
+    # Same labels as the corpus case ids ("<operator>@<target>%")
+    columns = [f"{t * 100:g}%" for t in args.selectivity]
+
+    # Summary
+    print(f"\n{'═' * 50}")
+    print(f"✨ {len(result['cases'])} filter cases over {result['records']:,} records "
+          f"in {time.perf_counter() - started:.1f}s")
+    print(f"{'═' * 50}")
+    print_matrix(result, columns)
+    print(f"{'─' * 50}")
+    print(f"⏱️  Median of {result['repeat']} run(s) per case, in ms")
+    print(f"🗂️  Results: {out}")
+    print(f"{'═' * 50}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+═══════════════════════════════════════════════════════════════════════════════
+  Projects Plus Formula & Transform Cache Benchmark
+
+  Generates a vault with generate-test-files.py together with its --formulas
+  workload (formula fields of a given depth, fan-in and family mix plus
+  dashboard widgets computing them) and profiles it under Jest
+  (src/__tests__/performance/formulas.test.ts). Prints the evaluation cost of
+  every formula, slowest first, with its growth from half to all of the
+  records. Then prints render times and the transformCache hit rate over
+  replayed renders with periodic note edits.
+
+  Usage:
+    python bench-formulas.py [--size 20000] [options]
+
+  Examples:
+    python bench-formulas.py --size 5000 --formulas 12
+    python bench-formulas.py --workload rollup --mix rollup=3,math=1 --depth 4
+    python bench-formulas.py --size 50000 --widgets 24 --renders 50 --edit-every 10
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import bench_common
+from bench_common import ROOT
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CONFIGURATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+SUITE = "src/__tests__/performance/formulas.test.ts"
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ARGUMENT PARSING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+parser = argparse.ArgumentParser(
+    prog="bench-formulas",
+    description="Per-formula evaluation cost and transform cache hit rate benchmark.",
+    formatter_class=argparse.RawDescriptionHelpFormatter,
+)
+parser.add_argument(
+    "--size",
+    type=int,
+    default=20_000,
+    help="Vault size (default: 20000)",
+)
+parser.add_argument(
+    "--workload",
+    choices=["default", "rollup"],
+    default="default",
+    help="Vault shape the formulas run over: tasks/events or projects with ledgers (default: default)",
+)
+parser.add_argument(
+    "--workdir",
+    default=str(ROOT / ".bench"),
+    help="Where generated vaults are cached (default: .bench/)",
+)
+parser.add_argument(
+    "--seed",
+    type=int,
+    default=42,
+    help="Generator seed (default: 42)",
+)
+parser.add_argument(
+    "--preset",
+    help="Generator scale profile (see scripts/profiles/)",
+)
+parser.add_argument(
+    "--formulas",
+    type=int,
+    default=24,
+    help="Formula fields to generate (default: 24)",
+)
+parser.add_argument(
+    "--depth",
+    type=int,
+    help="Nesting depth per formula (generator default: 3)",
+)
+parser.add_argument(
+    "--fan-in",
+    type=int,
+    help="Arguments of variadic calls (generator default: 2)",
+)
+parser.add_argument(
+    "--mix",
+    help="Function family weights, e.g. date=2,rollup=1 (generator default: all 1)",
+)
+parser.add_argument(
+    "--chain-rate",
+    type=float,
+    help="Leaves referencing an earlier formula (generator default: 0.2)",
+)
+parser.add_argument(
+    "--widgets",
+    type=int,
+    help="Dashboard widgets computing the formulas (generator default: 4)",
+)
+parser.add_argument(
+    "--renders",
+    type=int,
+    default=20,
+    help="Replayed renders (default: 20)",
+)
+parser.add_argument(
+    "--edit-every",
+    type=int,
+    default=5,
+    help="Renders between simulated note edits; 0 = never (default: 5)",
+)
+parser.add_argument(
+    "--repeat",
+    type=int,
+    default=1,
+    help="Runs per formula and rung; the median is reported (default: 1)",
+)
+parser.add_argument(
+    "--quadratic-threshold",
+    type=float,
+    default=1.6,
+    help="Growth exponent from which a formula is flagged (default: 1.6)",
+)
+parser.add_argument(
+    "--fail-on-quadratic",
+    action="store_true",
+    help="Exit non-zero when any formula is flagged",
+)
+parser.add_argument(
+    "--top",
+    type=int,
+    default=15,
+    help="Formulas listed in the summary, slowest first (default: 15)",
+)
+parser.add_argument(
+    "--out",
+    help="Results JSON (default: <workdir>/<vault>.formulas-result.json)",
+)
+parser.add_argument(
+    "--node-heap-mb",
+    type=int,
+    default=8192,
+    help="--max-old-space-size for the Jest process (default: 8192)",
+)
+parser.add_argument(
+    "--regenerate",
+    action="store_true",
+    help="Regenerate the vault even if a matching cached one exists",
+)
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# VAULT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def ensure_vault(args: argparse.Namespace) -> Path:
+    """Generate (or reuse) the vault and its formula workload."""
+    options = ["--seed", str(args.seed), "--yaml-backend", "fast", "--formulas", str(args.formulas)]
+    if args.preset:
+        options += ["--preset", args.preset]
+    else:
+        options += ["-n", str(args.size)]
+    if args.workload == "rollup":
+        options.append("--rollup-workload")
+    for flag, value in (
+        ("--formula-depth", args.depth),
+        ("--formula-fan-in", args.fan_in),
+        ("--formula-mix", args.mix),
+        ("--formula-chain-rate", args.chain_rate),
+        ("--formula-widgets", args.widgets),
+    ):
+        if value is not None:
+            options += [flag, str(value)]
+    name = f"formulas-{args.workload}-{args.preset or args.size}-s{args.seed}"
+    vault = Path(args.workdir) / name
+    label = f"{args.preset or f'{args.size:,} notes'} + {args.formulas} formulas"
+    return bench_common.ensure_vault(
+        vault, options, label, args.regenerate, requires=[vault.with_name(f"{name}.formulas.json")],
+    )
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# JEST RUN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def run_suite(vault: Path, out: Path, args: argparse.Namespace) -> Dict[str, Any]:
+    """Profile the formulas and renders under Jest and return the suite's measurements."""
+    env = dict(
+        PP_BENCH_VAULT=str(vault.resolve()),
+        PP_BENCH_CORPUS=str(vault.with_name(f"{vault.name}.formulas.json").resolve()),
+        PP_BENCH_REPEAT=str(args.repeat),
+        PP_BENCH_RENDERS=str(args.renders),
+        PP_BENCH_EDIT_EVERY=str(args.edit_every),
+    )
+    return bench_common.run_suite(SUITE, out, env, args.node_heap_mb)["formulas"]
+
+
+def print_formulas(formulas: List[Dict[str, Any]], top: int, threshold: float) -> List[str]:
+    """Slowest formulas first; returns the names of those growing past ``threshold``."""
+    print(f"{'formula':<18}{'type':>9}{'calls':>7}{'@refs':>7}{'ms':>11}{'ns/rec':>10}{'growth':>8}{'null':>7}")
+    flagged = [f["name"] for f in formulas if f["growth"] is not None and f["growth"] >= threshold]
+    for f in sorted(formulas, key=lambda f: -f["ms"][-1])[:top]:
+        mark = " ⚠️" if f["name"] in flagged else ""
+        growth = "—" if f["growth"] is None else f"{f['growth']:.2f}"
+        print(f"{f['name']:<18}{f['resultType']:>9}{f['calls']:>7}{f['columnRefs']:>7}{f['ms'][-1]:>11,.1f}"
+              f"{f['nsPerRecord']:>10,}{growth:>8}{f['nullRate']:>7.0%}{mark}")
+    return flagged
+
+
+def family_costs(formulas: List[Dict[str, Any]]) -> Dict[str, float]:
+    """Top-rung milliseconds per family, largest first."""
+    costs: Dict[str, float] = {}
+    for f in formulas:
+        costs[f["family"]] = costs.get(f["family"], 0.0) + f["ms"][-1]
+    return dict(sorted(costs.items(), key=lambda kv: -kv[1]))
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# MAIN EXECUTION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point."""
+    args = parser.parse_args(argv)
+    Path(args.workdir).mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+
+    vault = ensure_vault(args)
+    out = Path(args.out or Path(args.workdir) / f"{vault.name}.formulas-result.json")
+    result = run_suite(vault, out, args)
+
+    formulas = result["formulas"]
+    renders = result["renders"]
+    cache = result["transformCache"]
+    hit_rate = "—" if cache["hitRate"] is None else f"{cache['hitRate']:.1%}"
+
+    # Summary
+    print(f"\n{'═' * 50}")
+    print(f"✨ {len(formulas)} formulas over {result['records']:,} records "
+          f"in {time.perf_counter() - started:.1f}s")
+    print(f"{'═' * 50}")
+    flagged = print_formulas(formulas, args.top, args.quadratic_threshold)
+    print(f"{'─' * 50}")
+    print(f"🧮 By family: {', '.join(f'{k} {v:,.1f} ms' for k, v in family_costs(formulas).items())}")
+    pass_ = result["pass"]
+    print(f"🧾 All formula fields: {pass_['formulaMs']:,.1f} ms · {pass_['allocatedMb']:,.1f} MiB allocated"
+          f" · auto fields {pass_['autoMs']:,.1f} ms")
+    print(f"🖼️  Renders: {renders['count']} × {renders['widgets']} widgets · p50 {renders['p50Ms']:,.1f} ms"
+          f" · p95 {renders['p95Ms']:,.1f} ms")
+    print(f"♻️  Transform cache: {hit_rate} hits ({cache['hits']} / {cache['hits'] + cache['misses']})"
+          f" · {cache['evictions']} evictions · {cache['expired']} expired")
+    errors = [f["name"] for f in formulas if f["errors"]]
+    if errors:
+        print(f"❌ Evaluation errors: {', '.join(errors)}")
+    if flagged:
+        print(f"⚠️  Growth ≥ {args.quadratic_threshold}: {', '.join(flagged)}")
+    else:
+        print(f"✅ No formula grows faster than n^{args.quadratic_threshold}")
+    print(f"🗂️  Results: {out}")
+    print(f"{'═' * 50}")
+    return 1 if flagged and args.fail_on_quadratic else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
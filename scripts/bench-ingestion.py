@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+═══════════════════════════════════════════════════════════════════════════════
+  Projects Plus Ingestion Benchmark
+
+  Generates vaults at a size ladder with generate-test-files.py and ingests
+  each one headlessly through the real folder/frontmatter datasources and
+  FrontmatterReader (src/__tests__/performance/ingestion.test.ts under Jest).
+  Results are appended to a JSON history file; a regression gate compares
+  each run with the previous one.
+
+  Usage:
+    python bench-ingestion.py [--sizes 1000 10000 ...] [options]
+
+  Examples:
+    python bench-ingestion.py --sizes 1000 10000
+    python bench-ingestion.py --preset wide-schema-300-fields --sizes 20000
+    python bench-ingestion.py --threshold 0.10 --history ci/ingestion.json
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import argparse
+import datetime
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import bench_common
+from bench_common import ROOT
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CONFIGURATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+SUITE = "src/__tests__/performance/ingestion.test.ts"
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+# Metrics checked by the regression gate (all "lower is better")
+GATED_METRICS = ["parseMs", "buildMs", "queryAllMs", "readerMs", "heapPeakMb"]
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ARGUMENT PARSING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+parser = argparse.ArgumentParser(
+    prog="bench-ingestion",
+    description="Vault ingestion benchmark for the folder/frontmatter datasources.",
+    formatter_class=argparse.RawDescriptionHelpFormatter,
+)
+parser.add_argument(
+    "--sizes",
+    type=int,
+    nargs="+",
+    default=DEFAULT_SIZES,
+    help="Vault sizes to benchmark (default: 1000 10000 100000 1000000)",
+)
+parser.add_argument(
+    "--workdir",
+    default=str(ROOT / ".bench"),
+    help="Where generated vaults are cached (default: .bench/)",
+)
+parser.add_argument(
+    "--history",
+    help="JSON history file (default: <workdir>/ingestion-history.json)",
+)
+parser.add_argument(
+    "--seed",
+    type=int,
+    default=42,
+    help="Generator seed (default: 42)",
+)
+parser.add_argument(
+    "--preset",
+    help="Generator scale profile (see scripts/profiles/)",
+)
+parser.add_argument(
+    "--threshold",
+    type=float,
+    default=0.15,
+    help="Allowed slowdown vs. the previous run before failing (default: 0.15)",
+)
+parser.add_argument(
+    "--min-ms",
+    type=float,
+    default=50.0,
+    help="Ignore timing regressions where both runs are below this (default: 50)",
+)
+parser.add_argument(
+    "--node-heap-mb",
+    type=int,
+    default=8192,
+    help="--max-old-space-size for the Jest process (default: 8192)",
+)
+parser.add_argument(
+    "--regenerate",
+    action="store_true",
+    help="Regenerate vaults even if a matching cached one exists",
+)
+parser.add_argument(
+    "--no-save",
+    action="store_true",
+    help="Do not append this run to the history file",
+)
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# VAULTS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def generator_args(size: int, args: argparse.Namespace) -> List[str]:
+    """Options that define a vault's contents (also its cache key)."""
+    options = ["-n", str(size), "--seed", str(args.seed), "--yaml-backend", "fast"]
+    if args.preset:
+        options += ["--preset", args.preset]
+    return options
+
+
+def ensure_vault(size: int, args: argparse.Namespace) -> Path:
+    """Generate (or reuse) the vault for one ladder rung."""
+    name = f"vault-{size}-s{args.seed}" + (f"-{args.preset}" if args.preset else "")
+    return bench_common.ensure_vault(
+        Path(args.workdir) / name, generator_args(size, args), f"{size:,} notes", args.regenerate,
+    )
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# JEST RUNS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def run_suite(vault: Path, args: argparse.Namespace) -> Dict[str, Any]:
+    """Ingest one vault under Jest and return the suite's measurements."""
+    out = Path(args.workdir) / f"{vault.name}.result.json"
+    env = dict(PP_BENCH_VAULT=str(vault.resolve()))
+    return bench_common.run_suite(SUITE, out, env, args.node_heap_mb)["ingestion"]
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# HISTORY & REGRESSION GATE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def load_history(path: Path) -> List[Dict[str, Any]]:
+    if not path.is_file():
+        return []
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def baseline_for(history: List[Dict[str, Any]], size: int, preset: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Most recent recorded result for the same size and preset."""
+    for entry in reversed(history):
+        result = entry["results"].get(str(size))
+        if result is not None and entry.get("preset") == preset:
+            return result
+    return None
+
+
+def regressions(current: Dict[str, Any], baseline: Dict[str, Any], args: argparse.Namespace) -> List[str]:
+    """Human-readable list of gated metrics that got worse than allowed."""
+    found = []
+    for metric in GATED_METRICS:
+        old, new = baseline.get(metric), current.get(metric)
+        if not old or new is None:
+            continue
+        if metric.endswith("Ms") and max(old, new) < args.min_ms:
+            continue
+        if new > old * (1 + args.threshold):
+            found.append(f"{metric} {old:,.1f} → {new:,.1f} (+{(new / old - 1) * 100:.0f}%)")
+    return found
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# MAIN EXECUTION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point."""
+    args = parser.parse_args(argv)
+    Path(args.workdir).mkdir(parents=True, exist_ok=True)
+    history_path = Path(args.history or Path(args.workdir) / "ingestion-history.json")
+    history = load_history(history_path)
+
+    started = time.perf_counter()
+    results: Dict[str, Dict[str, Any]] = {}
+    failures: Dict[int, List[str]] = {}
+
+    for size in args.sizes:
+        vault = ensure_vault(size, args)
+        result = run_suite(vault, args)
+        results[str(size)] = result
+        baseline = baseline_for(history, size, args.preset)
+        if baseline is not None:
+            found = regressions(result, baseline, args)
+            if found:
+                failures[size] = found
+        print(
+            f"📥 {size:>9,} notes · parse {result['parseMs']:,.0f} ms · build {result['buildMs']:,.0f} ms"
+            f" · queryAll {result['queryAllMs']:,.0f} ms · heap {result['heapPeakMb']:,.0f} MiB"
+            f" · gc {result['gc']['totalMs']:,.0f} ms (max {result['gc']['maxMs']:,.0f})"
+        )
+
+    # A failing run is not recorded, so the baseline stays the last good run
+    saved = not args.no_save and not failures
+    if saved:
+        history.append({
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "seed": args.seed,
+            "preset": args.preset,
+            "results": results,
+        })
+        history_path.write_text(json.dumps(history, indent=2) + "\n", encoding="utf-8")
+
+    # Summary
+    print(f"\n{'═' * 50}")
+    print(f"✨ Benchmarked {len(results)} vault size(s) in {time.perf_counter() - started:.1f}s")
+    print(f"{'═' * 50}")
+    for size, found in failures.items():
+        print(f"❌ {size:,} notes regressed beyond {args.threshold:.0%}:")
+        for line in found:
+            print(f"   {line}")
+    if not failures:
+        print("✅ No regressions against the previous run")
+    if saved:
+        print(f"🗂️  History: {history_path} ({len(history)} runs)")
+    print(f"{'═' * 50}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
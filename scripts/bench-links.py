@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+═══════════════════════════════════════════════════════════════════════════════
+  Projects Plus Wikilink Extraction & Resolution Benchmark
+
+  Builds a corpus with `generate-test-files.py link-corpus` (exotic note
+  names, duplicate and case-colliding basenames, dense link values and
+  pathological near-backtracking inputs) and runs it under Jest
+  (src/__tests__/performance/links.test.ts). Prints the cost of every link
+  extractor per million links, with the values where its output differs
+  from the expected bodies. Then prints how many links the basename index
+  and the inverse index resolve to the intended note. Last, it prints how
+  each extractor grows on the pathological inputs.
+
+  Usage:
+    python bench-links.py [--notes 20000] [--values 50000] [options]
+
+  Examples:
+    python bench-links.py --notes 2000 --values 5000
+    python bench-links.py --notes 100000 --values 500000 --duplicate-rate 0.3
+    python bench-links.py --lengths 64 256 1024 4096 --budget-ms 2000 --fail-on-superlinear
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import bench_common
+from bench_common import GENERATOR, ROOT
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CONFIGURATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+SUITE = "src/__tests__/performance/links.test.ts"
+
+# Written next to a corpus once generation finished
+CORPUS_MARKER = ".options.json"
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ARGUMENT PARSING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+parser = argparse.ArgumentParser(
+    prog="bench-links",
+    description="Wikilink extraction and basename resolution per million links, and regex growth.",
+    formatter_class=argparse.RawDescriptionHelpFormatter,
+)
+parser.add_argument(
+    "--notes",
+    type=int,
+    default=20_000,
+    help="Link targets (default: 20000)",
+)
+parser.add_argument(
+    "--values",
+    type=int,
+    default=50_000,
+    help="Link values (default: 50000)",
+)
+parser.add_argument(
+    "--workdir",
+    default=str(ROOT / ".bench"),
+    help="Where generated corpora are cached (default: .bench/)",
+)
+parser.add_argument(
+    "--seed",
+    type=int,
+    default=42,
+    help="Generator seed (default: 42)",
+)
+parser.add_argument(
+    "--links-per-value",
+    type=int,
+    help="Mean links per list, inline or plain value (generator default: 4)",
+)
+parser.add_argument(
+    "--duplicate-rate",
+    type=float,
+    help="Notes reusing an earlier basename (generator default: 0.1)",
+)
+parser.add_argument(
+    "--unicode-rate",
+    type=float,
+    help="Names built from non-Latin words (generator default: 0.5)",
+)
+parser.add_argument(
+    "--lengths",
+    type=int,
+    nargs="+",
+    help="Repetitions per pathological input (generator default: 32 128 512 2048)",
+)
+parser.add_argument(
+    "--budget-ms",
+    type=float,
+    default=500,
+    help="A pathological input stops growing once one call takes this long (default: 500)",
+)
+parser.add_argument(
+    "--repeat",
+    type=int,
+    default=3,
+    help="Passes per extractor; the median is reported (default: 3)",
+)
+parser.add_argument(
+    "--superlinear-threshold",
+    type=float,
+    default=1.6,
+    help="Growth exponent from which a pathological input is flagged (default: 1.6)",
+)
+parser.add_argument(
+    "--fail-on-superlinear",
+    action="store_true",
+    help="Exit non-zero when any pathological input is flagged or over budget",
+)
+parser.add_argument(
+    "--out",
+    help="Results JSON (default: <workdir>/<corpus>.links-result.json)",
+)
+parser.add_argument(
+    "--node-heap-mb",
+    type=int,
+    default=8192,
+    help="--max-old-space-size for the Jest process (default: 8192)",
+)
+parser.add_argument(
+    "--regenerate",
+    action="store_true",
+    help="Regenerate the corpus even if a matching cached one exists",
+)
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CORPUS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def ensure_corpus(args: argparse.Namespace) -> Path:
+    """Generate (or reuse) the link corpus."""
+    options = ["--seed", str(args.seed), "--notes", str(args.notes), "--values", str(args.values)]
+    for flag, value in (
+        ("--links-per-value", args.links_per_value),
+        ("--duplicate-rate", args.duplicate_rate),
+        ("--unicode-rate", args.unicode_rate),
+    ):
+        if value is not None:
+            options += [flag, str(value)]
+    if args.lengths:
+        options += ["--lengths", *map(str, args.lengths)]
+    corpus = Path(args.workdir) / f"links-{args.notes}x{args.values}-s{args.seed}.json"
+    marker = corpus.with_suffix(CORPUS_MARKER)
+    # Link values carry no dates, so the corpus is not pinned to a day
+    expected = bench_common.stamp(options, dated=False)
+    if not args.regenerate and bench_common.is_current(marker, expected, [corpus]):
+        return corpus
+
+    print(f"🏗️  Generating {args.values:,} link values over {args.notes:,} notes → {corpus}")
+    command = [sys.executable, str(GENERATOR), "link-corpus", "-o", str(corpus), *options]
+    subprocess.run(command, check=True)
+    bench_common.write_marker(marker, expected)
+    return corpus
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# JEST RUN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def run_suite(corpus: Path, out: Path, args: argparse.Namespace) -> Dict[str, Any]:
+    """Run the link suite under Jest and return its measurements."""
+    env = dict(
+        PP_BENCH_CORPUS=str(corpus.resolve()),
+        PP_BENCH_REPEAT=str(args.repeat),
+        PP_BENCH_PATHOLOGICAL_MS=str(args.budget_ms),
+    )
+    return bench_common.run_suite(SUITE, out, env, args.node_heap_mb)["links"]
+
+
+def print_extraction(extraction: List[Dict[str, Any]]) -> None:
+    """One line per extractor with its cost and the values it reads differently."""
+    print(f"{'extractor':<24}{'ms':>10}{'ms/1M links':>14}{'links/s':>14}  differs")
+    for e in extraction:
+        differs = ", ".join(f"{shape} {count:,}" for shape, count in sorted(e["differing"].items())) or "—"
+        per_million = "—" if e["msPerMillionLinks"] is None else f"{e['msPerMillionLinks']:,.0f}"
+        rate = "—" if e["linksPerSec"] is None else f"{e['linksPerSec']:,}"
+        print(f"{e['name']:<24}{e['ms']:>10,.1f}{per_million:>14}{rate:>14}  {differs}")
+
+
+def print_pathological(rows: List[Dict[str, Any]], threshold: float) -> List[str]:
+    """Growth per input and extractor; returns those flagged or over budget."""
+    print(f"{'input':<18}{'extractor':<24}{'longest':>9}{'ms':>11}{'growth':>8}")
+    flagged = []
+    for row in rows:
+        last = row["rungs"][-1]
+        bad = row["overBudget"] or (row["growth"] is not None and row["growth"] >= threshold)
+        if bad:
+            flagged.append(f"{row['input']}/{row['extractor']}")
+        growth = "—" if row["growth"] is None else f"{row['growth']:.2f}"
+        mark = " ⏱️" if row["overBudget"] else " ⚠️" if bad else ""
+        print(f"{row['input']:<18}{row['extractor']:<24}{last['length']:>9,}{last['ms']:>11,.1f}{growth:>8}{mark}")
+    return flagged
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# MAIN EXECUTION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point."""
+    args = parser.parse_args(argv)
+    Path(args.workdir).mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+
+    corpus = ensure_corpus(args)
+    out = Path(args.out or Path(args.workdir) / f"{corpus.stem}.links-result.json")
+    result = run_suite(corpus, out, args)
+
+    index = result["resolution"]["recordIndex"]
+    inverse = result["resolution"]["inverseIndex"]
+
+    # Summary
+    print(f"\n{'═' * 50}")
+    print(f"✨ {result['links']:,} links in {result['values']:,} values over {result['notes']:,} notes "
+          f"in {time.perf_counter() - started:.1f}s")
+    print(f"{'═' * 50}")
+    print_extraction(result["extraction"])
+    print(f"{'─' * 50}")
+    print(f"🗂️  Basename index: built in {index['buildMs']:,.1f} ms · {index['lookupMsPerMillionLinks']:,.0f} ms/1M lookups"
+          f" · {index['intended']:,} intended · {index['other']:,} other note · {index['unresolved']:,} unresolved")
+    print(f"↩️  Inverse index: {inverse['msPerMillionLinks']:,.0f} ms/1M links · {inverse['intended']:,} intended"
+          f" · {inverse['other']:,} other note · {inverse['unresolved']:,} unresolved")
+    print(f"{'─' * 50}")
+    flagged = print_pathological(result["pathological"], args.superlinear_threshold)
+    print(f"{'─' * 50}")
+    if flagged:
+        print(f"⚠️  Superlinear or over {result['pathologicalBudgetMs']:,.0f} ms: {', '.join(flagged)}")
+    else:
+        print(f"✅ No pathological input grows faster than n^{args.superlinear_threshold}")
+    print(f"🗂️  Results: {out}")
+    print(f"{'═' * 50}")
+    return 1 if flagged and args.fail_on_superlinear else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+═══════════════════════════════════════════════════════════════════════════════
+  Projects Plus Cross-Project Resolution Benchmark
+
+  Generates one --multi-project vault per rung of a project-count ladder with
+  generate-test-files.py (per-project schemas and sizes, a controlled share
+  of cross-project relation links, plugin settings with one folder project
+  per block) and runs src/__tests__/performance/crossProject.test.ts on
+  each. Prints, per rung, the cost of loading every project frame through
+  resolveExternalFrame and of enrichFrameWithAllRelations over all projects
+  (cold and warm), with the growth exponent against the previous rung.
+
+  By default every rung holds the same number of notes (--size), so only the
+  project count changes; --per-project grows the vault with it instead.
+
+  Usage:
+    python bench-projects.py [--projects 10 50 100 500] [options]
+
+  Examples:
+    python bench-projects.py --size 20000 --projects 10 100
+    python bench-projects.py --size 100000 --cross-project-rate 0.5 --target-skew 1.5
+    python bench-projects.py --per-project 200 --projects 10 50 250 500 --fail-on-superlinear
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import bench_common
+from bench_common import ROOT
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CONFIGURATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+SUITE = "src/__tests__/performance/crossProject.test.ts"
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ARGUMENT PARSING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+parser = argparse.ArgumentParser(
+    prog="bench-projects",
+    description="Cross-project frame loading and relation enrichment as projects multiply.",
+    formatter_class=argparse.RawDescriptionHelpFormatter,
+)
+parser.add_argument(
+    "--projects",
+    type=int,
+    nargs="+",
+    default=[10, 50, 100, 500],
+    help="Project counts, one vault per rung (default: 10 50 100 500)",
+)
+parser.add_argument(
+    "--size",
+    type=int,
+    default=50_000,
+    help="Notes per rung (default: 50000)",
+)
+parser.add_argument(
+    "--per-project",
+    type=int,
+    help="Notes per project instead of a fixed --size, so the vault grows with the ladder",
+)
+parser.add_argument(
+    "--workdir",
+    default=str(ROOT / ".bench"),
+    help="Where generated vaults are cached (default: .bench/)",
+)
+parser.add_argument(
+    "--seed",
+    type=int,
+    default=42,
+    help="Generator seed (default: 42)",
+)
+parser.add_argument(
+    "--cross-project-rate",
+    type=float,
+    help="Share of links into another project (generator default: 0.2)",
+)
+parser.add_argument(
+    "--cross-project-fields",
+    type=int,
+    help="Cross-project relation fields per project (generator default: 2)",
+)
+parser.add_argument(
+    "--project-links",
+    type=float,
+    help="Mean relation links per note (generator default: 3)",
+)
+parser.add_argument(
+    "--project-fields",
+    type=int,
+    help="Median schema width per project (generator default: 12)",
+)
+parser.add_argument(
+    "--project-size-skew",
+    type=float,
+    help="Zipf exponent of notes per project (generator default: 1.0)",
+)
+parser.add_argument(
+    "--target-skew",
+    type=float,
+    help="Zipf exponent of how often a project is linked into (generator default: 1.0)",
+)
+parser.add_argument(
+    "--repeat",
+    type=int,
+    default=3,
+    help="Warm enrichment passes; the median is reported (default: 3)",
+)
+parser.add_argument(
+    "--superlinear-threshold",
+    type=float,
+    default=1.0,
+    help="Growth exponent of cold enrichment from which a rung is flagged (default: 1.0)",
+)
+parser.add_argument(
+    "--fail-on-superlinear",
+    action="store_true",
+    help="Exit non-zero when any rung is flagged",
+)
+parser.add_argument(
+    "--out",
+    help="Ladder results JSON (default: <workdir>/projects-<size>-s<seed>.ladder.json)",
+)
+parser.add_argument(
+    "--node-heap-mb",
+    type=int,
+    default=8192,
+    help="--max-old-space-size for the Jest process (default: 8192)",
+)
+parser.add_argument(
+    "--regenerate",
+    action="store_true",
+    help="Regenerate vaults even if matching cached ones exist",
+)
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# VAULT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def ensure_vault(args: argparse.Namespace, projects: int) -> Path:
+    """Generate (or reuse) the vault and plugin settings of one rung."""
+    size = projects * args.per_project if args.per_project else args.size
+    options = ["--seed", str(args.seed), "--yaml-backend", "fast", "-n", str(size), "--multi-project", str(projects)]
+    for flag, value in (
+        ("--cross-project-rate", args.cross_project_rate),
+        ("--cross-project-fields", args.cross_project_fields),
+        ("--project-links", args.project_links),
+        ("--project-fields", args.project_fields),
+        ("--project-size-skew", args.project_size_skew),
+        ("--target-skew", args.target_skew),
+    ):
+        if value is not None:
+            options += [flag, str(value)]
+    name = f"projects-{projects}x{size}-s{args.seed}"
+    vault = Path(args.workdir) / name
+    return bench_common.ensure_vault(
+        vault, options, f"{size:,} notes over {projects} projects", args.regenerate,
+        requires=[vault.with_name(f"{name}.data.json")],
+    )
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# JEST RUN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def run_suite(vault: Path, out: Path, args: argparse.Namespace) -> Dict[str, Any]:
+    """Run the cross-project suite on one vault and return its rung."""
+    env = dict(
+        PP_BENCH_VAULT=str(vault.resolve()),
+        PP_BENCH_CORPUS=str(vault.with_name(f"{vault.name}.data.json").resolve()),
+        PP_BENCH_REPEAT=str(args.repeat),
+    )
+    return bench_common.run_suite(SUITE, out, env, args.node_heap_mb)["crossProject"]["rungs"][0]
+
+
+def growth(previous: Optional[Dict[str, Any]], current: Dict[str, Any], key: str) -> Optional[float]:
+    """log(t2/t1) / log(p2/p1) of ``key``'s total against the project count (None below 1 ms)."""
+    if previous is None or previous[key]["totalMs"] < 1 or current["projects"] <= previous["projects"]:
+        return None
+    ratio = current[key]["totalMs"] / previous[key]["totalMs"]
+    return round(math.log(ratio) / math.log(current["projects"] / previous["projects"]), 2)
+
+
+def print_rungs(rungs: List[Dict[str, Any]], threshold: float) -> List[int]:
+    """One line per rung; returns the project counts whose cold enrichment grows past ``threshold``."""
+    print(f"{'projects':>9}{'notes':>10}{'links':>10}{'cross':>7}{'hub in':>8}"
+          f"{'load ms':>10}{'n^':>7}{'cold ms':>10}{'n^':>7}{'warm ms':>10}{'p95/proj':>10}")
+    flagged = []
+    for rung in rungs:
+        load, cold = rung["growth"]["load"], rung["growth"]["cold"]
+        mark = ""
+        if cold is not None and cold >= threshold:
+            flagged.append(rung["projects"])
+            mark = " ⚠️"
+        print(f"{rung['projects']:>9,}{rung['notes']:>10,}{rung['links']:>10,}{rung['crossShare']:>7.0%}"
+              f"{rung['maxInDegree']:>8}{rung['load']['totalMs']:>10,.1f}{'—' if load is None else load:>7}"
+              f"{rung['cold']['totalMs']:>10,.1f}{'—' if cold is None else cold:>7}"
+              f"{rung['warm']['totalMs']:>10,.1f}{rung['cold']['p95Ms']:>10,.2f}{mark}")
+    return flagged
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# MAIN EXECUTION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point."""
+    args = parser.parse_args(argv)
+    Path(args.workdir).mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+
+    rungs: List[Dict[str, Any]] = []
+    for projects in sorted(set(args.projects)):
+        vault = ensure_vault(args, projects)
+        rung = run_suite(vault, Path(args.workdir) / f"{vault.name}.projects-result.json", args)
+        previous = rungs[-1] if rungs else None
+        rung["growth"] = {"load": growth(previous, rung, "load"), "cold": growth(previous, rung, "cold")}
+        rungs.append(rung)
+
+    size = f"{args.per_project}pp" if args.per_project else str(args.size)
+    out = Path(args.out or Path(args.workdir) / f"projects-{size}-s{args.seed}.ladder.json")
+    out.write_text(json.dumps({"rungs": rungs}, indent=2) + "\n", encoding="utf-8")
+    unresolved = sum(rung["links"] - rung["resolved"] for rung in rungs)
+
+    # Summary
+    print(f"\n{'═' * 50}")
+    print(f"✨ {len(rungs)} rungs, {rungs[0]['projects']}–{rungs[-1]['projects']} projects, "
+          f"in {time.perf_counter() - started:.1f}s")
+    print(f"{'═' * 50}")
+    flagged = print_rungs(rungs, args.superlinear_threshold)
+    print(f"{'─' * 50}")
+    top = rungs[-1]
+    print(f"🧠 Cold enrichment at {top['projects']} projects: {top['cold']['allocatedMb']:,.1f} MB allocated"
+          f" · {top['cold']['msPerKiloLinks'] or 0:,.3f} ms per 1k links · largest project {top['largestProject']:,} notes")
+    if unresolved:
+        print(f"⚠️  {unresolved:,} links did not resolve")
+    if flagged:
+        print(f"⚠️  Cold enrichment grows faster than projects^{args.superlinear_threshold} at: "
+              f"{', '.join(map(str, flagged))}")
+    else:
+        print(f"✅ Cold enrichment grows no faster than projects^{args.superlinear_threshold}")
+    print(f"🗂️  Results: {out}")
+    print(f"{'═' * 50}")
+    return 1 if flagged and args.fail_on_superlinear else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+═══════════════════════════════════════════════════════════════════════════════
+  Projects Plus Native & Dataview Query Benchmark
+
+  Generates a vault with generate-test-files.py --query-workload (projects,
+  work items with inline fields and annotated tasks, and a query suite of
+  selectivity ladders, sorts, joins, groupings, inline-field and task
+  queries) and runs the suite under Jest
+  (src/__tests__/performance/queries.test.ts). Prints p50/p95/p99 latency
+  per query for the native executor and for the Dataview bridge, on cold
+  runs (freshly loaded vault) and warm runs (same vault, repeated), next to
+  the selectivity each query was designed for.
+
+  Usage:
+    python bench-queries.py [--size 100000] [options]
+
+  Examples:
+    python bench-queries.py --size 10000
+    python bench-queries.py --preset query-suite-100k --warm-runs 20
+    python bench-queries.py --size 100000 --selectivity 0.0001 0.01 0.5 --budget-ms 250
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import bench_common
+from bench_common import ROOT
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CONFIGURATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+SUITE = "src/__tests__/performance/queries.test.ts"
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ARGUMENT PARSING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+parser = argparse.ArgumentParser(
+    prog="bench-queries",
+    description="Per-query p50/p95/p99 of native queries and the Dataview bridge, cold and warm.",
+    formatter_class=argparse.RawDescriptionHelpFormatter,
+)
+parser.add_argument(
+    "--size",
+    type=int,
+    default=100_000,
+    help="Vault size (default: 100000)",
+)
+parser.add_argument(
+    "--workdir",
+    default=str(ROOT / ".bench"),
+    help="Where generated vaults are cached (default: .bench/)",
+)
+parser.add_argument(
+    "--seed",
+    type=int,
+    default=42,
+    help="Generator seed (default: 42)",
+)
+parser.add_argument(
+    "--preset",
+    help="Generator scale profile (see scripts/profiles/)",
+)
+parser.add_argument(
+    "--projects",
+    type=int,
+    help="Project notes (generator default: one per 100 notes)",
+)
+parser.add_argument(
+    "--areas",
+    type=int,
+    help="Work areas (generator default: 8)",
+)
+parser.add_argument(
+    "--tasks",
+    type=float,
+    help="Mean tasks per item (generator default: 3)",
+)
+parser.add_argument(
+    "--selectivity",
+    type=float,
+    nargs="+",
+    help="Fractions matched by the score ladder (generator default: 0.001 0.01 0.1 0.5)",
+)
+parser.add_argument(
+    "--cold-runs",
+    type=int,
+    default=3,
+    help="Rounds over a freshly loaded vault (default: 3)",
+)
+parser.add_argument(
+    "--warm-runs",
+    type=int,
+    default=10,
+    help="Repeats of every query on the last loaded vault (default: 10)",
+)
+parser.add_argument(
+    "--budget-ms",
+    type=float,
+    help="Flag queries whose warm p95 exceeds this many ms",
+)
+parser.add_argument(
+    "--fail-on-budget",
+    action="store_true",
+    help="Exit non-zero when any query is over --budget-ms",
+)
+parser.add_argument(
+    "--out",
+    help="Results JSON (default: <workdir>/<vault>.queries-result.json)",
+)
+parser.add_argument(
+    "--node-heap-mb",
+    type=int,
+    default=8192,
+    help="--max-old-space-size for the Jest process (default: 8192)",
+)
+parser.add_argument(
+    "--regenerate",
+    action="store_true",
+    help="Regenerate the vault even if a matching cached one exists",
+)
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# VAULT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def ensure_vault(args: argparse.Namespace) -> Path:
+    """Generate (or reuse) the vault and its query suite."""
+    options = ["--seed", str(args.seed), "--yaml-backend", "fast", "--query-workload"]
+    if args.preset:
+        options += ["--preset", args.preset]
+    else:
+        options += ["-n", str(args.size)]
+    for flag, value in (
+        ("--query-projects", args.projects),
+        ("--query-areas", args.areas),
+        ("--query-tasks", args.tasks),
+    ):
+        if value is not None:
+            options += [flag, str(value)]
+    if args.selectivity:
+        options += ["--query-selectivity", *map(str, args.selectivity)]
+    name = f"queries-{args.preset or args.size}-s{args.seed}"
+    vault = Path(args.workdir) / name
+    return bench_common.ensure_vault(
+        vault, options, args.preset or f"{args.size:,} notes", args.regenerate,
+        requires=[vault.with_name(f"{name}.queries.json")],
+    )
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# JEST RUN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def run_suite(vault: Path, out: Path, args: argparse.Namespace) -> Dict[str, Any]:
+    """Run the query suite under Jest and return its measurements."""
+    env = dict(
+        PP_BENCH_VAULT=str(vault.resolve()),
+        PP_BENCH_CORPUS=str(vault.with_name(f"{vault.name}.queries.json").resolve()),
+        PP_BENCH_COLD_RUNS=str(args.cold_runs),
+        PP_BENCH_WARM_RUNS=str(args.warm_runs),
+    )
+    return bench_common.run_suite(SUITE, out, env, args.node_heap_mb)["queries"]
+
+
+def format_latency(latency: Optional[Dict[str, float]]) -> str:
+    """p50/p95/p99 in ms, or a dash for a path the query does not run on."""
+    if latency is None:
+        return f"{'—':>23}"
+    return f"{latency['p50Ms']:>7,.1f}{latency['p95Ms']:>8,.1f}{latency['p99Ms']:>8,.1f}"
+
+
+def print_queries(queries: List[Dict[str, Any]], budget: Optional[float]) -> List[str]:
+    """One line per query and path; returns the queries whose warm p95 misses ``budget``."""
+    print(f"{'query':<24}{'path':<10}{'rows':>9}{'select':>9}{'expect':>9}"
+          f"{'cold p50':>9}{'p95':>8}{'p99':>8}{'warm p50':>9}{'p95':>8}{'p99':>8}")
+    missed = []
+    for query in queries:
+        selectivity = "—" if query["selectivity"] is None else f"{query['selectivity']:.4f}"
+        for path in ("native", "dataview"):
+            run = query[path]
+            if run is None:
+                continue
+            mark = ""
+            if budget is not None and run["warm"]["p95Ms"] > budget:
+                missed.append(f"{query['name']}/{path}")
+                mark = " ⚠️"
+            print(f"{query['name']:<24}{path:<10}{run['rows']:>9,}{selectivity:>9}{query['expected']:>9.4f}"
+                  f" {format_latency(run['cold'])} {format_latency(run['warm'])}{mark}")
+    return missed
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# MAIN EXECUTION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point."""
+    args = parser.parse_args(argv)
+    Path(args.workdir).mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+
+    vault = ensure_vault(args)
+    out = Path(args.out or Path(args.workdir) / f"{vault.name}.queries-result.json")
+    result = run_suite(vault, out, args)
+
+    native = [q for q in result["queries"] if q["native"] is not None]
+    slowest = max(native, key=lambda q: q["native"]["warm"]["p95Ms"], default=None)
+
+    # Summary
+    print(f"\n{'═' * 50}")
+    print(f"✨ {len(result['queries'])} queries over {result['items']:,} items and {result['tasks']:,} tasks "
+          f"({result['coldRuns']} cold, {result['warmRuns']} warm runs) in {time.perf_counter() - started:.1f}s")
+    print(f"{'═' * 50}")
+    missed = print_queries(result["queries"], args.budget_ms)
+    print(f"{'─' * 50}")
+    if slowest is not None:
+        print(f"🐢 Slowest native query: {slowest['name']} ({slowest['native']['warm']['p95Ms']:,.1f} ms warm p95)")
+    if args.budget_ms is not None:
+        if missed:
+            print(f"⚠️  Warm p95 over {args.budget_ms:,.0f} ms: {', '.join(missed)}")
+        else:
+            print(f"✅ Every query's warm p95 fits in {args.budget_ms:,.0f} ms")
+    print(f"🗂️  Results: {out}")
+    print(f"{'═' * 50}")
+    return 1 if missed and args.fail_on_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+═══════════════════════════════════════════════════════════════════════════════
+  Projects Plus Sub-base Partition & Rollup Benchmark
+
+  Generates a --rollup-workload vault with generate-test-files.py (projects
+  with skewed ledgers, many sub-base types, numeric/date rollup targets) and
+  times partitionBySubBases and computeCrossProjectRollupColumn on a ladder
+  of growing shares of it under Jest
+  (src/__tests__/performance/subBaseRollup.test.ts). Prints time, allocation
+  and growth exponent per rung and flags operations that scale
+  quadratically.
+
+  Usage:
+    python bench-rollups.py [--size 50000] [options]
+
+  Examples:
+    python bench-rollups.py --size 20000
+    python bench-rollups.py --preset rollup-skewed
+    python bench-rollups.py --size 100000 --sub-bases 12 --fail-on-quadratic
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import bench_common
+from bench_common import ROOT
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CONFIGURATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+SUITE = "src/__tests__/performance/subBaseRollup.test.ts"
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ARGUMENT PARSING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+parser = argparse.ArgumentParser(
+    prog="bench-rollups",
+    description="Sub-base partition and cross-project rollup scaling benchmark.",
+    formatter_class=argparse.RawDescriptionHelpFormatter,
+)
+parser.add_argument(
+    "--size",
+    type=int,
+    default=50_000,
+    help="Vault size, projects plus ledger entries (default: 50000)",
+)
+parser.add_argument(
+    "--workdir",
+    default=str(ROOT / ".bench"),
+    help="Where generated vaults are cached (default: .bench/)",
+)
+parser.add_argument(
+    "--seed",
+    type=int,
+    default=42,
+    help="Generator seed (default: 42)",
+)
+parser.add_argument(
+    "--preset",
+    help="Generator scale profile, e.g. rollup-skewed (see scripts/profiles/)",
+)
+parser.add_argument(
+    "--sub-bases",
+    type=int,
+    help="Entry types to partition on (generator default: 6)",
+)
+parser.add_argument(
+    "--project-skew",
+    type=float,
+    help="Zipf exponent of entries per project (generator default: 1.1)",
+)
+parser.add_argument(
+    "--quadratic-threshold",
+    type=float,
+    default=1.6,
+    help="Growth exponent from which an operation is flagged (default: 1.6)",
+)
+parser.add_argument(
+    "--fail-on-quadratic",
+    action="store_true",
+    help="Exit non-zero when the top rung of any operation is flagged",
+)
+parser.add_argument(
+    "--out",
+    help="Results JSON (default: <workdir>/<vault>.rollups-result.json)",
+)
+parser.add_argument(
+    "--node-heap-mb",
+    type=int,
+    default=8192,
+    help="--max-old-space-size for the Jest process (default: 8192)",
+)
+parser.add_argument(
+    "--regenerate",
+    action="store_true",
+    help="Regenerate the vault even if a matching cached one exists",
+)
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# VAULT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def ensure_vault(args: argparse.Namespace) -> Path:
+    """Generate (or reuse) the rollup workload vault."""
+    options = ["--rollup-workload", "--seed", str(args.seed), "--yaml-backend", "fast"]
+    if args.preset:
+        options += ["--preset", args.preset]
+    else:
+        options += ["-n", str(args.size)]
+    if args.sub_bases is not None:
+        options += ["--sub-bases", str(args.sub_bases)]
+    if args.project_skew is not None:
+        options += ["--project-skew", str(args.project_skew)]
+    name = f"rollups-{args.preset or args.size}-s{args.seed}"
+    return bench_common.ensure_vault(
+        Path(args.workdir) / name, options, args.preset or f"{args.size:,} notes", args.regenerate,
+    )
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# JEST RUN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def run_suite(vault: Path, out: Path, args: argparse.Namespace) -> Dict[str, Any]:
+    """Run the ladder under Jest and return the suite's measurements."""
+    env = dict(PP_BENCH_VAULT=str(vault.resolve()))
+    return bench_common.run_suite(SUITE, out, env, args.node_heap_mb)["subBaseRollup"]
+
+
+def print_ladder(result: Dict[str, Any], threshold: float) -> List[str]:
+    """One line per operation and rung; returns the operations flagged at the top rung."""
+    operations = ["partition", *result["rungs"][0]["rollups"]]
+    print(f"{'operation':<24}{'records':>10}{'ms':>11}{'alloc MiB':>11}{'gc':>6}{'growth':>8}")
+    flagged = []
+    for operation in operations:
+        for index, rung in enumerate(result["rungs"]):
+            m = rung["partition"] if operation == "partition" else rung["rollups"][operation]
+            growth = m.get("growth")
+            mark = " ⚠️" if growth is not None and growth >= threshold else ""
+            label = operation if index == 0 else ""
+            records = rung["projects"] + rung["entries"]
+            print(f"{label:<24}{records:>10,}{m['ms']:>11,.1f}{m['allocatedMb']:>11,.1f}{m['gcCount']:>6}"
+                  f"{'—' if growth is None else f'{growth:.2f}':>8}{mark}")
+        top = result["rungs"][-1]
+        growth = (top["partition"] if operation == "partition" else top["rollups"][operation]).get("growth")
+        if growth is not None and growth >= threshold:
+            flagged.append(operation)
+    return flagged
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# MAIN EXECUTION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point."""
+    args = parser.parse_args(argv)
+    Path(args.workdir).mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+
+    vault = ensure_vault(args)
+    out = Path(args.out or Path(args.workdir) / f"{vault.name}.rollups-result.json")
+    result = run_suite(vault, out, args)
+
+    top = result["rungs"][-1]
+
+    # Summary
+    print(f"\n{'═' * 50}")
+    print(f"✨ {len(result['rungs'])} rungs up to {top['projects']:,} projects / {top['entries']:,} entries "
+          f"in {time.perf_counter() - started:.1f}s")
+    print(f"{'═' * 50}")
+    flagged = print_ladder(result, args.quadratic_threshold)
+    print(f"{'─' * 50}")
+    sizes = top["partition"]["sizes"]
+    print(f"🧩 Partitions: {', '.join(f'{k} {v:,}' for k, v in sorted(sizes.items(), key=lambda kv: -kv[1]))}")
+    if flagged:
+        print(f"⚠️  Growth ≥ {args.quadratic_threshold} at the top rung: {', '.join(flagged)}")
+    else:
+        print(f"✅ No operation grows faster than n^{args.quadratic_threshold}")
+    print(f"🗂️  Results: {out}")
+    print(f"{'═' * 50}")
+    return 1 if flagged and args.fail_on_quadratic else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+═══════════════════════════════════════════════════════════════════════════════
+  Projects Plus Soak Benchmark
+
+  Generates a --relations vault with generate-test-files.py (Projects, Team
+  and Clients notes linked by [[wikilinks]]) and runs
+  src/__tests__/performance/soak.test.ts on it for a fixed time: one
+  long-lived session under a seeded stream of edits, renames, deletes,
+  creates and link retargets (the op mix of the generator's mutate command)
+  with dashboard view queries in between. The retained heap (after a full
+  GC), the transform cache, the inverse-relation index and the metadata-cache
+  listeners are sampled at fixed op intervals.
+
+  Prints the time series and a trend per metric over the samples after the
+  warm-up. Exits non-zero when the retained heap or a cache keeps growing by
+  more than --growth-limit of its level (unless --report-only).
+
+  Usage:
+    python bench-soak.py [--size 20000] [--minutes 120] [options]
+
+  Examples:
+    python bench-soak.py --size 5000 --minutes 10
+    python bench-soak.py --size 50000 --minutes 240 --sample-ops 2000 --csv soak.csv
+    python bench-soak.py --mix edit=0.2,rename=0.4,create=0.2,delete=0.2 --report-only
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import argparse
+import csv
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import bench_common
+from bench_common import ROOT
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CONFIGURATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+SUITE = "src/__tests__/performance/soak.test.ts"
+
+
+# Trended metrics, as named in the suite's results, with their labels
+METRICS = {
+    "heapUsedMb": "Retained heap (MB)",
+    "transformCache": "Transform cache entries",
+    "entriesPerNote": "Inverse-index entries per note",
+    "listeners": "Metadata-cache listeners",
+}
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ARGUMENT PARSING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+parser = argparse.ArgumentParser(
+    prog="bench-soak",
+    description="Hours of seeded edits and view queries, watching the heap and session caches for growth.",
+    formatter_class=argparse.RawDescriptionHelpFormatter,
+)
+parser.add_argument(
+    "--size",
+    type=int,
+    default=20_000,
+    help="Vault size (default: 20000)",
+)
+parser.add_argument(
+    "--minutes",
+    type=float,
+    default=120,
+    help="How long the session runs (default: 120)",
+)
+parser.add_argument(
+    "--ops",
+    type=int,
+    help="Stop after this many ops even if --minutes is not over",
+)
+parser.add_argument(
+    "--workdir",
+    default=str(ROOT / ".bench"),
+    help="Where generated vaults are cached (default: .bench/)",
+)
+parser.add_argument(
+    "--seed",
+    type=int,
+    default=42,
+    help="Generator and op-stream seed (default: 42)",
+)
+parser.add_argument(
+    "--mix",
+    help="Op weights as op=weight,... (default: the generator's mutate mix)",
+)
+parser.add_argument(
+    "--sample-ops",
+    type=int,
+    default=500,
+    help="Ops between two samples (default: 500)",
+)
+parser.add_argument(
+    "--query-every",
+    type=int,
+    default=10,
+    help="Ops between two view queries (default: 10)",
+)
+parser.add_argument(
+    "--warmup",
+    type=float,
+    default=0.25,
+    help="Share of the samples left out of the trends (default: 0.25)",
+)
+parser.add_argument(
+    "--growth-limit",
+    type=float,
+    default=0.1,
+    help="Trend rise over the measured window, relative to its mean, from which a metric is unbounded (default: 0.1)",
+)
+parser.add_argument(
+    "--report-only",
+    action="store_true",
+    help="Exit zero even when a metric grows without bound",
+)
+parser.add_argument(
+    "--rows",
+    type=int,
+    default=24,
+    help="Samples printed from the time series (default: 24)",
+)
+parser.add_argument(
+    "--csv",
+    help="Also write every sample to this CSV file",
+)
+parser.add_argument(
+    "--out",
+    help="Results JSON (default: <workdir>/<vault>.soak-result.json)",
+)
+parser.add_argument(
+    "--node-heap-mb",
+    type=int,
+    default=8192,
+    help="--max-old-space-size for the Jest process (default: 8192)",
+)
+parser.add_argument(
+    "--regenerate",
+    action="store_true",
+    help="Regenerate the vault even if a matching cached one exists",
+)
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# VAULT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def ensure_vault(args: argparse.Namespace) -> Path:
+    """Generate (or reuse) the linked vault the session starts from."""
+    options = ["--seed", str(args.seed), "--yaml-backend", "fast", "-n", str(args.size), "--relations"]
+    name = f"soak-{args.size}-s{args.seed}"
+    return bench_common.ensure_vault(
+        Path(args.workdir) / name, options, f"{args.size:,} linked notes", args.regenerate,
+    )
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# JEST RUN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def run_suite(vault: Path, out: Path, args: argparse.Namespace) -> Dict[str, Any]:
+    """Run the soak suite under Jest and return its time series and trends."""
+    env = dict(
+        PP_BENCH_VAULT=str(vault.resolve()),
+        PP_BENCH_SOAK_MINUTES=str(args.minutes),
+        PP_BENCH_SAMPLE_OPS=str(args.sample_ops),
+        PP_BENCH_QUERY_EVERY=str(args.query_every),
+        PP_BENCH_SEED=str(args.seed),
+        PP_BENCH_WARMUP=str(args.warmup),
+        PP_BENCH_GROWTH_LIMIT=str(args.growth_limit),
+    )
+    if args.ops:
+        env["PP_BENCH_SOAK_OPS"] = str(args.ops)
+    if args.mix:
+        env["PP_BENCH_MIX"] = args.mix
+    return bench_common.run_suite(SUITE, out, env, args.node_heap_mb)["soak"]
+
+
+def print_series(samples: List[Dict[str, Any]], rows: int) -> None:
+    """Up to ``rows`` evenly spaced samples, always including the first and the last."""
+    step = max(1, -(-(len(samples) - 1) // max(rows - 1, 1)))
+    shown = samples[::step]
+    if shown[-1] is not samples[-1]:
+        shown.append(samples[-1])
+    print(f"{'min':>8}{'ops':>10}{'notes':>9}{'heap MB':>10}{'rss MB':>9}"
+          f"{'cache':>7}{'hit %':>7}{'targets':>9}{'ent/note':>10}{'lstn':>6}")
+    for sample in shown:
+        lookups = sample["transformHits"] + sample["transformMisses"]
+        hits = f"{100 * sample['transformHits'] / lookups:.0f}" if lookups else "—"
+        print(f"{sample['t'] / 60:>8.1f}{sample['ops']:>10,}{sample['notes']:>9,}{sample['heapUsedMb']:>10,.1f}"
+              f"{sample['rssMb']:>9,.0f}{sample['transformCache']:>7}{hits:>7}{sample['indexTargets']:>9,}"
+              f"{sample['entriesPerNote']:>10.3f}{sample['listeners']:>6}")
+
+
+def write_csv(path: Path, samples: List[Dict[str, Any]]) -> None:
+    """Every sample as one CSV row, with the suite's metric names as headers."""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(samples[0]))
+        writer.writeheader()
+        writer.writerows(samples)
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# MAIN EXECUTION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point."""
+    args = parser.parse_args(argv)
+    Path(args.workdir).mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+
+    vault = ensure_vault(args)
+    out = Path(args.out or Path(args.workdir) / f"{vault.name}.soak-result.json")
+    result = run_suite(vault, out, args)
+    samples = result["samples"]
+    if args.csv:
+        write_csv(Path(args.csv), samples)
+
+    # Summary
+    applied = result["applied"]
+    print(f"\n{'═' * 50}")
+    print(f"✨ {result['ops']:,} ops ({', '.join(f'{applied[op]:,} {op}' for op in applied)}) and "
+          f"{result['views']:,} views over {result['elapsedS'] / 60:.1f} min in {time.perf_counter() - started:.1f}s")
+    print(f"{'═' * 50}")
+    print_series(samples, args.rows)
+    print(f"{'─' * 50}")
+    if not result["gcExposed"]:
+        print("⚠️  Node ran without --expose-gc, so the heap was sampled without a full GC")
+    for metric, label in METRICS.items():
+        trend = result["growth"][metric]
+        if trend is None:
+            print(f"⚠️  {label}: too few samples after the warm-up for a trend")
+            continue
+        mark = "⚠️ " if trend["unbounded"] else "✅"
+        print(f"{mark} {label}: {trend['first']:,} → {trend['last']:,} (max {trend['max']:,}), "
+              f"{trend['perKiloOps']:+,.4f} per 1k ops, {trend['growth']:+.1%} over the window")
+    unbounded = result["unbounded"]
+    if unbounded:
+        print(f"⚠️  Growing past {args.growth_limit:.0%} of their level: "
+              f"{', '.join(METRICS.get(metric, metric) for metric in unbounded)}")
+    else:
+        print(f"✅ Heap and caches stay within {args.growth_limit:.0%} of their level")
+    print(f"🗂️  Results: {out}")
+    if args.csv:
+        print(f"📈 Time series: {args.csv}")
+    print(f"{'═' * 50}")
+    return 1 if unbounded and not args.report_only else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
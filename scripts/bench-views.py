@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+═══════════════════════════════════════════════════════════════════════════════
+  Projects Plus Table & Board Frame-Budget Benchmark
+
+  Generates a vault with generate-test-files.py --view-workload (long,
+  variable-height cards over hundreds of Board columns, plus scroll traces)
+  and replays the traces under Jest (src/__tests__/performance/views.test.ts):
+  Table scrolling through computeVirtualScroll and Board panning through the
+  getColumns grouping. Prints per-frame compute time against the 16 ms
+  budget for every trace, the rows clipped by the fixed row height and the
+  cost of getColumns as the column count grows.
+
+  Usage:
+    python bench-views.py [--size 50000] [options]
+
+  Examples:
+    python bench-views.py --size 5000 --columns 100
+    python bench-views.py --preset board-wide-50k --density compact
+    python bench-views.py --size 50000 --columns 600 --edit-every 10 --fail-on-budget
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import bench_common
+from bench_common import ROOT
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CONFIGURATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+SUITE = "src/__tests__/performance/views.test.ts"
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ARGUMENT PARSING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+parser = argparse.ArgumentParser(
+    prog="bench-views",
+    description="Per-frame Table scroll and Board grouping cost against a 16 ms budget.",
+    formatter_class=argparse.RawDescriptionHelpFormatter,
+)
+parser.add_argument(
+    "--size",
+    type=int,
+    default=50_000,
+    help="Vault size (default: 50000)",
+)
+parser.add_argument(
+    "--workdir",
+    default=str(ROOT / ".bench"),
+    help="Where generated vaults are cached (default: .bench/)",
+)
+parser.add_argument(
+    "--seed",
+    type=int,
+    default=42,
+    help="Generator seed (default: 42)",
+)
+parser.add_argument(
+    "--preset",
+    help="Generator scale profile (see scripts/profiles/)",
+)
+parser.add_argument(
+    "--columns",
+    type=int,
+    help="Board columns (generator default: 300)",
+)
+parser.add_argument(
+    "--column-skew",
+    type=float,
+    help="Zipf exponent of cards per column (generator default: 1.0)",
+)
+parser.add_argument(
+    "--title-words",
+    type=int,
+    help="Median title length in words (generator default: 14)",
+)
+parser.add_argument(
+    "--frames",
+    type=int,
+    help="60 Hz frames per scroll trace (generator default: 600)",
+)
+parser.add_argument(
+    "--density",
+    choices=["compact", "default", "expanded"],
+    default="default",
+    help="Table row density (default: default)",
+)
+parser.add_argument(
+    "--edit-every",
+    type=int,
+    default=30,
+    help="Board frames between card moves; 0 = never (default: 30)",
+)
+parser.add_argument(
+    "--repeat",
+    type=int,
+    default=3,
+    help="Runs per getColumns rung; the median is reported (default: 3)",
+)
+parser.add_argument(
+    "--fail-on-budget",
+    action="store_true",
+    help="Exit non-zero when any trace's p95 frame exceeds the budget",
+)
+parser.add_argument(
+    "--out",
+    help="Results JSON (default: <workdir>/<vault>.views-result.json)",
+)
+parser.add_argument(
+    "--node-heap-mb",
+    type=int,
+    default=8192,
+    help="--max-old-space-size for the Jest process (default: 8192)",
+)
+parser.add_argument(
+    "--regenerate",
+    action="store_true",
+    help="Regenerate the vault even if a matching cached one exists",
+)
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# VAULT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def ensure_vault(args: argparse.Namespace) -> Path:
+    """Generate (or reuse) the vault and its view workload."""
+    options = ["--seed", str(args.seed), "--yaml-backend", "fast", "--view-workload"]
+    if args.preset:
+        options += ["--preset", args.preset]
+    else:
+        options += ["-n", str(args.size)]
+    for flag, value in (
+        ("--board-columns", args.columns),
+        ("--column-skew", args.column_skew),
+        ("--title-words", args.title_words),
+        ("--scroll-frames", args.frames),
+    ):
+        if value is not None:
+            options += [flag, str(value)]
+    name = f"views-{args.preset or args.size}-s{args.seed}"
+    vault = Path(args.workdir) / name
+    return bench_common.ensure_vault(
+        vault, options, args.preset or f"{args.size:,} cards", args.regenerate,
+        requires=[vault.with_name(f"{name}.views.json")],
+    )
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# JEST RUN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def run_suite(vault: Path, out: Path, args: argparse.Namespace) -> Dict[str, Any]:
+    """Replay the scroll traces under Jest and return the suite's measurements."""
+    env = dict(
+        PP_BENCH_VAULT=str(vault.resolve()),
+        PP_BENCH_CORPUS=str(vault.with_name(f"{vault.name}.views.json").resolve()),
+        PP_BENCH_DENSITY=args.density,
+        PP_BENCH_EDIT_EVERY=str(args.edit_every),
+        PP_BENCH_REPEAT=str(args.repeat),
+    )
+    return bench_common.run_suite(SUITE, out, env, args.node_heap_mb)["views"]
+
+
+def print_traces(traces: List[Dict[str, Any]], budget: float) -> List[str]:
+    """One line per replayed trace; returns those whose p95 misses ``budget``."""
+    print(f"{'trace':<14}{'frames':>8}{'p50':>8}{'p95':>8}{'p99':>8}{'max':>9}{'>16ms':>7}")
+    missed = []
+    for trace in traces:
+        mark = ""
+        if trace["p95Ms"] > budget:
+            missed.append(trace["name"])
+            mark = " ⚠️"
+        print(f"{trace['name']:<14}{trace['frames']:>8}{trace['p50Ms']:>8.2f}{trace['p95Ms']:>8.2f}"
+              f"{trace['p99Ms']:>8.2f}{trace['maxMs']:>9.2f}{trace['overBudget']:>7}{mark}")
+    return missed
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# MAIN EXECUTION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point."""
+    args = parser.parse_args(argv)
+    Path(args.workdir).mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+
+    vault = ensure_vault(args)
+    out = Path(args.out or Path(args.workdir) / f"{vault.name}.views-result.json")
+    result = run_suite(vault, out, args)
+
+    table = result["table"]
+    board = result["board"]
+    pan = {"name": "board-pan", **board["pan"]}
+    ladder = ", ".join(
+        f"{rung['columns']} → {rung['ms']:,.1f} ms" + (f" (n^{rung['growth']})" if rung["growth"] is not None else "")
+        for rung in board["getColumns"]
+    )
+    clipped = max((trace["clippedShare"] for trace in table["traces"]), default=0)
+    drift = table["contentHeightPx"] / table["fixedHeightPx"] if table["fixedHeightPx"] else 0
+
+    # Summary
+    print(f"\n{'═' * 50}")
+    print(f"✨ {result['records']:,} cards · {board['columns']} columns · {result['density']} rows "
+          f"({result['rowHeight']} px) in {time.perf_counter() - started:.1f}s")
+    print(f"{'═' * 50}")
+    missed = print_traces(table["traces"] + [pan], result["budgetMs"])
+    print(f"{'─' * 50}")
+    print(f"📏 Rows clipped by the fixed height: up to {clipped:.0%} · content needs {drift:.1f}× the fixed height")
+    print(f"🗃️  getColumns: {ladder}")
+    print(f"🃏 Board: {pan['edits']} regroups · largest column {board['largestColumn']:,} cards"
+          f" · {pan['meanWindowedCards']:,} windowed of {pan['renderedCards']:,} rendered")
+    if missed:
+        print(f"⚠️  p95 over {result['budgetMs']} ms: {', '.join(missed)}")
+    else:
+        print(f"✅ Every trace's p95 frame fits in {result['budgetMs']} ms")
+    print(f"🗂️  Results: {out}")
+    print(f"{'═' * 50}")
+    return 1 if missed and args.fail_on_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
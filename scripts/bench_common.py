@@ -0,0 +1,125 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+  Shared plumbing for the scripts/bench-*.py runners
+
+  Every runner generates (or reuses) an input with generate-test-files.py
+  and runs one suite of src/__tests__/performance under Jest. The parts that
+  do not depend on the benchmark live here: paths, the generation marker,
+  vault generation and the Jest invocation.
+
+  A generated input is reused only while its marker matches the generator
+  options, the generator source (by hash) and the pinned generation date, so
+  a vault written by an older generator or on an earlier day is rebuilt.
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CONFIGURATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+SCRIPTS = Path(__file__).resolve().parent
+ROOT = SCRIPTS.parent
+GENERATOR = SCRIPTS / "generate-test-files.py"
+JEST = ROOT / "node_modules" / "jest" / "bin" / "jest.js"
+JEST_CONFIG = "jest.performance.config.js"
+
+# Marker written into a vault once generation finished
+VAULT_MARKER = ".bench-vault.json"
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# GENERATION MARKERS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def generator_hash() -> str:
+    """SHA-256 of the generator source; any change to it invalidates inputs."""
+    return hashlib.sha256(GENERATOR.read_bytes()).hexdigest()
+
+
+def run_date() -> str:
+    """The date generated inputs are pinned to, as the generator picks it.
+
+    SOURCE_DATE_EPOCH when set, else the wall clock.
+    """
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if epoch:
+        return datetime.datetime.fromtimestamp(int(epoch), datetime.timezone.utc).date().isoformat()
+    return datetime.date.today().isoformat()
+
+
+def stamp(options: List[str], dated: bool = True) -> Dict[str, Any]:
+    """What a marker records: options (seed included), generator hash and date."""
+    return {"options": options, "generator": generator_hash(), "today": run_date() if dated else None}
+
+
+def is_current(marker: Path, expected: Dict[str, Any], requires: Sequence[Path] = ()) -> bool:
+    """Whether ``marker`` records ``expected`` and every path in ``requires`` exists."""
+    if not marker.is_file() or not all(path.exists() for path in requires):
+        return False
+    try:
+        return json.loads(marker.read_text(encoding="utf-8")) == expected
+    except ValueError:
+        return False
+
+
+def write_marker(marker: Path, expected: Dict[str, Any]) -> None:
+    marker.write_text(json.dumps(expected), encoding="utf-8")
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# VAULTS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def ensure_vault(
+    vault: Path,
+    options: List[str],
+    label: str,
+    regenerate: bool = False,
+    manifest: Optional[Path] = None,
+    requires: Sequence[Path] = (),
+) -> Path:
+    """Generate ``vault`` with generator ``options``, or reuse a current one.
+
+    ``requires`` lists side files (workloads, settings) that must exist for
+    reuse; with ``manifest`` the run also writes an NDJSON manifest there.
+    Generation is pinned to run_date() with --today.
+    """
+    marker = vault / VAULT_MARKER
+    expected = stamp(options)
+    if not regenerate and is_current(marker, expected, [*requires, *([manifest] if manifest else [])]):
+        return vault
+
+    print(f"🏗️  Generating {label} → {vault}")
+    outputs = ["--manifest-format", "ndjson", "--manifest", str(manifest)] if manifest else ["--manifest-format", "none"]
+    command = [
+        sys.executable, str(GENERATOR), str(vault), *options,
+        "--today", expected["today"], "--clear", "--workers", "0", *outputs,
+    ]
+    subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+    write_marker(marker, expected)
+    return vault
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# JEST RUN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def run_suite(suite: str, out: Path, env: Dict[str, str], node_heap_mb: int) -> Dict[str, Any]:
+    """Run one performance suite under Jest; returns the results JSON it wrote to ``out``.
+
+    ``env`` holds the suite's PP_BENCH_* inputs; PP_BENCH_OUT is set here.
+    """
+    if out.exists():
+        out.unlink()
+    command = [
+        "node", "--expose-gc", f"--max-old-space-size={node_heap_mb}", str(JEST),
+        "--config", JEST_CONFIG, "--runInBand", "--runTestsByPath", suite,
+    ]
+    subprocess.run(command, check=True, cwd=ROOT, env=dict(os.environ, **env, PP_BENCH_OUT=str(out.resolve())))
+    return json.loads(out.read_text(encoding="utf-8"))
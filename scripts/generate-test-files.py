@@ -20,13 +20,67 @@
 """
 
 import random
+import re
+import shutil
 import string
 import argparse
+import bisect
+import copy
+import cProfile
+import csv
+import hashlib
+import io
+import json
+import marshal
+import math
+import multiprocessing
 import os
+import pstats
+import sys
+import tarfile
+import time
+import tracemalloc
+import unicodedata
+import uuid
+import zipfile
 import yaml
 import datetime
+import errno
+from itertools import accumulate
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, TextIO, Tuple, Callable, Set
+
+try:
+    import resource  # POSIX only; peak RSS is skipped on Windows
+except ImportError:  # pragma: no cover
+    resource = None
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # optional: manifests fall back to NDJSON
+    pyarrow = None
+
+try:
+    import numpy as np
+except ImportError:  # optional: the oracle and --sampler numpy need it
+    np = None
+
+try:
+    import tomllib  # Python 3.11+; TOML scale profiles only
+except ImportError:  # pragma: no cover
+    tomllib = None
+
+try:
+    import fcntl  # POSIX only; reflinks in the generation cache
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+try:
+    import zstandard
+except ImportError:  # optional: only --archive *.tar.zst needs it
+    zstandard = None
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CONFIGURATION
@@ -122,6 +176,26 @@ ATTENDEES = [
     "Лариса", "Михаил", "Наталья", "Олег", "Полина",
 ]
 
+CLIENT_NAMES = [
+    "Acme Corp", "Globex Industries", "Initech Solutions", "Stark Dynamics",
+    "Umbrella Systems", "Wayne Holdings", "Ромашка", "Вектор Групп",
+]
+
+PERSON_ROLES = [
+    "Backend Developer", "Frontend Developer", "Designer", "QA Engineer",
+    "Product Manager", "DevOps Engineer", "Analyst", "Team Lead",
+]
+
+DEPARTMENTS = ["Engineering", "Design", "Product", "Operations", "Sales"]
+
+# Folder per entity in --relations and --rollup-workload modes (mirrors demo-vault layout)
+RELATION_FOLDERS = {
+    "person": "Team",
+    "client": "Clients",
+    "project": "Projects",
+    "entry": "Ledger",
+}
+
 TAGS_POOL = {
     "task": ["task", "todo", "work", "dev"],
     "event": ["event", "calendar", "meeting"],
@@ -129,6 +203,9 @@ TAGS_POOL = {
     "meeting": ["meeting", "sync", "call"],
     "personal": ["personal", "life", "home"],
 }
+EXTRA_TAGS = ["urgent", "important", "low-priority", "blocked", "review"]
+PROGRESS_STEPS = [0, 10, 25, 33, 50, 66, 75, 80, 90, 100]
+HOUR_DURATIONS = [1, 1, 1, 2, 2, 3, 4, 8]
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # ARGUMENT PARSING
@@ -144,6 +221,24 @@ Examples:
   python generate-test-files.py ./demo -n 20 --type calendar --with-overdue
   python generate-test-files.py ./demo -n 30 --type board --realistic
   python generate-test-files.py ./demo -n 100 --type mixed --date-range 90
+  python generate-test-files.py ./bench -n 500000 --seed 42 --workers 0 --manifest-format none
+  python generate-test-files.py ./graph -n 100000 --relations --fan-dist hub --fan-out 8
+  python generate-test-files.py ./bench -n 200000 --workers 0 --archive bench.tar.zst
+  python generate-test-files.py ./cal -n 20000 --calendar-workload --hot-days 5 --hot-day-events 500
+  python generate-test-files.py ./ledger -n 100000 --rollup-workload --sub-bases 8 --project-skew 1.3
+  python generate-test-files.py ./ledger -n 20000 --rollup-workload --formulas 24 --formula-depth 4
+  python generate-test-files.py ./board -n 50000 --view-workload --board-columns 400 --column-skew 0.8
+  python generate-test-files.py ./work -n 100000 --query-workload --query-tasks 5 --query-selectivity 0.001 0.1
+  python generate-test-files.py ./org -n 100000 --multi-project 200 --cross-project-rate 0.3 --project-size-skew 1.2
+  python generate-test-files.py ./pkm --preset large-pkm-200k --seed 1 --workers 0
+  python generate-test-files.py ./fixture -n 5000 --seed 1 --today 2025-01-15 --cache ~/.cache/pp-fixtures
+  python generate-test-files.py ./bench -n 100000 --seed 1 --profile gen-profile.json --profile-speedscope gen.speedscope.json
+  python generate-test-files.py verify-yaml -n 5000 --seed 1
+  python generate-test-files.py mutate ./graph --ops 5000 --rate 100 --seed 7
+  python generate-test-files.py oracle ./graph.manifest.ndjson queries.json -o expected.json
+  python generate-test-files.py filter-corpus ./bench.manifest.ndjson --selectivity 0.001 0.1 0.9
+  python generate-test-files.py verify-export ./bench.manifest.ndjson ./export.csv
+  python generate-test-files.py link-corpus -o links.json --notes 50000 --values 200000 --vault ./links
 
 Types:
   all       - Generate all types of records
@@ -158,8 +253,7 @@ parser.add_argument("output", help="Output folder for generated Markdown files."
 parser.add_argument(
     "-n", "--numfiles",
     type=int,
-    required=True,
-    help="Number of files to generate.",
+    help="Number of files to generate (required unless --preset sets a count).",
 )
 parser.add_argument(
     "-t", "--type",
@@ -191,28 +285,552 @@ parser.add_argument(
 parser.add_argument(
     "--clear",
     action="store_true",
-    help="Clear output folder before generating",
+    help="Clear output folder before generating (required when it holds notes of an earlier run)",
+)
+parser.add_argument(
+    "--preset",
+    help="Scale profile: a name from scripts/profiles/ or a .yaml/.toml path. "
+         "Profile values become defaults; explicit flags still win.",
 )
 parser.add_argument(
     "--seed",
     type=int,
     help="Random seed for reproducible generation",
 )
+parser.add_argument(
+    "--today",
+    type=datetime.date.fromisoformat,
+    help="Pin the date all dates are relative to, YYYY-MM-DD "
+         "(default: the SOURCE_DATE_EPOCH date if set, else today)",
+)
+parser.add_argument(
+    "-w", "--workers",
+    type=int,
+    default=1,
+    help="Worker processes for writing files (0 = all CPUs, default: 1). "
+         "Output for a given --seed is identical for any worker count.",
+)
+parser.add_argument(
+    "--sampler",
+    choices=["python", "numpy"],
+    default="python",
+    help="Record sampling engine: python (per-record random calls) or numpy "
+         "(whole columns per shard; needs numpy, same distributions, different stream)",
+)
+parser.add_argument(
+    "--yaml-backend",
+    choices=["pyyaml", "fast"],
+    default="fast",
+    help="Frontmatter serializer: fast (specialised emitter, default; parses "
+         "identically to pyyaml, see verify-yaml) or pyyaml (reference, about 3x slower)",
+)
+parser.add_argument(
+    "--manifest",
+    help="Record manifest path (default: <output>.manifest.ndjson or .parquet)",
+)
+parser.add_argument(
+    "--manifest-format",
+    choices=["auto", "ndjson", "parquet", "none"],
+    default="auto",
+    help="Manifest format; auto = parquet when pyarrow is installed (default: auto)",
+)
+parser.add_argument(
+    "--archive",
+    help="Write the vault as a single .tar[.gz|.bz2|.xz|.zst] or .zip archive "
+         "instead of loose files (members are relative to the vault root)",
+)
 parser.add_argument(
     "-v", "--verbose",
     action="store_true",
     help="Verbose output",
 )
 
-args = parser.parse_args()
+relations_group = parser.add_argument_group(
+    "relations",
+    "Linked Projects/Team/Clients folders for inverse-index and rollup benchmarks",
+)
+relations_group.add_argument(
+    "--relations",
+    action="store_true",
+    help="Generate Projects, Team and Clients folders linked by [[wikilinks]]",
+)
+relations_group.add_argument(
+    "--people",
+    type=int,
+    help="Number of Team notes (default: 10%% of --numfiles)",
+)
+relations_group.add_argument(
+    "--clients",
+    type=int,
+    help="Number of Clients notes (default: 5%% of --numfiles)",
+)
+relations_group.add_argument(
+    "--fan-dist",
+    choices=["uniform", "zipf", "hub"],
+    default="zipf",
+    help="How link targets are chosen, i.e. the fan-in shape (default: zipf)",
+)
+relations_group.add_argument(
+    "--zipf-s",
+    type=float,
+    default=1.1,
+    help="Zipf exponent for --fan-dist zipf (default: 1.1)",
+)
+relations_group.add_argument(
+    "--hub-fraction",
+    type=float,
+    default=0.01,
+    help="Share of targets acting as hubs for --fan-dist hub (default: 0.01)",
+)
+relations_group.add_argument(
+    "--hub-weight",
+    type=float,
+    default=0.8,
+    help="Share of links that land on hubs for --fan-dist hub (default: 0.8)",
+)
+relations_group.add_argument(
+    "--fan-out",
+    type=int,
+    default=5,
+    help="Maximum length of list-valued relation fields (default: 5)",
+)
+relations_group.add_argument(
+    "--dangling-rate",
+    type=float,
+    default=0.02,
+    help="Probability that a link points to a note that does not exist (default: 0.02)",
+)
+relations_group.add_argument(
+    "--cycle-rate",
+    type=float,
+    default=0.05,
+    help="Share of project pairs that depend on each other (default: 0.05)",
+)
+
+cache_group = parser.add_argument_group(
+    "generation cache",
+    "Reuse outputs of identical runs (same options, profile, --seed and script version)",
+)
+cache_group.add_argument(
+    "--cache",
+    default=os.environ.get("PP_GEN_CACHE"),
+    help="Cache directory (default: $PP_GEN_CACHE; off when unset). Needs --seed",
+)
+cache_group.add_argument(
+    "--cache-max-mb",
+    type=float,
+    default=4096,
+    help="Evict least recently used entries beyond this size (default: 4096)",
+)
+cache_group.add_argument(
+    "--cache-mode",
+    choices=["auto", "reflink", "hardlink", "copy"],
+    default="auto",
+    help="How files move in and out of the cache; auto = reflink, else hardlink, "
+         "else copy. Never edit hardlinked files in place (default: auto)",
+)
+
+calendar_group = parser.add_argument_group(
+    "calendar workload",
+    "Worst-case densities for the Calendar view, indexed by date into "
+    "<output>.calendar.json (rates are shares of --numfiles)",
+)
+calendar_group.add_argument(
+    "--calendar-workload",
+    action="store_true",
+    help="Generate the calendar workload instead of --type records",
+)
+calendar_group.add_argument(
+    "--day-skew",
+    type=float,
+    default=1.0,
+    help="Zipf exponent of events per day over --date-range; 0 = uniform (default: 1.0)",
+)
+calendar_group.add_argument(
+    "--weekend-factor",
+    type=float,
+    default=0.3,
+    help="Weight of Saturdays and Sundays relative to weekdays (default: 0.3)",
+)
+calendar_group.add_argument(
+    "--hot-days",
+    type=int,
+    default=3,
+    help="Days that get --hot-day-events overlapping timed events (default: 3)",
+)
+calendar_group.add_argument(
+    "--hot-day-events",
+    type=int,
+    default=300,
+    help="Timed events on each hot day, scaled down so hot days take at most half the notes (default: 300)",
+)
+calendar_group.add_argument(
+    "--long-span-rate",
+    type=float,
+    default=0.05,
+    help="Events spanning 4-17 weeks across month boundaries (default: 0.05)",
+)
+calendar_group.add_argument(
+    "--recurrence-rate",
+    type=float,
+    default=0.1,
+    help="Events with an RFC 5545 recurrence rule (default: 0.1)",
+)
+calendar_group.add_argument(
+    "--dst-rate",
+    type=float,
+    default=0.02,
+    help="Events in the skipped/repeated hour of a DST transition (default: 0.02)",
+)
+calendar_group.add_argument(
+    "--overdue-rate",
+    type=float,
+    default=0.1,
+    help="Unfinished tasks due in the past (default: 0.1)",
+)
+calendar_group.add_argument(
+    "--undated-rate",
+    type=float,
+    default=0.05,
+    help="Tasks without any date (default: 0.05)",
+)
+calendar_group.add_argument(
+    "--calendar-index",
+    help="Date index path (default: <output>.calendar.json)",
+)
+
+rollup_group = parser.add_argument_group(
+    "rollup workload",
+    "Projects with skewed ledgers for sub-base partition and cross-project rollup benchmarks",
+)
+rollup_group.add_argument(
+    "--rollup-workload",
+    action="store_true",
+    help="Generate Projects and Ledger folders instead of --type records",
+)
+rollup_group.add_argument(
+    "--rollup-projects",
+    type=int,
+    help="Number of Projects notes; the rest are Ledger entries (default: 0.5%% of --numfiles)",
+)
+rollup_group.add_argument(
+    "--project-skew",
+    type=float,
+    default=1.1,
+    help="Zipf exponent of ledger entries per project; 0 = even (default: 1.1)",
+)
+rollup_group.add_argument(
+    "--sub-bases",
+    type=int,
+    default=6,
+    help="Distinct entry types to partition on (default: 6)",
+)
+rollup_group.add_argument(
+    "--partition-skew",
+    type=float,
+    default=1.2,
+    help="Zipf exponent of entries per type; 0 = even partitions (default: 1.2)",
+)
+rollup_group.add_argument(
+    "--rollup-max-links",
+    type=int,
+    default=1000,
+    help="Longest entries list on a project, as capped by the resolver (default: 1000)",
+)
+rollup_group.add_argument(
+    "--rollup-null-rate",
+    type=float,
+    default=0.05,
+    help="Entries missing one of amount, hours or date (default: 0.05)",
+)
+
+formula_group = parser.add_argument_group(
+    "formula workload",
+    "Formula fields and dashboard pipelines over the generated fields, for dashboard-engine profiling",
+)
+formula_group.add_argument(
+    "--formulas",
+    type=int,
+    default=0,
+    help="Formula fields to write to <output>.formulas.json (default: 0 = none)",
+)
+formula_group.add_argument(
+    "--formula-depth",
+    type=int,
+    default=3,
+    help="Levels of nested function calls per formula (default: 3)",
+)
+formula_group.add_argument(
+    "--formula-fan-in",
+    type=int,
+    default=2,
+    help="Arguments of variadic calls such as MAX, JOIN, AND and sums (default: 2)",
+)
+formula_group.add_argument(
+    "--formula-mix",
+    default="math=1,date=1,string=1,rollup=1,logic=1",
+    help="Function family weights (default: math=1,date=1,string=1,rollup=1,logic=1)",
+)
+formula_group.add_argument(
+    "--formula-chain-rate",
+    type=float,
+    default=0.2,
+    help="Leaves that reference an earlier formula instead of a field (default: 0.2)",
+)
+formula_group.add_argument(
+    "--formula-widgets",
+    type=int,
+    default=4,
+    help="Dashboard widgets computing the formulas, round-robin (default: 4)",
+)
+formula_group.add_argument(
+    "--formulas-file",
+    help="Formula workload path (default: <output>.formulas.json)",
+)
+
+view_group = parser.add_argument_group(
+    "view workload",
+    "Wide boards and long, variable-height cards for Table and Board rendering benchmarks",
+)
+view_group.add_argument(
+    "--view-workload",
+    action="store_true",
+    help="Generate task cards for view rendering instead of --type records",
+)
+view_group.add_argument(
+    "--board-columns",
+    type=int,
+    default=300,
+    help="Distinct status values, i.e. Board columns (default: 300)",
+)
+view_group.add_argument(
+    "--column-skew",
+    type=float,
+    default=1.0,
+    help="Zipf exponent of cards per column; 0 = even columns (default: 1.0)",
+)
+view_group.add_argument(
+    "--title-words",
+    type=int,
+    default=14,
+    help="Median title length in words (default: 14)",
+)
+view_group.add_argument(
+    "--view-tags",
+    type=int,
+    default=8,
+    help="Mean extra tags per card (default: 8)",
+)
+view_group.add_argument(
+    "--description-lines",
+    type=float,
+    default=3.0,
+    help="Mean lines of the multi-line description; 0 = none (default: 3)",
+)
+view_group.add_argument(
+    "--scroll-frames",
+    type=int,
+    default=600,
+    help="60 Hz frames per scroll trace (default: 600)",
+)
+view_group.add_argument(
+    "--views-file",
+    help="View workload path (default: <output>.views.json)",
+)
+
+query_group = parser.add_argument_group(
+    "query workload",
+    "Projects and items with inline fields and annotated tasks, plus a native and Dataview query suite",
+)
+query_group.add_argument(
+    "--query-workload",
+    action="store_true",
+    help="Generate projects and work items for query benchmarks instead of --type records",
+)
+query_group.add_argument(
+    "--query-projects",
+    type=int,
+    help="Project notes items join on (default: one per 100 notes)",
+)
+query_group.add_argument(
+    "--query-areas",
+    type=int,
+    default=8,
+    help="Areas, i.e. Work/ subfolders and #q/ tags, Zipf-sized (default: 8)",
+)
+query_group.add_argument(
+    "--query-tasks",
+    type=float,
+    default=3.0,
+    help="Mean annotated tasks per item body; 0 = none (default: 3)",
+)
+query_group.add_argument(
+    "--query-inline-fields",
+    type=float,
+    default=2.0,
+    help="Mean inline fields per item body besides effort:: (default: 2)",
+)
+query_group.add_argument(
+    "--query-selectivity",
+    type=float,
+    nargs="+",
+    default=[0.001, 0.01, 0.1, 0.5],
+    help="Selectivities of the score range queries (default: 0.001 0.01 0.1 0.5)",
+)
+query_group.add_argument(
+    "--queries-file",
+    help="Query suite path (default: <output>.queries.json)",
+)
+
+project_group = parser.add_argument_group(
+    "multi-project workload",
+    "Many project folders, each with its own schema and size, linked by per-project relation fields",
+)
+project_group.add_argument(
+    "--multi-project",
+    type=int,
+    metavar="N",
+    help="Generate N project folders instead of --type records, plus plugin settings for them",
+)
+project_group.add_argument(
+    "--project-size-skew",
+    type=float,
+    default=1.0,
+    help="Zipf exponent of notes per project; 0 = equal sizes (default: 1.0)",
+)
+project_group.add_argument(
+    "--project-fields",
+    type=int,
+    default=12,
+    help="Median schema width per project, relation fields aside (default: 12)",
+)
+project_group.add_argument(
+    "--project-links",
+    type=float,
+    default=3.0,
+    help="Mean relation links per note (default: 3)",
+)
+project_group.add_argument(
+    "--cross-project-rate",
+    type=float,
+    default=0.2,
+    help="Share of relation links that point into another project (default: 0.2)",
+)
+project_group.add_argument(
+    "--cross-project-fields",
+    type=int,
+    default=2,
+    help="Relation fields per project that target another project (default: 2)",
+)
+project_group.add_argument(
+    "--target-skew",
+    type=float,
+    default=1.0,
+    help="Zipf exponent of how often a project is a relation target; 0 = uniform (default: 1.0)",
+)
+project_group.add_argument(
+    "--projects-file",
+    help="Project layout path (default: <output>.projects.json)",
+)
+project_group.add_argument(
+    "--settings-file",
+    help="Plugin settings path (default: <output>.data.json; "
+         "use <vault>/.obsidian/plugins/obs-projects-plus/data.json to install them)",
+)
+
+bodies_group = parser.add_argument_group(
+    "note bodies",
+    "Log-normal body sizes with inline fields, tasks, embeds and links "
+    "(densities are per 1000 characters; a --preset body section sets the defaults)",
+)
+bodies_group.add_argument(
+    "--body-median",
+    type=int,
+    help="Median body size in characters; enables generated bodies",
+)
+bodies_group.add_argument(
+    "--body-sigma",
+    type=float,
+    help="Log-normal sigma of body sizes (default: 1.0)",
+)
+bodies_group.add_argument(
+    "--body-max",
+    type=int,
+    help="Largest body in characters (default: 500000)",
+)
+bodies_group.add_argument(
+    "--body-empty-rate",
+    type=float,
+    help="Share of notes with no body at all (default: 0)",
+)
+bodies_group.add_argument(
+    "--link-density",
+    type=float,
+    help="[[links]] per 1000 characters (default: 0)",
+)
+bodies_group.add_argument(
+    "--field-density",
+    type=float,
+    help="Inline Dataview key:: value fields per 1000 characters (default: 0)",
+)
+bodies_group.add_argument(
+    "--task-density",
+    type=float,
+    help="Task lines per 1000 characters (default: 0)",
+)
+bodies_group.add_argument(
+    "--embed-density",
+    type=float,
+    help="![[embeds]] per 1000 characters (default: 0)",
+)
+
+profiling_group = parser.add_argument_group(
+    "profiling",
+    "Stage timings, memory and call profiles of the generator itself",
+)
+profiling_group.add_argument(
+    "--profile",
+    metavar="PATH",
+    help="Write per-stage wall time and throughput as JSON; bypasses --cache lookups",
+)
+profiling_group.add_argument(
+    "--profile-tracemalloc",
+    action="store_true",
+    help="Also trace Python allocations for the peak heap (slows generation down)",
+)
+profiling_group.add_argument(
+    "--profile-pstats",
+    metavar="PATH",
+    help="Dump cProfile statistics merged over all workers (pstats format)",
+)
+profiling_group.add_argument(
+    "--profile-speedscope",
+    metavar="PATH",
+    help="Write the merged cProfile call graph as a speedscope profile",
+)
+
+# Parsed in main(); pool workers receive it through init_worker()
+args: argparse.Namespace = argparse.Namespace()
 
-if args.seed:
-    random.seed(args.seed)
+# Records are generated in fixed-size shards, each with its own seed derived
+# from --seed. Shard boundaries never depend on --workers, which is what keeps
+# the output byte-identical between serial and parallel runs.
+SHARD_SIZE = 1000
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # HELPER FUNCTIONS
 # ═══════════════════════════════════════════════════════════════════════════════
 
+def run_date() -> datetime.date:
+    """The generation's "today".
+
+    Pinned once per run in main() (--today, else SOURCE_DATE_EPOCH, else the
+    wall clock) and shipped to workers with ``args``, so every shard agrees
+    and a given --today/--seed reproduces the vault byte for byte.
+    """
+    return getattr(args, "today", None) or datetime.date.today()
+
+
 def random_text(length: int = 10) -> str:
     """Generate random alphanumeric string."""
     letters = string.ascii_letters + string.digits
@@ -220,8 +838,8 @@ def random_text(length: int = 10) -> str:
 
 
 def random_id() -> str:
-    """Generate unique file-safe ID."""
-    return f"{random_text(6)}_{int(datetime.datetime.now().timestamp())}"
+    """Generate unique file-safe ID (drawn from the seeded stream)."""
+    return f"{random_text(6)}_{random.getrandbits(32)}"
 
 
 def random_bool(probability: float = 0.5) -> bool:
@@ -231,7 +849,7 @@ def random_bool(probability: float = 0.5) -> bool:
 
 def random_date(days_back: int = 30, days_forward: int = 60) -> datetime.date:
     """Generate random date within range from today."""
-    today = datetime.date.today()
+    today = run_date()
     start_date = today - datetime.timedelta(days=days_back)
     end_date = today + datetime.timedelta(days=days_forward)
     delta = (end_date - start_date).days
@@ -247,7 +865,7 @@ def random_time(start_hour: int = 8, end_hour: int = 20) -> str:
 
 def random_duration_hours() -> int:
     """Generate random duration in hours."""
-    return random.choice([1, 1, 1, 2, 2, 3, 4, 8])
+    return random.choice(HOUR_DURATIONS)
 
 
 def add_hours_to_time(time_str: str, hours: int) -> str:
@@ -273,7 +891,7 @@ def random_priority() -> str:
 
 def random_progress() -> int:
     """Random progress percentage."""
-    return random.choice([0, 10, 25, 33, 50, 66, 75, 80, 90, 100])
+    return random.choice(PROGRESS_STEPS)
 
 
 def random_attendees(min_count: int = 1, max_count: int = 5) -> List[str]:
@@ -285,7 +903,7 @@ def random_attendees(min_count: int = 1, max_count: int = 5) -> List[str]:
 def random_tags(category: str) -> List[str]:
     """Random tags for category."""
     base_tags = TAGS_POOL.get(category, ["misc"])
-    extra_tags = random.sample(["urgent", "important", "low-priority", "blocked", "review"], k=random.randint(0, 2))
+    extra_tags = random.sample(EXTRA_TAGS, k=random.randint(0, 2))
     return base_tags[:2] + extra_tags
 
 
@@ -309,7 +927,7 @@ def get_title(category: str, realistic: bool = False) -> str:
 
 def generate_task(realistic: bool = False, with_overdue: bool = False) -> Dict[str, Any]:
     """Generate a task record for Board/Table view."""
-    today = datetime.date.today()
+    today = run_date()
     
     # Determine if this task is overdue
     if with_overdue and random_bool(0.2):
@@ -358,7 +976,7 @@ def generate_calendar_event(
     
     frontmatter: Dict[str, Any] = {
         "title": get_title("event", realistic),
-        "date": datetime.date.today().isoformat(),
+        "date": run_date().isoformat(),
         "startDate": start_date.isoformat(),
         "status": random.choice(EVENT_STATUSES),
         "color": random_color(),
@@ -396,7 +1014,7 @@ def generate_meeting(realistic: bool = False) -> Dict[str, Any]:
     
     return {
         "title": get_title("meeting", realistic),
-        "date": datetime.date.today().isoformat(),
+        "date": run_date().isoformat(),
         "startDate": meeting_date.isoformat(),
         "startTime": start_time,
         "endTime": end_time,
@@ -419,7 +1037,7 @@ def generate_project(realistic: bool = False) -> Dict[str, Any]:
     
     return {
         "title": get_title("project", realistic),
-        "date": datetime.date.today().isoformat(),
+        "date": run_date().isoformat(),
         "startDate": start_date.isoformat(),
         "endDate": end_date.isoformat(),
         "status": status,
@@ -434,7 +1052,7 @@ def generate_undated_task(realistic: bool = False) -> Dict[str, Any]:
     """Generate a task without dates (for inbox/backlog)."""
     return {
         "title": get_title("task", realistic),
-        "date": datetime.date.today().isoformat(),
+        "date": run_date().isoformat(),
         "priority": random_priority(),
         "status": "inbox",
         "color": COLORS["gray"],
@@ -445,203 +1063,6050 @@ def generate_undated_task(realistic: bool = False) -> Dict[str, Any]:
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
-# FILE GENERATION
+# RELATIONAL GRAPH
 # ═══════════════════════════════════════════════════════════════════════════════
+#
+# Record indices are laid out as [people | clients | projects]. Every note's
+# name is a pure function of its index, so any shard can link to notes that
+# another worker writes without sharing state.
 
-def generate_content(record: Dict[str, Any]) -> str:
-    """Generate markdown content based on record type."""
-    record_type = record.get("_type", "task")
-    title = record.get("title", "Untitled")
-    
-    # Build frontmatter (exclude internal fields)
-    frontmatter = {k: v for k, v in record.items() if not k.startswith("_")}
-    
-    content = "---\n"
-    content += yaml.dump(frontmatter, allow_unicode=True, default_flow_style=False)
-    content += "---\n\n"
-    
-    # Content by type
-    if record_type == "task":
-        content += f"# {title}\n\n"
-        content += "## Описание\n\n"
-        content += "<!-- Описание задачи -->\n\n"
-        content += "## Чеклист\n"
-        content += "- [ ] Подготовка\n"
-        content += "- [ ] Выполнение\n"
-        content += "- [ ] Проверка\n"
+class RelationLayout:
+    """Entity counts and index ranges for --relations mode."""
     
-    elif record_type == "event":
-        content += f"# 📅 {title}\n\n"
-        content += "## Детали\n\n"
-        if record.get("_subtype") == "multi-day":
-            content += f"**Период**: {record.get('startDate')} — {record.get('endDate')}\n\n"
-        elif record.get("startTime"):
-            content += f"**Время**: {record.get('startTime')} — {record.get('endTime')}\n\n"
-        content += "## Заметки\n\n"
+    def __init__(self, total: int, people: Optional[int], clients: Optional[int]):
+        self.people = people if people is not None else max(1, total // 10)
+        self.clients = clients if clients is not None else max(1, total // 20)
+        self.projects = max(0, total - self.people - self.clients)
+        self.total = self.people + self.clients + self.projects
     
-    elif record_type == "meeting":
-        content += f"# 📅 {title}\n\n"
-        content += "## Участники\n"
-        for att in record.get("attendees", []):
-            content += f"- {att}\n"
-        content += "\n## Повестка\n1. \n\n"
-        content += "## Заметки\n\n"
-        content += "## Действия\n- [ ] \n"
+    def entity_at(self, index: int) -> Tuple[str, int]:
+        """Map a global record index to (entity, index within entity)."""
+        if index < self.people:
+            return "person", index
+        index -= self.people
+        if index < self.clients:
+            return "client", index
+        return "project", index - self.clients
+
+
+def relation_name(entity: str, index: int, realistic: bool = False) -> str:
+    """Deterministic, unique note basename for an entity index."""
+    if entity == "person":
+        return f"{ATTENDEES[index % len(ATTENDEES)]} {index}" if realistic else f"Person {index}"
+    if entity == "client":
+        return f"{CLIENT_NAMES[index % len(CLIENT_NAMES)]} {index}" if realistic else f"Client {index}"
+    if entity == "entry":
+        return f"{EVENT_TITLES[index % len(EVENT_TITLES)]} {index}" if realistic else f"Entry {index}"
+    return f"{PROJECT_TITLES[index % len(PROJECT_TITLES)]} {index}" if realistic else f"Project {index}"
+
+
+class TargetSampler:
+    """Pick link targets in [0, size) with a fixed fan-in distribution.
+
+    Zipf and hub tables are cumulative weights built once per process, so
+    each draw is a binary search rather than a scan over all targets.
+    """
     
-    elif record_type == "project":
-        content += f"# 🎯 {title}\n\n"
-        content += "## Описание\n\n"
-        content += "## Цели\n- \n\n"
-        content += "## Этапы\n"
-        content += "- [ ] Этап 1\n"
-        content += "- [ ] Этап 2\n"
-        content += "- [ ] Этап 3\n"
+    def __init__(self, size: int, dist: str, zipf_s: float, hub_fraction: float, hub_weight: float):
+        self.size = size
+        self.dist = dist
+        self.cum_weights: Optional[List[float]] = None
+        if size <= 0 or dist == "uniform":
+            return
+        if dist == "zipf":
+            weights = [1.0 / (rank + 1) ** zipf_s for rank in range(size)]
+        else:
+            hubs = max(1, int(size * hub_fraction))
+            rest = size - hubs
+            hub_share = hub_weight if rest else 1.0
+            weights = [hub_share / hubs] * hubs + [(1.0 - hub_share) / rest] * rest
+        running = 0.0
+        self.cum_weights = []
+        for w in weights:
+            running += w
+            self.cum_weights.append(running)
+        self.population = range(size)
     
-    return content
+    def pick(self, k: int = 1) -> List[int]:
+        if self.size <= 0:
+            return []
+        if self.cum_weights is None:
+            return [random.randrange(self.size) for _ in range(k)]
+        return random.choices(self.population, cum_weights=self.cum_weights, k=k)
 
 
-def get_filename(record: Dict[str, Any]) -> str:
-    """Generate safe filename from record."""
-    title = record.get("title", "untitled")
-    # Sanitize filename
-    safe_title = "".join(c for c in title if c.isalnum() or c in " -_").strip()
-    safe_title = safe_title[:40]  # Limit length
-    unique_id = random_text(4)
-    return f"{safe_title}_{unique_id}.md"
+_samplers: Dict[str, TargetSampler] = {}
+
+
+def relation_sampler(entity: str, layout: RelationLayout) -> TargetSampler:
+    """Per-process cache of target samplers, one per entity."""
+    sampler = _samplers.get(entity)
+    if sampler is None:
+        size = {"person": layout.people, "client": layout.clients, "project": layout.projects}[entity]
+        sampler = TargetSampler(size, args.fan_dist, args.zipf_s, args.hub_fraction, args.hub_weight)
+        _samplers[entity] = sampler
+    return sampler
+
+
+def in_cycle_pair(pair: int) -> bool:
+    """Whether projects 2*pair and 2*pair+1 depend on each other.
+
+    Derived from --seed and the pair index only, so both members of a pair
+    agree even when they land in different shards.
+    """
+    digest = hashlib.blake2b(f"cycle:{args.seed}:{pair}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / 2**64 < args.cycle_rate
 
 
-def generate_records(count: int, record_type: str) -> List[Dict[str, Any]]:
-    """Generate records based on type."""
-    records = []
+def relation_links(entity: str, layout: RelationLayout, k: int = 1, exclude: int = -1) -> List[str]:
+    """Draw ``k`` distinct wikilinks to ``entity`` notes, some of them dangling."""
     realistic = args.realistic
+    links: List[str] = []
+    seen = set()
+    for target in relation_sampler(entity, layout).pick(k):
+        if target == exclude or target in seen:
+            continue
+        seen.add(target)
+        if random_bool(args.dangling_rate):
+            links.append(f"[[Missing {entity} {random_text(8)}]]")
+        else:
+            links.append(f"[[{relation_name(entity, target, realistic)}]]")
+    return links
+
+
+def relation_link(entity: str, layout: RelationLayout, exclude: int = -1) -> Optional[str]:
+    """Single-valued relation; None when the draw hit ``exclude``."""
+    links = relation_links(entity, layout, 1, exclude)
+    return links[0] if links else None
+
+
+def generate_person(index: int, layout: RelationLayout) -> Dict[str, Any]:
+    """Team note; ``manager`` links people to people (chains and cycles)."""
+    name = relation_name("person", index, args.realistic)
+    record: Dict[str, Any] = {
+        "title": name,
+        "role": random.choice(PERSON_ROLES),
+        "department": random.choice(DEPARTMENTS),
+        "email": f"person{index}@example.com",
+        "joinDate": random_date(days_back=1500, days_forward=0).isoformat(),
+        "tags": ["team", random.choice(DEPARTMENTS).lower()],
+        "_type": "person",
+        "_name": name,
+    }
+    manager = relation_link("person", layout, exclude=index)
+    if manager:
+        record["manager"] = manager
+    return record
+
+
+def generate_client(index: int, layout: RelationLayout) -> Dict[str, Any]:
+    """Client note with a single ``accountManager`` relation."""
+    name = relation_name("client", index, args.realistic)
+    budget = random.randrange(10_000, 500_000, 1_000)
+    record: Dict[str, Any] = {
+        "title": name,
+        "status": random.choice(["active", "prospect", "churned"]),
+        "budget": budget,
+        "spent": int(budget * random.random()),
+        "score": random.randint(1, 10),
+        "tags": ["client"],
+        "_type": "client",
+        "_name": name,
+    }
+    manager = relation_link("person", layout)
+    if manager:
+        record["accountManager"] = manager
+    return record
+
+
+def generate_linked_project(index: int, layout: RelationLayout) -> Dict[str, Any]:
+    """Project note linked to Team, Clients and other Projects.
+
+    ``assignee``/``reviewer``/``client`` are single-valued, ``members`` and
+    ``dependsOn`` are lists. Paired projects (see in_cycle_pair) always
+    list each other in ``dependsOn`` to guarantee 2-cycles.
+    """
+    record = generate_project(args.realistic)
+    name = relation_name("project", index, args.realistic)
+    budget = random.randrange(5_000, 200_000, 500)
+    record.update({
+        "title": name,
+        "priority": random_priority(),
+        "budget": budget,
+        "spent": int(budget * random.random()),
+        "hours": random.randint(0, 2000),
+        "members": relation_links("person", layout, random.randint(1, args.fan_out)),
+        "dependsOn": relation_links("project", layout, random.randint(0, args.fan_out), exclude=index),
+        "_name": name,
+    })
+    for field, entity in (("assignee", "person"), ("reviewer", "person"), ("client", "client")):
+        link = relation_link(entity, layout)
+        if link:
+            record[field] = link
     
-    if record_type == "all":
-        # Balanced distribution
-        generators = [
-            (generate_task, 0.35),
-            (generate_calendar_event, 0.25),
-            (generate_meeting, 0.15),
-            (generate_project, 0.10),
-        ]
+    partner = index ^ 1
+    if partner < layout.projects and in_cycle_pair(index // 2):
+        link = f"[[{relation_name('project', partner, args.realistic)}]]"
+        if link not in record["dependsOn"]:
+            record["dependsOn"].append(link)
+    return record
+
+
+def generate_relational_records(start: int, count: int) -> Iterator[Dict[str, Any]]:
+    """Yield records ``start .. start+count`` of the linked vault."""
+    layout = RelationLayout(args.numfiles, args.people, args.clients)
+    for index in range(start, min(start + count, layout.total)):
+        entity, local = layout.entity_at(index)
+        if entity == "person":
+            yield generate_person(local, layout)
+        elif entity == "client":
+            yield generate_client(local, layout)
+        else:
+            yield generate_linked_project(local, layout)
+
+
+def count_relation_edges(record: Dict[str, Any]) -> int:
+    """Number of wikilinks in a record's relation fields."""
+    edges = 0
+    for key in ("manager", "accountManager", "assignee", "reviewer", "client", "project"):
+        if key in record:
+            edges += 1
+    for key in ("members", "dependsOn", "entries"):
+        edges += len(record.get(key, ()))
+    return edges
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CALENDAR WORKLOAD
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# --calendar-workload lays records out as [hot-day events | everything else].
+# The day window, per-day weights, hot days and DST transition days depend
+# only on --seed and today's date, so every shard agrees on them. Events
+# land on days by a skewed weight table (--day-skew, --weekend-factor);
+# a share of records become long spans, recurring events, DST-boundary
+# times, overdue or undated tasks (--*-rate).
+#
+# The parent indexes every note by date into <output>.calendar.json. Spans
+# are read back from the final frontmatter (see calendar_span), the same
+# fields the Calendar view reads. Recurring events are indexed at their
+# first occurrence only, because the view does not expand RRULEs.
+
+RECURRENCE_RULES = [
+    "FREQ=DAILY",
+    "FREQ=DAILY;INTERVAL=2",
+    "FREQ=WEEKLY;BYDAY=MO",
+    "FREQ=WEEKLY;BYDAY=MO,WE,FR",
+    "FREQ=WEEKLY;INTERVAL=2;BYDAY=TU,TH",
+    "FREQ=MONTHLY;BYMONTHDAY=1",
+    "FREQ=MONTHLY;BYMONTHDAY=31",
+    "FREQ=MONTHLY;BYDAY=-1FR",
+    "FREQ=YEARLY;BYMONTH=2;BYMONTHDAY=29",
+]
+
+# (zone, month, nth Sunday (-1 = last), first affected local hour,
+#  UTC offset before, UTC offset after). Spring transitions skip that hour,
+# autumn transitions repeat it.
+DST_TRANSITIONS = [
+    ("Europe/Berlin", 3, -1, 2, "+01:00", "+02:00"),
+    ("Europe/Berlin", 10, -1, 2, "+02:00", "+01:00"),
+    ("America/New_York", 3, 2, 2, "-05:00", "-04:00"),
+    ("America/New_York", 11, 1, 1, "-04:00", "-05:00"),
+]
+
+
+def nth_sunday(year: int, month: int, nth: int) -> datetime.date:
+    """The ``nth`` Sunday of a month (``-1`` for the last one)."""
+    if nth > 0:
+        first = datetime.date(year, month, 1)
+        return first + datetime.timedelta(days=(6 - first.weekday()) % 7 + 7 * (nth - 1))
+    last = datetime.date(year + month // 12, month % 12 + 1, 1) - datetime.timedelta(days=1)
+    return last - datetime.timedelta(days=(last.weekday() + 1) % 7)
+
+
+class CalendarLayout:
+    """Day window, weights and special days for --calendar-workload."""
+    
+    def __init__(self, total: int):
+        self.first_day = run_date() - datetime.timedelta(days=7)
+        self.days = args.date_range + 7
+        rng = random.Random(f"calendar:{args.seed}")
         
-        if args.with_undated:
-            generators.append((generate_undated_task, 0.15))
+        # Busiest days are spread over the window rather than front-loaded
+        ranks = list(range(self.days))
+        rng.shuffle(ranks)
+        weights = []
+        for offset, rank in enumerate(ranks):
+            weight = 1.0 / (rank + 1) ** args.day_skew
+            if self.day(offset).weekday() >= 5:
+                weight *= args.weekend_factor
+            weights.append(weight)
+        self.day_cum = list(accumulate(weights))
         
-        # Add overdue tasks
-        for _ in range(count):
-            gen_func, _ = random.choices(
-                generators,
-                weights=[w for _, w in generators],
-                k=1
-            )[0]
-            
-            if gen_func == generate_task:
-                records.append(gen_func(realistic, args.with_overdue))
-            else:
-                records.append(gen_func(realistic))
+        self.hot_days = sorted(rng.sample(range(self.days), min(args.hot_days, self.days)))
+        # Hot days take at most half the notes, so spans, recurrences, DST
+        # edges, overdue and undated notes still get the rest
+        self.hot_day_events = min(args.hot_day_events, total // 2 // max(len(self.hot_days), 1))
+        if not self.hot_day_events:
+            self.hot_days = []
+        self.hot_events = len(self.hot_days) * self.hot_day_events
+        
+        last_day = self.day(self.days - 1)
+        self.dst: List[Tuple[datetime.date, Tuple[Any, ...]]] = sorted(
+            (nth_sunday(year, rule[1], rule[2]), rule)
+            for year in range(self.first_day.year, last_day.year + 1)
+            for rule in DST_TRANSITIONS
+        )
+        inside = [(day, rule) for day, rule in self.dst if self.first_day <= day <= last_day]
+        # Outside the window when it holds no transition; still worth having
+        self.dst = inside or self.dst
+        
+        # Cumulative shares of the special record kinds, in roll order
+        self.kinds = ["undated", "overdue", "long-span", "recurring", "dst"]
+        self.kind_cum = list(accumulate([
+            args.undated_rate, args.overdue_rate, args.long_span_rate,
+            args.recurrence_rate, args.dst_rate,
+        ]))
     
-    elif record_type == "calendar":
-        for _ in range(count):
-            event_type = random.choices(
-                ["timed", "allday", "multiday"],
-                weights=[0.5, 0.3, 0.2],
-                k=1
-            )[0]
-            records.append(generate_calendar_event(
-                realistic,
-                force_multiday=(event_type == "multiday"),
-                force_allday=(event_type == "allday"),
-                force_timed=(event_type == "timed"),
-            ))
+    def day(self, offset: int) -> datetime.date:
+        return self.first_day + datetime.timedelta(days=offset)
     
-    elif record_type == "board":
+    def pick_day(self) -> datetime.date:
+        offset = bisect.bisect(self.day_cum, random.random() * self.day_cum[-1])
+        return self.day(min(offset, self.days - 1))
+    
+    def kind_at(self, index: int) -> str:
+        """Record kind for a global index; special kinds are rolled."""
+        if index < self.hot_events:
+            return "hot-day"
+        roll = random.random()
+        for kind, edge in zip(self.kinds, self.kind_cum):
+            if roll < edge:
+                return kind
+        return "regular"
+
+
+_calendar_layouts: Dict[Tuple[Any, datetime.date, int], CalendarLayout] = {}
+
+
+def calendar_layout() -> CalendarLayout:
+    """Per-process cache of the calendar layout.
+
+    Keyed on everything the layout draws from: the seed, the run date and
+    the note count. Only call it once main() has pinned --today and --seed.
+    """
+    key = (args.seed, run_date(), args.numfiles)
+    layout = _calendar_layouts.get(key)
+    if layout is None:
+        layout = _calendar_layouts[key] = CalendarLayout(args.numfiles)
+    return layout
+
+
+def generate_hot_day_event(index: int, layout: CalendarLayout) -> Dict[str, Any]:
+    """Timed event on a hot day; starts cluster around midday so they overlap."""
+    day = layout.day(layout.hot_days[index // layout.hot_day_events])
+    record = generate_calendar_event(args.realistic, force_timed=True)
+    start_time = random_time(8, 12)
+    record.update({
+        "startDate": day.isoformat(),
+        "startTime": start_time,
+        "endTime": add_hours_to_time(start_time, random_duration_hours()),
+        "_subtype": "hot-day",
+    })
+    return record
+
+
+def generate_dst_event(layout: CalendarLayout) -> Dict[str, Any]:
+    """Event inside the skipped or repeated hour of a DST transition.
+
+    Uses either plain startTime/endTime, naive ISO datetimes or ISO
+    datetimes with the UTC offsets on both sides of the jump.
+    """
+    day, (zone, _, _, hour, before, after) = random.choice(layout.dst)
+    record = generate_calendar_event(args.realistic, force_timed=True)
+    for key in ("startTime", "endTime"):
+        record.pop(key, None)
+    minute = f"{random.choice([0, 15, 30, 45]):02d}"
+    style = random.choice(["fields", "naive", "offset"])
+    if style == "fields":
+        record["startDate"] = day.isoformat()
+        record["startTime"] = f"{hour:02d}:{minute}"
+        record["endTime"] = f"{hour + 1:02d}:{minute}"
+    elif style == "naive":
+        record["startDate"] = f"{day.isoformat()}T{hour:02d}:{minute}:00"
+        record["endDate"] = f"{day.isoformat()}T{hour + 1:02d}:{minute}:00"
+    else:
+        record["startDate"] = f"{day.isoformat()}T{hour - 1:02d}:{minute}:00{before}"
+        record["endDate"] = f"{day.isoformat()}T{hour + 1:02d}:{minute}:00{after}"
+    record["timezone"] = zone
+    record["_subtype"] = "dst"
+    return record
+
+
+def generate_calendar_workload_record(index: int, layout: CalendarLayout) -> Dict[str, Any]:
+    """Record ``index`` of the calendar workload."""
+    realistic = args.realistic
+    kind = layout.kind_at(index)
+    if kind == "hot-day":
+        return generate_hot_day_event(index, layout)
+    if kind == "undated":
+        return generate_undated_task(realistic)
+    if kind == "overdue":
+        record = generate_task(realistic)
+        due = run_date() - datetime.timedelta(days=random.randint(1, 30))
+        record.update({
+            "startDate": (due - datetime.timedelta(days=random.randint(0, 14))).isoformat(),
+            "dueDate": due.isoformat(),
+            "status": random.choice(["todo", "in-progress"]),
+            "progress": 0,
+            "_subtype": "overdue",
+        })
+        return record
+    if kind == "dst":
+        return generate_dst_event(layout)
+    
+    start = layout.pick_day()
+    if kind == "long-span":
+        # 4-17 weeks always crosses at least one month boundary
+        record = generate_calendar_event(realistic, force_multiday=True)
+        record["endDate"] = (start + datetime.timedelta(days=random.randint(28, 120))).isoformat()
+        record["_subtype"] = "long-span"
+    else:
+        event_type = random.choices(["timed", "allday", "multiday"], weights=[0.55, 0.3, 0.15], k=1)[0]
+        record = generate_calendar_event(
+            realistic,
+            force_multiday=(event_type == "multiday"),
+            force_allday=(event_type == "allday"),
+            force_timed=(event_type == "timed"),
+        )
+        if "endDate" in record:
+            days = (datetime.date.fromisoformat(record["endDate"]) - datetime.date.fromisoformat(record["startDate"])).days
+            record["endDate"] = (start + datetime.timedelta(days=days)).isoformat()
+    record["startDate"] = start.isoformat()
+    if kind == "recurring":
+        rule = random.choice(RECURRENCE_RULES)
+        ending = random.random()
+        if ending < 0.3:
+            rule += f";COUNT={random.randint(2, 52)}"
+        elif ending < 0.6:
+            until = start + datetime.timedelta(days=random.randint(30, 365))
+            rule += f";UNTIL={until.strftime('%Y%m%d')}"
+        record["recurrence"] = rule
+        record["_subtype"] = "recurring"
+    return record
+
+
+def generate_calendar_records(start: int, count: int) -> Iterator[Dict[str, Any]]:
+    """Yield records ``start .. start+count`` of the calendar workload."""
+    layout = calendar_layout()
+    for index in range(start, min(start + count, args.numfiles)):
+        yield generate_calendar_workload_record(index, layout)
+
+
+def clock_minutes(value: str) -> Optional[int]:
+    """Minutes since midnight of an HH:mm string (None if malformed)."""
+    match = re.match(r"^(\d{2}):(\d{2})", value)
+    return int(match.group(1)) * 60 + int(match.group(2)) if match else None
+
+
+def calendar_span(record: Dict[str, Any]) -> Optional[Tuple[str, str, Optional[int], Optional[int]]]:
+    """(first day, last day, start minute, end minute) the Calendar view shows.
+
+    Minutes are wall-clock times as written and None for all-day events;
+    returns None for undated notes.
+    """
+    start = record.get("startDate")
+    if not isinstance(start, str):
+        return None
+    end = record.get("endDate")
+    end = end if isinstance(end, str) else start
+    if len(start) > 10:
+        start_min = clock_minutes(start[11:])
+        end_min = clock_minutes(end[11:]) if len(end) > 10 else None
+    elif isinstance(record.get("startTime"), str):
+        start_min = clock_minutes(record["startTime"])
+        end_min = clock_minutes(record["endTime"]) if isinstance(record.get("endTime"), str) else None
+    else:
+        return start[:10], end[:10], None, None
+    if start_min is not None and (end_min is None or end_min <= start_min):
+        end_min = start_min + 60
+    return start[:10], max(start[:10], end[:10]), start_min, end_min
+
+
+def max_overlap(intervals: List[Tuple[int, int]]) -> int:
+    """Largest number of intervals open at the same minute."""
+    edges = sorted([(start, 1) for start, _ in intervals] + [(end, -1) for _, end in intervals])
+    best = current = 0
+    for _, delta in edges:
+        current += delta
+        best = max(best, current)
+    return best
+
+
+class CalendarIndex:
+    """Per-day counts and note paths, written as <output>.calendar.json."""
+    
+    def __init__(self):
+        self.days: Dict[str, Dict[str, Any]] = {}
+        self.timed: Dict[str, List[Tuple[int, int]]] = {}
+        self.totals: Dict[str, int] = {}
+    
+    def entry(self, day: str) -> Dict[str, Any]:
+        entry = self.days.get(day)
+        if entry is None:
+            entry = self.days[day] = {"starts": 0, "visible": 0, "timed": 0, "allDay": 0, "notes": []}
+        return entry
+    
+    def add(self, rows: List[Tuple[str, str, Optional[Tuple[str, str, Optional[int], Optional[int]]]]]) -> None:
+        for path, subtype, span in rows:
+            self.totals[subtype] = self.totals.get(subtype, 0) + 1
+            if span is None:
+                continue
+            first, last, start_min, end_min = span
+            entry = self.entry(first)
+            entry["starts"] += 1
+            entry["notes"].append(path)
+            if first == last and start_min is not None:
+                entry["timed"] += 1
+                self.timed.setdefault(first, []).append((start_min, end_min))
+            else:
+                entry["allDay"] += 1
+            day = datetime.date.fromisoformat(first)
+            stop = datetime.date.fromisoformat(last)
+            while day <= stop:
+                self.entry(day.isoformat())["visible"] += 1
+                day += datetime.timedelta(days=1)
+    
+    def peak(self) -> Tuple[Optional[str], int, int]:
+        """(busiest day, notes visible on it, largest timed overlap anywhere)."""
+        if not self.days:
+            return None, 0, 0
+        day = max(self.days, key=lambda d: self.days[d]["visible"])
+        overlap = max((max_overlap(spans) for spans in self.timed.values()), default=0)
+        return day, self.days[day]["visible"], overlap
+    
+    def write(self, path: Path, layout: CalendarLayout) -> None:
+        days = {}
+        for day in sorted(self.days):
+            entry = self.days[day]
+            entry["maxOverlap"] = max_overlap(self.timed.get(day, []))
+            days[day] = entry
+        index = {
+            "seed": args.seed,
+            "window": [layout.first_day.isoformat(), layout.day(layout.days - 1).isoformat()],
+            "hotDays": [layout.day(offset).isoformat() for offset in layout.hot_days],
+            "dstDays": [{"date": day.isoformat(), "zone": rule[0]} for day, rule in layout.dst],
+            "totals": dict(sorted(self.totals.items())),
+            "days": days,
+        }
+        path.write_text(json.dumps(index, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ROLLUP WORKLOAD
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# --rollup-workload lays records out as [projects | ledger entries]. Every
+# project owns a contiguous block of entries. Block sizes follow a Zipf law
+# over shuffled ranks (--project-skew), so block offsets depend only on
+# --seed and the counts. Links in both directions are therefore known to
+# every shard: an entry's ``project`` and a project's ``entries`` list.
+#
+# Entries carry the ``type`` that sub-bases partition on, with Zipf-skewed
+# shares (--partition-skew). They also carry numeric and date rollup targets
+# (amount, hours, date); projects carry budget/spent/hours like the
+# demo-vault Projects. ``entries`` is capped at --rollup-max-links, the
+# resolver's per-value limit. ``entryCount`` keeps the uncapped size.
+
+ROLLUP_KINDS = [
+    "expense", "timesheet", "invoice", "budget", "milestone", "purchase-order",
+    "change-request", "risk", "payment", "refund", "forecast", "credit-note",
+]
+ENTRY_STATUSES = ["draft", "submitted", "approved", "rejected"]
+
+
+class RollupLayout:
+    """Project blocks and entry kinds for --rollup-workload."""
+    
+    def __init__(self, total: int, projects: Optional[int]):
+        self.projects = min(total, projects if projects is not None else max(1, total // 200))
+        self.entries = total - self.projects
+        rng = random.Random(f"rollup:{args.seed}")
+        
+        # Largest blocks are spread over the project range, not front-loaded
+        ranks = list(range(self.projects))
+        rng.shuffle(ranks)
+        weights = [1.0 / (rank + 1) ** args.project_skew for rank in ranks]
+        scale = self.entries / sum(weights) if weights else 0.0
+        sizes = [int(w * scale) for w in weights]
+        # Rounding leftovers go to the heaviest blocks
+        heaviest = sorted(range(self.projects), key=lambda p: (-weights[p], p))
+        for project in heaviest[:self.entries - sum(sizes)]:
+            sizes[project] += 1
+        self.offsets = [0] + list(accumulate(sizes))
+        
+        self.kinds = [
+            ROLLUP_KINDS[i] if i < len(ROLLUP_KINDS) else f"kind-{i + 1}"
+            for i in range(args.sub_bases)
+        ]
+        self.kind_cum = list(accumulate(1.0 / (rank + 1) ** args.partition_skew for rank in range(len(self.kinds))))
+    
+    def block(self, project: int) -> range:
+        """Entry indices owned by ``project``."""
+        return range(self.offsets[project], self.offsets[project + 1])
+    
+    def owner(self, entry: int) -> int:
+        return bisect.bisect_right(self.offsets, entry) - 1
+    
+    def pick_kind(self) -> str:
+        return self.kinds[bisect.bisect(self.kind_cum, random.random() * self.kind_cum[-1])]
+
+
+_rollup_layouts: Dict[int, RollupLayout] = {}
+
+
+def rollup_layout() -> RollupLayout:
+    """Per-process cache of the rollup layout."""
+    layout = _rollup_layouts.get(args.numfiles)
+    if layout is None:
+        layout = _rollup_layouts[args.numfiles] = RollupLayout(args.numfiles, args.rollup_projects)
+    return layout
+
+
+def generate_rollup_project(index: int, layout: RollupLayout) -> Dict[str, Any]:
+    """Project note whose ``entries`` list links its whole ledger block."""
+    realistic = args.realistic
+    record = generate_project(realistic)
+    name = relation_name("project", index, realistic)
+    block = layout.block(index)
+    budget = random.randrange(5_000, 500_000, 500)
+    record.update({
+        "title": name,
+        "type": "project",
+        "priority": random_priority(),
+        "budget": budget,
+        # Up to 20% overruns, so "spent > budget" filters match something
+        "spent": int(budget * random.uniform(0.0, 1.2)),
+        "hours": random.randint(0, 5000),
+        "entryCount": len(block),
+        "entries": [f"[[{relation_name('entry', e, realistic)}]]" for e in block[:args.rollup_max_links]],
+        "_name": name,
+    })
+    return record
+
+
+def generate_ledger_entry(index: int, layout: RollupLayout) -> Dict[str, Any]:
+    """Entry ``index`` of the ledger: one sub-base kind, rollup targets, its project."""
+    realistic = args.realistic
+    kind = layout.pick_kind()
+    name = relation_name("entry", index, realistic)
+    status = random.choice(ENTRY_STATUSES)
+    record: Dict[str, Any] = {
+        "title": name,
+        "type": kind,
+        "project": f"[[{relation_name('project', layout.owner(index), realistic)}]]",
+        "amount": round(random.lognormvariate(5.0, 1.2), 2),
+        "hours": random.randint(1, 32) / 4,
+        "date": random_date(days_back=365, days_forward=90).isoformat(),
+        "status": status,
+        "approved": status == "approved",
+        "_type": "entry",
+        "_subtype": kind,
+        "_name": name,
+    }
+    if random_bool(args.rollup_null_rate):
+        del record[random.choice(["amount", "hours", "date"])]
+    return record
+
+
+def generate_rollup_records(start: int, count: int) -> Iterator[Dict[str, Any]]:
+    """Yield records ``start .. start+count`` of the rollup workload."""
+    layout = rollup_layout()
+    for index in range(start, min(start + count, args.numfiles)):
+        if index < layout.projects:
+            yield generate_rollup_project(index, layout)
+        else:
+            yield generate_ledger_entry(index - layout.projects, layout)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FORMULA WORKLOAD
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# --formulas writes <output>.formulas.json next to the vault: formula fields
+# (FormulaFieldDef, as saved in DatabaseViewConfig.formulaFields) and
+# dashboard widgets whose transform pipelines compute them. Expressions are
+# random typed trees over the fields of the generated workload:
+# --formula-depth levels of nesting, --formula-fan-in arguments per variadic
+# node, families drawn by --formula-mix. "rollup" nodes aggregate a whole
+# column (``@field``) or count a relation list; leaves may reference an
+# earlier formula (--formula-chain-rate), as applyFormulaFields evaluates
+# them in order. Only --seed and the formula options decide the output.
+
+FORMULA_FAMILIES = ["math", "date", "string", "rollup", "logic"]
+FORMULA_RESULT_TYPES = ["number", "date", "string", "boolean"]
+
+# Family -> (result kind, template, argument kinds). {0}, {1}, ... are
+# sub-expressions; {fan} joins --formula-fan-in of them with ", " and {sum}
+# with " + "; {col} is a numeric column and {list} a list field. Operator
+# templates are parenthesized so they nest under any other operator.
+FORMULA_TEMPLATES: Dict[str, List[Tuple[str, str, Tuple[str, ...]]]] = {
+    "math": [
+        ("number", "ROUND({0} * {1}, 2)", ("number", "number")),
+        ("number", "ABS({0} - {1})", ("number", "number")),
+        ("number", "SQRT(ABS({0}))", ("number",)),
+        ("number", "MOD(ROUND({0}, 0), 7)", ("number",)),
+        ("number", "({sum})", ("number",)),
+        ("number", "MAX({fan})", ("number",)),
+        ("string", "TO_CURRENCY({0})", ("number",)),
+        ("boolean", "({0} > {1})", ("number", "number")),
+    ],
+    "date": [
+        ("date", 'DATE_ADD({0}, ROUND({1}, 0), "day")', ("date", "number")),
+        ("date", 'DATE_SUB({0}, 7, "day")', ("date",)),
+        ("date", "END_OF_MONTH({0})", ("date",)),
+        ("number", 'DATE_BETWEEN({0}, {1}, "day")', ("date", "date")),
+        ("number", "WORKDAYS({0}, {1})", ("date", "date")),
+        ("number", "(YEAR({0}) * 100 + MONTH({0}))", ("date",)),
+        ("string", 'FORMAT_DATE({0}, "YYYY-MM")', ("date",)),
+        ("string", "WEEKDAY_NAME({0})", ("date",)),
+        ("boolean", '(DATE_BETWEEN({0}, {1}, "day") > 0)', ("date", "date")),
+    ],
+    "string": [
+        ("string", "UPPER({0})", ("string",)),
+        ("string", "TRIM(LOWER({0}))", ("string",)),
+        ("string", "LEFT({0}, 12)", ("string",)),
+        ("string", 'REGEX_REPLACE({0}, "[aeiou]", "")', ("string",)),
+        ("string", 'JOIN(" · ", {fan})', ("string",)),
+        ("number", "LENGTH({0})", ("string",)),
+        ("boolean", 'CONTAINS({0}, "a")', ("string",)),
+        ("boolean", 'REGEX_MATCH({0}, "^[A-M]")', ("string",)),
+    ],
+    "rollup": [
+        ("number", "SUM(@{col})", ()),
+        ("number", "AVG(@{col})", ()),
+        ("number", "STD_DEV(@{col})", ()),
+        ("number", "({0}) / MAX(@{col})", ("number",)),
+        ("number", "COUNT({list})", ()),
+        ("boolean", "({0} > AVG(@{col}))", ("number",)),
+    ],
+    "logic": [
+        ("number", "IF({0}, {1}, {2})", ("boolean", "number", "number")),
+        ("string", "IF({0}, {1}, {2})", ("boolean", "string", "string")),
+        ("date", "IF({0}, {1}, {2})", ("boolean", "date", "date")),
+        ("number", "IFBLANK({0}, 0)", ("number",)),
+        ("boolean", "AND({fan})", ("boolean",)),
+        ("boolean", "OR({fan})", ("boolean",)),
+        ("boolean", "NOT({0})", ("boolean",)),
+    ],
+}
+
+# Frontmatter fields per kind that each workload writes
+FORMULA_FIELDS: Dict[str, Dict[str, List[str]]] = {
+    "default": {
+        "number": ["progress"],
+        "date": ["date", "startDate", "dueDate", "endDate"],
+        "string": ["title", "status", "priority", "color"],
+        "boolean": [],
+        "list": ["tags"],
+    },
+    "relations": {
+        "number": ["budget", "spent", "hours", "score", "progress"],
+        "date": ["startDate", "endDate", "joinDate"],
+        "string": ["title", "status", "priority", "role", "department"],
+        "boolean": [],
+        "list": ["members", "dependsOn", "tags"],
+    },
+    "rollup": {
+        "number": ["amount", "hours", "budget", "spent", "entryCount"],
+        "date": ["date", "startDate", "endDate"],
+        "string": ["title", "type", "status", "priority"],
+        "boolean": ["approved"],
+        "list": ["entries", "tags"],
+    },
+}
+
+FORMULA_FUNCTION = re.compile(r"\b([A-Z][A-Z_]*)\(")
+# Function names the formula tokenizer would read a same-named field as
+# (case-insensitively); such fields are referenced through PROP("name")
+FORMULA_RESERVED = {
+    "HOURS", "DAYS", "MINUTES", "YEAR", "MONTH", "DAY", "HOUR", "MINUTE", "WEEK",
+    "COUNT", "SUM", "AVG", "MIN", "MAX", "MEDIAN", "MODE", "RANK", "ID", "PI", "NOW", "TODAY",
+}
+
+
+def parse_formula_mix(spec: str) -> Dict[str, float]:
+    """Parse ``family=weight,...`` into a weight table over FORMULA_FAMILIES."""
+    mix = {family: 0.0 for family in FORMULA_FAMILIES}
+    for part in spec.split(","):
+        family, _, weight = part.partition("=")
+        family = family.strip()
+        if family not in mix:
+            raise ValueError(f"unknown formula family {family!r} (expected one of {', '.join(FORMULA_FAMILIES)})")
+        mix[family] = float(weight or 1)
+    if min(mix.values()) < 0 or not any(mix.values()):
+        raise ValueError("formula family weights must be >= 0 and not all 0")
+    return mix
+
+
+class FormulaBuilder:
+    """Seeded random expression trees over one workload's fields."""
+    
+    def __init__(self, fields: Dict[str, List[str]], mix: Dict[str, float]):
+        self.rng = random.Random(f"formulas:{args.seed}")
+        self.fields = fields
+        self.mix = mix
+        # Earlier formulas by result kind, for chained references
+        self.defined: Dict[str, List[str]] = {kind: [] for kind in FORMULA_RESULT_TYPES}
+        self.refs: List[str] = []
+    
+    def family(self, kind: Optional[str] = None) -> Optional[str]:
+        """Weighted family with a template for ``kind`` (any kind when None)."""
+        families = [
+            f for f in FORMULA_FAMILIES
+            if self.mix[f] > 0 and any(kind in (None, t[0]) for t in FORMULA_TEMPLATES[f])
+        ]
+        if not families:
+            return None
+        return self.rng.choices(families, weights=[self.mix[f] for f in families])[0]
+    
+    def leaf(self, kind: str) -> str:
+        rng = self.rng
+        if self.defined[kind] and rng.random() < args.formula_chain_rate:
+            name = rng.choice(self.defined[kind])
+            self.refs.append(name)
+            return name
+        if self.fields[kind]:
+            name = rng.choice(self.fields[kind])
+            return f'PROP("{name}")' if name.upper() in FORMULA_RESERVED else name
+        if kind == "boolean":
+            return f"({self.leaf('number')} > {rng.randint(1, 100)})"
+        return str(rng.randint(1, 100)) if kind == "number" else '"n/a"'
+    
+    def build(self, kind: str, depth: int, family: Optional[str] = None) -> str:
+        """Expression of result ``kind`` with up to ``depth`` levels of calls."""
+        if depth <= 0:
+            return self.leaf(kind)
+        family = family or self.family(kind)
+        if family is None:
+            return self.leaf(kind)
+        rng = self.rng
+        result, template, kinds = rng.choice([t for t in FORMULA_TEMPLATES[family] if t[0] == kind])
+        parts = [self.build(k, depth - 1) for k in kinds]
+        fan = [self.build(kinds[0], depth - 1) for _ in range(args.formula_fan_in)] if "{fan}" in template or "{sum}" in template else []
+        return template.format(
+            *parts,
+            fan=", ".join(fan),
+            sum=" + ".join(fan),
+            col=rng.choice(self.fields["number"] or ["progress"]),
+            list=rng.choice(self.fields["list"] or ["tags"]),
+        )
+    
+    def formula(self, index: int) -> Dict[str, Any]:
+        """Formula ``index``: a root from a weighted family, then random subtrees."""
+        family = self.family()
+        kind = self.rng.choice([t[0] for t in FORMULA_TEMPLATES[family]])
+        self.refs = []
+        expression = self.build(kind, args.formula_depth, family)
+        name = f"fx_{family}_{index:02d}"
+        self.defined[kind].append(name)
+        functions = FORMULA_FUNCTION.findall(expression)
+        return {
+            "name": name,
+            "expression": expression,
+            "resultType": kind,
+            "family": family,
+            "depth": args.formula_depth,
+            "calls": len(functions),
+            "functions": sorted(set(functions)),
+            "columnRefs": expression.count("@"),
+            "dependsOn": sorted(set(self.refs)),
+        }
+
+
+def formula_widget(index: int, formulas: List[Dict[str, Any]], by_name: Dict[str, Dict[str, Any]], fields: Dict[str, List[str]]) -> Dict[str, Any]:
+    """Dashboard widget computing ``formulas`` (and what they depend on)."""
+    needed = set()
+    pending = [f["name"] for f in formulas]
+    while pending:
+        name = pending.pop()
+        if name not in needed:
+            needed.add(name)
+            pending.extend(by_name[name]["dependsOn"])
+    columns = [{"name": name, "expression": by_name[name]["expression"]} for name in by_name if name in needed]
+    steps: List[Dict[str, Any]] = [{"type": "compute", "columns": columns}]
+    widget_type = "data-table"
+    numeric = [f["name"] for f in formulas if f["resultType"] == "number"]
+    # Every other widget charts a numeric formula per status, like buildChartPipeline
+    if index % 2 == 1 and numeric and fields["string"]:
+        widget_type = "chart"
+        group = "status" if "status" in fields["string"] else fields["string"][0]
+        steps += [
+            {"type": "group-by", "fields": [group]},
+            {"type": "aggregate", "columns": [{"sourceField": numeric[0], "outputName": f"{numeric[0]}_sum", "function": "SUM"}]},
+        ]
+    return {
+        "id": f"formula-widget-{index + 1}",
+        "type": widget_type,
+        "title": f"Formulas {index + 1}",
+        "layout": {"x": (index % 2) * 6, "y": (index // 2) * 4, "w": 6, "h": 4},
+        "config": {},
+        "transform": {"steps": steps},
+    }
+
+
+def write_formula_workload(path: Path, records: int) -> Dict[str, Any]:
+    """Write <output>.formulas.json for a vault of ``records`` notes; returns it."""
+    workload = "rollup" if args.rollup_workload else "relations" if args.relations else "default"
+    fields = FORMULA_FIELDS[workload]
+    builder = FormulaBuilder(fields, parse_formula_mix(args.formula_mix))
+    formulas = [builder.formula(index) for index in range(args.formulas)]
+    by_name = {f["name"]: f for f in formulas}
+    widgets = [
+        formula_widget(w, formulas[w::args.formula_widgets], by_name, fields)
+        for w in range(min(args.formula_widgets, len(formulas)))
+    ]
+    config = {
+        "seed": args.seed,
+        "workload": workload,
+        "records": records,
+        "options": {
+            "depth": args.formula_depth,
+            "fanIn": args.formula_fan_in,
+            "mix": builder.mix,
+            "chainRate": args.formula_chain_rate,
+        },
+        "fields": fields,
+        "formulas": formulas,
+        # DatabaseViewConfig subset: what the Dashboard view saves and renders
+        "dashboard": {
+            "formulaFields": [
+                {"name": f["name"], "expression": f["expression"], "resultType": f["resultType"]}
+                for f in formulas
+            ],
+            "widgets": widgets,
+        },
+    }
+    path.write_text(json.dumps(config, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    return config
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# VIEW WORKLOAD
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# --view-workload generates task cards tuned for Table and Board rendering:
+# long titles (some with an unbreakable token), many tags, a multi-line
+# ``description`` and a ``checklist`` of varying length, so cells wrap to
+# very different heights. ``status`` takes one of --board-columns values.
+# Column sizes follow a Zipf law over shuffled ranks (--column-skew), so the
+# Board is wide and its long columns are spread across it.
+#
+# <output>.views.json (--views-file) lists the columns in Board order with
+# their expected shares. It also holds scroll traces sampled at 60 Hz: steady
+# wheel scrolling, flings with friction and scrollbar drags for the Table,
+# and pans across the Board. Offsets are in pixels for the default row
+# height and Board column width; consumers rescale them to their own.
+
+VIEW_ROW_HEIGHT = 36  # getRowHeight("default")
+VIEW_COLUMN_WIDTH = 270  # BoardOptionsProvider's default columnWidth
+VIEW_VIEWPORT = (1600, 900)
+VIEW_FRAME_HZ = 60
+VIEW_STAGES = [
+    "Intake", "Triage", "Discovery", "Design", "Review", "Build", "Code Review",
+    "QA", "Staging", "Release", "Follow-up", "Blocked",
+]
+# Tokens without break opportunities, so title cells cannot wrap them
+VIEW_LONG_TOKENS = [
+    "https://tracker.example.com/projects/platform/issues/4711/comments#c-20251117",
+    "SynchronizeDashboardWidgetConfigurationAcrossWorkspaces",
+    "refactor/board-virtualization-with-variable-height-cards",
+    "/Users/shared/Vault/Projects/Platform/Quarterly Planning/Draft.md",
+]
+VIEW_TAG_VOCABULARY = 400
+
+
+class ViewLayout:
+    """Board columns and the tag vocabulary of --view-workload."""
+    
+    def __init__(self):
+        rng = random.Random(f"views:{args.seed}")
+        # Zero-padded so the Board's numeric sort keeps generation order
+        width = len(str(args.board_columns))
+        self.columns = [
+            f"{i + 1:0{width}d} {VIEW_STAGES[i % len(VIEW_STAGES)]}"
+            for i in range(args.board_columns)
+        ]
+        ranks = list(range(len(self.columns)))
+        rng.shuffle(ranks)
+        self.weights = [1.0 / (rank + 1) ** args.column_skew for rank in ranks]
+        self.column_cum = list(accumulate(self.weights))
+        self.tags = sorted({
+            f"{rng.choice(FILLER_WORDS)}/{rng.choice(FILLER_WORDS)}-{i}" for i in range(VIEW_TAG_VOCABULARY)
+        })
+    
+    def pick_column(self) -> str:
+        return self.columns[bisect.bisect(self.column_cum, random.random() * self.column_cum[-1])]
+
+
+_view_layouts: Dict[int, ViewLayout] = {}
+
+
+def view_layout() -> ViewLayout:
+    """Per-process cache of the view layout."""
+    layout = _view_layouts.get(args.board_columns)
+    if layout is None:
+        layout = _view_layouts[args.board_columns] = ViewLayout()
+    return layout
+
+
+def view_title(words: int) -> str:
+    """Title of about ``words`` words; one in twenty carries an unbreakable token."""
+    parts = [random.choice(TASK_TITLES)] + random.choices(FILLER_WORDS, k=max(words - 3, 0))
+    if random_bool(0.05):
+        parts.insert(random.randrange(len(parts) + 1), random.choice(VIEW_LONG_TOKENS))
+    return " ".join(parts)
+
+
+def generate_view_card(layout: ViewLayout) -> Dict[str, Any]:
+    """Task card with long, variable-height cells in one of the Board columns."""
+    record = generate_task(args.realistic, args.with_overdue)
+    words = max(3, round(random.lognormvariate(math.log(args.title_words), 0.5)))
+    lines = min(int(random.expovariate(1 / args.description_lines)) if args.description_lines > 0 else 0, 40)
+    tags = random.sample(layout.tags, min(random.randint(0, 2 * args.view_tags), len(layout.tags)))
+    record.update({
+        "title": view_title(words),
+        "status": layout.pick_column(),
+        "tags": record["tags"] + tags,
+        "estimate": random.choice([1, 2, 3, 5, 8, 13, 21]),
+        "assignees": [f"[[{name}]]" for name in random.sample(ATTENDEES, random.randint(0, 4))],
+        "checklist": [view_title(random.randint(3, 8)) for _ in range(random.randint(0, 8))],
+        "_subtype": "card",
+    })
+    if lines:
+        record["description"] = "\n".join(view_title(random.randint(6, 20)) for _ in range(lines))
+    return record
+
+
+def generate_view_records(start: int, count: int) -> Iterator[Dict[str, Any]]:
+    """Yield ``count`` cards of the view workload."""
+    layout = view_layout()
+    for _ in range(count):
+        yield generate_view_card(layout)
+
+
+def scroll_trace(rng: random.Random, limit: int, kind: str, frames: int) -> List[int]:
+    """Scroll offsets, one per 60 Hz frame, clamped to ``0 .. limit``.
+
+    ``wheel`` alternates bursts of wheel ticks with pauses, ``fling`` gives
+    flicks that decay by friction and ``drag`` drags the scrollbar thumb to
+    random positions within a few frames.
+    """
+    position = 0.0
+    velocity = 0.0
+    target = 0.0
+    scrolling = False
+    burst = 0
+    trace: List[int] = []
+    for _ in range(frames):
+        if kind == "wheel":
+            if burst == 0:
+                scrolling = not scrolling
+                burst = rng.randint(20, 60) if scrolling else rng.randint(5, 20)
+                velocity = rng.choice([100.0, 100.0, 100.0, -100.0]) if scrolling else 0.0
+            burst -= 1
+            position += velocity
+        elif kind == "fling":
+            if abs(velocity) < 50 / VIEW_FRAME_HZ:
+                velocity = rng.uniform(4_000, 12_000) / VIEW_FRAME_HZ * (1 if rng.random() < 0.8 else -1)
+            position += velocity
+            velocity *= 0.95
+        else:
+            if abs(target - position) < 1:
+                target = rng.uniform(0, limit)
+                velocity = (target - position) / rng.randint(3, 8)
+            position += velocity if abs(target - position) > abs(velocity) else target - position
+        if position <= 0 or position >= limit:
+            position = min(max(position, 0.0), float(limit))
+            velocity = -velocity if kind == "fling" else velocity
+        trace.append(int(position))
+    return trace
+
+
+def write_view_workload(path: Path, records: int) -> Dict[str, Any]:
+    """Write <output>.views.json for a vault of ``records`` cards; returns it."""
+    layout = view_layout()
+    rng = random.Random(f"views:traces:{args.seed}")
+    width, height = VIEW_VIEWPORT
+    table_limit = max(records * VIEW_ROW_HEIGHT - height, 0)
+    board_limit = max(len(layout.columns) * VIEW_COLUMN_WIDTH - width, 0)
+    total = sum(layout.weights)
+    traces = [
+        {"name": f"table-{kind}", "axis": "y", "frames": scroll_trace(rng, table_limit, kind, args.scroll_frames)}
+        for kind in ("wheel", "fling", "drag")
+    ]
+    traces.append({
+        "name": "board-pan",
+        "axis": "x",
+        "frames": scroll_trace(rng, board_limit, "fling", args.scroll_frames),
+    })
+    config = {
+        "seed": args.seed,
+        "records": records,
+        "groupBy": "status",
+        "rowHeight": VIEW_ROW_HEIGHT,
+        "columnWidth": VIEW_COLUMN_WIDTH,
+        "viewport": {"width": width, "height": height},
+        "frameHz": VIEW_FRAME_HZ,
+        "options": {
+            "boardColumns": args.board_columns,
+            "columnSkew": args.column_skew,
+            "titleWords": args.title_words,
+            "tags": args.view_tags,
+            "descriptionLines": args.description_lines,
+        },
+        "columns": [
+            {"id": column, "share": round(weight / total, 6)}
+            for column, weight in zip(layout.columns, layout.weights)
+        ],
+        "traces": traces,
+    }
+    path.write_text(json.dumps(config, ensure_ascii=False) + "\n", encoding="utf-8")
+    return config
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# QUERY WORKLOAD
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# --query-workload lays records out as [projects | items]. Items live in
+# Work/<area> (a tenth in Work/<area>/Archive), tagged #q/<area>, and link
+# one project picked uniformly. Areas follow a Zipf law. Project status and
+# owner are drawn from a layout rng, so every shard knows them. Item fields
+# have fixed distributions: ``score`` is uniform over 0..9999 and ``due``
+# uniform over today ± 180 days. A query's expected selectivity therefore
+# follows from the layout alone, without reading the vault back.
+#
+# Item bodies carry what only Dataview indexes: an ``effort::`` inline field,
+# a few more inline fields (--query-inline-fields) and a task list with
+# ``[due:: ]`` / ``[priority:: ]`` annotations (--query-tasks).
+#
+# <output>.queries.json (--queries-file) is the query suite. Every query
+# has a native form (from / where / sort / limit as in NativeQuery, plus an
+# optional relation ``join`` and ``groupBy``) and the equivalent DQL.
+# Queries over inline fields or tasks are Dataview-only (``native: false``).
+# ``expected`` is the share of items (of tasks, for TASK queries) the query
+# should return.
+
+QUERY_AREAS = [
+    "Engineering", "Design", "Marketing", "Sales", "Support", "Finance",
+    "Legal", "Operations", "Research", "People", "Security", "Data",
+]
+QUERY_STATUSES = {"todo": 0.35, "doing": 0.2, "review": 0.1, "done": 0.3, "blocked": 0.05}
+QUERY_PRIORITIES = {"low": 0.4, "medium": 0.35, "high": 0.2, "urgent": 0.05}
+QUERY_PROJECT_STATUSES = {"active": 0.6, "paused": 0.25, "closed": 0.15}
+QUERY_SCORE_RANGE = 10_000
+QUERY_DUE_DAYS = 180
+QUERY_ARCHIVE_RATE = 0.1
+QUERY_EFFORTS = [1, 2, 3, 5, 8, 13]
+QUERY_TASK_DONE_RATE = 0.4
+
+
+class QueryLayout:
+    """Projects, areas and their shares for --query-workload."""
+    
+    def __init__(self, total: int, projects: Optional[int]):
+        self.projects = min(total, projects if projects is not None else max(1, total // 100))
+        self.items = total - self.projects
+        rng = random.Random(f"queries:{args.seed}")
+        self.areas = [
+            QUERY_AREAS[i] if i < len(QUERY_AREAS) else f"Area {i + 1}"
+            for i in range(args.query_areas)
+        ]
+        weights = [1.0 / (rank + 1) for rank in range(len(self.areas))]
+        self.area_shares = [w / sum(weights) for w in weights]
+        self.area_cum = list(accumulate(self.area_shares))
+        states, state_weights = cumulative(QUERY_PROJECT_STATUSES)
+        self.project_status = [states[bisect.bisect(state_weights, rng.random() * state_weights[-1])]
+                               for _ in range(self.projects)]
+        self.project_owner = [rng.choice(ATTENDEES) for _ in range(self.projects)]
+    
+    def pick_area(self) -> str:
+        return self.areas[min(bisect.bisect(self.area_cum, random.random()), len(self.areas) - 1)]
+    
+    def project_share(self, **match: str) -> float:
+        """Share of projects (hence of items, which pick one uniformly) matching ``match``."""
+        columns = {"status": self.project_status, "owner": self.project_owner}
+        hits = sum(all(columns[k][p] == v for k, v in match.items()) for p in range(self.projects))
+        return hits / self.projects if self.projects else 0.0
+
+
+_query_layouts: Dict[int, QueryLayout] = {}
+
+
+def query_layout() -> QueryLayout:
+    """Per-process cache of the query layout."""
+    layout = _query_layouts.get(args.numfiles)
+    if layout is None:
+        layout = _query_layouts[args.numfiles] = QueryLayout(args.numfiles, args.query_projects)
+    return layout
+
+
+def area_tag(area: str) -> str:
+    return "q/" + area.lower().replace(" ", "-")
+
+
+def pick_weighted(weights: Dict[str, float]) -> str:
+    return random.choices(list(weights), weights=list(weights.values()))[0]
+
+
+def generate_query_project(index: int, layout: QueryLayout) -> Dict[str, Any]:
+    """Project note the items join on: status and owner come from the layout."""
+    name = relation_name("project", index, args.realistic)
+    return {
+        "title": name,
+        "type": "project",
+        "status": layout.project_status[index],
+        "owner": layout.project_owner[index],
+        "budget": random.randrange(5_000, 500_000, 500),
+        "tags": ["project"],
+        "_type": "project",
+        "_name": name,
+    }
+
+
+def query_item_body(area: str) -> str:
+    """Inline fields and an annotated task list, as Dataview indexes them."""
+    today = run_date()
+    lines = [f"effort:: {random.choice(QUERY_EFFORTS)}\n"]
+    for _ in range(int(random.expovariate(1 / args.query_inline_fields)) if args.query_inline_fields > 0 else 0):
+        key = random.choice(list(INLINE_FIELD_KEYS))
+        value_kind = INLINE_FIELD_KEYS[key]
+        if value_kind == "number":
+            value = str(random.randint(1, 10))
+        elif value_kind == "date":
+            value = random_date().isoformat()
+        elif value_kind == "link":
+            value = f"[[{relation_name('project', random.randrange(query_layout().projects), args.realistic)}]]"
+        else:
+            value = random.choice(FILLER_WORDS)
+        lines.append(f"Noted [{key}:: {value}] during review.\n" if random_bool(0.4) else f"{key}:: {value}\n")
+    tasks = int(random.expovariate(1 / args.query_tasks)) if args.query_tasks > 0 else 0
+    if tasks:
+        lines.append("\n## Tasks\n")
+        for _ in range(tasks):
+            done = "x" if random_bool(QUERY_TASK_DONE_RATE) else " "
+            due = today + datetime.timedelta(days=random.randint(-QUERY_DUE_DAYS, QUERY_DUE_DAYS))
+            lines.append(f"- [{done}] {random.choice(TASK_TITLES)} [due:: {due.isoformat()}]"
+                         f" [priority:: {pick_weighted(QUERY_PRIORITIES)}] #{area_tag(area)}\n")
+    return "".join(lines)
+
+
+def generate_query_item(index: int, layout: QueryLayout) -> Dict[str, Any]:
+    """Item ``index``: fixed-distribution fields, one project link, inline fields and tasks."""
+    area = layout.pick_area()
+    status = pick_weighted(QUERY_STATUSES)
+    priority = pick_weighted(QUERY_PRIORITIES)
+    due = run_date() + datetime.timedelta(days=random.randint(-QUERY_DUE_DAYS, QUERY_DUE_DAYS))
+    archived = random_bool(QUERY_ARCHIVE_RATE)
+    return {
+        "title": f"{random.choice(TASK_TITLES)} {index}",
+        "type": "task",
+        "status": status,
+        "priority": priority,
+        "score": random.randrange(QUERY_SCORE_RANGE),
+        "due": due.isoformat(),
+        "done": status == "done",
+        "area": area,
+        "project": f"[[{relation_name('project', random.randrange(layout.projects), args.realistic)}]]",
+        "tags": [area_tag(area)] + (["q/urgent"] if priority == "urgent" else []),
+        "_type": "task",
+        "_folder": f"Work/{area}/Archive" if archived else f"Work/{area}",
+        "_markdown": query_item_body(area),
+    }
+
+
+def generate_query_records(start: int, count: int) -> Iterator[Dict[str, Any]]:
+    """Yield records ``start .. start+count`` of the query workload."""
+    layout = query_layout()
+    for index in range(start, min(start + count, args.numfiles)):
+        if index < layout.projects:
+            yield generate_query_project(index, layout)
+        else:
+            yield generate_query_item(index - layout.projects, layout)
+
+
+def condition(field: str, operator: str, value: Optional[str] = None) -> Dict[str, Any]:
+    """A FilterCondition; ``value`` is left out for value-less operators."""
+    cond: Dict[str, Any] = {"field": field, "operator": operator, "enabled": True}
+    if value is not None:
+        cond["value"] = value
+    return cond
+
+
+def all_of(*conditions: Dict[str, Any], groups: Optional[List[Dict[str, Any]]] = None,
+           conjunction: str = "and") -> Dict[str, Any]:
+    """A FilterDefinition over ``conditions`` (and nested ``groups``)."""
+    definition: Dict[str, Any] = {"conjunction": conjunction, "conditions": list(conditions)}
+    if groups:
+        definition["groups"] = groups
+    return definition
+
+
+def sort_by(*keys: Tuple[str, str]) -> Dict[str, Any]:
+    """A SortDefinition from (field, order) pairs."""
+    return {"criteria": [{"field": field, "order": order, "enabled": True} for field, order in keys]}
+
+
+def query_spec(name: str, family: str, expected: float, dql: str,
+               source: Optional[Dict[str, Any]] = None, **clauses: Any) -> Dict[str, Any]:
+    """One suite entry; clauses default to a full scan of Work/ as a table."""
+    spec = {
+        "name": name,
+        "family": family,
+        "expected": round(expected, 6),
+        "from": source or {"kind": "folder", "path": "Work", "recursive": True},
+        "where": None,
+        "join": None,
+        "sort": None,
+        "limit": None,
+        "groupBy": None,
+        "columns": [],
+        "native": True,
+        "dataview": "table",
+        "dql": dql,
+    }
+    spec.update(clauses)
+    return spec
+
+
+def build_query_suite(layout: QueryLayout) -> List[Dict[str, Any]]:
+    """The native and Dataview queries of the workload, with expected selectivities."""
+    today = run_date()
+    span = 2 * QUERY_DUE_DAYS + 1
+    window_end = today + datetime.timedelta(days=30)
+    open_states = ["todo", "doing", "review"]
+    open_share = sum(QUERY_STATUSES[s] for s in open_states)
+    urgent, blocked = QUERY_PRIORITIES["urgent"], QUERY_STATUSES["blocked"]
+    top_area = layout.areas[0]
+    owner = layout.project_owner[0] if layout.projects else ATTENDEES[0]
+    projects = {"kind": "folder", "path": RELATION_FOLDERS["project"], "recursive": False}
+    
+    suite = []
+    for target in args.query_selectivity:
+        below = max(1, round(target * QUERY_SCORE_RANGE))
+        suite.append(query_spec(
+            f"score-lt-{target:g}", "selectivity", below / QUERY_SCORE_RANGE,
+            f'TABLE score, due, status FROM "Work" WHERE score < {below} SORT due ASC',
+            where=all_of(condition("score", "lt", str(below))),
+            sort=sort_by(("due", "asc")), columns=["score", "due", "status"],
+        ))
+    suite += [
+        query_spec(
+            "full-scan", "scan", 1.0, 'TABLE status FROM "Work"', columns=["status"],
+        ),
+        query_spec(
+            "open-by-priority", "sort", min(open_share, 100 / max(layout.items, 1)),
+            'TABLE priority, due FROM "Work" WHERE contains(list("todo", "doing", "review"), status) '
+            'SORT priority DESC, due ASC LIMIT 100',
+            where=all_of(condition("status", "is-any-of", json.dumps(open_states))),
+            sort=sort_by(("priority", "desc"), ("due", "asc")), limit=100, columns=["priority", "due"],
+        ),
+        query_spec(
+            "sort-multi", "sort", 1.0, 'TABLE priority, due FROM "Work" SORT priority DESC, due ASC, title ASC',
+            sort=sort_by(("priority", "desc"), ("due", "asc"), ("title", "asc")), columns=["priority", "due"],
+        ),
+        query_spec(
+            "tag-area", "source", layout.area_shares[0], f"TABLE status FROM #{area_tag(top_area)}",
+            source={"kind": "tag", "tag": area_tag(top_area), "hierarchy": False}, columns=["status"],
+        ),
+        query_spec(
+            "folder-area-flat", "source", layout.area_shares[0] * (1 - QUERY_ARCHIVE_RATE),
+            f'TABLE status FROM "Work/{top_area}" WHERE file.folder = "Work/{top_area}"',
+            source={"kind": "folder", "path": f"Work/{top_area}", "recursive": False}, columns=["status"],
+        ),
+        query_spec(
+            "due-next-30d", "selectivity", 30 / span,
+            f'TABLE due FROM "Work" WHERE due >= date({today}) AND due < date({window_end}) SORT due ASC',
+            where=all_of(condition("due", "is-on-and-after", today.isoformat()),
+                       condition("due", "is-before", window_end.isoformat())),
+            sort=sort_by(("due", "asc")), columns=["due"],
+        ),
+        query_spec(
+            "urgent-or-blocked-low", "selectivity", urgent + blocked * 0.5 - urgent * blocked * 0.5,
+            'TABLE priority, status, score FROM "Work" WHERE priority = "urgent" OR (status = "blocked" AND score < 5000)',
+            where=all_of(condition("priority", "is", "urgent"), conjunction="or",
+                         groups=[all_of(condition("status", "is", "blocked"), condition("score", "lt", "5000"))]),
+            columns=["priority", "status", "score"],
+        ),
+        query_spec(
+            "join-active-open", "join", (1 - QUERY_STATUSES["done"]) * layout.project_share(status="active"),
+            'TABLE project, project.owner FROM "Work" WHERE status != "done" AND project.status = "active"',
+            where=all_of(condition("status", "is-not", "done")),
+            join={"field": "project", "from": projects, "where": all_of(condition("status", "is", "active"))},
+            columns=["project"],
+        ),
+        query_spec(
+            "join-owner", "join", layout.project_share(owner=owner),
+            f'TABLE project, due FROM "Work" WHERE project.owner = "{owner}" SORT due ASC',
+            join={"field": "project", "from": projects, "where": all_of(condition("owner", "is", owner))},
+            sort=sort_by(("due", "asc")), columns=["project", "due"],
+        ),
+        query_spec(
+            "group-status", "group", 0.5,
+            'TABLE length(rows) AS count FROM "Work" WHERE score < 5000 GROUP BY status',
+            where=all_of(condition("score", "lt", "5000")), groupBy="status",
+        ),
+        query_spec(
+            "group-project", "group", 1.0, 'TABLE length(rows) AS count FROM "Work" GROUP BY project',
+            groupBy="project",
+        ),
+        query_spec(
+            "inline-effort", "inline", 2 / len(QUERY_EFFORTS),
+            'TABLE effort FROM "Work" WHERE effort >= 8',
+            where=all_of(condition("effort", "gte", "8")), columns=["effort"], native=False,
+        ),
+        query_spec(
+            "tasks-open-overdue", "task", (1 - QUERY_TASK_DONE_RATE) * QUERY_DUE_DAYS / span,
+            f'TASK FROM "Work" WHERE !completed AND due < date({today})',
+            where=all_of(condition("completed", "is-not-checked"), condition("due", "is-before", today.isoformat())),
+            native=False, dataview="task",
+        ),
+    ]
+    return suite
+
+
+def write_query_workload(path: Path, records: int) -> Dict[str, Any]:
+    """Write <output>.queries.json for a vault of ``records`` notes; returns it."""
+    layout = query_layout()
+    config = {
+        "seed": args.seed,
+        "records": records,
+        "projects": layout.projects,
+        "items": layout.items,
+        "today": run_date().isoformat(),
+        "options": {
+            "areas": args.query_areas,
+            "tasks": args.query_tasks,
+            "inlineFields": args.query_inline_fields,
+            "selectivity": args.query_selectivity,
+        },
+        "areas": [{"name": a, "tag": area_tag(a), "share": round(s, 6)}
+                  for a, s in zip(layout.areas, layout.area_shares)],
+        "queries": build_query_suite(layout),
+    }
+    path.write_text(json.dumps(config, ensure_ascii=False) + "\n", encoding="utf-8")
+    return config
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# MULTI-PROJECT WORKLOAD
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# --multi-project N lays records out as N consecutive blocks, one per project
+# folder (Projects/<name>). Block sizes follow a Zipf law over shuffled ranks
+# (--project-size-skew); every project gets at least one note. Each project
+# draws its own schema (--project-fields names out of PROJECT_FIELD_KINDS,
+# with its own option lists) from a layout rng, so every shard knows it.
+#
+# Relation links are wikilinks to note basenames. ``related`` targets the
+# note's own project. Each of the --cross-project-fields fields
+# (dependsOn, blocks, ...) targets one other project, picked with a Zipf
+# law over shuffled ranks (--target-skew), so some projects become hubs that
+# many others link into. A RelationFieldConfig names a single target
+# project, so the cross-project share is drawn per link: each of a note's
+# links (--project-links on average) goes through a cross-project field with
+# probability --cross-project-rate. With a single project every link stays
+# in ``related``.
+#
+# <output>.data.json (--settings-file) holds the plugin settings: one folder
+# project per block, with the relation and option field configs. Copy it to
+# <vault>/.obsidian/plugins/obs-projects-plus/data.json when the output
+# folder is the vault root. <output>.projects.json (--projects-file) is the
+# layout benchmarks read: per project its id, folder, size, schema and
+# relation targets.
+
+PROJECT_FIELD_KINDS = {
+    "status": "option", "priority": "option", "stage": "option", "category": "option",
+    "region": "option", "risk": "option", "severity": "option", "channel": "option",
+    "component": "option", "quarter": "option",
+    "owner": "person", "reviewer": "person",
+    "summary": "text", "customer": "text", "version": "text",
+    "estimate": "number", "progress": "number", "budget": "number", "rating": "number",
+    "effort": "number", "score": "number", "impact": "number",
+    "due": "date", "start": "date", "reviewed": "date", "released": "date",
+    "billable": "bool", "blocked": "bool", "archived": "bool",
+    "labels": "list", "teams": "list",
+}
+CROSS_PROJECT_FIELDS = ["dependsOn", "blocks", "relatesTo", "duplicates", "implements", "follows"]
+# Share of schema fields a note fills in
+PROJECT_FIELD_FILL = 0.85
+
+
+def cross_field_name(slot: int) -> str:
+    """Name of a project's ``slot``-th cross-project relation field."""
+    return CROSS_PROJECT_FIELDS[slot] if slot < len(CROSS_PROJECT_FIELDS) else f"linksTo{slot + 1}"
+
+
+class ProjectLayout:
+    """Project blocks, schemas and relation targets for --multi-project."""
+    
+    def __init__(self, total: int, projects: int):
+        self.projects = projects
+        rng = random.Random(f"projects:{args.seed}")
+        
+        # Largest blocks are spread over the project range, not front-loaded
+        ranks = list(range(projects))
+        rng.shuffle(ranks)
+        weights = [1.0 / (rank + 1) ** args.project_size_skew for rank in ranks]
+        spare = total - projects
+        scale = spare / sum(weights)
+        sizes = [1 + int(w * scale) for w in weights]
+        # Rounding leftovers go to the heaviest blocks
+        heaviest = sorted(range(projects), key=lambda p: (-weights[p], p))
+        for project in heaviest[:total - sum(sizes)]:
+            sizes[project] += 1
+        self.sizes = sizes
+        self.offsets = [0] + list(accumulate(sizes))
+        
+        self.names = [relation_name("project", p, args.realistic) for p in range(projects)]
+        self.keys = [f"P{p + 1:0{len(str(projects))}d}" for p in range(projects)]
+        self.folders = [f"{RELATION_FOLDERS['project']}/{name}" for name in self.names]
+        self.ids = [str(uuid.UUID(int=rng.getrandbits(128), version=4)) for _ in range(projects)]
+        # --realistic note names: task titles sanitized as get_filename() does
+        self.titles = [" ".join("".join(c for c in t if c.isalnum() or c in " -_").split()) for t in TASK_TITLES]
+        
+        pool = list(PROJECT_FIELD_KINDS)
+        low, high = max(1, args.project_fields // 2), args.project_fields + args.project_fields // 2
+        self.schemas: List[Dict[str, str]] = []
+        self.options: List[Dict[str, List[str]]] = []
+        for _ in range(projects):
+            names = rng.sample(pool, min(len(pool), rng.randint(low, max(low, high)))) if args.project_fields else []
+            self.schemas.append({name: PROJECT_FIELD_KINDS[name] for name in names})
+            self.options.append({
+                name: rng.sample(FILLER_WORDS, rng.randint(3, 8))
+                for name in names if PROJECT_FIELD_KINDS[name] in ("option", "list")
+            })
+        
+        # Hub projects: a Zipf law over shuffled ranks decides who gets linked into
+        target_ranks = list(range(projects))
+        rng.shuffle(target_ranks)
+        target_cum = list(accumulate(1.0 / (rank + 1) ** args.target_skew for rank in target_ranks))
+        slots = min(args.cross_project_fields, projects - 1)
+        self.targets: List[List[int]] = []
+        for project in range(projects):
+            picked: List[int] = []
+            for _ in range(20 * slots):
+                if len(picked) == slots:
+                    break
+                target = bisect.bisect(target_cum, rng.random() * target_cum[-1])
+                if target != project and target not in picked:
+                    picked.append(target)
+            if len(picked) < slots:  # heavy skew: fill up in rank order
+                by_rank = sorted(range(projects), key=lambda p: target_ranks[p])
+                picked += [p for p in by_rank if p != project and p not in picked][:slots - len(picked)]
+            self.targets.append(picked)
+    
+    def owner(self, index: int) -> int:
+        return bisect.bisect_right(self.offsets, index) - 1
+    
+    def note_name(self, project: int, local: int) -> str:
+        """Basename of note ``local`` of ``project``; unique across the vault."""
+        if args.realistic:
+            return f"{self.keys[project]}-{local + 1} {self.titles[local % len(self.titles)]}"
+        return f"{self.keys[project]}-{local + 1}"
+    
+    def relation_fields(self, project: int) -> List[Tuple[str, int]]:
+        """(field, target project) pairs of ``project``'s relation fields."""
+        return [("related", project)] + [(cross_field_name(slot), target)
+                                         for slot, target in enumerate(self.targets[project])]
+
+
+_project_layouts: Dict[int, ProjectLayout] = {}
+
+
+def project_layout() -> ProjectLayout:
+    """Per-process cache of the multi-project layout."""
+    layout = _project_layouts.get(args.numfiles)
+    if layout is None:
+        layout = _project_layouts[args.numfiles] = ProjectLayout(args.numfiles, args.multi_project)
+    return layout
+
+
+def project_field_value(kind: str, options: Optional[List[str]]) -> Any:
+    """A value of schema field ``kind``; option and list fields draw from ``options``."""
+    if kind == "option":
+        return random.choice(options)
+    if kind == "list":
+        return random.sample(options, random.randint(1, min(3, len(options))))
+    if kind == "person":
+        return random.choice(ATTENDEES)
+    if kind == "number":
+        return random.randint(0, 100)
+    if kind == "date":
+        return random_date(90, 90).isoformat()
+    if kind == "bool":
+        return random_bool()
+    return " ".join(random.sample(FILLER_WORDS, 3))
+
+
+def generate_project_note(index: int, layout: ProjectLayout) -> Dict[str, Any]:
+    """Note ``index``: its project's schema, then intra- and cross-project links."""
+    project = layout.owner(index)
+    local = index - layout.offsets[project]
+    name = layout.note_name(project, local)
+    record: Dict[str, Any] = {"title": name}
+    options = layout.options[project]
+    for field, kind in layout.schemas[project].items():
+        if random_bool(PROJECT_FIELD_FILL):
+            record[field] = project_field_value(kind, options.get(field))
+    
+    targets = layout.targets[project]
+    links = int(random.expovariate(1 / args.project_links)) if args.project_links > 0 else 0
+    for _ in range(links):
+        if targets and random_bool(args.cross_project_rate):
+            slot = random.randrange(len(targets))
+            field, target = cross_field_name(slot), targets[slot]
+            other = random.randrange(layout.sizes[target])
+        else:
+            if layout.sizes[project] < 2:
+                continue
+            field, target = "related", project
+            other = random.randrange(layout.sizes[project] - 1)
+            other += other >= local  # never the note itself
+        link = f"[[{layout.note_name(target, other)}]]"
+        values = record.setdefault(field, [])
+        if link not in values:
+            values.append(link)
+    
+    record["_type"] = "task"
+    record["_name"] = name
+    record["_folder"] = layout.folders[project]
+    return record
+
+
+def count_project_edges(record: Dict[str, Any]) -> Tuple[int, int]:
+    """(links, cross-project links) in a --multi-project note's relation fields."""
+    cross = sum(len(values) for field, values in record.items()
+                if field in CROSS_PROJECT_FIELDS or field.startswith("linksTo"))
+    return len(record.get("related", ())) + cross, cross
+
+
+def generate_multi_project_records(start: int, count: int) -> Iterator[Dict[str, Any]]:
+    """Yield records ``start .. start+count`` of the multi-project workload."""
+    layout = project_layout()
+    for index in range(start, min(start + count, args.numfiles)):
+        yield generate_project_note(index, layout)
+
+
+def project_settings(layout: ProjectLayout) -> Dict[str, Any]:
+    """Plugin settings (version 4) with one folder project per block."""
+    projects = []
+    for p in range(layout.projects):
+        field_config: Dict[str, Any] = {
+            field: {"options": options}
+            for field, options in layout.options[p].items() if layout.schemas[p][field] == "option"
+        }
+        for field, target in layout.relation_fields(p):
+            field_config[field] = {"relation": {"targetProjectId": layout.ids[target]}}
+        projects.append({
+            "name": layout.names[p],
+            "id": layout.ids[p],
+            "fieldConfig": field_config,
+            "views": [],
+            "defaultName": "",
+            "templates": [],
+            "excludedNotes": [],
+            "isDefault": p == 0,
+            "dataSource": {"kind": "folder", "config": {"path": layout.folders[p], "recursive": False}},
+            "newNotesFolder": layout.folders[p],
+        })
+    return {
+        "version": 4,
+        "projects": projects,
+        "archives": [],
+        # The default limit (1000) would refuse the larger blocks
+        "preferences": {"projectSizeLimit": max(1000, max(layout.sizes))},
+    }
+
+
+def write_project_workload(path: Path, settings_path: Path, records: int) -> Dict[str, Any]:
+    """Write <output>.projects.json and the plugin settings; returns the layout."""
+    layout = project_layout()
+    config = {
+        "seed": args.seed,
+        "records": records,
+        "options": {
+            "projects": layout.projects,
+            "sizeSkew": args.project_size_skew,
+            "fields": args.project_fields,
+            "links": args.project_links,
+            "crossProjectRate": args.cross_project_rate,
+            "crossProjectFields": args.cross_project_fields,
+            "targetSkew": args.target_skew,
+        },
+        "settings": str(settings_path),
+        "projects": [
+            {
+                "id": layout.ids[p],
+                "name": layout.names[p],
+                "folder": layout.folders[p],
+                "records": layout.sizes[p],
+                "fields": layout.schemas[p],
+                "relations": [
+                    {"field": field, "target": target, "targetProjectId": layout.ids[target]}
+                    for field, target in layout.relation_fields(p)
+                ],
+            }
+            for p in range(layout.projects)
+        ],
+    }
+    path.write_text(json.dumps(config, ensure_ascii=False) + "\n", encoding="utf-8")
+    settings_path.parent.mkdir(parents=True, exist_ok=True)
+    settings_path.write_text(json.dumps(project_settings(layout), ensure_ascii=False, indent=2) + "\n",
+                             encoding="utf-8")
+    return config
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SCALE PROFILES
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# A profile (scripts/profiles/*.yaml or *.toml) describes a vault shape:
+#
+#   count        default for -n
+#   options      defaults for other CLI options (realistic, date_range, ...)
+#   relations    --relations knobs (people, fan_out, fan_dist, ...)
+#   calendar     --calendar-workload knobs (hot_days, day_skew, dst_rate, ...)
+#   rollup       --rollup-workload knobs (rollup_projects, project_skew, ...)
+#   formulas     --formulas knobs (formulas, formula_depth, formula_mix, ...)
+#   views        --view-workload knobs (board_columns, column_skew, title_words, ...)
+#   queries      --query-workload knobs (query_projects, query_areas, query_tasks, ...)
+#   projects     --multi-project knobs (multi_project, project_size_skew, cross_project_rate, ...)
+#   types        type mix: task / event / meeting / project / undated weights
+#   folders      per type (or "*") folder -> weight
+#   folder_tree  generated folder tree {depth, fanout, skew} for types
+#                without explicit folders
+#   nulls        field -> probability the key is left out
+#   tags         {vocabulary, per_record: [min, max], skew}
+#   body         note bodies: {median, sigma, max, empty_rate, links, fields,
+#                tasks, embeds}; see NOTE BODIES (--body-* flags override)
+#   fields       extra field -> {kind, cardinality, fill_rate}
+#   wide         generated sparse fields {count, prefix, kinds, cardinality,
+#                fill_rate}, optionally stressing type inference with
+#                mixed_rate (share of values drawn from another kind than the
+#                field's own), nesting {depth, breadth} for object values and
+#                long_lists {rate, length}
+#
+# SamplingPlan compiles the profile once per process into cumulative weight
+# tables and pre-generated value pools, so each record costs a few bisects.
+
+PROFILES_DIR = Path(__file__).resolve().parent / "profiles"
+PROFILE_KEYS = {
+    "name", "description", "count", "options", "relations", "calendar", "rollup", "formulas", "views", "queries",
+    "projects", "types", "folders", "folder_tree", "nulls", "tags", "body", "fields", "wide",
+}
+PROFILE_GENERATORS = {
+    "task": generate_task,
+    "event": generate_calendar_event,
+    "meeting": generate_meeting,
+    "project": generate_project,
+    "undated": generate_undated_task,
+}
+FIELD_KINDS = ["text", "number", "date", "checkbox", "list", "wikilink", "object"]
+FOLDER_LEVELS = ["Area", "Topic", "Notes", "Drafts"]
+FILLER_WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor "
+    "incididunt ut labore et dolore magna aliqua ut enim ad minim veniam quis "
+    "nostrud exercitation ullamco laboris nisi ut aliquip ex ea commodo consequat"
+).split()
+
+
+def load_profile(spec: str) -> Dict[str, Any]:
+    """Load a scale profile by preset name or file path.
+
+    Raises ValueError for unknown presets, formats or keys.
+    """
+    path = Path(spec)
+    if not path.is_file():
+        for suffix in (".yaml", ".yml", ".toml"):
+            candidate = PROFILES_DIR / f"{spec}{suffix}"
+            if candidate.is_file():
+                path = candidate
+                break
+        else:
+            known = sorted(p.stem for p in PROFILES_DIR.glob("*.*"))
+            raise ValueError(f"unknown preset {spec!r} (available: {', '.join(known)})")
+    if path.suffix == ".toml":
+        if tomllib is None:
+            raise ValueError("TOML profiles require Python 3.11+")
+        with open(path, "rb") as f:
+            profile = tomllib.load(f)
+    else:
+        with open(path, encoding="utf-8") as f:
+            profile = yaml.safe_load(f) or {}
+    unknown = set(profile) - PROFILE_KEYS
+    if unknown:
+        raise ValueError(f"{path.name}: unknown profile keys: {', '.join(sorted(unknown))}")
+    unknown = set(profile.get("types", {})) - set(PROFILE_GENERATORS)
+    if unknown:
+        raise ValueError(f"{path.name}: unknown record types: {', '.join(sorted(unknown))}")
+    return profile
+
+
+def profile_defaults(profile: Dict[str, Any]) -> Dict[str, Any]:
+    """CLI defaults implied by a profile (count, options and the workload knobs)."""
+    defaults = dict(profile.get("options", {}))
+    if "count" in profile:
+        defaults["numfiles"] = profile["count"]
+    if profile.get("relations"):
+        defaults["relations"] = True
+        defaults.update(profile["relations"])
+    if profile.get("calendar"):
+        defaults["calendar_workload"] = True
+        defaults.update(profile["calendar"])
+    if profile.get("rollup"):
+        defaults["rollup_workload"] = True
+        defaults.update(profile["rollup"])
+    if profile.get("views"):
+        defaults["view_workload"] = True
+        defaults.update(profile["views"])
+    if profile.get("queries"):
+        defaults["query_workload"] = True
+        defaults.update(profile["queries"])
+    defaults.update(profile.get("projects") or {})
+    defaults.update(profile.get("formulas") or {})
+    return defaults
+
+
+def cumulative(weights: Dict[Any, float]) -> Tuple[List[Any], List[float]]:
+    """Split a {value: weight} mapping into values and cumulative weights."""
+    return list(weights), list(accumulate(float(w) for w in weights.values()))
+
+
+def zipf_cumulative(size: int, s: float) -> List[float]:
+    """Cumulative Zipf weights for ranks 1..size."""
+    return list(accumulate(1.0 / (rank + 1) ** s for rank in range(size)))
+
+
+def nested_value(rng: random.Random, depth: int, breadth: int) -> Any:
+    """A YAML object ``depth`` levels deep with ``breadth`` keys per level.
+
+    The first key nests further; the others hold scalars, lists or a list
+    of objects, so every container shape appears along the way.
+    """
+    if depth <= 0:
+        return rng.choice([rng.randint(0, 99), rng.choice(FILLER_WORDS), True, None])
+    node: Dict[str, Any] = {"k0": nested_value(rng, depth - 1, breadth)}
+    for j in range(1, breadth):
+        shape = rng.randrange(3)
+        if shape == 0:
+            node[f"k{j}"] = rng.choice(FILLER_WORDS)
+        elif shape == 1:
+            node[f"k{j}"] = rng.sample(FILLER_WORDS, 3)
+        else:
+            node[f"k{j}"] = [{"id": i, "v": rng.choice(FILLER_WORDS)} for i in range(2)]
+    return node
+
+
+def field_pool(name: str, kind: str, cardinality: int, depth: int = 3, breadth: int = 2) -> List[Any]:
+    """The distinct values an extra field can take.
+
+    Seeded from the field name alone, so every shard and process agrees.
+    """
+    rng = random.Random(f"field:{name}")
+    today = run_date()
+    if kind == "checkbox":
+        return [True, False]
+    pool: List[Any] = []
+    for i in range(cardinality):
+        if kind == "number":
+            pool.append(rng.choice([rng.randint(0, 1000), round(rng.uniform(0, 100), 2)]))
+        elif kind == "date":
+            pool.append((today + datetime.timedelta(days=rng.randint(-365, 365))).isoformat())
+        elif kind == "list":
+            pool.append(rng.sample(FILLER_WORDS, rng.randint(1, 4)))
+        elif kind == "wikilink":
+            pool.append(f"[[{rng.choice(FILLER_WORDS).capitalize()} {i}]]")
+        elif kind == "object":
+            pool.append(nested_value(rng, depth, breadth))
+        else:
+            pool.append(f"{rng.choice(FILLER_WORDS).capitalize()} {i}")
+    return pool
+
+
+class SamplingPlan:
+    """A scale profile compiled into lookup tables for per-shard sampling."""
+    
+    def __init__(self, profile: Dict[str, Any]):
+        self.name = profile.get("name", "custom")
+        self.mix = profile.get("types") or {"task": 35, "event": 25, "meeting": 15, "project": 10}
+        self.types, self.type_cum = cumulative(self.mix)
+        
+        # Folders: explicit per-type tables, "*" fallback, else a generated tree
+        self.folders: Dict[str, Tuple[List[str], List[float]]] = {
+            kind: cumulative(table) for kind, table in profile.get("folders", {}).items()
+        }
+        tree = profile.get("folder_tree")
+        if tree and "*" not in self.folders:
+            names = self._folder_tree(tree.get("depth", 2), tree.get("fanout", 5))
+            self.folders["*"] = (names, zipf_cumulative(len(names), tree.get("skew", 1.0)))
+        self.folder_names = sorted({name for names, _ in self.folders.values() for name in names if name})
+        
+        self.nulls = [(field, rate) for field, rate in profile.get("nulls", {}).items() if rate > 0]
+        
+        tags = profile.get("tags")
+        self.tag_vocab: List[str] = []
+        if tags:
+            words = sorted({tag for pool in TAGS_POOL.values() for tag in pool} | set(FILLER_WORDS))
+            self.tag_vocab = [
+                words[i] if i < len(words) else f"{words[i % len(words)]}-{i // len(words)}"
+                for i in range(tags.get("vocabulary", 50))
+            ]
+            self.tag_cum = zipf_cumulative(len(self.tag_vocab), tags.get("skew", 1.0))
+            self.tag_range = tuple(tags.get("per_record", [0, 3]))
+        
+        self.body = profile.get("body") or {}
+        
+        # (name, fill_rate, pool, alternate pools) for every extra field,
+        # named ones first; alternates are only used with wide.mixed_rate
+        self.fields: List[Tuple[str, float, List[Any], List[List[Any]]]] = []
+        for name, spec in profile.get("fields", {}).items():
+            pool = field_pool(name, spec.get("kind", "text"), spec.get("cardinality", 10))
+            self.fields.append((name, spec.get("fill_rate", 1.0), pool, []))
+        wide = profile.get("wide") or {}
+        self.mixed_rate = wide.get("mixed_rate", 0.0)
+        self.long_lists: List[List[Any]] = []
+        if wide:
+            kinds, kind_cum = cumulative(wide.get("kinds") or {kind: 1 for kind in FIELD_KINDS})
+            nesting = wide.get("nesting", {})
+            depth, breadth = nesting.get("depth", 3), nesting.get("breadth", 2)
+            cardinality = wide.get("cardinality", 20)
+            rng = random.Random(f"wide:{self.name}")
+            for i in range(wide["count"]):
+                name = f"{wide.get('prefix', 'field')}{i:03d}"
+                kind = rng.choices(kinds, cum_weights=kind_cum)[0]
+                alternates = [
+                    field_pool(f"{name}:{other}", other, min(cardinality, 8), depth, breadth)
+                    for other in kinds if other != kind
+                ] if self.mixed_rate > 0 else []
+                pool = field_pool(name, kind, cardinality, depth, breadth)
+                self.fields.append((name, wide.get("fill_rate", 0.1), pool, alternates))
+            long_lists = wide.get("long_lists")
+            if long_lists:
+                self.long_list_rate = long_lists.get("rate", 0.01)
+                length = long_lists.get("length", 1000)
+                for j in range(4):
+                    items = field_pool(f"long:{j}", ["text", "number", "wikilink", "date"][j], length)
+                    self.long_lists.append(items)
+    
+    @staticmethod
+    def _folder_tree(depth: int, fanout: int) -> List[str]:
+        """Every folder of a depth x fanout tree, parents before children."""
+        names: List[str] = []
+        level = [""]
+        for d in range(depth):
+            label = FOLDER_LEVELS[min(d, len(FOLDER_LEVELS) - 1)]
+            level = [f"{parent}/{label} {i}".lstrip("/") for parent in level for i in range(1, fanout + 1)]
+            names += level
+        return names
+    
+    def sample_types(self, count: int) -> List[str]:
+        """Draw the record type of a whole shard in one call."""
+        return random.choices(self.types, cum_weights=self.type_cum, k=count)
+    
+    def decorate(self, record: Dict[str, Any], kind: str) -> None:
+        """Apply folder, tags, extra fields, nulls and body size to a record."""
+        table = self.folders.get(kind) or self.folders.get("*")
+        if table is not None and "_name" not in record:
+            names, cum = table
+            record["_folder"] = names[bisect.bisect(cum, random.random() * cum[-1])]
+        if self.tag_vocab and "tags" in record:
+            k = random.randint(*self.tag_range)
+            tags = random.choices(self.tag_vocab, cum_weights=self.tag_cum, k=k)
+            record["tags"] = list(dict.fromkeys(tags))
+        for name, rate, pool, alternates in self.fields:
+            if random.random() < rate:
+                if alternates and random.random() < self.mixed_rate:
+                    pool = alternates[random.randrange(len(alternates))]
+                value = pool[random.randrange(len(pool))]
+                if self.long_lists and random.random() < self.long_list_rate:
+                    value = self.long_lists[random.randrange(len(self.long_lists))]
+                record[name] = value
+        for field, rate in self.nulls:
+            if field in record and random.random() < rate:
+                del record[field]
+
+
+_plans: Dict[str, SamplingPlan] = {}
+
+
+def sampling_plan() -> Optional[SamplingPlan]:
+    """Per-process cache of the compiled --preset plan (None without one)."""
+    if not args.preset:
+        return None
+    plan = _plans.get(args.preset)
+    if plan is None:
+        plan = SamplingPlan(load_profile(args.preset))
+        _plans[args.preset] = plan
+    return plan
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# NOTE BODIES
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# Bodies are appended after the per-type template. Sizes are log-normal;
+# Markdown chunks (prose, lists, quotes, code, tables) are rendered once per
+# process and reused by reference, and only the links, inline fields, tasks
+# and embeds interleaved between them are drawn per note. Densities are per
+# 1000 characters, so a multi-MB body costs a few thousand small writes.
+
+BODY_CHUNK_COUNT = 96
+INLINE_FIELD_KEYS = {
+    "rating": "number",
+    "effort": "number",
+    "source": "text",
+    "context": "text",
+    "reviewed": "date",
+    "due": "date",
+    "related": "link",
+    "owner": "link",
+}
+EMBED_FILES = ["diagram.png", "screenshot.jpg", "whiteboard.excalidraw", "recording.m4a", "spec.pdf"]
+
+
+class BodySpec:
+    """Body size distribution and per-1000-character content densities."""
+    
+    def __init__(self, options: Dict[str, Any]):
+        self.mu = math.log(max(options["median"], 1))
+        self.sigma = options.get("sigma", 1.0)
+        self.max = options.get("max", 500_000)
+        self.empty_rate = options.get("empty_rate", 0.0)
+        self.densities = [(kind, options.get(kind, 0.0)) for kind in ("links", "fields", "tasks", "embeds")]
+    
+    def sample_size(self) -> int:
+        if self.empty_rate and random.random() < self.empty_rate:
+            return 0
+        return min(int(random.lognormvariate(self.mu, self.sigma)), self.max)
+
+
+_body_specs: Dict[str, Optional[BodySpec]] = {}
+
+
+def body_spec() -> Optional[BodySpec]:
+    """Per-process cache of the body options: profile body, then --body-* flags."""
+    key = args.preset or ""
+    if key in _body_specs:
+        return _body_specs[key]
+    plan = sampling_plan()
+    options = dict(plan.body) if plan is not None else {}
+    flags = {
+        "median": args.body_median, "sigma": args.body_sigma, "max": args.body_max,
+        "empty_rate": args.body_empty_rate, "links": args.link_density,
+        "fields": args.field_density, "tasks": args.task_density, "embeds": args.embed_density,
+    }
+    options.update({k: v for k, v in flags.items() if v is not None})
+    spec = BodySpec(options) if "median" in options else None
+    _body_specs[key] = spec
+    return spec
+
+
+_body_chunks: List[str] = []
+
+
+def body_chunks() -> List[str]:
+    """The cached Markdown building blocks bodies are assembled from."""
+    if _body_chunks:
+        return _body_chunks
+    rng = random.Random("body-chunks")
+    
+    def sentence() -> str:
+        return " ".join(rng.choices(FILLER_WORDS, k=rng.randint(6, 18))).capitalize() + "."
+    
+    for i in range(BODY_CHUNK_COUNT):
+        shape = i % 8
+        if shape == 0:
+            chunk = f"## {sentence()[:-1]}\n\n{' '.join(sentence() for _ in range(rng.randint(2, 6)))}\n\n"
+        elif shape in (1, 2, 3):
+            chunk = " ".join(sentence() for _ in range(rng.randint(3, 12))) + "\n\n"
+        elif shape == 4:
+            chunk = "".join(f"- {sentence()}\n" for _ in range(rng.randint(3, 8))) + "\n"
+        elif shape == 5:
+            chunk = "".join(f"> {sentence()}\n" for _ in range(rng.randint(1, 4))) + "\n"
+        elif shape == 6:
+            lines = [f"const {word} = {rng.randint(0, 999)};" for word in rng.sample(FILLER_WORDS, 5)]
+            chunk = "```js\n" + "\n".join(lines) + "\n```\n\n"
+        else:
+            rows = [f"| {rng.choice(FILLER_WORDS)} | {rng.randint(0, 99)} | {rng.choice(FILLER_WORDS)} |"
+                    for _ in range(rng.randint(2, 6))]
+            chunk = "| Name | Value | Note |\n| --- | --- | --- |\n" + "\n".join(rows) + "\n\n"
+        _body_chunks.append(chunk)
+    return _body_chunks
+
+
+def body_link_target() -> str:
+    """A note name to link to: real --relations notes, else realistic titles."""
+    if args.relations:
+        layout = RelationLayout(args.numfiles, args.people, args.clients)
+        entity, local = layout.entity_at(random.randrange(layout.total))
+        return relation_name(entity, local, args.realistic)
+    return random.choice(random.choice([PROJECT_TITLES, TASK_TITLES, ATTENDEES]))
+
+
+def body_item(kind: str) -> str:
+    """One dynamic line: a link, inline field, task or embed."""
+    roll = random.random()
+    if kind == "links":
+        target = body_link_target()
+        if roll < 0.6:
+            return f"See [[{target}]] for details.\n\n"
+        if roll < 0.8:
+            return f"Discussed with [[{target}|{random.choice(FILLER_WORDS)}]].\n\n"
+        return f"Background in [[{target}#{random.choice(FILLER_WORDS).capitalize()}]].\n\n"
+    if kind == "fields":
+        key = random.choice(list(INLINE_FIELD_KEYS))
+        value_kind = INLINE_FIELD_KEYS[key]
+        if value_kind == "number":
+            value = str(random.randint(1, 10))
+        elif value_kind == "date":
+            value = random_date().isoformat()
+        elif value_kind == "link":
+            value = f"[[{body_link_target()}]]"
+        else:
+            value = random.choice(FILLER_WORDS)
+        if roll < 0.6:
+            return f"{key}:: {value}\n\n"
+        bracket = "[{}]" if roll < 0.85 else "({})"
+        return f"Noted {bracket.format(f'{key}:: {value}')} during review.\n\n"
+    if kind == "tasks":
+        done = "x" if roll < 0.3 else " "
+        title = random.choice(TASK_TITLES)
+        if random.random() < 0.5:
+            return f"- [{done}] {title} [due:: {random_date().isoformat()}]\n"
+        return f"- [{done}] {title} 📅 {random_date().isoformat()}\n"
+    if roll < 0.6:
+        return f"![[{random.choice(EMBED_FILES)}]]\n\n"
+    return f"![[{body_link_target()}]]\n\n"
+
+
+def render_body(size: int, spec: BodySpec, out: TextIO) -> None:
+    """Write about ``size`` characters of Markdown body into ``out``."""
+    chunks = body_chunks()
+    w = out.write
+    written = 0
+    while written < size:
+        chunk = chunks[random.randrange(len(chunks))]
+        w(chunk)
+        written += len(chunk)
+        scale = len(chunk) / 1000
+        for kind, density in spec.densities:
+            if density:
+                # Stochastic rounding keeps the expected density exact
+                for _ in range(int(density * scale + random.random())):
+                    item = body_item(kind)
+                    w(item)
+                    written += len(item)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# BATCH SAMPLING
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# --sampler numpy draws whole columns (dates, times, statuses, priorities,
+# progress, tags, titles) for a shard from one NumPy Generator and then zips
+# them into records. Distributions match the per-record generators above;
+# the random stream differs, so output is reproducible for a given --seed
+# and sampler, but not identical between samplers.
+
+# Type mix per --type; "event-*" kinds force the calendar subtype
+BATCH_TYPE_MIX = {
+    "all": {"task": 0.35, "event": 0.25, "meeting": 0.15, "project": 0.10},
+    "calendar": {"event-timed": 0.5, "event-allday": 0.3, "event-multiday": 0.2},
+    "board": {"task": 1},
+    "table": {"task": 1, "event": 1, "project": 1},
+    "mixed": {"task": 1, "event": 1, "meeting": 1, "project": 1, "undated": 1},
+}
+ALPHANUMERIC = (string.ascii_letters + string.digits).encode()
+# "HH:mm" for every hour and quarter, indexed by hour * 4 + quarter
+QUARTER_TIMES = [f"{hour:02d}:{minute:02d}" for hour in range(24) for minute in (0, 15, 30, 45)]
+
+
+class BatchSampler:
+    """Column-at-a-time record construction for one shard."""
+    
+    def __init__(self, rng: "np.random.Generator", realistic: bool, with_overdue: bool, date_range: int):
+        self.rng = rng
+        self.realistic = realistic
+        self.with_overdue = with_overdue
+        self.date_range = date_range
+        self.today = np.datetime64(run_date(), "D")
+        self.today_iso = str(self.today)
+        self.alphabet = np.frombuffer(ALPHANUMERIC, dtype=np.uint8)
+    
+    def pick(self, values: List[Any], n: int, p: Optional[List[float]] = None) -> List[Any]:
+        """``n`` draws from ``values`` (with replacement) as Python objects."""
+        if p is None:
+            index = self.rng.integers(0, len(values), n)
+        else:
+            weights = np.asarray(p, dtype=float)
+            index = self.rng.choice(len(values), n, p=weights / weights.sum())
+        return [values[i] for i in index.tolist()]
+    
+    def dates(self, days_back: int, days_forward: int, n: int) -> "np.ndarray":
+        """Vectorized random_date(): uniform days in [today-back, today+forward)."""
+        return self.today + self.rng.integers(-days_back, days_forward, n)
+    
+    def times(self, start_hour: int, end_hour: int, n: int) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Vectorized random_time(): (hours, quarter index) arrays."""
+        return self.rng.integers(start_hour, end_hour + 1, n), self.rng.integers(0, 4, n)
+    
+    @staticmethod
+    def hhmm(hours: "np.ndarray", quarters: "np.ndarray") -> List[str]:
+        return [QUARTER_TIMES[i] for i in (hours * 4 + quarters).tolist()]
+    
+    @staticmethod
+    def iso(days: "np.ndarray") -> List[str]:
+        return days.astype(str).tolist()
+    
+    def titles(self, category: str, n: int) -> List[str]:
+        """Vectorized get_title(): realistic picks or 15 random alphanumerics."""
+        if self.realistic:
+            titles = {"event": EVENT_TITLES, "project": PROJECT_TITLES, "meeting": EVENT_TITLES}
+            return self.pick(titles.get(category, TASK_TITLES), n)
+        chars = self.alphabet[self.rng.integers(0, len(self.alphabet), (n, 15))]
+        return [title.decode() for title in chars.view("S15").ravel().tolist()]
+    
+    def tags(self, category: str, n: int) -> List[List[str]]:
+        """Vectorized random_tags(): two base tags plus 0-2 distinct extras."""
+        base = TAGS_POOL.get(category, ["misc"])[:2]
+        extra = self.rng.integers(0, 3, n).tolist()
+        order = self.rng.random((n, len(EXTRA_TAGS))).argsort(axis=1).tolist()
+        return [base + [EXTRA_TAGS[j] for j in row[:k]] for row, k in zip(order, extra)]
+    
+    def priorities(self, n: int) -> List[str]:
+        return self.pick(PRIORITIES, n, p=[0.2, 0.5, 0.3])
+    
+    def task(self, n: int) -> List[Dict[str, Any]]:
+        rng = self.rng
+        overdue = rng.random(n) < 0.2 if self.with_overdue else np.zeros(n, dtype=bool)
+        start = np.where(overdue, self.dates(30, 0, n), self.dates(7, 30, n))
+        due = np.where(overdue, self.dates(15, 0, n), start + rng.integers(1, 15, n))
+        # Overdue tasks are todo (1) or in-progress (2), never done
+        status = np.where(overdue, rng.integers(1, 3, n), rng.integers(0, len(TASK_STATUSES), n))
+        progress = np.where(
+            (status == 2) | (status == 3),
+            np.asarray(PROGRESS_STEPS)[rng.integers(0, len(PROGRESS_STEPS), n)],
+            0,
+        )
+        colors = {"high": COLORS["red"], "medium": COLORS["yellow"], "low": COLORS["green"]}
+        return [
+            {
+                "title": title,
+                "date": self.today_iso,
+                "startDate": start_iso,
+                "dueDate": due_iso,
+                "priority": priority,
+                "status": TASK_STATUSES[s],
+                "color": colors[priority],
+                "progress": p,
+                "tags": tags,
+                "_type": "task",
+            }
+            for title, start_iso, due_iso, priority, s, p, tags in zip(
+                self.titles("task", n), self.iso(start), self.iso(due), self.priorities(n),
+                status.tolist(), progress.tolist(), self.tags("task", n),
+            )
+        ]
+    
+    def event(self, n: int, subtype: Optional[str] = None) -> List[Dict[str, Any]]:
+        rng = self.rng
+        start = self.dates(7, self.date_range, n)
+        if subtype is None:
+            multiday = rng.random(n) < 0.2
+            allday = ~multiday & (rng.random(n) < 0.3)
+        else:
+            # As in generate_calendar_event(), forced all-day events still
+            # become multi-day 20% of the time
+            multiday = np.full(n, subtype == "multiday")
+            if subtype == "allday":
+                multiday = rng.random(n) < 0.2
+            allday = np.full(n, subtype == "allday")
+        end = self.iso(start + rng.integers(2, 8, n))
+        hours, quarters = self.times(8, 18, n)
+        end_hours = np.minimum(hours + np.asarray(HOUR_DURATIONS)[rng.integers(0, len(HOUR_DURATIONS), n)], 23)
+        start_times = self.hhmm(hours, quarters)
+        end_times = self.hhmm(end_hours, quarters)
+        records = []
+        for i, (title, start_iso, status, color, tags, multi, whole_day) in enumerate(zip(
+            self.titles("event", n), self.iso(start), self.pick(EVENT_STATUSES, n),
+            self.pick(list(COLORS.values()), n), self.tags("event", n),
+            multiday.tolist(), allday.tolist(),
+        )):
+            record: Dict[str, Any] = {
+                "title": title,
+                "date": self.today_iso,
+                "startDate": start_iso,
+                "status": status,
+                "color": color,
+                "tags": tags,
+                "_type": "event",
+            }
+            if multi:
+                record["endDate"] = end[i]
+                record["_subtype"] = "multi-day"
+            elif not whole_day:
+                record["startTime"] = start_times[i]
+                record["endTime"] = end_times[i]
+                record["_subtype"] = "timed"
+            else:
+                record["_subtype"] = "all-day"
+            records.append(record)
+        return records
+    
+    def meeting(self, n: int) -> List[Dict[str, Any]]:
+        rng = self.rng
+        hours, quarters = self.times(9, 17, n)
+        end_hours = np.minimum(hours + np.asarray([1, 1, 2])[rng.integers(0, 3, n)], 23)
+        if self.realistic:
+            locations = self.pick(MEETING_LOCATIONS, n)
+            counts = rng.integers(1, 6, n).tolist()
+            order = rng.random((n, len(ATTENDEES))).argsort(axis=1).tolist()
+            attendees = [[ATTENDEES[j] for j in row[:k]] for row, k in zip(order, counts)]
+        else:
+            locations = [f"Room {i}" for i in rng.integers(1, 11, n).tolist()]
+            attendees = [[] for _ in range(n)]
+        return [
+            {
+                "title": title,
+                "date": self.today_iso,
+                "startDate": day,
+                "startTime": start_time,
+                "endTime": end_time,
+                "location": location,
+                "attendees": people,
+                "status": status,
+                "color": COLORS["blue"],
+                "tags": tags,
+                "_type": "meeting",
+            }
+            for title, day, start_time, end_time, location, people, status, tags in zip(
+                self.titles("meeting", n), self.iso(self.dates(3, 30, n)),
+                self.hhmm(hours, quarters), self.hhmm(end_hours, quarters), locations, attendees,
+                self.pick(["scheduled", "completed"], n), self.tags("meeting", n),
+            )
+        ]
+    
+    def project(self, n: int) -> List[Dict[str, Any]]:
+        rng = self.rng
+        start = self.dates(60, 30, n)
+        end = start + rng.integers(14, 91, n)
+        status = self.pick(PROJECT_STATUSES, n)
+        progress = self.pick(PROGRESS_STEPS, n)
+        return [
+            {
+                "title": title,
+                "date": self.today_iso,
+                "startDate": start_iso,
+                "endDate": end_iso,
+                "status": s,
+                "progress": 100 if s == "completed" else p,
+                "color": COLORS["purple"],
+                "tags": tags,
+                "_type": "project",
+            }
+            for title, start_iso, end_iso, s, p, tags in zip(
+                self.titles("project", n), self.iso(start), self.iso(end), status, progress,
+                self.tags("project", n),
+            )
+        ]
+    
+    def undated(self, n: int) -> List[Dict[str, Any]]:
+        return [
+            {
+                "title": title,
+                "date": self.today_iso,
+                "priority": priority,
+                "status": "inbox",
+                "color": COLORS["gray"],
+                "tags": tags + ["undated"],
+                "_type": "task",
+                "_subtype": "undated",
+            }
+            for title, priority, tags in zip(self.titles("task", n), self.priorities(n), self.tags("task", n))
+        ]
+    
+    def records(self, kinds: List[str]) -> List[Dict[str, Any]]:
+        """Build one record per kind, drawing each kind's columns in one go."""
+        positions: Dict[str, List[int]] = {}
+        for i, kind in enumerate(kinds):
+            positions.setdefault(kind, []).append(i)
+        records: List[Any] = [None] * len(kinds)
+        for kind in sorted(positions):
+            rows = positions[kind]
+            if kind.startswith("event-"):
+                built = self.event(len(rows), kind[len("event-"):])
+            else:
+                built = getattr(self, kind)(len(rows))
+            for i, record in zip(rows, built):
+                records[i] = record
+        return records
+
+
+def generate_batch(count: int, record_type: str, plan: Optional["SamplingPlan"]) -> Iterator[Dict[str, Any]]:
+    """--sampler numpy counterpart of generate_records() (non-relational)."""
+    # Seeded from the shard's random state, so each shard stays reproducible
+    sampler = BatchSampler(
+        np.random.default_rng(random.getrandbits(64)), args.realistic, args.with_overdue, args.date_range,
+    )
+    if plan is not None:
+        mix = plan.mix
+    else:
+        mix = dict(BATCH_TYPE_MIX[record_type])
+        if record_type == "all" and args.with_undated:
+            mix["undated"] = 0.15
+    kinds = sampler.pick(list(mix), count, p=list(mix.values()))
+    for kind, record in zip(kinds, sampler.records(kinds)):
+        if plan is not None:
+            plan.decorate(record, kind)
+        yield record
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FRONTMATTER SERIALIZATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Strings that are safe as YAML plain scalars under both YAML 1.1 (PyYAML) and
+# YAML 1.2 (the `yaml` package behind Obsidian/codec.ts): start with a letter,
+# only word characters, spaces, dots and dashes after that, no trailing space.
+# Matched with fullmatch(): "$" would also accept a trailing newline
+_PLAIN_SAFE = re.compile(r"[^\W\d_][\w.\- ]*(?<! )")
+# Plain words that either YAML version resolves to a bool or null
+_RESERVED_WORDS = frozenset({
+    "y", "n", "yes", "no", "on", "off", "true", "false", "null",
+})
+# Line breaks, tabs and everything PyYAML's reader rejects as non-printable
+_NEEDS_DOUBLE_QUOTES = re.compile(
+    r"[^\x20-\x7e\xa0-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]|[\u2028\u2029\ufeff]"
+)
+# What json.dumps leaves raw but PyYAML only reads back as an escape
+_NEEDS_ESCAPE = re.compile(r"[\x7f-\x9f\ud800-\udfff\u2028\u2029\ufeff\ufffe\uffff]")
+
+
+def fast_scalar(value: Any) -> str:
+    """Serialize one scalar the way PyYAML would resolve it back."""
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if math.isnan(value):
+            return ".nan"
+        if math.isinf(value):
+            return ".inf" if value > 0 else "-.inf"
+        text = repr(value)
+        # YAML 1.1 needs a dot in the mantissa to read exponent floats
+        if "e" in text and "." not in text:
+            text = text.replace("e", ".0e", 1)
+        return text
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    
+    text = str(value)
+    if _PLAIN_SAFE.fullmatch(text) and text.lower() not in _RESERVED_WORDS:
+        return text
+    if _NEEDS_DOUBLE_QUOTES.search(text):
+        # JSON string syntax is a valid YAML double-quoted scalar
+        quoted = json.dumps(text, ensure_ascii=False)
+        return _NEEDS_ESCAPE.sub(lambda m: f"\\u{ord(m.group()):04x}", quoted)
+    # ISO dates, times, colors, wikilinks and anything with YAML indicators
+    return "'" + text.replace("'", "''") + "'"
+
+
+def fast_block(value: Any, indent: str, parts: List[str], lead: Optional[str] = None) -> None:
+    """Append a non-empty mapping or sequence in PyYAML's block layout.
+
+    ``lead`` replaces ``indent`` on the first line, which is how list items
+    ("- key: value") start. Sequences under a key are not indented, as with
+    PyYAML. Flat frontmatter takes one pass through the mapping loop.
+    """
+    if isinstance(value, dict):
+        for key in sorted(value):
+            prefix = indent if lead is None else lead
+            lead = None
+            item = value[key]
+            if isinstance(item, dict) and item:
+                parts.append(f"{prefix}{fast_scalar(key)}:\n")
+                fast_block(item, indent + "  ", parts)
+            elif isinstance(item, (list, tuple)) and item:
+                parts.append(f"{prefix}{fast_scalar(key)}:\n")
+                fast_block(item, indent, parts)
+            else:
+                parts.append(f"{prefix}{fast_scalar(key)}: {fast_leaf(item)}\n")
+    else:
+        for item in value:
+            prefix = indent if lead is None else lead
+            lead = None
+            if isinstance(item, (dict, list, tuple)) and item:
+                fast_block(item, indent + "  ", parts, lead=prefix + "- ")
+            else:
+                parts.append(f"{prefix}- {fast_leaf(item)}\n")
+
+
+def fast_leaf(value: Any) -> str:
+    """A scalar, or an empty container in flow style."""
+    if isinstance(value, (list, tuple)) and not value:
+        return "[]"
+    if isinstance(value, dict) and not value:
+        return "{}"
+    return fast_scalar(value)
+
+
+def dump_frontmatter_fast(frontmatter: Dict[str, Any]) -> str:
+    """Serialize frontmatter to YAML without PyYAML's representer machinery.
+
+    A specialised replacement for ``yaml.dump`` on the generator's schemas.
+    Keys are sorted and collections use block style, as with PyYAML.
+    """
+    parts: List[str] = []
+    fast_block(frontmatter, "", parts)
+    return "".join(parts)
+
+
+def dump_frontmatter_pyyaml(frontmatter: Dict[str, Any]) -> str:
+    """Reference serializer: PyYAML's full representer."""
+    return yaml.dump(frontmatter, allow_unicode=True, default_flow_style=False)
+
+
+YAML_BACKENDS = {
+    "pyyaml": dump_frontmatter_pyyaml,
+    "fast": dump_frontmatter_fast,
+}
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# MANIFEST
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# One row per generated note: path, type, subtype, frontmatter and the
+# basenames it links to. Workers serialize their shard's rows and the parent
+# appends them in shard order, so the manifest is as deterministic as the
+# vault and never held in memory as a whole.
+#
+# Frontmatter schemas differ per note type, so Parquet stores ``fields`` as
+# the same compact JSON object the NDJSON manifest inlines (the column carries
+# ``encoding: json`` metadata): ``json.loads`` of a Parquet cell equals the
+# ``fields`` object of the matching NDJSON line.
+
+WIKILINK_VALUE = re.compile(r"^\[\[([^\]|#]+)(?:[#|][^\]]*)?\]\]$")
+
+MANIFEST_SCHEMA = None
+if pyarrow is not None:
+    MANIFEST_SCHEMA = pyarrow.schema([
+        ("path", pyarrow.string()),
+        ("type", pyarrow.string()),
+        ("subtype", pyarrow.string()),
+        pyarrow.field("fields", pyarrow.string(), metadata={"encoding": "json"}),
+        ("links", pyarrow.list_(pyarrow.string())),
+    ])
+
+
+def record_links(frontmatter: Dict[str, Any]) -> List[str]:
+    """Wikilink targets (basenames) found in frontmatter values, in order."""
+    links: List[str] = []
+    for value in frontmatter.values():
+        for item in (value if isinstance(value, list) else (value,)):
+            if isinstance(item, str):
+                match = WIKILINK_VALUE.match(item)
+                if match:
+                    links.append(match.group(1))
+    return links
+
+
+def manifest_row(record: Dict[str, Any], path: str) -> Dict[str, Any]:
+    """Manifest row for one record written at ``path`` (vault-relative)."""
+    fields = {k: v for k, v in record.items() if not k.startswith("_")}
+    return {
+        "path": path,
+        "type": record.get("_type", "task"),
+        "subtype": record.get("_subtype"),
+        "fields": fields,
+        "links": record_links(fields),
+    }
+
+
+def resolve_manifest_format() -> str:
+    """Concrete manifest format for this run ('none' disables it)."""
+    if args.manifest_format == "auto":
+        return "parquet" if pyarrow is not None else "ndjson"
+    if args.manifest_format == "parquet" and pyarrow is None:
+        raise SystemExit("--manifest-format parquet requires pyarrow (pip install pyarrow)")
+    return args.manifest_format
+
+
+def encode_manifest_rows(rows: List[Dict[str, Any]], fmt: str) -> Any:
+    """Shard payload sent back to the parent: NDJSON text or parquet-ready rows."""
+    if fmt == "ndjson":
+        return "".join(manifest_json(row) + "\n" for row in rows)
+    for row in rows:
+        row["fields"] = manifest_json(row["fields"])
+    return rows
+
+
+def manifest_json(value: Any) -> str:
+    """Compact JSON shared by NDJSON lines and the Parquet ``fields`` column."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+class ManifestWriter:
+    """Streams shard payloads to an NDJSON file or a Parquet row group each."""
+    
+    def __init__(self, path: Path, fmt: str):
+        self.path = path
+        self.fmt = fmt
+        if fmt == "parquet":
+            self._writer = pyarrow.parquet.ParquetWriter(str(path), MANIFEST_SCHEMA)
+        else:
+            self._file = open(path, "w", encoding="utf-8")
+    
+    def write(self, payload: Any) -> None:
+        if self.fmt == "parquet":
+            if payload:
+                self._writer.write_table(pyarrow.Table.from_pylist(payload, schema=MANIFEST_SCHEMA))
+        else:
+            self._file.write(payload)
+    
+    def close(self) -> None:
+        if self.fmt == "parquet":
+            self._writer.close()
+        else:
+            self._file.close()
+
+
+def write_manifest_index(path: Path, stats: Dict[str, int], total: int, manifest: Optional[Path]) -> None:
+    """Small JSON summary next to the manifest: run options and ground-truth counts."""
+    index = {
+        "generator": "generate-test-files",
+        "count": total,
+        "types": {k: v for k, v in stats.items() if not k.startswith("_")},
+        "edges": stats.get("_edges", 0),
+        "manifest": manifest.name if manifest else None,
+        "options": {k: v for k, v in vars(args).items() if k != "output"},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, indent=2, default=str)
+        f.write("\n")
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# OUTPUT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Loose files are staged in a buffer of this size and written a chunk at a time
+WRITE_CHUNK = 1 << 20
+
+# Archive suffix -> tarfile stream mode ("zip" and "zst" are handled separately)
+ARCHIVE_MODES = {
+    ".tar": "w|",
+    ".tar.gz": "w|gz",
+    ".tgz": "w|gz",
+    ".tar.bz2": "w|bz2",
+    ".tar.xz": "w|xz",
+    ".tar.zst": "zst",
+    ".zip": "zip",
+}
+
+
+def archive_mode(path: str) -> Optional[str]:
+    """Archive mode for an output path, or None if the suffix is unknown."""
+    name = path.lower()
+    for suffix, mode in ARCHIVE_MODES.items():
+        if name.endswith(suffix):
+            return mode
+    return None
+
+
+def write_file(path: str, data: Any) -> None:
+    """Write a whole file with a single open/write/close and no text layer.
+
+    Never overwrites: note paths are unique within a run, so an existing file
+    was left by an earlier run (or is a hardlink into the generation cache)
+    and writing through it would corrupt both. Raises FileExistsError.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    try:
+        fd = os.open(path, flags, 0o644)
+    except FileExistsError:
+        raise FileExistsError(errno.EEXIST, "note already exists (rerun with --clear)", path) from None
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+class FileBatch:
+    """Stages rendered files in one reused buffer and writes them a chunk at a time.
+
+    Files are copied into a preallocated ``WRITE_CHUNK`` buffer; once it is
+    full, every staged file is written from a slice of it on a thread pool
+    (open/write/close release the GIL), so the per-file metadata round-trips
+    overlap instead of running one after another. Files larger than the
+    buffer are written on their own. ``flush()`` writes what is left.
+    ``seconds`` is the time spent writing, for the write throughput.
+    """
+    
+    def __init__(self, root: str):
+        self.root = root
+        self.buffer = bytearray(WRITE_CHUNK)
+        self.used = 0
+        self.staged: List[Tuple[str, int, int]] = []
+        self.seconds = 0.0
+        workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+        self.threads = max(1, min(32, (os.cpu_count() or 1) + 4) // workers)
+    
+    def add(self, filename: str, data: bytes) -> None:
+        size = len(data)
+        if size > WRITE_CHUNK:
+            started = time.perf_counter()
+            write_file(os.path.join(self.root, filename), data)
+            self.seconds += time.perf_counter() - started
+            return
+        if self.used + size > WRITE_CHUNK:
+            self.flush()
+        self.buffer[self.used:self.used + size] = data
+        self.staged.append((filename, self.used, self.used + size))
+        self.used += size
+    
+    def flush(self) -> None:
+        if not self.staged:
+            return
+        started = time.perf_counter()
+        with memoryview(self.buffer) as view:
+            def write_all(batch: List[Tuple[str, int, int]]) -> None:
+                for filename, start, end in batch:
+                    write_file(os.path.join(self.root, filename), view[start:end])
+            
+            threads = min(self.threads, len(self.staged))
+            if threads == 1:
+                write_all(self.staged)
+            else:
+                with ThreadPoolExecutor(threads) as executor:
+                    list(executor.map(write_all, [self.staged[i::threads] for i in range(threads)]))
+        self.staged.clear()
+        self.used = 0
+        self.seconds += time.perf_counter() - started
+
+
+def clear_folders(folders: List[Path]) -> int:
+    """Delete the Markdown files in ``folders`` in parallel; returns the count.
+
+    unlink() releases the GIL, so a thread pool overlaps the per-file
+    metadata round-trips that dominate on network filesystems.
+    """
+    paths = [
+        entry.path
+        for folder in folders if folder.is_dir()
+        for entry in os.scandir(folder)
+        if entry.name.endswith(".md") and entry.is_file(follow_symlinks=False)
+    ]
+    
+    def unlink_all(batch: List[str]) -> None:
+        for path in batch:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+    
+    threads = min(32, (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(threads) as executor:
+        list(executor.map(unlink_all, [paths[i::threads] for i in range(threads)]))
+    return len(paths)
+
+
+class ArchiveWriter:
+    """Streams rendered files into a single tar (optionally compressed) or zip."""
+    
+    def __init__(self, path: Path, mode: str, mtime: int):
+        self.path = path
+        self.mode = mode
+        self.mtime = mtime
+        self._raw = open(path, "wb")
+        self._zstd = None
+        if mode == "zip":
+            self._archive = zipfile.ZipFile(self._raw, "w", zipfile.ZIP_DEFLATED)
+        elif mode == "zst":
+            self._zstd = zstandard.ZstdCompressor(level=3).stream_writer(self._raw)
+            self._archive = tarfile.open(fileobj=self._zstd, mode="w|", format=tarfile.PAX_FORMAT)
+        else:
+            self._archive = tarfile.open(fileobj=self._raw, mode=mode, format=tarfile.PAX_FORMAT)
+    
+    def add(self, name: str, data: bytes) -> None:
+        if self.mode == "zip":
+            # Zip timestamps start at 1980
+            info = zipfile.ZipInfo(name, date_time=time.gmtime(max(self.mtime, 315532800))[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            self._archive.writestr(info, data)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = self.mtime
+            info.mode = 0o644
+            self._archive.addfile(info, io.BytesIO(data))
+    
+    def close(self) -> None:
+        self._archive.close()
+        if self._zstd is not None:
+            self._zstd.close()
+        self._raw.close()
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# GENERATION CACHE
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# --cache DIR keeps finished outputs (vault or archive, manifest, indexes)
+# under a key hashed from every content-affecting option, the profile's
+# contents and this script's own bytes. A hit clones the entry into place
+# instead of generating. Clones are reflinks where the filesystem supports
+# them, else hardlinks, else copies. Hardlinked files share storage with
+# the cache, so the writers here replace files rather than truncating them.
+# Entries are evicted least recently used first once --cache-max-mb is hit.
+
+# Linux ioctl that makes dst share src's extents (btrfs, XFS, ...)
+FICLONE = 0x40049409
+CACHE_ENTRY = "entry.json"
+# Options that only decide where and how output goes, not what it contains
+CACHE_NEUTRAL_OPTIONS = {
+    "output", "workers", "verbose", "clear", "manifest", "archive", "calendar_index", "formulas_file",
+    "views_file", "queries_file", "projects_file", "settings_file", "cache", "cache_max_mb", "cache_mode",
+    "preset", "profile", "profile_tracemalloc", "profile_pstats", "profile_speedscope",
+}
+
+_generator_version: Optional[str] = None
+
+
+def generator_version() -> str:
+    """Digest of this script; any edit invalidates cached outputs."""
+    global _generator_version
+    if _generator_version is None:
+        _generator_version = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=8).hexdigest()
+    return _generator_version
+
+
+def cache_key(profile: Optional[Dict[str, Any]], mode: Optional[str]) -> str:
+    """Content address of the run described by ``args`` and ``profile``."""
+    options = {k: v for k, v in vars(args).items() if k not in CACHE_NEUTRAL_OPTIONS}
+    options["archive_mode"] = mode
+    options["manifest_format"] = resolve_manifest_format()
+    blob = json.dumps(
+        {"version": generator_version(), "options": options, "profile": profile},
+        sort_keys=True, default=str,
+    )
+    return hashlib.blake2b(blob.encode(), digest_size=16).hexdigest()
+
+
+def replace_file(path: Path) -> None:
+    """Drop ``path`` so the next write creates a new inode instead of
+    truncating one that may be hardlinked into the cache."""
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def clone_file(src: str, dst: str, mode: str) -> str:
+    """Materialize ``src`` at ``dst``; returns the method that worked."""
+    replace_file(Path(dst))
+    if mode in ("auto", "reflink") and fcntl is not None:
+        try:
+            with open(src, "rb") as s, open(dst, "wb") as d:
+                fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+            return "reflink"
+        except OSError:
+            replace_file(Path(dst))
+    if mode in ("auto", "hardlink"):
+        try:
+            os.link(src, dst)
+            return "hardlink"
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+    return "copy"
+
+
+class GenerationCache:
+    """Content-addressed store of finished outputs with LRU eviction.
+
+    Each entry is ``<root>/<key>/`` holding one item per output role
+    (``vault`` directory, ``archive``, ``manifest``, ...) and an
+    ``entry.json`` whose mtime records the last use.
+    """
+    
+    def __init__(self, root: Path, max_mb: float, mode: str):
+        self.root = root
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.mode = mode
+        self.method: Optional[str] = None
+        root.mkdir(parents=True, exist_ok=True)
+    
+    def clone(self, pairs: List[Tuple[str, str]]) -> None:
+        """Clone (src, dst) pairs; the first success fixes the method."""
+        if not pairs:
+            return
+        self.method = clone_file(*pairs[0], self.method or self.mode)
+        
+        def clone_all(batch: List[Tuple[str, str]]) -> None:
+            for src, dst in batch:
+                clone_file(src, dst, self.method)
+        
+        rest = pairs[1:]
+        threads = min(32, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(threads) as executor:
+            list(executor.map(clone_all, [rest[i::threads] for i in range(threads)]))
+    
+    @staticmethod
+    def tree_pairs(
+        src: Path, dst: Path, skip: Optional[Dict[str, Tuple[int, int]]] = None
+    ) -> List[Tuple[str, str]]:
+        """Every file under ``src`` paired with its place under ``dst``.
+        
+        Files recorded in ``skip`` (see ``snapshot``) and not rewritten
+        since are left out.
+        """
+        pairs = []
+        for folder, _, names in os.walk(src):
+            target = dst / Path(folder).relative_to(src)
+            target.mkdir(parents=True, exist_ok=True)
+            for name in names:
+                path = os.path.join(folder, name)
+                if skip and skip.get(os.path.relpath(path, src)) == GenerationCache.identity(path):
+                    continue
+                pairs.append((path, str(target / name)))
+        return pairs
+    
+    @staticmethod
+    def identity(path: str) -> Tuple[int, int]:
+        """(inode, mtime) of ``path``; writers replace files, so a rewrite changes it."""
+        st = os.stat(path)
+        return st.st_ino, st.st_mtime_ns
+    
+    @staticmethod
+    def snapshot(root: Path) -> Dict[str, Tuple[int, int]]:
+        """Identity of every file already under ``root`` before a run.
+        
+        Leftovers of earlier runs (without --clear, or files --clear does
+        not remove) must not end up in the entry this run stores.
+        """
+        return {
+            os.path.relpath(os.path.join(folder, name), root): GenerationCache.identity(os.path.join(folder, name))
+            for folder, _, names in os.walk(root)
+            for name in names
+        }
+    
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """Entry metadata for ``key`` (marked as just used), or None."""
+        meta_path = self.root / key / CACHE_ENTRY
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        os.utime(meta_path)
+        return meta
+    
+    def restore(self, key: str, meta: Dict[str, Any], targets: Dict[str, Path]) -> None:
+        """Clone a cached entry's items to this run's output paths."""
+        entry = self.root / key
+        pairs: List[Tuple[str, str]] = []
+        for role, name in meta["items"].items():
+            target = targets.get(role)
+            if target is None:
+                continue
+            if role == "vault":
+                pairs += self.tree_pairs(entry / name, target)
+            else:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                pairs.append((str(entry / name), str(target)))
+        self.clone(pairs)
+    
+    def store(
+        self, key: str, targets: Dict[str, Path], stats: Dict[str, int], total: int,
+        leftovers: Optional[Dict[str, Tuple[int, int]]] = None,
+    ) -> None:
+        """Add this run's outputs under ``key`` (atomically; first writer wins).
+        
+        ``leftovers`` is the vault's ``snapshot`` from before the run; only
+        files this run wrote are stored.
+        """
+        staging = self.root / f".tmp-{key}-{os.getpid()}"
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir()
+        items: Dict[str, str] = {}
+        pairs: List[Tuple[str, str]] = []
+        for role, target in targets.items():
+            if role == "vault":
+                pairs += self.tree_pairs(target, staging / role, leftovers)
+                items[role] = role
+            elif target.is_file():
+                name = role + "".join(target.suffixes[-2:] if role == "archive" else target.suffixes[-1:])
+                pairs.append((str(target), str(staging / name)))
+                items[role] = name
+        self.clone(pairs)
+        # Allocated blocks, not st_size: thousands of small notes round up
+        size = sum(os.stat(dst).st_blocks * 512 for _, dst in pairs)
+        meta = {"key": key, "version": generator_version(), "bytes": size,
+                "total": total, "stats": stats, "items": items}
+        (staging / CACHE_ENTRY).write_text(json.dumps(meta, sort_keys=True) + "\n", encoding="utf-8")
+        try:
+            os.rename(staging, self.root / key)
+        except OSError:  # a concurrent run stored the same key first
+            shutil.rmtree(staging, ignore_errors=True)
+    
+    def evict(self, keep: str) -> int:
+        """Drop least recently used entries until under the size cap."""
+        entries = []
+        for child in self.root.iterdir():
+            meta_path = child / CACHE_ENTRY
+            if child.name.startswith(".") or not meta_path.is_file():
+                continue
+            try:
+                size = json.loads(meta_path.read_text(encoding="utf-8"))["bytes"]
+            except (OSError, ValueError, KeyError):
+                size = 0
+            entries.append((meta_path.stat().st_mtime, size, child))
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, child in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            if child.name == keep:
+                continue
+            shutil.rmtree(child, ignore_errors=True)
+            total -= size
+            removed += 1
+        return removed
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# GENERATOR PROFILING
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# --profile times each stage of every shard: sampling records, filename
+# sanitization, rendering the note, YAML serialization (nested in
+# rendering, reported separately) and I/O. Shards return their timings in
+# stats["_profile"] with cProfile statistics (--profile-pstats,
+# --profile-speedscope) and the tracemalloc peak (--profile-tracemalloc).
+# The parent merges them, adds its own stages (manifest, archive, indexes)
+# and writes one JSON report. Stage seconds are summed over workers, so with
+# several workers they add up to more than the wall time.
+
+PROFILE_STAGES = ["sample", "filename", "render", "yaml", "io", "manifest", "archive", "index"]
+# Stages timed inside another one: yaml runs within render
+NESTED_STAGES = {"yaml": "render"}
+# Stage times shorter than this are timer resolution and lap overhead more
+# than work: their files/s and MB/s are reported as null
+MIN_RATE_SECONDS = max(time.get_clock_info("perf_counter").resolution, 1e-3)
+# Call-graph edges lighter than this share of the total are folded into
+# their caller's own time in speedscope output
+SPEEDSCOPE_MIN_SHARE = 0.0005
+
+
+class StageTimer:
+    """Accumulates wall time per stage between successive ``lap()`` calls."""
+    
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+        self.last = time.perf_counter()
+    
+    def restart(self) -> None:
+        """Start the next lap now, leaving the time since the last one out."""
+        self.last = time.perf_counter()
+    
+    def lap(self, stage: str) -> None:
+        now = time.perf_counter()
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + now - self.last
+        self.last = now
+    
+    def add(self, stage: str, seconds: float) -> None:
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+    
+    def merge(self, seconds: Dict[str, float]) -> None:
+        for stage, value in seconds.items():
+            self.add(stage, value)
+    
+    def exclusive(self) -> Dict[str, float]:
+        """Seconds per stage with nested stages taken out of their parent."""
+        seconds = dict(self.seconds)
+        for stage, parent in NESTED_STAGES.items():
+            if stage in seconds and parent in seconds:
+                seconds[parent] = max(seconds[parent] - seconds[stage], 0.0)
+        return seconds
+
+
+# Timer of the shard being written in this process, for timed_backend()
+_stage_timer: Optional[StageTimer] = None
+
+
+def profiling() -> bool:
+    return bool(args.profile or args.profile_pstats or args.profile_speedscope)
+
+
+def skip_lap(stage: str) -> None:
+    """Stand-in for StageTimer.lap when not profiling."""
+
+
+def timed_backend(dump: Callable[[Dict[str, Any]], str]) -> Callable[[Dict[str, Any]], str]:
+    """Wrap a YAML backend so its time is charged to the ``yaml`` stage."""
+    def timed(frontmatter: Dict[str, Any]) -> str:
+        started = time.perf_counter()
+        try:
+            return dump(frontmatter)
+        finally:
+            if _stage_timer is not None:
+                _stage_timer.add("yaml", time.perf_counter() - started)
+    timed.__wrapped__ = dump
+    return timed
+
+
+def install_stage_timers() -> None:
+    """Time the YAML backends in this process (idempotent)."""
+    for name, dump in YAML_BACKENDS.items():
+        if not hasattr(dump, "__wrapped__"):
+            YAML_BACKENDS[name] = timed_backend(dump)
+
+
+class CallStats:
+    """Raw cProfile statistics in the shape pstats.Stats loads them from."""
+    
+    def __init__(self, stats: Dict[Any, Any]):
+        self.stats = stats
+    
+    def create_stats(self) -> None:
+        pass
+
+
+def merge_call_stats(merged: Optional["pstats.Stats"], payload: bytes) -> "pstats.Stats":
+    """Fold one shard's marshalled cProfile statistics into ``merged``."""
+    shard = pstats.Stats(CallStats(marshal.loads(payload)))
+    if merged is None:
+        return shard
+    merged.add(shard)
+    return merged
+
+
+def frame_name(func: Tuple[str, int, str]) -> Dict[str, Any]:
+    filename, line, name = func
+    if filename == "~":
+        return {"name": name}
+    return {"name": name, "file": filename, "line": line}
+
+
+def speedscope_profile(stats: "pstats.Stats") -> Dict[str, Any]:
+    """Turn a cProfile call graph into a weighted speedscope "sampled" profile.
+
+    cProfile keeps per-edge totals, not stacks: each function's time is
+    split over the stacks it is reached through in proportion to its
+    callers' edge times, which is exact for trees and an estimate for
+    functions shared by several callers.
+    """
+    raw = stats.stats
+    callees: Dict[Any, List[Tuple[Any, float]]] = {}
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, []).append((func, edge[3]))
+    roots = [func for func, entry in raw.items() if not entry[4]]
+    total = sum(raw[func][3] for func in roots) or 1.0
+    floor = total * SPEEDSCOPE_MIN_SHARE
+    
+    frames: List[Dict[str, Any]] = []
+    index: Dict[Any, int] = {}
+    samples: List[List[int]] = []
+    weights: List[float] = []
+    
+    def frame(func: Any) -> int:
+        if func not in index:
+            index[func] = len(frames)
+            frames.append(frame_name(func))
+        return index[func]
+    
+    # Iterative walk: (function, seconds attributed to this stack, stack)
+    pending = [(func, raw[func][3], [frame(func)]) for func in sorted(roots, key=lambda f: -raw[f][3])]
+    while pending:
+        func, weight, stack = pending.pop()
+        cumulative = raw[func][3]
+        scale = weight / cumulative if cumulative > 0 else 0.0
+        own = raw[func][2] * scale
+        for callee, edge in callees.get(func, []):
+            share = edge * scale
+            if index.get(callee) in stack:
+                # Recursion: already part of the outer call's own time
+                continue
+            if share < floor:
+                own += share
+                continue
+            pending.append((callee, share, stack + [frame(callee)]))
+        if own > 0:
+            samples.append(stack)
+            weights.append(round(own, 6))
+    
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": "generate-test-files",
+        "exporter": f"generate-test-files {generator_version()}",
+        "shared": {"frames": frames},
+        "profiles": [{
+            "type": "sampled",
+            "name": "generate-test-files (cProfile, all workers)",
+            "unit": "seconds",
+            "startValue": 0,
+            "endValue": round(sum(weights), 6),
+            "samples": samples,
+            "weights": weights,
+        }],
+    }
+
+
+def profile_report(
+    timer: StageTimer,
+    phases: Dict[str, float],
+    stats: Dict[str, int],
+    total: int,
+    workers: int,
+    memory_peak: Optional[int],
+) -> Dict[str, Any]:
+    """The --profile JSON document."""
+    megabytes = stats.get("_bytes", 0) / 1e6
+    wall = sum(phases.values())
+    seconds = timer.exclusive()
+    busy = sum(seconds.values()) or 1.0
+    stages = {}
+    for stage in PROFILE_STAGES:
+        if stage not in seconds:
+            continue
+        spent = seconds[stage]
+        entry: Dict[str, Any] = {
+            "seconds": round(spent, 4),
+            "share": round(spent / busy, 4),
+            "filesPerSec": round(total / spent) if spent >= MIN_RATE_SECONDS else None,
+        }
+        if stage in ("render", "yaml", "io", "archive"):
+            entry["mbPerSec"] = round(megabytes / spent, 2) if spent >= MIN_RATE_SECONDS else None
+        stages[stage] = entry
+    rss = peak_rss_mb()
+    return {
+        "generator": generator_version(),
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "options": {
+            "numfiles": args.numfiles,
+            "type": args.type,
+            "preset": args.preset,
+            "workload": (
+                "relations" if args.relations else "calendar" if args.calendar_workload
+                else "rollup" if args.rollup_workload else "views" if args.view_workload
+                else "queries" if args.query_workload else "projects" if args.multi_project else "default"
+            ),
+            "sampler": args.sampler,
+            "yamlBackend": args.yaml_backend,
+            "manifestFormat": resolve_manifest_format(),
+            "archive": archive_mode(args.archive) if args.archive else None,
+            "workers": workers,
+        },
+        "files": total,
+        "megabytes": round(megabytes, 3),
+        "wallSeconds": round(wall, 4),
+        "filesPerSec": round(total / phases["generate"]) if phases.get("generate") else None,
+        "mbPerSec": round(megabytes / phases["generate"], 2) if phases.get("generate") else None,
+        "phases": {name: round(value, 4) for name, value in phases.items()},
+        "stages": stages,
+        "memory": {
+            "peakRssMb": round(rss, 1) if rss is not None else None,
+            "tracemallocPeakMb": round(memory_peak / (1024 * 1024), 2) if memory_peak is not None else None,
+        },
+        "pstats": args.profile_pstats,
+        "speedscope": args.profile_speedscope,
+    }
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FILE GENERATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def render_content(record: Dict[str, Any], out: TextIO) -> None:
+    """Render markdown content for a record into a text stream.
+
+    Writes straight into ``out`` instead of growing a string with ``+=``,
+    so the caller can reuse a single buffer for every file.
+    """
+    record_type = record.get("_type", "task")
+    title = record.get("title", "Untitled")
+    w = out.write
+    
+    # Build frontmatter (exclude internal fields)
+    frontmatter = {k: v for k, v in record.items() if not k.startswith("_")}
+    
+    w("---\n")
+    w(YAML_BACKENDS[args.yaml_backend](frontmatter))
+    w("---\n\n")
+    
+    # Content by type
+    if record_type == "task":
+        w(f"# {title}\n\n")
+        w("## Описание\n\n")
+        w("<!-- Описание задачи -->\n\n")
+        w("## Чеклист\n")
+        w("- [ ] Подготовка\n")
+        w("- [ ] Выполнение\n")
+        w("- [ ] Проверка\n")
+    
+    elif record_type == "event":
+        w(f"# 📅 {title}\n\n")
+        w("## Детали\n\n")
+        if record.get("_subtype") == "multi-day":
+            w(f"**Период**: {record.get('startDate')} — {record.get('endDate')}\n\n")
+        elif record.get("startTime"):
+            w(f"**Время**: {record.get('startTime')} — {record.get('endTime')}\n\n")
+        w("## Заметки\n\n")
+    
+    elif record_type == "meeting":
+        w(f"# 📅 {title}\n\n")
+        w("## Участники\n")
+        for att in record.get("attendees", []):
+            w(f"- {att}\n")
+        w("\n## Повестка\n1. \n\n")
+        w("## Заметки\n\n")
+        w("## Действия\n- [ ] \n")
+    
+    elif record_type == "person":
+        w(f"# {title}\n\n")
+        w(f"**{record.get('role')}** · {record.get('department')}\n\n")
+        w("## Заметки\n\n")
+    
+    elif record_type == "client":
+        w(f"# {title}\n\n")
+        w("## Контракт\n\n")
+        w("## Заметки\n\n")
+    
+    elif record_type == "project":
+        w(f"# 🎯 {title}\n\n")
+        w("## Описание\n\n")
+        w("## Цели\n- \n\n")
+        w("## Этапы\n")
+        w("- [ ] Этап 1\n")
+        w("- [ ] Этап 2\n")
+        w("- [ ] Этап 3\n")
+    
+    # Workload-specific Markdown (inline fields, annotated tasks)
+    markdown = record.get("_markdown")
+    if markdown:
+        w("\n")
+        w(markdown)
+    
+    size = record.get("_body")
+    if size:
+        w("\n")
+        render_body(size, body_spec(), out)
+
+
+def generate_content(record: Dict[str, Any]) -> str:
+    """Generate markdown content based on record type."""
+    buf = io.StringIO()
+    render_content(record, buf)
+    return buf.getvalue()
+
+
+def get_filename(record: Dict[str, Any], index: Optional[int] = None) -> str:
+    """Generate safe filename from record.
+
+    Linked records keep their exact name (wikilinks must resolve) and go
+    into their entity folder. Other names end in four random characters
+    followed by the record's global ``index`` in hex, so two records of a
+    run never share a path whatever their titles.
+    """
+    name = record.get("_name")
+    if name is not None:
+        return f"{record.get('_folder') or RELATION_FOLDERS[record['_type']]}/{name}.md"
+    title = record.get("title", "untitled")
+    # Sanitize filename
+    safe_title = "".join(c for c in title if c.isalnum() or c in " -_").strip()
+    safe_title = safe_title[:40]  # Limit length
+    unique_id = random_text(4) if index is None else f"{random_text(4)}{index:x}"
+    folder = record.get("_folder")
+    if folder:
+        return f"{folder}/{safe_title}_{unique_id}.md"
+    return f"{safe_title}_{unique_id}.md"
+
+
+def generate_records(count: int, record_type: str, start: int = 0) -> Iterator[Dict[str, Any]]:
+    """Yield records one at a time based on type.
+
+    Nothing is accumulated, so memory stays flat regardless of ``count``.
+    ``start`` is the global index of the first record (used by --relations,
+    --calendar-workload and --rollup-workload).
+    """
+    realistic = args.realistic
+    plan = sampling_plan()
+    
+    if (args.relations or args.calendar_workload or args.rollup_workload or args.view_workload
+            or args.query_workload or args.multi_project):
+        if args.relations:
+            source = generate_relational_records
+        elif args.calendar_workload:
+            source = generate_calendar_records
+        elif args.rollup_workload:
+            source = generate_rollup_records
+        elif args.view_workload:
+            source = generate_view_records
+        elif args.query_workload:
+            source = generate_query_records
+        else:
+            source = generate_multi_project_records
+        for record in source(start, count):
+            if plan is not None:
+                plan.decorate(record, record["_type"])
+            yield record
+        return
+    
+    if args.sampler == "numpy":
+        yield from generate_batch(count, record_type, plan)
+        return
+    
+    if plan is not None:
+        for kind in plan.sample_types(count):
+            gen_func = PROFILE_GENERATORS[kind]
+            if gen_func == generate_task:
+                record = gen_func(realistic, args.with_overdue)
+            else:
+                record = gen_func(realistic)
+            plan.decorate(record, kind)
+            yield record
+        return
+    
+    if record_type == "all":
+        # Balanced distribution
+        generators = [
+            (generate_task, 0.35),
+            (generate_calendar_event, 0.25),
+            (generate_meeting, 0.15),
+            (generate_project, 0.10),
+        ]
+        
+        if args.with_undated:
+            generators.append((generate_undated_task, 0.15))
+        
+        # Add overdue tasks
+        for _ in range(count):
+            gen_func, _ = random.choices(
+                generators,
+                weights=[w for _, w in generators],
+                k=1
+            )[0]
+            
+            if gen_func == generate_task:
+                yield gen_func(realistic, args.with_overdue)
+            else:
+                yield gen_func(realistic)
+    
+    elif record_type == "calendar":
+        for _ in range(count):
+            event_type = random.choices(
+                ["timed", "allday", "multiday"],
+                weights=[0.5, 0.3, 0.2],
+                k=1
+            )[0]
+            yield generate_calendar_event(
+                realistic,
+                force_multiday=(event_type == "multiday"),
+                force_allday=(event_type == "allday"),
+                force_timed=(event_type == "timed"),
+            )
+    
+    elif record_type == "board":
         for _ in range(count):
-            records.append(generate_task(realistic, args.with_overdue))
+            yield generate_task(realistic, args.with_overdue)
+    
+    elif record_type == "table":
+        # Mix for table view
+        for _ in range(count):
+            gen_func = random.choice([
+                generate_task,
+                generate_calendar_event,
+                generate_project,
+            ])
+            if gen_func == generate_task:
+                yield gen_func(realistic, args.with_overdue)
+            else:
+                yield gen_func(realistic)
+    
+    elif record_type == "mixed":
+        for _ in range(count):
+            gen_func = random.choice([
+                generate_task,
+                generate_calendar_event,
+                generate_meeting,
+                generate_project,
+                generate_undated_task,
+            ])
+            if gen_func == generate_task:
+                yield gen_func(realistic, args.with_overdue)
+            else:
+                yield gen_func(realistic)
+
+
+def derive_seed(base_seed: int, shard: int) -> int:
+    """Derive an independent, stable seed for a shard from the run seed."""
+    digest = hashlib.blake2b(f"{base_seed}:{shard}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def plan_shards(count: int, base_seed: int) -> List[Tuple[int, int, int]]:
+    """Split ``count`` records into (shard, size, seed) work items."""
+    return [
+        (shard, min(SHARD_SIZE, count - start), derive_seed(base_seed, shard))
+        for shard, start in enumerate(range(0, count, SHARD_SIZE))
+    ]
+
+
+def init_worker(parsed: argparse.Namespace) -> None:
+    """Pool initializer: hand the parsed CLI options to a worker process."""
+    global args
+    args = parsed
+
+
+def write_shard(task: Tuple[int, int, int]) -> Tuple[Dict[str, int], Any, List[Tuple[str, bytes]], List[Any]]:
+    """Generate and write one shard.
+
+    Returns per-type counts (plus ``_bytes`` written and the ``_io_seconds``
+    spent writing them), the manifest payload,
+    with ``--archive`` the rendered files for the parent to append and, with
+    ``--calendar-workload``, (path, subtype, span) rows for the date index.
+    Runs in the parent for ``--workers 1`` and in pool processes otherwise.
+    """
+    shard, count, seed = task
+    random.seed(seed)
+    root = args.output
+    stats: Dict[str, Any] = {"_bytes": 0}
+    manifest_format = resolve_manifest_format()
+    rows: List[Dict[str, Any]] = []
+    files: List[Tuple[str, bytes]] = []
+    spans: List[Any] = []
+    
+    # One record rendered at a time into a reused text buffer; the encoded
+    # files are staged in a reused write buffer. Folders exist already.
+    buf = io.StringIO()
+    batch = FileBatch(root) if not args.archive else None
+    
+    body = body_spec()
+    
+    global _stage_timer
+    timer = _stage_timer = StageTimer() if profiling() else None
+    lap = timer.lap if timer is not None else skip_lap
+    profiler = None
+    if timer is not None:
+        install_stage_timers()
+        if args.profile_pstats or args.profile_speedscope:
+            profiler = cProfile.Profile()
+            profiler.enable()
+        if args.profile_tracemalloc:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+        timer.restart()
+    
+    start = shard * SHARD_SIZE
+    for index, record in enumerate(generate_records(count, args.type, start), start):
+        if body is not None:
+            record["_body"] = body.sample_size()
+        lap("sample")
+        filename = get_filename(record, index)
+        lap("filename")
+        
+        buf.seek(0)
+        buf.truncate()
+        render_content(record, buf)
+        data = buf.getvalue().encode("utf-8")
+        stats["_bytes"] += len(data)
+        lap("render")
+        
+        if args.archive:
+            files.append((filename, data))
+        else:
+            batch.add(filename, data)
+        lap("io")
+        
+        record_type = record.get("_type", "task")
+        stats[record_type] = stats.get(record_type, 0) + 1
+        if args.relations or args.rollup_workload:
+            stats["_edges"] = stats.get("_edges", 0) + count_relation_edges(record)
+        elif args.multi_project:
+            edges, cross = count_project_edges(record)
+            stats["_edges"] = stats.get("_edges", 0) + edges
+            stats["_cross_edges"] = stats.get("_cross_edges", 0) + cross
+        if manifest_format != "none":
+            rows.append(manifest_row(record, filename))
+        if args.calendar_workload:
+            spans.append((filename, record.get("_subtype", record_type), calendar_span(record)))
+        
+        if args.verbose:
+            print(f"✅ {filename}")
+        lap("manifest")
+    
+    if batch is not None:
+        batch.flush()
+        stats["_io_seconds"] = batch.seconds
+        lap("io")
+    payload = encode_manifest_rows(rows, manifest_format) if rows else None
+    if timer is not None:
+        timer.lap("manifest")
+        _stage_timer = None
+        calls = None
+        if profiler is not None:
+            profiler.disable()
+            profiler.create_stats()
+            calls = marshal.dumps(profiler.stats)
+        stats["_profile"] = {
+            "seconds": timer.seconds,
+            "calls": calls,
+            "tracemalloc": tracemalloc.get_traced_memory()[1] if args.profile_tracemalloc else None,
+        }
+    return stats, payload, files, spans
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size in MiB (None if unavailable).
+
+    Takes the larger of this process and its reaped worker processes.
+    """
+    if resource is None:
+        return None
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # Linux reports KiB, macOS reports bytes
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# MAIN EXECUTION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def print_type_counts(stats: Dict[str, int]) -> None:
+    """Per-type lines of the run summary."""
+    print(f"📋 Tasks:    {stats.get('task', 0)}")
+    print(f"📅 Events:   {stats.get('event', 0)}")
+    print(f"🤝 Meetings: {stats.get('meeting', 0)}")
+    print(f"🎯 Projects: {stats.get('project', 0)}")
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main entry point."""
+    global args
+    launched = time.perf_counter()
+    args = parser.parse_args(argv)
+    profile: Optional[Dict[str, Any]] = None
+    if args.preset:
+        try:
+            profile = load_profile(args.preset)
+        except (OSError, ValueError, yaml.YAMLError) as exc:
+            parser.error(f"--preset: {exc}")
+        # Profile values become defaults, so explicit flags still override them
+        parser.set_defaults(**profile_defaults(profile))
+        args = parser.parse_args(argv)
+    if args.numfiles is None:
+        parser.error("-n/--numfiles is required unless --preset sets a count")
+    if args.sampler == "numpy" and np is None:
+        parser.error("--sampler numpy requires the numpy package")
+    if args.calendar_workload:
+        if args.relations:
+            parser.error("--calendar-workload and --relations are mutually exclusive")
+        if args.sampler == "numpy":
+            parser.error("--calendar-workload only supports --sampler python")
+        rates = (args.undated_rate, args.overdue_rate, args.long_span_rate, args.recurrence_rate, args.dst_rate)
+        if min(rates) < 0 or sum(rates) > 1:
+            parser.error("calendar workload rates must be >= 0 and add up to at most 1")
+        if args.hot_days < 0 or args.hot_day_events < 1:
+            parser.error("--hot-days must be >= 0 and --hot-day-events >= 1")
+    if args.rollup_workload:
+        if args.relations or args.calendar_workload:
+            parser.error("--rollup-workload cannot be combined with --relations or --calendar-workload")
+        if args.sampler == "numpy":
+            parser.error("--rollup-workload only supports --sampler python")
+        if args.sub_bases < 1 or args.rollup_max_links < 0:
+            parser.error("--sub-bases must be >= 1 and --rollup-max-links >= 0")
+        if args.rollup_projects is not None and not 1 <= args.rollup_projects <= args.numfiles:
+            parser.error("--rollup-projects must be between 1 and --numfiles")
+    if args.view_workload:
+        if args.relations or args.calendar_workload or args.rollup_workload:
+            parser.error("--view-workload cannot be combined with another workload")
+        if args.sampler == "numpy":
+            parser.error("--view-workload only supports --sampler python")
+        if args.board_columns < 1 or args.title_words < 1 or args.view_tags < 0 or args.description_lines < 0:
+            parser.error("--board-columns and --title-words must be >= 1, --view-tags and --description-lines >= 0")
+        if args.scroll_frames < 1:
+            parser.error("--scroll-frames must be >= 1")
+    if args.query_workload:
+        if args.relations or args.calendar_workload or args.rollup_workload or args.view_workload:
+            parser.error("--query-workload cannot be combined with another workload")
+        if args.sampler == "numpy":
+            parser.error("--query-workload only supports --sampler python")
+        if args.query_areas < 1 or args.query_tasks < 0 or args.query_inline_fields < 0:
+            parser.error("--query-areas must be >= 1, --query-tasks and --query-inline-fields >= 0")
+        if args.query_projects is not None and not 1 <= args.query_projects < args.numfiles:
+            parser.error("--query-projects must be between 1 and --numfiles - 1")
+        if not all(0 < target <= 1 for target in args.query_selectivity):
+            parser.error("--query-selectivity values must be in (0, 1]")
+    if args.multi_project is not None:
+        if args.relations or args.calendar_workload or args.rollup_workload or args.view_workload or args.query_workload:
+            parser.error("--multi-project cannot be combined with another workload")
+        if args.sampler == "numpy":
+            parser.error("--multi-project only supports --sampler python")
+        if not 1 <= args.multi_project <= args.numfiles:
+            parser.error("--multi-project must be between 1 and --numfiles")
+        if args.project_fields < 0 or args.project_links < 0 or args.cross_project_fields < 0:
+            parser.error("--project-fields, --project-links and --cross-project-fields must be >= 0")
+        if args.project_size_skew < 0 or args.target_skew < 0:
+            parser.error("--project-size-skew and --target-skew must be >= 0")
+        if not 0 <= args.cross_project_rate <= 1:
+            parser.error("--cross-project-rate must be between 0 and 1")
+    if args.formulas:
+        if args.formulas < 0 or args.formula_depth < 0 or args.formula_fan_in < 1 or args.formula_widgets < 1:
+            parser.error("--formulas and --formula-depth must be >= 0, --formula-fan-in and --formula-widgets >= 1")
+        if not 0 <= args.formula_chain_rate <= 1:
+            parser.error("--formula-chain-rate must be between 0 and 1")
+        try:
+            parse_formula_mix(args.formula_mix)
+        except ValueError as exc:
+            parser.error(f"--formula-mix: {exc}")
+    output_path = Path(args.output)
+    mode = archive_mode(args.archive) if args.archive else None
+    if args.archive and mode is None:
+        parser.error(f"--archive: unsupported suffix (use one of {', '.join(ARCHIVE_MODES)})")
+    if mode == "zst" and zstandard is None:
+        parser.error("--archive *.tar.zst requires the zstandard package")
+    
+    # Pin the clock and the seed before anything is generated or hashed
+    if args.today is None:
+        epoch = os.environ.get("SOURCE_DATE_EPOCH")
+        args.today = (
+            datetime.datetime.fromtimestamp(int(epoch), datetime.timezone.utc).date()
+            if epoch else datetime.date.today()
+        )
+    seeded = args.seed is not None
+    if not seeded:
+        args.seed = random.randrange(2**63)
+    if args.calendar_workload and args.hot_days:
+        scaled = calendar_layout().hot_day_events
+        if scaled < args.hot_day_events:
+            print(f"⚠️  --hot-day-events {args.hot_day_events} × --hot-days {args.hot_days} would take over half "
+                  f"of {args.numfiles:,} notes; using {scaled} per hot day", file=sys.stderr)
+    
+    manifest_format = resolve_manifest_format()
+    manifest_path: Optional[Path] = None
+    if manifest_format != "none":
+        suffix = ".parquet" if manifest_format == "parquet" else ".ndjson"
+        manifest_path = Path(args.manifest or f"{output_path}.manifest{suffix}")
+    calendar_path = Path(args.calendar_index or f"{output_path}.calendar.json") if args.calendar_workload else None
+    formulas_path = Path(args.formulas_file or f"{output_path}.formulas.json") if args.formulas else None
+    views_path = Path(args.views_file or f"{output_path}.views.json") if args.view_workload else None
+    queries_path = Path(args.queries_file or f"{output_path}.queries.json") if args.query_workload else None
+    projects_path = Path(args.projects_file or f"{output_path}.projects.json") if args.multi_project else None
+    settings_path = Path(args.settings_file or f"{output_path}.data.json") if args.multi_project else None
+    # Output role -> path; what the generation cache stores and restores
+    targets: Dict[str, Path] = {"archive": Path(args.archive)} if args.archive else {"vault": output_path}
+    if manifest_path is not None:
+        targets["manifest"] = manifest_path
+        targets["manifest-index"] = Path(f"{output_path}.manifest.json")
+    if calendar_path is not None:
+        targets["calendar-index"] = calendar_path
+    if formulas_path is not None:
+        targets["formulas"] = formulas_path
+    if views_path is not None:
+        targets["views"] = views_path
+    if queries_path is not None:
+        targets["queries"] = queries_path
+    if projects_path is not None and settings_path is not None:
+        targets["projects"] = projects_path
+        targets["settings"] = settings_path
+    
+    cache: Optional[GenerationCache] = None
+    key = ""
+    if args.cache and not seeded:
+        print("⚠️  --cache needs --seed; generating without the cache", file=sys.stderr)
+    elif args.cache:
+        cache = GenerationCache(Path(args.cache).expanduser(), args.cache_max_mb, args.cache_mode)
+        key = cache_key(profile, mode)
+    
+    folders = [output_path]
+    if args.relations:
+        folders += [output_path / RELATION_FOLDERS[entity] for entity in ("person", "client", "project")]
+    if args.rollup_workload:
+        folders += [output_path / RELATION_FOLDERS[entity] for entity in ("project", "entry")]
+    if args.query_workload:
+        folders.append(output_path / RELATION_FOLDERS["project"])
+        for area in query_layout().areas:
+            folders += [output_path / "Work" / area, output_path / "Work" / area / "Archive"]
+    if args.multi_project:
+        folders += [output_path / folder for folder in project_layout().folders]
+    plan = sampling_plan()
+    if plan is not None:
+        folders += [output_path / name for name in plan.folder_names]
+    
+    # Clear if requested
+    if args.clear:
+        cleared = clear_folders(folders)
+        if args.verbose:
+            print(f"🗑️  Cleared {cleared} files from {output_path}")
+    
+    # A profiled run has to generate; it still refreshes the cache entry
+    cached = cache.lookup(key) if cache is not None and not profiling() else None
+    if cached is not None:
+        started = time.perf_counter()
+        cache.restore(key, cached, targets)
+        elapsed = time.perf_counter() - started
+        print(f"\n{'═' * 50}")
+        print(f"♻️  Restored {cached['total']} files into {args.archive or output_path} from cache")
+        print(f"{'═' * 50}")
+        print_type_counts(cached["stats"])
+        print(f"{'─' * 50}")
+        print(f"🔑 {key[:16]} · {cache.method or 'nothing to clone'} · {elapsed:.2f}s")
+        print(f"{'═' * 50}")
+        return
+    # Files already in the vault that this run may not rewrite
+    leftovers = (
+        GenerationCache.snapshot(output_path)
+        if cache is not None and not args.archive and output_path.is_dir() else None
+    )
+    
+    # Create every output directory once, up front
+    if not args.archive:
+        for folder in folders:
+            folder.mkdir(parents=True, exist_ok=True)
+    # Side files may be hardlinks into the cache: replace, never truncate
+    for role, target in targets.items():
+        if role != "vault":
+            replace_file(target)
+    
+    # Statistics
+    stats = {
+        "task": 0,
+        "event": 0,
+        "meeting": 0,
+        "project": 0,
+    }
+    
+    count = args.numfiles
+    if args.relations:
+        count = RelationLayout(args.numfiles, args.people, args.clients).total
+    shards = plan_shards(count, args.seed)
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    workers = min(workers, max(len(shards), 1))
+    
+    manifest: Optional[ManifestWriter] = None
+    if manifest_path is not None:
+        manifest = ManifestWriter(manifest_path, manifest_format)
+    archive: Optional[ArchiveWriter] = None
+    if mode is not None:
+        # SOURCE_DATE_EPOCH, else midnight UTC of the pinned date: reproducible
+        midnight = datetime.datetime.combine(args.today, datetime.time(), datetime.timezone.utc)
+        mtime = int(os.environ.get("SOURCE_DATE_EPOCH", midnight.timestamp()))
+        archive = ArchiveWriter(Path(args.archive), mode, mtime)
+    calendar = CalendarIndex() if args.calendar_workload else None
+    
+    timer = StageTimer() if profiling() else None
+    calls: Optional["pstats.Stats"] = None
+    memory_peak: Optional[int] = None
+    if args.profile_tracemalloc:
+        tracemalloc.start()
+    
+    total = 0
+    # Parent time spent writing the archive; loose files are timed per shard
+    archive_seconds = 0.0
+    started = time.perf_counter()
+    
+    if workers == 1:
+        results = map(write_shard, shards)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(workers, initializer=init_worker, initargs=(args,))
+        # Ordered so the manifest follows shard order whatever the worker count
+        results = pool.imap(write_shard, shards)
+    
+    try:
+        for shard_stats, payload, files, spans in results:
+            shard_profile = shard_stats.pop("_profile", None)
+            if shard_profile is not None:
+                timer.merge(shard_profile["seconds"])
+                if shard_profile["calls"] is not None:
+                    calls = merge_call_stats(calls, shard_profile["calls"])
+                if shard_profile["tracemalloc"] is not None:
+                    memory_peak = max(memory_peak or 0, shard_profile["tracemalloc"])
+                timer.restart()
+            for record_type, n in shard_stats.items():
+                stats[record_type] = stats.get(record_type, 0) + n
+                if not record_type.startswith("_"):
+                    total += n
+            if manifest is not None and payload:
+                manifest.write(payload)
+                if timer is not None:
+                    timer.lap("manifest")
+            if archive is not None:
+                began = time.perf_counter()
+                for name, data in files:
+                    archive.add(name, data)
+                archive_seconds += time.perf_counter() - began
+                if timer is not None:
+                    timer.lap("archive")
+            if calendar is not None:
+                calendar.add(spans)
+                if timer is not None:
+                    timer.lap("index")
+    except FileExistsError as exc:
+        raise SystemExit(f"Refusing to overwrite {exc.filename}: {exc.strerror}")
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        generated = time.perf_counter()
+        if timer is not None:
+            timer.restart()
+        if manifest is not None:
+            manifest.close()
+            if timer is not None:
+                timer.lap("manifest")
+        if archive is not None:
+            began = time.perf_counter()
+            archive.close()
+            archive_seconds += time.perf_counter() - began
+            if timer is not None:
+                timer.lap("archive")
+    
+    # Shards write in parallel, so their summed write time is spread over the workers
+    io_seconds = stats.pop("_io_seconds", 0.0) / workers + archive_seconds
+    if manifest_path is not None:
+        write_manifest_index(Path(f"{output_path}.manifest.json"), stats, total, manifest_path)
+    if calendar is not None:
+        calendar.write(calendar_path, calendar_layout())
+    formulas = write_formula_workload(formulas_path, total) if formulas_path is not None else None
+    views = write_view_workload(views_path, total) if views_path is not None else None
+    queries = write_query_workload(queries_path, total) if queries_path is not None else None
+    projects = (
+        write_project_workload(projects_path, settings_path, total)
+        if projects_path is not None and settings_path is not None else None
+    )
+    if timer is not None:
+        timer.lap("index")
+    if cache is not None:
+        cache.store(key, targets, stats, total, leftovers)
+        cache.evict(keep=key)
+    
+    elapsed = time.perf_counter() - started
+    report: Optional[Dict[str, Any]] = None
+    if timer is not None:
+        if args.profile_tracemalloc:
+            memory_peak = max(memory_peak or 0, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        if calls is not None and args.profile_pstats:
+            calls.dump_stats(args.profile_pstats)
+        if calls is not None and args.profile_speedscope:
+            Path(args.profile_speedscope).write_text(json.dumps(speedscope_profile(calls)), encoding="utf-8")
+        phases = {
+            "setup": started - launched,
+            "generate": generated - started,
+            "finalize": time.perf_counter() - generated,
+        }
+        report = profile_report(timer, phases, stats, total, workers, memory_peak)
+        if args.profile:
+            Path(args.profile).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    rate = total / elapsed if elapsed > 0 else 0.0
+    megabytes = stats.get("_bytes", 0) / 1e6
+    throughput = megabytes / io_seconds if io_seconds > 0 else 0.0
+    rss = peak_rss_mb()
+    
+    # Summary
+    print(f"\n{'═' * 50}")
+    print(f"✨ Generated {total} files in {args.archive or output_path}")
+    print(f"{'═' * 50}")
+    print_type_counts(stats)
+    if args.relations:
+        print(f"👥 People:   {stats.get('person', 0)}")
+        print(f"🏢 Clients:  {stats.get('client', 0)}")
+        print(f"🔗 Edges:    {stats.get('_edges', 0)} ({args.fan_dist})")
+    if args.rollup_workload:
+        layout = rollup_layout()
+        largest = max(range(layout.projects), key=lambda p: len(layout.block(p)))
+        print(f"📒 Entries:  {stats.get('entry', 0)} in {len(layout.kinds)} types"
+              f" · largest project {len(layout.block(largest))} ({relation_name('project', largest, args.realistic)})")
+        print(f"🔗 Edges:    {stats.get('_edges', 0)}")
+    if calendar is not None:
+        peak_day, peak_visible, overlap = calendar.peak()
+        print(f"🔥 Peak day: {peak_day} · {peak_visible} visible · max overlap {overlap}")
+        print(f"🔁 Recurring: {calendar.totals.get('recurring', 0)} · DST: {calendar.totals.get('dst', 0)}"
+              f" · Overdue: {calendar.totals.get('overdue', 0)} · Undated: {calendar.totals.get('undated', 0)}")
+    if formulas is not None:
+        families: Dict[str, int] = {}
+        for formula in formulas["formulas"]:
+            families[formula["family"]] = families.get(formula["family"], 0) + 1
+        print(f"🧮 Formulas: {len(formulas['formulas'])} ({', '.join(f'{k} {v}' for k, v in sorted(families.items()))})"
+              f" · {len(formulas['dashboard']['widgets'])} widgets")
+    if views is not None:
+        widest = max(views["columns"], key=lambda column: column["share"])
+        print(f"🗃️  Columns:  {len(views['columns'])} · largest {widest['id']} ({widest['share']:.1%})"
+              f" · {len(views['traces'])} scroll traces")
+    if queries is not None:
+        native = sum(query["native"] for query in queries["queries"])
+        print(f"🔎 Queries:  {len(queries['queries'])} ({native} native) over {queries['items']} items"
+              f" · {queries['projects']} projects · {len(queries['areas'])} areas")
+    if projects is not None:
+        sizes = sorted(project["records"] for project in projects["projects"])
+        edges = stats.get("_edges", 0)
+        print(f"📁 Folders:  {len(sizes)} projects · notes per project {sizes[0]}–{sizes[len(sizes) // 2]}–{sizes[-1]}"
+              f" (min–median–max)")
+        print(f"🔗 Edges:    {edges} · {stats.get('_cross_edges', 0) / edges if edges else 0:.1%} cross-project")
+    print(f"{'─' * 50}")
+    if plan is not None:
+        print(f"🧭 Preset:   {plan.name}")
+    print(f"⏱️  {elapsed:.2f}s · {rate:,.0f} files/sec · {workers} worker(s)")
+    print(f"💾 {megabytes:,.1f} MB written · {throughput:,.1f} MB/s over {io_seconds:.2f}s of writes")
+    if rss is not None:
+        print(f"🧠 Peak RSS: {rss:.1f} MiB")
+    if manifest_path is not None:
+        print(f"🗂️  Manifest: {manifest_path}")
+    if calendar_path is not None:
+        print(f"🗓️  Date index: {calendar_path}")
+    if formulas_path is not None:
+        print(f"🧮 Formula workload: {formulas_path}")
+    if views_path is not None:
+        print(f"🗃️  View workload: {views_path}")
+    if queries_path is not None:
+        print(f"🔎 Query workload: {queries_path}")
+    if projects_path is not None:
+        print(f"🗂️  Project layout: {projects_path}")
+        print(f"⚙️  Plugin settings: {settings_path}")
+    if cache is not None:
+        print(f"🔑 Cached as {key[:16]} ({cache.method or 'empty'})")
+    if report is not None:
+        ranked = sorted(report["stages"].items(), key=lambda kv: -kv[1]["share"])
+        shares = " · ".join(f"{stage} {entry['share']:.0%}" for stage, entry in ranked)
+        print(f"🔬 Stages:   {shares}")
+    if args.profile:
+        print(f"📈 Profile:  {args.profile}")
+    print(f"{'═' * 50}")
+
+
+# Strings chosen to hit every quoting branch of fast_scalar()
+ADVERSARIAL_STRINGS = [
+    "", " ", "yes", "No", "ON", "null", "~", "true", "0", "007", "1e5", "1.5",
+    "08:30", "10:30", "2026-01-31", "2026-01-31T10:00:00Z", "#ff6b9d",
+    "[[Bob Wilson]]", "[[Bob|alias]]", "a: b", "a #b", "- item", "? key",
+    "'quoted'", '"double"', "tab\tin", "line\nbreak", "trailing ", " leading",
+    "Код-ревью PR #42", "Переговорная 'Альфа'", "emoji 🎯", "%percent", "@at",
+    "`tick`", "{a: 1}", "back\\slash", "\u2028sep", "ünïcödé", "A_b-c.d",
+    "del\x7f", "nel\x85", "c1\x9b", "bom\ufeff", "nonchar\ufffe", "bell\x07",
+    "abc\n", "crlf\r\n", "cr\rin", "\n", "two\n\n",
+]
+
+
+def random_frontmatter_value() -> Any:
+    """Random value from the fast emitter's supported alphabet."""
+    kind = random.randrange(9)
+    if kind == 0:
+        return random.choice(ADVERSARIAL_STRINGS)
+    if kind == 1:
+        return random_text(random.randint(1, 20))
+    if kind == 2:
+        return random.randint(-10**12, 10**12)
+    if kind == 3:
+        return random.choice([0.5, -2.25, 1e-7, 3.0e20, 100.0, float("inf")])
+    if kind == 4:
+        return random.choice([True, False, None])
+    if kind == 5:
+        return random_date().isoformat()
+    if kind == 6:
+        return f"[[{random.choice(ATTENDEES)}]]"
+    if kind == 7:
+        return [random.choice(ADVERSARIAL_STRINGS + [1, 2.5, True, None])
+                for _ in range(random.randint(0, 4))]
+    # Nested objects and lists of the schema-stress profiles
+    node = nested_value(random.Random(random.random()), random.randint(0, 4), random.randint(1, 3))
+    if isinstance(node, dict) and random_bool(0.3):
+        node[random.choice(ADVERSARIAL_STRINGS[:12]) or "key"] = random.choice([[], {}, [[1, "a"], []]])
+    return node
+
+
+def verify_yaml_main(argv: Optional[List[str]] = None) -> int:
+    """Round-trip check: the fast emitter must parse exactly like PyYAML.
+
+    Covers both the generator's own records and random adversarial values.
+    Exits non-zero on the first mismatch.
+    """
+    global args
+    check = argparse.ArgumentParser(
+        prog="generate-test-files verify-yaml",
+        description="Check that --yaml-backend fast parses identically to pyyaml.",
+    )
+    check.add_argument("-n", "--numrecords", type=int, default=2000)
+    check.add_argument("--seed", type=int, default=0)
+    opts = check.parse_args(argv)
+    random.seed(opts.seed)
+    
+    samples: List[Dict[str, Any]] = []
+    for realistic in (False, True):
+        args = parser.parse_args([".", "-n", "0", "--with-overdue", "--with-undated"]
+                                 + (["--realistic"] if realistic else []))
+        for record in generate_records(opts.numrecords // 4, "all"):
+            samples.append({k: v for k, v in record.items() if not k.startswith("_")})
+    for _ in range(opts.numrecords - len(samples)):
+        samples.append({
+            random.choice(ADVERSARIAL_STRINGS[:12]) or "key": random_frontmatter_value(),
+            "title": random.choice(ADVERSARIAL_STRINGS),
+            "tags": [random.choice(ADVERSARIAL_STRINGS) for _ in range(3)],
+        })
+    
+    for i, frontmatter in enumerate(samples):
+        expected = yaml.safe_load(dump_frontmatter_pyyaml(frontmatter))
+        actual = yaml.safe_load(dump_frontmatter_fast(frontmatter))
+        # PyYAML's own dumper writes NEL raw and reads it back as a space;
+        # reading back the original value is as good as matching it
+        if expected != actual and frontmatter != actual:
+            print(f"❌ Mismatch on sample {i}:\n{dump_frontmatter_fast(frontmatter)}")
+            print(f"   pyyaml: {expected!r}\n   fast:   {actual!r}")
+            return 1
+    
+    print(f"✅ {len(samples)} frontmatter samples round-trip identically")
+    return 0
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# VAULT MUTATION (churn workload)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+MUTATION_OPS = ["edit", "rename", "delete", "create", "retarget"]
+DEFAULT_MUTATION_MIX = "edit=0.6,rename=0.1,delete=0.1,create=0.1,retarget=0.1"
+
+
+def split_frontmatter(text: str) -> Tuple[Dict[str, Any], str]:
+    """Split a note into (frontmatter dict, body). Missing frontmatter → {}."""
+    if not text.startswith("---\n"):
+        return {}, text
+    end = text.find("\n---\n", 4)
+    if end == -1:
+        return {}, text
+    data = yaml.safe_load(text[4:end + 1]) or {}
+    return (data if isinstance(data, dict) else {}), text[end + 5:]
+
+
+def join_frontmatter(frontmatter: Dict[str, Any], body: str) -> str:
+    """Inverse of split_frontmatter, using the selected --yaml-backend."""
+    return f"---\n{YAML_BACKENDS[args.yaml_backend](frontmatter)}---\n{body}"
+
+
+def mutated_value(value: Any) -> Any:
+    """A new value of the same shape as ``value``."""
+    if isinstance(value, bool):
+        return not value
+    if isinstance(value, int):
+        if 0 <= value <= 100:
+            return random_progress()
+        spread = abs(value) // 4 + 1
+        return value + random.randint(-spread, spread)
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return random_date()
+    if isinstance(value, list):
+        return random_tags(random.choice(list(TAGS_POOL)))
+    if isinstance(value, str):
+        if re.match(r"^\d{4}-\d{2}-\d{2}$", value):
+            return random_date().isoformat()
+        if re.match(r"^\d{2}:\d{2}$", value):
+            return random_time()
+        if value in TASK_STATUSES:
+            return random.choice(TASK_STATUSES)
+        if value in EVENT_STATUSES + PROJECT_STATUSES:
+            return random.choice(EVENT_STATUSES + PROJECT_STATUSES)
+        if value in PRIORITIES:
+            return random_priority()
+        if value.startswith("#"):
+            return random_color()
+    return value
+
+
+class VaultState:
+    """Sorted, index-addressable view of the vault's notes.
+
+    Swap-remove keeps deletes O(1); the list order (and therefore every
+    seeded choice) only depends on the vault contents and the op stream.
+    """
+    
+    def __init__(self, root: Path):
+        self.root = root
+        self.paths: List[str] = sorted(
+            p.relative_to(root).as_posix() for p in root.rglob("*.md")
+        )
+        self.index = {p: i for i, p in enumerate(self.paths)}
+        self.stems = {Path(p).stem: p for p in self.paths}
+    
+    def __len__(self) -> int:
+        return len(self.paths)
+    
+    def pick(self) -> str:
+        return self.paths[random.randrange(len(self.paths))]
+    
+    def pick_like(self, stem: str, attempts: int = 8) -> str:
+        """Pick a note from the same folder as ``stem`` when it resolves."""
+        folder = Path(self.stems[stem]).parent if stem in self.stems else None
+        for _ in range(attempts):
+            path = self.pick()
+            if folder is None or Path(path).parent == folder:
+                return path
+        return path
+    
+    def add(self, path: str) -> None:
+        self.index[path] = len(self.paths)
+        self.paths.append(path)
+        self.stems[Path(path).stem] = path
     
-    elif record_type == "table":
-        # Mix for table view
-        for _ in range(count):
-            gen_func = random.choice([
-                generate_task,
-                generate_calendar_event,
-                generate_project,
-            ])
-            if gen_func == generate_task:
-                records.append(gen_func(realistic, args.with_overdue))
+    def remove(self, path: str) -> None:
+        self.stems.pop(Path(path).stem, None)
+        i = self.index.pop(path)
+        last = self.paths.pop()
+        if last != path:
+            self.paths[i] = last
+            self.index[last] = i
+    
+    def read(self, path: str) -> Tuple[Dict[str, Any], str]:
+        return split_frontmatter((self.root / path).read_text(encoding="utf-8"))
+    
+    def write(self, path: str, frontmatter: Dict[str, Any], body: str) -> None:
+        # The vault may be restored from the generation cache as hardlinks
+        replace_file(self.root / path)
+        with open(self.root / path, "w", encoding="utf-8") as f:
+            f.write(join_frontmatter(frontmatter, body))
+
+
+def apply_mutation(op: str, vault: VaultState) -> Optional[Dict[str, Any]]:
+    """Apply one op to the vault; returns its log entry (None = nothing to do)."""
+    path = vault.pick()
+    
+    if op == "edit":
+        frontmatter, body = vault.read(path)
+        fields = [k for k in frontmatter if k != "title"]
+        random.shuffle(fields)
+        for field in fields:
+            old = frontmatter[field]
+            new = mutated_value(old)
+            # Values without a known shape (dicts, nested lists, free text) come
+            # back as is; an unchanged value would log an edit that never happened
+            if new != old:
+                frontmatter[field] = new
+                vault.write(path, frontmatter, body)
+                return {"path": path, "field": field, "old": old, "new": new}
+        return None
+    
+    if op == "rename":
+        stem = Path(path).stem.rsplit("_", 1)[0]
+        new_path = (Path(path).parent / f"{stem}_{random_text(6)}.md").as_posix()
+        if new_path in vault.index:
+            return None
+        os.rename(vault.root / path, vault.root / new_path)
+        vault.remove(path)
+        vault.add(new_path)
+        return {"path": path, "newPath": new_path}
+    
+    if op == "delete":
+        if len(vault) <= 1:
+            return None
+        (vault.root / path).unlink()
+        vault.remove(path)
+        return {"path": path}
+    
+    if op == "create":
+        record = next(generate_records(1, "mixed"))
+        folder = Path(path).parent
+        new_path = (folder / get_filename(record)).as_posix()
+        if new_path in vault.index:
+            return None
+        with open(vault.root / new_path, "w", encoding="utf-8") as f:
+            f.write(generate_content(record))
+        vault.add(new_path)
+        return {"path": new_path, "type": record["_type"]}
+    
+    # retarget: point one wikilink in frontmatter at another live note
+    frontmatter, body = vault.read(path)
+    slots = []
+    for field, value in frontmatter.items():
+        if isinstance(value, str) and WIKILINK_VALUE.match(value):
+            slots.append((field, None))
+        elif isinstance(value, list):
+            slots += [(field, i) for i, item in enumerate(value)
+                      if isinstance(item, str) and WIKILINK_VALUE.match(item)]
+    if not slots:
+        return None
+    field, position = random.choice(slots)
+    old = frontmatter[field] if position is None else frontmatter[field][position]
+    new = f"[[{Path(vault.pick_like(WIKILINK_VALUE.match(old).group(1))).stem}]]"
+    if position is None:
+        frontmatter[field] = new
+    else:
+        frontmatter[field][position] = new
+    vault.write(path, frontmatter, body)
+    return {"path": path, "field": field, "old": old, "new": new}
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """Parse ``op=weight,...`` into a weight table over MUTATION_OPS."""
+    mix = {op: 0.0 for op in MUTATION_OPS}
+    for part in spec.split(","):
+        op, _, weight = part.partition("=")
+        op = op.strip()
+        if op not in mix:
+            raise SystemExit(f"Unknown mutation op '{op}' (expected one of {', '.join(MUTATION_OPS)})")
+        mix[op] = float(weight)
+    return mix
+
+
+def mutate_main(argv: Optional[List[str]] = None) -> int:
+    """Replay a seeded stream of edits against an existing vault.
+
+    Every applied op is appended to a JSONL log, so a churn run can be
+    replayed and compared between plugin builds.
+    """
+    global args
+    mparser = argparse.ArgumentParser(
+        prog="generate-test-files mutate",
+        description="Apply a reproducible stream of edits to a generated vault.",
+    )
+    mparser.add_argument("vault", help="Existing vault folder (e.g. from a previous run)")
+    mparser.add_argument("--ops", type=int, default=1000, help="Number of ops to apply (default: 1000)")
+    mparser.add_argument("--rate", type=float, default=50.0,
+                         help="Target ops/sec; 0 = as fast as possible (default: 50)")
+    mparser.add_argument("--mix", default=DEFAULT_MUTATION_MIX,
+                         help=f"Op weights (default: {DEFAULT_MUTATION_MIX})")
+    mparser.add_argument("--log", help="JSONL op log (default: <vault>.mutations.jsonl)")
+    mparser.add_argument("--seed", type=int, default=0, help="Seed for the op stream (default: 0)")
+    mparser.add_argument("--yaml-backend", choices=list(YAML_BACKENDS), default="fast")
+    mparser.add_argument("--realistic", action="store_true", help="Realistic titles for created notes")
+    mparser.add_argument("-v", "--verbose", action="store_true")
+    opts = mparser.parse_args(argv)
+    
+    root = Path(opts.vault)
+    if not root.is_dir():
+        raise SystemExit(f"Vault folder not found: {root}")
+    args = parser.parse_args(
+        [opts.vault, "-n", "0", "--yaml-backend", opts.yaml_backend]
+        + (["--realistic"] if opts.realistic else [])
+    )
+    random.seed(opts.seed)
+    
+    mix = parse_mix(opts.mix)
+    ops, weights = list(mix), list(mix.values())
+    vault = VaultState(root)
+    if not len(vault):
+        raise SystemExit(f"No notes in {root}")
+    log_path = Path(opts.log) if opts.log else root.with_name(root.name + ".mutations.jsonl")
+    
+    counts = {op: 0 for op in MUTATION_OPS}
+    started = time.perf_counter()
+    with open(log_path, "w", encoding="utf-8") as log:
+        for seq in range(opts.ops):
+            if opts.rate > 0:
+                delay = started + seq / opts.rate - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            op = random.choices(ops, weights=weights, k=1)[0]
+            entry = apply_mutation(op, vault)
+            if entry is None:
+                continue
+            counts[op] += 1
+            entry = {"seq": seq, "t": round(time.perf_counter() - started, 4), "op": op, **entry}
+            log.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+            if opts.verbose:
+                print(f"✏️  {op:8} {entry['path']}")
+    
+    elapsed = time.perf_counter() - started
+    applied = sum(counts.values())
+    print(f"\n{'═' * 50}")
+    print(f"🔁 Applied {applied} ops to {root} ({len(vault)} notes now)")
+    print(f"{'═' * 50}")
+    for op in MUTATION_OPS:
+        print(f"  {op:9} {counts[op]}")
+    print(f"{'─' * 50}")
+    print(f"⏱️  {elapsed:.2f}s · {applied / elapsed if elapsed > 0 else 0:,.1f} ops/sec "
+          f"(target {opts.rate or '∞'})")
+    print(f"📝 Log: {log_path}")
+    print(f"{'═' * 50}")
+    return 0
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# EXPECTED-RESULTS ORACLE
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# Evaluates a view spec (FilterIR / SortIR / GroupIR / aggregates / RollupIR
+# from src/lib/engine/contracts.ts) over a manifest with NumPy. Every field is
+# turned into typed columns once; string and date operators run over the
+# column's distinct values and are broadcast back through integer codes, so
+# the per-row cost is a handful of array ops rather than a Python loop.
+#
+# Mirrors, on the generator's schemas:
+#   - type detection and coercion of datasources/helpers.ts (detectCellType,
+#     parseRecords): ISO strings → dates, [[link]] arrays → relation paths,
+#     mixed-type fields → strings;
+#   - dispatch order and R2.1c negative semantics of engine/filterEvaluator.ts;
+#   - ui/app/viewSort.ts ordering (nulls last, strings case-insensitive);
+#   - group keys of dashboard-engine/transformExecutor.ts (String(v)/__empty__);
+#   - reductions of engine/aggregate.ts.
+# Date formulas in condition values (e.g. "today+7d") are not supported.
+
+KIND_MISSING, KIND_STRING, KIND_NUMBER, KIND_BOOL, KIND_DATE, KIND_LIST = range(6)
+ISO_DATE_VALUE = re.compile(r"^\d{4}-\d{2}-\d{2}(T)?(\d{2})?(:\d{2})?(:\d{2})?(\.\d{3})?$")
+NEGATIVE_OPS = {"is-not", "not-contains", "is-not-on", "neq", "has-none-of"}
+STRING_OPS = {"is", "is-any-of", "is-not", "contains", "not-contains", "starts-with", "ends-with", "regex"}
+NUMBER_OPS = {"eq", "neq", "lt", "gt", "lte", "gte"}
+BOOLEAN_OPS = {"is-checked", "is-not-checked"}
+LIST_OPS = {"has-any-of", "has-all-of", "has-none-of", "has-keyword"}
+DATE_OPS = {
+    "is-on", "is-not-on", "is-before", "is-after", "is-on-and-before", "is-on-and-after",
+    "is-today", "is-this-week", "is-this-month", "is-this-quarter", "is-this-year",
+    "is-past-week", "is-past-month", "is-past-year", "is-next-week", "is-next-month",
+    "is-next-year", "is-last-n-days", "is-next-n-days", "is-overdue", "is-upcoming",
+}
+# contracts.ts AggregateFn names that differ from aggregate.ts RollupFunction
+AGGREGATE_ALIASES = {"count_not_empty": "count_values", "list": "concat", "list_unique": "concat_unique"}
+
+
+def js_string(value: Any) -> str:
+    """String(value) as JavaScript would print a decoded frontmatter value."""
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, list):
+        return ",".join("" if v is None else js_string(v) for v in value)
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return str(value)
+
+
+def js_locale_string(value: Any) -> str:
+    """Number/boolean ``toLocaleString()`` in the en-US locale."""
+    if isinstance(value, bool):
+        return js_string(value)
+    if isinstance(value, int) or (isinstance(value, float) and value.is_integer()):
+        return f"{int(value):,}"
+    return f"{value:,.3f}".rstrip("0").rstrip(".")
+
+
+def strip_wikilink(value: str) -> str:
+    """engine/wikilink.ts stripToPath: ``[[path#h|alias]]`` → ``path``."""
+    match = WIKILINK_VALUE.match(value.strip())
+    return match.group(1).strip() if match else value
+
+
+def add_months(day: datetime.date, months: int) -> datetime.date:
+    """dayjs-style month arithmetic (clamps to the last day of the month)."""
+    month = day.month - 1 + months
+    year = day.year + month // 12
+    month = month % 12 + 1
+    last = (datetime.date(year + month // 12, month % 12 + 1, 1) - datetime.timedelta(days=1)).day
+    return datetime.date(year, month, min(day.day, last))
+
+
+class OracleColumn:
+    """Typed columnar view of one field after datasource-style coercion.
+    
+    Row-wise arrays: ``kind`` plus one value array per kind. Strings and list
+    items are interned into ``vocab`` and referenced by integer codes; list
+    items are stored flattened (``list_codes`` sliced by ``offsets``).
+    """
+    
+    def __init__(self, name: str, raw: List[Any]):
+        n = len(raw)
+        self.name = name
+        self.kind = np.zeros(n, dtype=np.int8)
+        self.num = np.full(n, np.nan)
+        self.date = np.full(n, np.datetime64("NaT"), dtype="datetime64[D]")
+        self.bool = np.zeros(n, dtype=bool)
+        self.code = np.full(n, -1, dtype=np.int64)
+        self.list_len = np.zeros(n, dtype=np.int64)
+        self.vocab: List[Any] = []
+        self.list_codes = np.zeros(0, dtype=np.int64)
+        
+        present = np.fromiter((v is not None for v in raw), dtype=bool, count=n)
+        value_types = {type(v) for v in raw} - {type(None)}
+        if value_types == {list} and self._build_string_lists(raw):
+            self.kind[present] = KIND_LIST
+            self._index_lists()
+            self.vocab_str = [js_string(v) for v in self.vocab]
+            return
+        
+        self.type = self.detect_type(raw)
+        if self.type == "number" and value_types <= {int, float}:
+            self.kind[present] = KIND_NUMBER
+            self.num = np.array([math.nan if v is None else v for v in raw], dtype=float)
+        elif self.type in ("string", "date") and value_types <= {str}:
+            # Intern distinct strings once; dates are parsed per distinct value
+            lookup: Dict[str, int] = {}
+            codes = np.fromiter(
+                (-1 if v is None else lookup.setdefault(v, len(lookup)) for v in raw),
+                dtype=np.int64, count=n,
+            )
+            if self.type == "date":
+                days = np.array([datetime.date.fromisoformat(v[:10]) for v in lookup], dtype="datetime64[D]")
+                self.kind[present] = KIND_DATE
+                self.date[present] = days[codes[present]]
             else:
-                records.append(gen_func(realistic))
+                self.kind[present] = KIND_STRING
+                self.code = codes
+                self.vocab = list(lookup)
+        else:
+            self._build_generic(raw)
+        self._index_lists()
+        self.vocab_str = [js_string(v) for v in self.vocab]
     
-    elif record_type == "mixed":
-        for _ in range(count):
-            gen_func = random.choice([
-                generate_task,
-                generate_calendar_event,
-                generate_meeting,
-                generate_project,
-                generate_undated_task,
-            ])
-            if gen_func == generate_task:
-                records.append(gen_func(realistic, args.with_overdue))
+    def _build_string_lists(self, raw: List[Any]) -> bool:
+        """Fast path for fields holding only lists of strings (tags, relations).
+
+        Detects the field type from the distinct items: relation when every
+        list is non-empty and every item is a wikilink, plain list otherwise.
+        Returns False (nothing built) when an item is not a string.
+        """
+        lengths = [0 if v is None else len(v) for v in raw]
+        flat = [item for v in raw if v for item in v]
+        lookup: Dict[Any, int] = {}
+        try:
+            codes = [lookup.setdefault(item, len(lookup)) for item in flat]
+        except TypeError:  # nested lists / objects
+            return False
+        vocab = list(lookup)
+        if not all(type(v) is str for v in vocab):
+            return False
+        self.list_len = np.array(lengths, dtype=np.int64)
+        codes_arr = np.array(codes, dtype=np.int64)
+        has_empty = any(length == 0 for v, length in zip(raw, lengths) if v is not None)
+        if vocab and not has_empty and all(WIKILINK_VALUE.match(v.strip()) for v in vocab):
+            self.type = "relation"
+            # Several raw links can strip to the same path: re-intern
+            stripped: Dict[str, int] = {}
+            remap = np.array([stripped.setdefault(strip_wikilink(v), len(stripped)) for v in vocab],
+                             dtype=np.int64)
+            self.vocab = list(stripped)
+            self.list_codes = remap[codes_arr] if len(codes_arr) else codes_arr
+        else:
+            self.type = "list"
+            self.vocab = vocab
+            self.list_codes = codes_arr
+        return True
+    
+    def _build_generic(self, raw: List[Any]) -> None:
+        """Row-at-a-time build for lists, booleans and mixed-type fields."""
+        lookup: Dict[Tuple[str, Any], int] = {}
+        list_codes: List[int] = []
+        
+        def intern(value: Any) -> int:
+            key = (type(value).__name__, value)
+            code = lookup.get(key)
+            if code is None:
+                code = lookup[key] = len(self.vocab)
+                self.vocab.append(value)
+            return code
+        
+        for row, value in enumerate(raw):
+            value = self.coerce(value)
+            if value is None:
+                continue
+            if isinstance(value, list):
+                self.kind[row] = KIND_LIST
+                self.list_len[row] = len(value)
+                list_codes.extend(intern(item) for item in value)
+            elif isinstance(value, bool):
+                self.kind[row] = KIND_BOOL
+                self.bool[row] = value
+            elif isinstance(value, (int, float)):
+                self.kind[row] = KIND_NUMBER
+                self.num[row] = value
+            elif isinstance(value, datetime.date):
+                self.kind[row] = KIND_DATE
+                self.date[row] = np.datetime64(value, "D")
             else:
-                records.append(gen_func(realistic))
+                self.kind[row] = KIND_STRING
+                self.code[row] = intern(value)
+        self.list_codes = np.array(list_codes, dtype=np.int64)
+    
+    def _index_lists(self) -> None:
+        self.offsets = np.concatenate(([0], np.cumsum(self.list_len)))
+        self.list_rows = np.repeat(np.arange(len(self.kind)), self.list_len)
+    
+    def take(self, index: "np.ndarray") -> "OracleColumn":
+        """Column restricted to ``index`` rows (in that order)."""
+        sub = copy.copy(self)
+        for attr in ("kind", "num", "date", "bool", "code", "list_len"):
+            setattr(sub, attr, getattr(self, attr)[index])
+        starts = self.offsets[:-1][index]
+        total = int(sub.list_len.sum())
+        new_offsets = np.concatenate(([0], np.cumsum(sub.list_len)))
+        positions = (np.arange(total) - np.repeat(new_offsets[:-1], sub.list_len)
+                     + np.repeat(starts, sub.list_len))
+        sub.list_codes = self.list_codes[positions]
+        sub._index_lists()
+        return sub
+    
+    @staticmethod
+    def cell_type(value: Any) -> Optional[str]:
+        """helpers.ts detectCellType, reduced to the types the oracle keeps."""
+        if value is None:
+            return None
+        if isinstance(value, bool):
+            return "boolean"
+        if isinstance(value, (int, float)):
+            return "number"
+        if isinstance(value, datetime.date):
+            return "date"
+        if isinstance(value, str):
+            return "date" if ISO_DATE_VALUE.match(value) else "string"
+        if isinstance(value, list):
+            if value and all(isinstance(v, str) and WIKILINK_VALUE.match(v.strip()) for v in value):
+                return "relation"
+            return "list"
+        return "string"
+    
+    def detect_type(self, raw: List[Any]) -> str:
+        strings = {v for v in raw if type(v) is str}
+        others = [v for v in raw if v is not None and type(v) is not str]
+        types = {t for t in map(self.cell_type, strings)}
+        types |= {t for t in map(self.cell_type, others) if t is not None}
+        if len(types) == 1:
+            return types.pop()
+        if types == {"relation", "list"}:
+            return "list"
+        return "string"
+    
+    def coerce(self, value: Any) -> Any:
+        """helpers.ts parseRecords for this column's detected type."""
+        if value is None:
+            return None
+        if self.type == "date":
+            if isinstance(value, str):
+                return datetime.date.fromisoformat(value[:10])
+            return value
+        if self.type == "relation" and isinstance(value, (str, list)):
+            items = value if isinstance(value, list) else [value]
+            return [strip_wikilink(v) if isinstance(v, str) else js_string(v)
+                    for v in items if v is not None]
+        if self.type == "string":
+            if isinstance(value, datetime.date):
+                return value.isoformat()
+            if isinstance(value, dict):
+                return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+            if isinstance(value, (bool, int, float)):
+                return js_locale_string(value)
+        return value
+    
+    def text(self, row: int) -> Optional[str]:
+        """String(value) for a row; None when the value is missing."""
+        kind = self.kind[row]
+        if kind == KIND_MISSING:
+            return None
+        if kind == KIND_STRING:
+            return self.vocab_str[self.code[row]]
+        if kind == KIND_NUMBER:
+            return js_string(float(self.num[row]))
+        if kind == KIND_BOOL:
+            return js_string(bool(self.bool[row]))
+        if kind == KIND_DATE:
+            return str(self.date[row])
+        codes = self.list_codes[self.offsets[row]:self.offsets[row + 1]]
+        return ",".join(self.vocab_str[c] for c in codes)
+    
+    def factorize(self) -> Tuple[List[Optional[str]], "np.ndarray"]:
+        """(labels, label index per row) over String(value); None labels missing."""
+        if not (self.kind == KIND_STRING).any() or ((self.kind != KIND_STRING) & (self.kind != KIND_MISSING)).any():
+            lookup: Dict[Optional[str], int] = {}
+            codes = np.fromiter(
+                (lookup.setdefault(self.text(i), len(lookup)) for i in range(len(self.kind))),
+                dtype=np.int64, count=len(self.kind),
+            )
+            return list(lookup), codes
+        # Pure string column: vocab entries are already distinct labels;
+        # keep only those that occur in these rows
+        codes = np.where(self.code < 0, len(self.vocab), self.code)
+        used, compact = np.unique(codes, return_inverse=True)
+        labels = list(self.vocab_str) + [None]
+        return [labels[u] for u in used], compact.reshape(-1)
+    
+    def vocab_mask(self, predicate: Callable[[Any], bool]) -> "np.ndarray":
+        """Evaluate ``predicate`` once per distinct string / list item."""
+        return np.fromiter((predicate(v) for v in self.vocab), dtype=bool, count=len(self.vocab))
+    
+    def scalar_hit(self, vocab_hit: "np.ndarray") -> "np.ndarray":
+        """Broadcast a per-vocab result to string rows (False elsewhere)."""
+        return np.append(vocab_hit, False)[self.code]
+    
+    def list_hits(self, vocab_hit: "np.ndarray") -> "np.ndarray":
+        """Number of list items per row whose vocab entry hits."""
+        if not len(self.list_codes):
+            return np.zeros(len(self.kind), dtype=np.int64)
+        weights = vocab_hit[self.list_codes].astype(np.int64)
+        return np.bincount(self.list_rows, weights=weights, minlength=len(self.kind)).astype(np.int64)
+    
+    def empty_string(self) -> "np.ndarray":
+        """Rows holding ``""``."""
+        if not self.vocab:
+            return np.zeros(len(self.kind), dtype=bool)
+        return self.scalar_hit(self.vocab_mask(lambda v: v == ""))
+
+
+class OracleFrame:
+    """Manifest loaded as paths plus lazily built typed columns."""
+    
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.paths = [row["path"] for row in rows]
+        self.fields = [row["fields"] for row in rows]
+        self.columns: Dict[str, OracleColumn] = {}
+        self._stems: Optional[Dict[str, int]] = None
+    
+    @property
+    def stems(self) -> Dict[str, int]:
+        """Basename → first row, for resolving relation links."""
+        if self._stems is None:
+            self._stems = {}
+            for i, path in enumerate(self.paths):
+                self._stems.setdefault(path.rsplit("/", 1)[-1][:-3], i)
+        return self._stems
+    
+    def __len__(self) -> int:
+        return len(self.paths)
+    
+    def column(self, name: str) -> OracleColumn:
+        col = self.columns.get(name)
+        if col is None:
+            col = self.columns[name] = OracleColumn(name, [f.get(name) for f in self.fields])
+        return col
+    
+    @classmethod
+    def load(cls, path: Path) -> "OracleFrame":
+        if path.suffix == ".parquet":
+            if pyarrow is None:
+                raise SystemExit("Reading a parquet manifest requires pyarrow")
+            table = pyarrow.parquet.read_table(str(path), columns=["path", "fields"])
+            return cls([
+                {"path": p, "fields": json.loads(f)}
+                for p, f in zip(table.column("path").to_pylist(), table.column("fields").to_pylist())
+            ])
+        with open(path, encoding="utf-8") as f:
+            return cls([json.loads(line) for line in f if line.strip()])
+
+
+def manifest_run_date(path: Path) -> datetime.date:
+    """The pinned "today" of the run that wrote a manifest.
+
+    Read from the ``<vault>.manifest.json`` index next to it, so relative
+    date operators see the same day the vault was generated for. Falls back
+    to the wall clock, with a warning, when there is no index.
+    """
+    index = path.with_suffix(".json")
+    try:
+        return datetime.date.fromisoformat(json.loads(index.read_text(encoding="utf-8"))["options"]["today"])
+    except (OSError, ValueError, KeyError, TypeError):
+        print(f"⚠️  No generation date in {index}; relative dates use the wall clock (pass --today)",
+              file=sys.stderr)
+        return datetime.date.today()
+
+
+def parse_json_list(value: Any) -> Optional[List[Any]]:
+    """Condition values for list operators: JSON text (legacy) or a list (IR)."""
+    if isinstance(value, list):
+        return value
+    if not value:
+        return None
+    try:
+        parsed = json.loads(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if isinstance(parsed, list) else None
+
+
+def condition_mask(frame: OracleFrame, cond: Dict[str, Any], today: datetime.date) -> "np.ndarray":
+    """Vectorized matchesCondition() for one FilterCondition."""
+    op = cond.get("op") or cond.get("operator")
+    value = cond.get("value")
+    col = frame.column(cond["field"])
+    kind = col.kind
+    missing = kind == KIND_MISSING
+    lists = kind == KIND_LIST
+    out = np.zeros(len(frame), dtype=bool)
+    
+    if op in ("is-empty", "is-not-empty"):
+        empty = missing | (lists & (col.list_len == 0)) | col.empty_string()
+        return empty if op == "is-empty" else ~empty
+    
+    if op in LIST_OPS:
+        listish = missing | lists
+        if op == "has-keyword":
+            needle = js_string(value).lower() if value else None
+            hit = col.vocab_mask(lambda v: needle is not None and needle in js_string(v).lower())
+            out[listish] = (col.list_hits(hit) > 0)[listish]
+            return out
+        wanted = parse_json_list(value)
+        if wanted is None:
+            out[listish] = op == "has-none-of"
+            return out
+        # Array.includes() is strict equality, so compare (type, value) keys
+        wanted_keys = {(type(w).__name__, w) for w in wanted}
+        vocab_keys = [(type(v).__name__, v) for v in col.vocab]
+        if op == "has-all-of":
+            present = np.zeros(len(frame), dtype=np.int64)
+            for key in wanted_keys:
+                present += col.list_hits(np.array([k == key for k in vocab_keys], dtype=bool)) > 0
+            result = present == len(wanted_keys)
+        else:
+            result = col.list_hits(np.array([k in wanted_keys for k in vocab_keys], dtype=bool)) > 0
+            if op == "has-none-of":
+                result = ~result
+        out[listish] = result[listish]
+        return out
+    
+    if op == "is-any-of":
+        candidates = parse_json_list(value) or []
+        if not candidates:
+            return out
+        wanted = set(map(str, candidates))
+        hit = np.array([s in wanted for s in col.vocab_str], dtype=bool)
+        out |= col.scalar_hit(hit) | (lists & (col.list_hits(hit) > 0))
+        out[missing] = "" in wanted
+        for row in np.flatnonzero((kind == KIND_NUMBER) | (kind == KIND_BOOL)):
+            out[row] = col.text(row) in wanted
+        # The plugin compares String(date), i.e. Date.prototype.toString() in
+        # the local time zone, which no ISO candidate ever equals
+        out[kind == KIND_DATE] = False
+        return out
+    
+    if op in STRING_OPS:
+        right = "" if value is None else js_string(value)
+        low = right.lower()
+        pattern = safe_regex(right) if op == "regex" and right else None
+        predicates: Dict[str, Callable[[str], bool]] = {
+            "is": lambda s: s == right,
+            "is-not": lambda s: s != right,
+            "contains": lambda s: low in s.lower(),
+            "not-contains": lambda s: low not in s.lower(),
+            "starts-with": lambda s: s.lower().startswith(low),
+            "ends-with": lambda s: s.lower().endswith(low),
+            "regex": lambda s: bool(pattern and pattern.search(s[:10000])),
+        }
+        pred = predicates[op]
+        negative = op in NEGATIVE_OPS
+        # "" is falsy in JS: affirmative ops fail on it, negative ops pass
+        hit = np.array([pred(s) if s else negative for s in col.vocab_str], dtype=bool)
+        hits = col.list_hits(hit)
+        if negative:
+            out[lists] = (hits == col.list_len)[lists]
+        else:
+            out[lists] = (hits > 0)[lists]
+        strings = kind == KIND_STRING
+        out[strings] = col.scalar_hit(hit)[strings]
+        out[missing] = negative
+        return out
+    
+    if op in NUMBER_OPS:
+        # `cond.value ? Number(cond.value) : undefined`
+        right = float(value) if value else None
+        numbers = kind == KIND_NUMBER
+        if right is None:
+            out[missing] = op == "eq"
+            out[numbers] = op == "neq"
+            return out
+        nums = col.num
+        compare = {
+            "eq": nums == right, "neq": nums != right, "lt": nums < right,
+            "gt": nums > right, "lte": nums <= right, "gte": nums >= right,
+        }[op]
+        out[numbers] = compare[numbers]
+        out[missing] = op == "neq"
+        return out
+    
+    if op in BOOLEAN_OPS:
+        booleans = kind == KIND_BOOL
+        out[booleans] = col.bool[booleans] if op == "is-checked" else ~col.bool[booleans]
+        return out
+    
+    if op in DATE_OPS:
+        dates = kind == KIND_DATE
+        out[missing] = op == "is-not-on"
+        if dates.any():
+            days, inverse = np.unique(col.date[dates], return_inverse=True)
+            hit = np.array([date_predicate(op, d.astype(datetime.date), value, today) for d in days], dtype=bool)
+            out[dates] = hit[inverse]
+        return out
+    
+    raise SystemExit(f"Unsupported filter operator: {op}")
+
+
+def safe_regex(pattern: str) -> Optional["re.Pattern[str]"]:
+    """safeRegexTest() guards: None where the kernel refuses the pattern."""
+    if len(pattern) > 200 or re.search(r"\(\?[<!=]", pattern):
+        return None
+    if re.search(r"(\+|\*|\{[^}]*\})\s*(\+|\*|\{)", pattern):
+        return None
+    if re.search(r"\([^)]*(\+|\*|\{[^}]*\})\)\s*(\+|\*|\{)", pattern):
+        return None
+    try:
+        return re.compile(pattern, re.IGNORECASE)
+    except re.error:
+        return None
+
+
+def date_predicate(op: str, day: datetime.date, value: Any, today: datetime.date) -> bool:
+    """dateFns from filterEvaluator.ts at day granularity."""
+    one = datetime.timedelta(days=1)
+    if op in ("is-on", "is-not-on", "is-before", "is-after", "is-on-and-before", "is-on-and-after"):
+        if not value:
+            return op == "is-not-on"
+        rv = datetime.date.fromisoformat(str(value)[:10])
+        return {
+            "is-on": day == rv,
+            "is-not-on": day != rv,
+            "is-before": day < rv,
+            "is-after": day > rv,
+            "is-on-and-before": day <= rv,
+            "is-on-and-after": day >= rv,
+        }[op]
+    if op in ("is-last-n-days", "is-next-n-days"):
+        try:
+            n = int(str(value))
+        except (TypeError, ValueError):
+            n = 0
+        if n <= 0:
+            return False
+        if op == "is-last-n-days":
+            return today - n * one < day <= today
+        return today <= day < today + n * one
+    return {
+        "is-today": day == today,
+        "is-this-week": day.isocalendar()[1] == today.isocalendar()[1] and day.year == today.year,
+        "is-this-month": (day.year, day.month) == (today.year, today.month),
+        "is-this-quarter": (day.month - 1) // 3 == (today.month - 1) // 3 and day.year == today.year,
+        "is-this-year": day.year == today.year,
+        "is-past-week": today - 7 * one < day <= today,
+        "is-past-month": add_months(today, -1) - one < day <= today,
+        "is-past-year": add_months(today, -12) - one < day <= today,
+        "is-next-week": today <= day < today + 8 * one,
+        "is-next-month": today <= day < add_months(today, 1) + one,
+        "is-next-year": today <= day < add_months(today, 12) + one,
+        "is-overdue": day < today,
+        "is-upcoming": day >= today,
+    }[op]
+
+
+def filter_mask(frame: OracleFrame, ir: Dict[str, Any], today: datetime.date, depth: int = 0) -> "np.ndarray":
+    """matchesFilterConditions() over the whole frame."""
+    if depth >= 20:
+        return np.ones(len(frame), dtype=bool)
+    masks = [condition_mask(frame, cond, today)
+             for cond in ir.get("conditions", []) if cond.get("enabled", True)]
+    masks += [filter_mask(frame, group, today, depth + 1) for group in ir.get("groups", [])]
+    if not masks:
+        return np.ones(len(frame), dtype=bool)
+    reduce = np.logical_or if ir.get("conjunction") == "or" else np.logical_and
+    return reduce.reduce(masks)
+
+
+def natural_key(text: str) -> Tuple[Any, ...]:
+    """Approximates ``localeCompare(b, undefined, { numeric: true })``."""
+    return tuple(
+        (0, int(part), "") if part.isdigit() else (1, 0, part)
+        for part in re.findall(r"\d+|\D+", text)
+    )
+
+
+def sort_order(frame: OracleFrame, rows: "np.ndarray", keys: List[Dict[str, Any]]) -> "np.ndarray":
+    """viewSort.ts ordering of ``rows`` (stable; nulls last in both directions)."""
+    lex_keys = []
+    for key in reversed(keys):  # np.lexsort treats the last key as primary
+        col = frame.column(key["field"]).take(rows)
+        desc = key.get("direction", key.get("order", "asc")) == "desc"
+        if col.type == "number":
+            rank = col.num
+        elif col.type == "date":
+            rank = col.date.astype("int64").astype(float)
+        elif col.type == "boolean":
+            rank = col.bool.astype(float)
+        else:
+            labels, codes = col.factorize()
+            lowered = [(label or "").lower() for label in labels]
+            ordered = {t: r for r, t in enumerate(sorted(set(lowered), key=natural_key))}
+            rank = np.array([ordered[t] for t in lowered], dtype=float)[codes] if labels else np.zeros(0)
+        rank = np.nan_to_num(-rank if desc else rank, nan=0.0)
+        lex_keys += [rank, col.kind == KIND_MISSING]
+    return rows[np.lexsort(lex_keys)] if lex_keys else rows
+
+
+def js_number(value: float) -> Any:
+    return int(value) if float(value).is_integer() else float(value)
+
+
+def parse_float(text: str) -> float:
+    """JavaScript parseFloat(): longest numeric prefix, NaN when none."""
+    match = re.match(r"^\s*[-+]?(Infinity|\d+\.?\d*(?:[eE][-+]?\d+)?|\.\d+(?:[eE][-+]?\d+)?)", text)
+    return float(match.group(0)) if match else math.nan
+
+
+def numeric_reduce(values: "np.ndarray", groups: "np.ndarray", n_groups: int, fn: str) -> List[Optional[float]]:
+    """Grouped sum/avg/min/max/median/range ignoring NaN; None for empty groups."""
+    ok = ~np.isnan(values)
+    g, v = groups[ok], values[ok]
+    count = np.bincount(g, minlength=n_groups)
+    if fn == "sum":
+        return np.bincount(g, weights=v, minlength=n_groups).tolist()
+    if fn == "avg":
+        total = np.bincount(g, weights=v, minlength=n_groups)
+        return [t / c if c else None for t, c in zip(total, count)]
+    order = np.lexsort((v, g))
+    g, v = g[order], v[order]
+    starts = np.searchsorted(g, np.arange(n_groups), side="left")
+    out: List[Optional[float]] = []
+    for grp in range(n_groups):
+        c, lo = int(count[grp]), int(starts[grp])
+        if not c:
+            out.append(None)
+        elif fn == "min":
+            out.append(float(v[lo]))
+        elif fn == "max":
+            out.append(float(v[lo + c - 1]))
+        elif fn == "range":
+            out.append(float(v[lo + c - 1] - v[lo]))
+        else:  # median
+            mid = lo + c // 2
+            out.append(float((v[mid - 1] + v[mid]) / 2 if c % 2 == 0 else v[mid]))
+    return out
+
+
+def aggregate_groups(col: OracleColumn, groups: "np.ndarray", n_groups: int, fn: str) -> List[Any]:
+    """engine/aggregate.ts for every group at once (``groups`` = group id per row)."""
+    fn = AGGREGATE_ALIASES.get(fn, fn)
+    kind = col.kind
+    size = np.bincount(groups, minlength=n_groups)
+    present_rows = kind != KIND_MISSING
+    present = np.bincount(groups, weights=present_rows, minlength=n_groups)
+    filled_rows = present_rows & ~((kind == KIND_BOOL) & ~col.bool) & ~col.empty_string()
+    filled = np.bincount(groups, weights=filled_rows, minlength=n_groups)
+    
+    def percent(numer: "np.ndarray", denom: "np.ndarray") -> List[str]:
+        return [f"{int(math.floor(a / b * 100 + 0.5)) if b else 0}%" for a, b in zip(numer, denom)]
+    
+    if fn == "count":
+        return present.astype(int).tolist()
+    if fn == "count_total":
+        return size.tolist()
+    if fn == "count_values":
+        return filled.astype(int).tolist()
+    if fn == "count_empty":
+        return (size - filled).astype(int).tolist()
+    if fn == "percent_empty":
+        return percent(size - filled, size)
+    if fn == "percent_not_empty":
+        return percent(filled, size)
+    if fn == "percent_true":
+        true_rows = ((kind == KIND_BOOL) & col.bool) | col.scalar_hit(col.vocab_mask(lambda v: v == "true"))
+        return percent(np.bincount(groups, weights=true_rows, minlength=n_groups), present)
+    if fn == "count_unique":
+        _, codes = col.factorize()
+        pairs = np.unique(np.stack([groups[present_rows], codes[present_rows]]), axis=1)
+        return np.bincount(pairs[0], minlength=n_groups).tolist()
+    if fn in ("earliest", "latest"):
+        days = col.date.astype("int64").astype(float)
+        days[kind != KIND_DATE] = np.nan
+        values = numeric_reduce(days, groups, n_groups, "min" if fn == "earliest" else "max")
+        return [None if v is None else str(np.datetime64(int(v), "D")) for v in values]
+    if fn in ("sum", "avg", "min", "max", "median", "range"):
+        # toNumbers(): numbers plus strings that parseFloat() accepts
+        nums = col.num.copy()
+        strings = kind == KIND_STRING
+        if strings.any():
+            parsed = np.array([parse_float(v) if isinstance(v, str) else math.nan for v in col.vocab])
+            nums[strings] = parsed[col.code[strings]]
+        values = numeric_reduce(nums, groups, n_groups, fn)
+        return [0 if v is None else js_number(v) for v in values]
+    raise SystemExit(f"Unsupported aggregate function for the oracle: {fn}")
+
+
+def rollup_values(frame: OracleFrame, rows: "np.ndarray", rollup: Dict[str, Any]) -> Dict[str, Any]:
+    """RollupIR per source row: aggregate targetField over linked records.
+
+    Links are resolved once per distinct value of the relation column, then
+    the (source, target) edge list is aggregated like a grouped column.
+    """
+    fn = rollup.get("fn") or rollup.get("function")
+    relation = frame.column(rollup["relationField"]).take(rows)
+    stems = frame.stems
+    target_of = np.array(
+        [stems.get(strip_wikilink(v).rsplit("/", 1)[-1], -1) if isinstance(v, str) else -1
+         for v in relation.vocab] + [-1],
+        dtype=np.int64,
+    )
+    list_targets = target_of[relation.list_codes]
+    single_targets = target_of[relation.code]
+    sources = np.concatenate([relation.list_rows, np.arange(len(rows))])
+    targets = np.concatenate([list_targets, single_targets])
+    linked = targets >= 0
+    edges = frame.column(rollup["targetField"]).take(targets[linked])
+    values = aggregate_groups(edges, sources[linked], len(rows), fn)
+    return {frame.paths[row]: value for row, value in zip(rows, values)}
+
+
+def checked_rollup(rollup: Any) -> Dict[str, Any]:
+    """A RollupIR from a view spec, or SystemExit naming what is missing."""
+    if not isinstance(rollup, dict):
+        raise SystemExit(f"Invalid rollup {json.dumps(rollup)}: expected a RollupIR object")
+    missing = [key for key in ("relationField", "targetField") if not isinstance(rollup.get(key), str)]
+    if not isinstance(rollup.get("fn") or rollup.get("function"), str):
+        missing.append("fn")
+    if missing:
+        raise SystemExit(f"Invalid rollup {json.dumps(rollup)}: missing {', '.join(missing)}")
+    return rollup
+
+
+def oracle_steps(spec: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], List[Tuple[str, Dict[str, Any]]]]:
+    """Column aggregates and named rollups of a view spec.
+
+    ``aggregates`` entries are either column summaries ``{field, fn}`` or
+    contracts.ts AggregateIR ``{outputField, rollup}``; the latter is a
+    rollup reported under its outputField. ``rollups`` holds bare RollupIRs,
+    named ``relationField.targetField:fn``.
+    """
+    aggregates: List[Dict[str, Any]] = []
+    rollups: List[Tuple[str, Dict[str, Any]]] = []
+    for agg in spec.get("aggregates") or []:
+        if isinstance(agg, dict) and isinstance(agg.get("outputField"), str) and "rollup" in agg:
+            rollups.append((agg["outputField"], checked_rollup(agg["rollup"])))
+        elif isinstance(agg, dict) and isinstance(agg.get("field"), str) and isinstance(agg.get("fn"), str):
+            aggregates.append(agg)
+        else:
+            raise SystemExit(f"Invalid aggregate {json.dumps(agg)}: expected {{field, fn}} "
+                             f"or an AggregateIR {{outputField, rollup}}")
+    for rollup in spec.get("rollups") or []:
+        rollup = checked_rollup(rollup)
+        fn = rollup.get("fn") or rollup.get("function")
+        rollups.append((f"{rollup['relationField']}.{rollup['targetField']}:{fn}", rollup))
+    group = spec.get("group")
+    if group and not (isinstance(group, dict) and isinstance(group.get("field"), str)):
+        raise SystemExit(f"Invalid group {json.dumps(group)}: expected a GroupIR {{field, direction?}}")
+    return aggregates, rollups
+
+
+def run_oracle(frame: OracleFrame, spec: Dict[str, Any], today: datetime.date) -> Dict[str, Any]:
+    """Evaluate a view spec; returns ids, groups, aggregates and rollups."""
+    aggregates, rollups = oracle_steps(spec)
+    timings: Dict[str, float] = {}
+    
+    started = time.perf_counter()
+    rows = np.flatnonzero(filter_mask(frame, spec.get("filter") or {}, today))
+    timings["filter"] = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    rows = sort_order(frame, rows, (spec.get("sort") or {}).get("keys", []))
+    timings["sort"] = time.perf_counter() - started
+    
+    result: Dict[str, Any] = {"count": int(len(rows)), "ids": [frame.paths[r] for r in rows]}
+    
+    started = time.perf_counter()
+    group = spec.get("group")
+    if group:
+        labels, codes = frame.column(group["field"]).take(rows).factorize()
+        labels = ["__empty__" if label is None else label for label in labels]
+        names = sorted(set(labels), reverse=group.get("direction") == "desc")
+        position = {name: g for g, name in enumerate(names)}
+        group_of = np.array([position[label] for label in labels], dtype=np.int64)[codes]
+        order = np.argsort(group_of, kind="stable")
+        bounds = np.searchsorted(group_of[order], np.arange(len(names) + 1))
+        buckets: Dict[str, Any] = {}
+        for g, name in enumerate(names):
+            members = rows[order[bounds[g]:bounds[g + 1]]]
+            buckets[name] = {"count": int(len(members)), "ids": [frame.paths[r] for r in members]}
+        for agg in aggregates:
+            values = aggregate_groups(frame.column(agg["field"]).take(rows), group_of, len(names), agg["fn"])
+            for name, value in zip(names, values):
+                buckets[name].setdefault("aggregates", {})[f"{agg['field']}:{agg['fn']}"] = value
+        result["groups"] = buckets
+    timings["group"] = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    if aggregates:
+        whole = np.zeros(len(rows), dtype=np.int64)
+        result["aggregates"] = {
+            f"{agg['field']}:{agg['fn']}":
+                aggregate_groups(frame.column(agg["field"]).take(rows), whole, 1, agg["fn"])[0]
+            for agg in aggregates
+        }
+    for name, rollup in rollups:
+        result.setdefault("rollups", {})[name] = rollup_values(frame, rows, rollup)
+    timings["aggregate"] = time.perf_counter() - started
+    
+    result["timings"] = {k: round(v, 4) for k, v in timings.items()}
+    return result
+
+
+def oracle_main(argv: Optional[List[str]] = None) -> int:
+    """Compute expected view results for a generated vault's manifest."""
+    oparser = argparse.ArgumentParser(
+        prog="generate-test-files oracle",
+        description="Evaluate a FilterIR/SortIR/GroupIR/RollupIR view spec over a manifest.",
+    )
+    oparser.add_argument("manifest", help="Manifest written by a generation run (.ndjson or .parquet)")
+    oparser.add_argument("spec", help="View spec JSON: {filter, sort, group, aggregates, rollups}; "
+                                      "aggregates are {field, fn} or AggregateIR {outputField, rollup}")
+    oparser.add_argument("-o", "--output", help="Write the expected results here (default: stdout)")
+    oparser.add_argument("--today", type=datetime.date.fromisoformat,
+                         help="Base date for relative date operators "
+                              "(default: the generation date in <vault>.manifest.json)")
+    opts = oparser.parse_args(argv)
+    if np is None:
+        raise SystemExit("The oracle requires numpy (pip install numpy)")
+    
+    started = time.perf_counter()
+    frame = OracleFrame.load(Path(opts.manifest))
+    loaded = time.perf_counter() - started
+    with open(opts.spec, encoding="utf-8") as f:
+        spec = json.load(f)
+    if not isinstance(spec, dict):
+        raise SystemExit(f"{opts.spec}: expected a view spec object")
     
-    return records
+    result = run_oracle(frame, spec, opts.today or manifest_run_date(Path(opts.manifest)))
+    result["timings"]["load"] = round(loaded, 4)
+    
+    text = json.dumps(result, ensure_ascii=False, default=str)
+    if opts.output:
+        with open(opts.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        print(f"🔮 {result['count']} of {len(frame)} records match · {opts.output} "
+              f"(load {loaded:.2f}s)", file=sys.stderr)
+    else:
+        print(text)
+    return 0
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
-# MAIN EXECUTION
+# FILTER CORPUS
 # ═══════════════════════════════════════════════════════════════════════════════
+#
+# Pairs a generated vault with FilterCondition specs for every operator of
+# engine/filterEvaluator.ts, for the operator benchmark in
+# src/__tests__/performance/filterOperators.test.ts. For each selectivity
+# target the (field, value) candidate whose oracle match rate is closest in
+# log space wins. Operators that take no value (is-today, is-checked, ...)
+# can only pick the field, so their selectivity is whatever the vault has.
+# Expected matches are stored as the smaller side: the matching paths
+# ("include") or the non-matching ones ("exclude").
 
-def main():
-    """Main entry point."""
-    output_path = Path(args.output)
+FILTER_OPERATORS = [
+    "is-empty", "is-not-empty",
+    "is", "is-any-of", "is-not", "contains", "not-contains", "starts-with", "ends-with", "regex",
+    "eq", "neq", "lt", "gt", "lte", "gte",
+    "is-checked", "is-not-checked",
+    "is-on", "is-not-on", "is-before", "is-after", "is-on-and-before", "is-on-and-after",
+    "is-today", "is-this-week", "is-this-month", "is-this-quarter", "is-this-year",
+    "is-past-week", "is-past-month", "is-past-year", "is-next-week", "is-next-month",
+    "is-next-year", "is-last-n-days", "is-next-n-days", "is-overdue", "is-upcoming",
+    "has-any-of", "has-all-of", "has-none-of", "has-keyword",
+]
+DEFAULT_SELECTIVITY = [0.001, 0.1, 0.9]
+VALUELESS_OPS = {"is-empty", "is-not-empty"} | BOOLEAN_OPS | (
+    DATE_OPS - {"is-on", "is-not-on", "is-before", "is-after", "is-on-and-before",
+                "is-on-and-after", "is-last-n-days", "is-next-n-days"}
+)
+QUANTILES = [0.0005, 0.001, 0.003, 0.01, 0.03, 0.1, 0.2, 0.35, 0.5, 0.65, 0.8, 0.9, 0.95, 0.99, 0.999]
+DAY_COUNTS = [1, 2, 3, 7, 14, 30, 60, 90, 180, 365, 730, 3650]
+
+
+def spread(items: List[Any], k: int) -> List[Any]:
+    """Up to ``k`` items at log-spaced ranks (keeps both head and tail)."""
+    if len(items) <= k:
+        return list(items)
+    ranks = np.unique(np.geomspace(1, len(items), k).astype(np.int64) - 1)
+    return [items[r] for r in ranks]
+
+
+def ranked_vocab(col: OracleColumn) -> List[Any]:
+    """Distinct strings and list items, most frequent first."""
+    if not col.vocab:
+        return []
+    counts = np.bincount(col.code[col.code >= 0], minlength=len(col.vocab))
+    counts += np.bincount(col.list_codes, minlength=len(col.vocab)) if len(col.list_codes) else 0
+    order = np.argsort(-counts, kind="stable")
+    return [col.vocab[i] for i in order if counts[i] > 0]
+
+
+def fragments(words: List[str], suffix: bool = False, middle: bool = True) -> List[str]:
+    """Prefixes (or suffixes) and infixes of a few lengths, deduplicated."""
+    out: Dict[str, None] = {}
+    for word in words:
+        for length in (1, 2, 3, 5, 8):
+            if length > len(word):
+                break
+            out[word[-length:] if suffix else word[:length]] = None
+            if middle:
+                mid = len(word) // 2
+                out[word[mid:mid + length]] = None
+    return [f for f in out if f.strip()]
+
+
+def operator_fields(frame: OracleFrame, fields: List[str], op: str, limit: int) -> List[str]:
+    """Fields an operator applies to, the most populated first."""
+    if op in ("is-empty", "is-not-empty"):
+        wanted = {KIND_STRING, KIND_NUMBER, KIND_BOOL, KIND_DATE, KIND_LIST}
+    elif op in STRING_OPS:
+        wanted = {KIND_STRING, KIND_LIST}
+    elif op in NUMBER_OPS:
+        wanted = {KIND_NUMBER}
+    elif op in BOOLEAN_OPS:
+        wanted = {KIND_BOOL}
+    elif op in DATE_OPS:
+        wanted = {KIND_DATE}
+    else:
+        wanted = {KIND_LIST}
+    populated = []
+    for name in fields:
+        kinds = frame.column(name).kind
+        # is-any-of on dates depends on the time zone (see condition_mask)
+        if op == "is-any-of" and (kinds == KIND_DATE).any():
+            continue
+        rows = int(np.isin(kinds, list(wanted)).sum())
+        if rows:
+            populated.append((-rows, name))
+    return [name for _, name in sorted(populated)[:limit]]
+
+
+def operator_values(col: OracleColumn, op: str, k: int) -> List[Optional[str]]:
+    """Candidate ``cond.value`` strings for one operator on one column."""
+    if op in VALUELESS_OPS:
+        return [None]
+    if op in ("is-last-n-days", "is-next-n-days"):
+        return [str(n) for n in DAY_COUNTS]
     
-    # Create output directory
-    output_path.mkdir(parents=True, exist_ok=True)
+    if op in NUMBER_OPS:
+        nums = col.num[col.kind == KIND_NUMBER]
+        if op in ("eq", "neq"):
+            distinct, counts = np.unique(nums, return_counts=True)
+            picks = spread(list(distinct[np.argsort(-counts, kind="stable")]), k)
+        else:
+            picks = list(np.quantile(nums, QUANTILES, method="nearest"))
+        return list(dict.fromkeys(js_string(float(v)) for v in picks))
     
-    # Clear if requested
-    if args.clear:
-        for file in output_path.glob("*.md"):
-            file.unlink()
-        if args.verbose:
-            print(f"🗑️  Cleared {output_path}")
+    if op in DATE_OPS:
+        days = col.date[col.kind == KIND_DATE]
+        if op in ("is-on", "is-not-on"):
+            distinct, counts = np.unique(days, return_counts=True)
+            picks = spread(list(distinct[np.argsort(-counts, kind="stable")]), k)
+        else:
+            as_int = days.astype(np.int64)
+            picks = [np.datetime64(int(d), "D") for d in np.quantile(as_int, QUANTILES, method="nearest")]
+        return list(dict.fromkeys(str(d) for d in picks))
+    
+    ranked = ranked_vocab(col)
+    words = [js_string(v) for v in spread(ranked, k)]
+    if op in ("is", "is-not"):
+        return words
+    if op in ("is-any-of", "has-any-of", "has-none-of"):
+        items = ranked if op == "is-any-of" else [v for v in ranked if isinstance(v, (str, int, float))]
+        if op == "is-any-of":
+            items = [js_string(v) for v in items]
+        sizes = sorted({int(n) for n in np.geomspace(1, max(len(items), 1), k)})
+        sets = [items[:n] for n in sizes] + [items[-n:] for n in sizes if n < len(items)]
+        return list(dict.fromkeys(json.dumps(c, ensure_ascii=False) for c in sets if c))
+    if op == "has-all-of":
+        items = [v for v in ranked if isinstance(v, (str, int, float))]
+        singles = [[v] for v in spread(items, k)]
+        pairs = [[a, b] for a, b in zip(items[:k], items[1:k + 1])]
+        return [json.dumps(c, ensure_ascii=False) for c in singles + pairs]
+    if op == "starts-with":
+        return fragments(words, middle=False)
+    if op == "ends-with":
+        return fragments(words, suffix=True, middle=False)
+    if op == "regex":
+        parts = [f for f in fragments(words) if f.isalnum()]
+        patterns = [f"^{f}" for f in parts] + [f"{f}$" for f in parts]
+        patterns += [f"{a}|{b}" for a, b in zip(parts, parts[1:])]
+        return patterns
+    return fragments(words)  # contains, not-contains, has-keyword
+
+
+def expected_matches(frame: OracleFrame, mask: "np.ndarray") -> Dict[str, List[str]]:
+    """The smaller of the matching and non-matching path sets."""
+    hits = int(mask.sum())
+    if hits <= len(frame) - hits:
+        return {"include": [frame.paths[i] for i in np.flatnonzero(mask)]}
+    return {"exclude": [frame.paths[i] for i in np.flatnonzero(~mask)]}
+
+
+def corpus_case(frame: OracleFrame, cond: Dict[str, Any], mask: "np.ndarray", target: Optional[float],
+                case_id: str, note: Optional[str] = None) -> Dict[str, Any]:
+    case = {
+        "id": case_id,
+        "condition": cond,
+        "target": target,
+        "selectivity": round(float(mask.mean()), 6) if len(frame) else 0.0,
+        "matches": int(mask.sum()),
+        "expected": expected_matches(frame, mask),
+    }
+    if note:
+        case["note"] = note
+    return case
+
+
+def adversarial_conditions(frame: OracleFrame, fields: List[str]) -> List[Tuple[str, Dict[str, Any]]]:
+    """Edge cases the selectivity search would never pick."""
+    # The string field with the most distinct values (titles, usually)
+    strings = sorted(operator_fields(frame, fields, "contains", len(fields)),
+                     key=lambda name: -len(frame.column(name).vocab))
+    lists = operator_fields(frame, fields, "has-any-of", 1)
+    numbers = operator_fields(frame, fields, "eq", 1)
+    cases: List[Tuple[str, Dict[str, Any]]] = [
+        ("missing field, negative operator", {"field": "noSuchField", "operator": "is-not", "value": "x"}),
+        ("missing field, neq", {"field": "noSuchField", "operator": "neq", "value": "1"}),
+    ]
+    if strings:
+        field = strings[0]
+        words = [js_string(v) for v in ranked_vocab(frame.column(field))]
+        tokens = dict.fromkeys(
+            token for name in strings for v in frame.column(name).vocab[:1000]
+            for token in js_string(v).split() if token.isalnum()
+        )
+        alternation = ""
+        for word in tokens:
+            if len(alternation) + len(word) + 1 > 200:
+                break
+            alternation = f"{alternation}|{word}" if alternation else word
+        unicode_field, unicode_word = field, "Ёж"
+        for name in strings:
+            word = next((js_string(v) for v in frame.column(name).vocab if not js_string(v).isascii()), None)
+            if word:
+                unicode_field, unicode_word = name, word
+                break
+        cases += [
+            ("empty needle", {"field": field, "operator": "contains", "value": ""}),
+            ("regex rejected by the ReDoS guard", {"field": field, "operator": "regex", "value": "(a+)+$"}),
+            ("alternation close to the 200 character limit", {"field": unicode_field, "operator": "regex",
+                                                              "value": alternation or "x"}),
+            ("case-folded non-ASCII needle", {"field": unicode_field, "operator": "contains",
+                                             "value": unicode_word[:4].upper()}),
+            ("is-any-of with 5000 candidates", {"field": field, "operator": "is-any-of",
+                                                "value": json.dumps(words[:2500] + [f"absent {i}" for i in range(2500)],
+                                                                    ensure_ascii=False)}),
+        ]
+    if lists:
+        field = lists[0]
+        items = [v for v in ranked_vocab(frame.column(field)) if isinstance(v, str)]
+        cases += [
+            ("has-all-of with 50 items", {"field": field, "operator": "has-all-of",
+                                          "value": json.dumps(items[:50], ensure_ascii=False)}),
+            ("has-none-of with malformed JSON", {"field": field, "operator": "has-none-of", "value": "[not json"}),
+        ]
+    if numbers:
+        cases.append(("number operator without a value", {"field": numbers[0], "operator": "gt", "value": ""}))
+    for _, cond in cases:
+        cond["enabled"] = True
+    return cases
+
+
+def build_filter_corpus(frame: OracleFrame, targets: List[float], today: datetime.date,
+                        max_fields: int, candidates: int, verbose: bool = False) -> Dict[str, Any]:
+    """Selectivity-targeted cases for every operator, plus adversarial ones."""
+    fields = sorted({name for f in frame.fields for name in f})
+    eps = 0.5 / max(len(frame), 1)
+    cases: List[Dict[str, Any]] = []
+    skipped: List[str] = []
+    for op in FILTER_OPERATORS:
+        started = time.perf_counter()
+        best: List[Optional[Tuple[float, Dict[str, Any], "np.ndarray"]]] = [None] * len(targets)
+        for field in operator_fields(frame, fields, op, max_fields):
+            for value in operator_values(frame.column(field), op, candidates):
+                cond = {"field": field, "operator": op, "enabled": True}
+                if value is not None:
+                    cond["value"] = value
+                mask = condition_mask(frame, cond, today)
+                rate = mask.mean() if len(frame) else 0.0
+                for i, target in enumerate(targets):
+                    score = abs(math.log((rate + eps) / target))
+                    if best[i] is None or score < best[i][0]:
+                        best[i] = (score, cond, mask)
+        if best[0] is None:
+            skipped.append(op)
+            continue
+        for target, (_, cond, mask) in zip(targets, best):
+            cases.append(corpus_case(frame, cond, mask, target, f"{op}@{target * 100:g}%"))
+        if verbose:
+            print(f"   {op:<18} {time.perf_counter() - started:6.2f}s", file=sys.stderr)
     
-    # Generate records
-    records = generate_records(args.numfiles, args.type)
+    for i, (note, cond) in enumerate(adversarial_conditions(frame, fields)):
+        mask = condition_mask(frame, cond, today)
+        cases.append(corpus_case(frame, cond, mask, None, f"{cond['operator']}#adversarial-{i}", note))
     
-    # Statistics
-    stats = {
-        "task": 0,
-        "event": 0,
-        "meeting": 0,
-        "project": 0,
+    return {
+        "records": len(frame),
+        "today": today.isoformat(),
+        "targets": targets,
+        "skipped": skipped,
+        "cases": cases,
     }
+
+
+def filter_corpus_main(argv: Optional[List[str]] = None) -> int:
+    """Emit selectivity-targeted filter specs with expected match sets."""
+    cparser = argparse.ArgumentParser(
+        prog="generate-test-files filter-corpus",
+        description="Build a FilterCondition corpus (every operator × selectivity target) "
+                    "with expected match sets for a generated vault's manifest.",
+    )
+    cparser.add_argument("manifest", help="Manifest written by a generation run (.ndjson or .parquet)")
+    cparser.add_argument("-o", "--output", help="Corpus JSON path (default: <manifest stem>.filters.json)")
+    cparser.add_argument("--selectivity", type=float, nargs="+", default=DEFAULT_SELECTIVITY,
+                         help="Target match rates per operator (default: 0.001 0.1 0.9)")
+    cparser.add_argument("--today", type=datetime.date.fromisoformat,
+                         help="Base date for relative date operators "
+                              "(default: the generation date in <vault>.manifest.json)")
+    cparser.add_argument("--max-fields", type=int, default=8,
+                         help="Most populated fields tried per operator (default: 8)")
+    cparser.add_argument("--candidates", type=int, default=24,
+                         help="Candidate values tried per field and operator (default: 24)")
+    cparser.add_argument("-v", "--verbose", action="store_true", help="Print per-operator search times")
+    opts = cparser.parse_args(argv)
+    if np is None:
+        raise SystemExit("The filter corpus requires numpy (pip install numpy)")
+    if not all(0 < t <= 1 for t in opts.selectivity):
+        cparser.error("--selectivity targets must be in (0, 1]")
     
-    # Write files
-    for record in records:
-        filename = get_filename(record)
-        filepath = output_path / filename
-        content = generate_content(record)
-        
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(content)
-        
-        record_type = record.get("_type", "task")
-        stats[record_type] = stats.get(record_type, 0) + 1
-        
-        if args.verbose:
-            print(f"✅ {filename}")
+    started = time.perf_counter()
+    manifest = Path(opts.manifest)
+    frame = OracleFrame.load(manifest)
+    corpus = build_filter_corpus(
+        frame, opts.selectivity, opts.today or manifest_run_date(manifest),
+        opts.max_fields, opts.candidates, opts.verbose,
+    )
+    corpus["manifest"] = str(manifest)
+    
+    stem = manifest.name.split(".manifest")[0]
+    output = Path(opts.output or manifest.with_name(f"{stem}.filters.json"))
+    output.write_text(json.dumps(corpus, ensure_ascii=False) + "\n", encoding="utf-8")
+    
+    hits = sum(
+        1 for case in corpus["cases"]
+        if case["target"] is not None and abs(math.log((case["selectivity"] + 1e-9) / case["target"])) < math.log(2)
+    )
+    targeted = sum(1 for case in corpus["cases"] if case["target"] is not None)
+    print(f"🧪 {len(corpus['cases'])} cases over {len(frame)} records · {hits}/{targeted} within 2× of "
+          f"their target · {output} ({time.perf_counter() - started:.1f}s)", file=sys.stderr)
+    if corpus["skipped"]:
+        print(f"⚠️  No applicable field for: {', '.join(corpus['skipped'])}", file=sys.stderr)
+    return 0
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# EXPORT VERIFICATION
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# Checks a file written by src/lib/export/exportService.ts against the
+# manifest of the vault it was exported from. The export is streamed one row
+# at a time, so memory is bounded by the manifest index and the largest
+# row, not by the export:
+#   - CSV/TSV go through the csv module.
+#   - Markdown tables are split line by line.
+#   - The JSON array goes through JSONDecoder.raw_decode over a sliding
+#     buffer.
+# Rows are matched on the ``path`` column (``_id`` in JSON).
+#
+# Cells are compared as exportService renders them, i.e. cellStr() of the
+# parsed value. parseRecords turns Date fields into Date objects, so dates
+# match on the instant they print (run the export under TZ=UTC). String
+# fields may hold toLocaleString() numbers; Number fields parse strings with
+# parseFloat.
+
+EXPORT_FORMATS = {".csv": "csv", ".tsv": "tsv", ".json": "json", ".md": "markdown"}
+# Fields the frontmatter datasource adds to every record
+EXPORT_VIRTUAL_FIELDS = {"path", "name", "pp_created_time", "pp_last_edited_time"}
+# Date.prototype.toString(), e.g. "Mon Jan 05 2026 10:30:00 GMT+0000 (...)"
+JS_DATE_STRING = re.compile(r"^\w{3} (\w{3}) (\d{2}) (-?\d{4,6}) (\d{2}):(\d{2}):(\d{2}) GMT([+-])(\d{2})(\d{2})")
+JS_MONTHS = {name: i + 1 for i, name in enumerate(
+    ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+)}
+MARKDOWN_CELL_SPLIT = re.compile(r"(?<!\\)\|")
+JSON_CHUNK = 1 << 20
+
+
+def iter_manifest(path: Path) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """(path, frontmatter) per manifest row, a batch or a line at a time."""
+    if path.suffix == ".parquet":
+        if pyarrow is None:
+            raise SystemExit("Reading a parquet manifest requires pyarrow")
+        for batch in pyarrow.parquet.ParquetFile(str(path)).iter_batches(columns=["path", "fields"]):
+            for note, fields in zip(batch.column(0).to_pylist(), batch.column(1).to_pylist()):
+                yield note, json.loads(fields)
+        return
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                row = json.loads(line)
+                yield row["path"], row["fields"]
+
+
+def js_cell(value: Any) -> str:
+    """exportService cellStr() of a value decoded from the JSON export."""
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return ", ".join(js_cell(v) for v in value)
+    if isinstance(value, dict):
+        return "[object Object]"
+    return js_string(value)
+
+
+def js_date_cell(cell: str) -> Optional[datetime.datetime]:
+    """UTC instant of a Date printed by String(date) or toISOString()."""
+    match = JS_DATE_STRING.match(cell)
+    if match:
+        month, day, year, hour, minute, second, sign, off_h, off_m = match.groups()
+        offset = datetime.timedelta(hours=int(off_h), minutes=int(off_m)) * (1 if sign == "+" else -1)
+        try:
+            local = datetime.datetime(int(year), JS_MONTHS[month], int(day), int(hour), int(minute), int(second))
+        except (KeyError, ValueError):
+            return None
+        return local - offset
+    if cell.endswith("Z"):
+        try:
+            return datetime.datetime.fromisoformat(cell[:-1])
+        except ValueError:
+            return None
+    return None
+
+
+def export_cell_matches(cell: str, value: Any) -> bool:
+    """Whether ``cell`` is how the export pipeline renders manifest ``value``."""
+    if value is None:
+        return cell == ""
+    if isinstance(value, list):
+        return cell == js_cell(value)
+    if isinstance(value, dict):
+        return cell in ("[object Object]", json.dumps(value, ensure_ascii=False, separators=(",", ":")))
+    if isinstance(value, bool):
+        return cell == js_string(value)
+    if isinstance(value, (int, float)):
+        if cell in (js_string(value), js_locale_string(value)):
+            return True
+        try:
+            return math.isclose(float(cell.replace(",", "")), value, rel_tol=1e-9, abs_tol=1e-9)
+        except ValueError:
+            return False
+    text = str(value)
+    if cell == text:
+        return True
+    if ISO_DATE_VALUE.match(text):
+        instant = js_date_cell(cell)
+        return instant is not None and instant == datetime.datetime.fromisoformat(text)
+    # Number fields: parseFloat() of the string, NaN when it has no numeric prefix
+    number = parse_float(text)
+    return cell == ("NaN" if math.isnan(number) else js_string(number))
+
+
+def iter_delimited_export(path: Path, sep: str) -> Iterator[Tuple[List[str], Dict[str, str]]]:
+    with open(path, encoding="utf-8", newline="") as f:
+        reader = csv.reader(f, delimiter=sep)
+        header = next(reader, [])
+        for row in reader:
+            yield header, dict(zip(header, row))
+
+
+def iter_markdown_export(path: Path) -> Iterator[Tuple[List[str], Dict[str, str]]]:
+    """Rows of a ``| a | b |`` table; cells had ``|`` escaped and newlines flattened."""
+    def cells(line: str) -> List[str]:
+        parts = MARKDOWN_CELL_SPLIT.split(line.rstrip("\n"))[1:-1]
+        return [part[1:-1].replace("\\|", "|") for part in parts]
+    
+    with open(path, encoding="utf-8") as f:
+        header = cells(next(f, ""))
+        next(f, None)  # --- separator
+        for line in f:
+            yield header, dict(zip(header, cells(line)))
+
+
+def iter_json_export(path: Path) -> Iterator[Tuple[List[str], Dict[str, str]]]:
+    """Objects of a top-level JSON array, decoded one at a time."""
+    decoder = json.JSONDecoder()
+    separators = re.compile(r"[\s,]*")
+    with open(path, encoding="utf-8") as f:
+        buf = f.read(JSON_CHUNK).lstrip()
+        if not buf.startswith("["):
+            raise ValueError(f"{path}: not a JSON array")
+        pos, eof = 1, False
+        while True:
+            pos = separators.match(buf, pos).end()
+            if buf.startswith("]", pos):
+                return
+            try:
+                row, pos = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                chunk = f.read(JSON_CHUNK)
+                eof = not chunk
+                buf, pos = buf[pos:] + chunk, 0
+                continue
+            yield list(row), {key: js_cell(value) for key, value in row.items()}
+
+
+def verify_export(manifest: Dict[str, Dict[str, Any]], rows: Iterator[Tuple[List[str], Dict[str, str]]],
+                  fmt: str, max_errors: int) -> Dict[str, Any]:
+    """Compare streamed export rows with the manifest; returns the report."""
+    key = "_id" if fmt == "json" else "path"
+    seen = set()
+    report: Dict[str, Any] = {
+        "rows": 0, "columns": [], "duplicates": 0, "unexpected": 0,
+        "mismatches": {}, "samples": [],
+    }
+    for header, row in rows:
+        if not report["columns"]:
+            report["columns"] = [c for c in header if c != "_id"]
+            if key not in header:
+                raise SystemExit(f"The export has no {key!r} column to match rows on")
+        report["rows"] += 1
+        note = row.get(key, "")
+        if note in seen:
+            report["duplicates"] += 1
+            continue
+        fields = manifest.get(note)
+        if fields is None:
+            report["unexpected"] += 1
+            continue
+        seen.add(note)
+        for column in report["columns"]:
+            if column in EXPORT_VIRTUAL_FIELDS:
+                continue
+            value = fields.get(column)
+            if fmt == "markdown" and isinstance(value, str):
+                value = value.replace("\n", " ")
+            cell = row.get(column, "")
+            if not export_cell_matches(cell, value):
+                report["mismatches"][column] = report["mismatches"].get(column, 0) + 1
+                if len(report["samples"]) < max_errors:
+                    report["samples"].append({"path": note, "column": column, "expected": value, "cell": cell})
+    report["matched"] = len(seen)
+    report["missing"] = len(manifest) - len(seen)
+    return report
+
+
+def verify_export_main(argv: Optional[List[str]] = None) -> int:
+    """Stream an exportService file and check it against a generation manifest."""
+    vparser = argparse.ArgumentParser(
+        prog="generate-test-files verify-export",
+        description="Check a CSV/TSV/JSON/Markdown export of a generated vault against its manifest.",
+    )
+    vparser.add_argument("manifest", help="Manifest written by a generation run (.ndjson or .parquet)")
+    vparser.add_argument("export", help="File written by exportRecords()")
+    vparser.add_argument("--format", choices=sorted(set(EXPORT_FORMATS.values())),
+                         help="Export format (default: from the file extension)")
+    vparser.add_argument("--allow-missing", action="store_true",
+                         help="Accept exports of a subset of the vault's notes")
+    vparser.add_argument("--max-errors", type=int, default=20,
+                         help="Mismatching cells to print (default: 20)")
+    vparser.add_argument("-o", "--output", help="Write the report as JSON here")
+    opts = vparser.parse_args(argv)
+    export_path = Path(opts.export)
+    fmt = opts.format or EXPORT_FORMATS.get(export_path.suffix)
+    if fmt is None:
+        vparser.error(f"cannot tell the format of {export_path.name}; pass --format")
+    
+    started = time.perf_counter()
+    manifest = dict(iter_manifest(Path(opts.manifest)))
+    if fmt == "json":
+        rows = iter_json_export(export_path)
+    elif fmt == "markdown":
+        rows = iter_markdown_export(export_path)
+    else:
+        rows = iter_delimited_export(export_path, "," if fmt == "csv" else "\t")
+    report = verify_export(manifest, rows, fmt, opts.max_errors)
+    elapsed = time.perf_counter() - started
+    size_mb = export_path.stat().st_size / 1e6
+    report.update({"format": fmt, "exportMb": round(size_mb, 2), "seconds": round(elapsed, 3)})
+    rss = peak_rss_mb()
+    if rss is not None:
+        report["peakRssMb"] = round(rss, 1)
+    if opts.output:
+        Path(opts.output).write_text(json.dumps(report, ensure_ascii=False, default=str) + "\n", encoding="utf-8")
+    
+    missing = 0 if opts.allow_missing else report["missing"]
+    mismatched = sum(report["mismatches"].values())
+    failed = bool(missing or report["unexpected"] or report["duplicates"] or mismatched)
     
-    # Summary
     print(f"\n{'═' * 50}")
-    print(f"✨ Generated {len(records)} files in {output_path}")
+    print(f"{'❌' if failed else '✅'} {report['matched']:,} of {len(manifest):,} notes in {export_path.name} "
+          f"({fmt}, {len(report['columns'])} columns)")
     print(f"{'═' * 50}")
-    print(f"📋 Tasks:    {stats.get('task', 0)}")
-    print(f"📅 Events:   {stats.get('event', 0)}")
-    print(f"🤝 Meetings: {stats.get('meeting', 0)}")
-    print(f"🎯 Projects: {stats.get('project', 0)}")
+    print(f"📄 Rows:       {report['rows']:,} · duplicates {report['duplicates']} · unexpected {report['unexpected']}"
+          f" · missing {report['missing']:,}{' (allowed)' if opts.allow_missing else ''}")
+    print(f"🔍 Mismatches: {mismatched:,}")
+    for column, n in sorted(report["mismatches"].items(), key=lambda kv: -kv[1]):
+        print(f"   {column}: {n:,}")
+    for sample in report["samples"]:
+        print(f"   {sample['path']} · {sample['column']}: expected {sample['expected']!r}, got {sample['cell']!r}")
+    print(f"{'─' * 50}")
+    print(f"⏱️  {elapsed:.2f}s · {size_mb / elapsed if elapsed > 0 else 0.0:,.1f} MB/s")
+    if rss is not None:
+        print(f"🧠 Peak RSS: {rss:.1f} MiB for a {size_mb:,.1f} MB export")
     print(f"{'═' * 50}")
+    return 1 if failed else 0
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# LINK CORPUS
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# Note names and link values that get_filename() never produces. Names mix
+# Cyrillic, CJK, emoji, accented letters and the punctuation Obsidian allows
+# in file names. Some basenames repeat in another folder or only differ by
+# case. Link values use every shape the parsers meet in frontmatter:
+#   - aliases, #heading and #^block anchors
+#   - folder-qualified and .md-suffixed targets, padded bodies
+#   - inline text with several links, lists, comma-separated plain names
+#   - a few bodies in NFD while the note name is NFC
+#
+# Every value records the bodies an extractor should return and the notes
+# they point at, so consumers can check extraction and resolution as well
+# as time them. Pathological inputs are stored as recipes, prefix + unit × n
+# + suffix, expanded to --lengths by the consumer. They target backtracking
+# of the wikilink regular expressions on unclosed or ambiguous brackets.
+
+LINK_NAME_WORDS = {
+    "latin": ["Quarterly", "Review", "Roadmap", "Meeting notes", "Draft", "Retro", "Budget", "API", "Spec", "Launch"],
+    "cyrillic": ["Планёрка", "Отчёт", "Ретроспектива", "Бюджет", "Встреча", "Задача", "Ёлка", "Черновик"],
+    "cjk": ["会議", "議事録", "計画", "報告書", "设计", "路线图"],
+    "emoji": ["🚀", "📅", "✅", "🔥", "🧪 Lab"],
+    "accented": ["Café", "Résumé", "Naïve", "Überblick", "Señor", "Ångström"],
+}
+# Separators Obsidian accepts in names and links (none of * " \ / < > : | ? # ^ [ ])
+LINK_NAME_SEPARATORS = [" ", " - ", " (", ") ", "'", " & ", " + ", ", ", ". ", "! ", " @", " %", " ~ ", " = ", "; "]
+LINK_FOLDERS = ["Projects", "Archive", "Areas/Work", "Areas/Личное", "Journal/2025", "Inbox", "Wiki/参考"]
+LINK_HEADINGS = ["Summary", "Итоги", "Action items", "Décisions", "1. Intro", "Q&A"]
+LINK_SHAPES = {"single": 3, "list": 4, "inline": 2, "plain": 1}
+# (name, prefix, unit, suffix); see above
+LINK_PATHOLOGICAL = [
+    ("unclosed-openers", "", "[[", ""),
+    ("unclosed-body", "[[", "a", ""),
+    ("alias-pipes", "[[a", "|", "]"),
+    ("anchor-hashes", "[[a", "#", "|b]"),
+    ("half-closed", "", "[[a]", ""),
+    ("nested-openers", "[[", "[[a", "]]"),
+    ("alias-chain", "[[", "a|", "]]x"),
+    ("single-brackets", "", "[a] ", "[[b]]"),
+]
+DEFAULT_LINK_LENGTHS = [32, 128, 512, 2048]
+
+
+class LinkCorpus:
+    """Exotic notes and the link values pointing at them."""
+    
+    def __init__(self, opts: argparse.Namespace):
+        self.opts = opts
+        self.rng = random.Random(f"links:{opts.seed}")
+        self.notes: List[Dict[str, str]] = []
+        # Case-folded, so no two notes share a file on case-insensitive filesystems either
+        self.paths: Set[str] = set()
+        self.stats = {"links": 0, "duplicates": 0, "caseCollisions": 0, "nfd": 0, "qualified": 0}
+        for index in range(opts.notes):
+            self.notes.append(self.note(index))
+        self.by_name: Dict[str, List[int]] = {}
+        for index, note in enumerate(self.notes):
+            self.by_name.setdefault(note["name"], []).append(index)
+    
+    def name(self, index: int) -> str:
+        rng = self.rng
+        script = "latin" if rng.random() >= self.opts.unicode_rate else rng.choice(list(LINK_NAME_WORDS)[1:])
+        parts = [rng.choice(LINK_NAME_WORDS[script])]
+        for _ in range(rng.randint(0, 3)):
+            parts.append(rng.choice(LINK_NAME_SEPARATORS))
+            parts.append(rng.choice(LINK_NAME_WORDS[rng.choice(["latin", script])]))
+        # The index keeps names unique unless a duplicate is asked for
+        return f"{''.join(parts).strip(' .,;')} {index}"
+    
+    def note(self, index: int) -> Dict[str, str]:
+        rng = self.rng
+        folder = rng.choice(LINK_FOLDERS)
+        name = None
+        if self.notes and rng.random() < self.opts.duplicate_rate:
+            original = rng.choice(self.notes)
+            case = rng.random() < self.opts.case_rate
+            name = original["name"].swapcase() if case else original["name"]
+            # Another folder than every earlier note of that name
+            folders = [f for f in LINK_FOLDERS if f"{f}/{name}.md".casefold() not in self.paths]
+            if (case and name == original["name"]) or not folders:
+                name = None
+            else:
+                folder = rng.choice(folders)
+                self.stats["caseCollisions" if case else "duplicates"] += 1
+        name = name or self.name(index)
+        path = f"{folder}/{name}.md"
+        self.paths.add(path.casefold())
+        return {"path": path, "name": name}
+    
+    def link(self, target: int) -> Tuple[str, str]:
+        """Markup of a link to note ``target`` and the body extractors should return."""
+        rng = self.rng
+        note = self.notes[target]
+        body = note["name"]
+        # Obsidian qualifies links to repeated basenames; some are typed bare
+        # anyway. Names differing only by case are never qualified.
+        if rng.random() < (0.8 if len(self.by_name[body]) > 1 else 0.05):
+            body = note["path"][:-3]
+            self.stats["qualified"] += 1
+        elif rng.random() < 0.03:
+            body += ".md"
+        if rng.random() < self.opts.nfd_rate and unicodedata.normalize("NFD", body) != body:
+            body = unicodedata.normalize("NFD", body)
+            self.stats["nfd"] += 1
+        markup = body
+        if rng.random() < 0.03:
+            markup = f" {markup} "
+        if rng.random() < self.opts.heading_rate:
+            markup += f"#{rng.choice(LINK_HEADINGS)}" if rng.random() < 0.8 else f"#^{random_text(6).lower()}"
+        if rng.random() < self.opts.alias_rate:
+            markup += f"|{rng.choice(LINK_NAME_WORDS['latin'])} {rng.choice(LINK_NAME_WORDS['cyrillic'])}"
+        self.stats["links"] += 1
+        return f"[[{markup}]]", body
+
+    def value(self) -> Dict[str, Any]:
+        """One frontmatter value in a random shape, with its expected bodies and targets."""
+        rng = self.rng
+        shapes, weights = zip(*LINK_SHAPES.items())
+        shape = rng.choices(shapes, weights)[0]
+        count = 1 if shape == "single" else rng.randint(1, max(2 * self.opts.links_per_value - 1, 1))
+        targets = [rng.randrange(len(self.notes)) for _ in range(count)]
+        if shape == "plain":
+            # Comma-separated bare names; names holding a comma would split
+            targets = [t for t in targets if "," not in self.notes[t]["name"]] or [0]
+            names = [self.notes[t]["name"] for t in targets]
+            self.stats["links"] += len(names)
+            return {"shape": shape, "value": ", ".join(names), "links": names, "targets": targets}
+        links = [self.link(t) for t in targets]
+        markups = [markup for markup, _ in links]
+        if shape == "list":
+            value: Any = markups
+        elif shape == "inline":
+            value = "See " + ", ".join(markups[:-1]) + (" and " if len(markups) > 1 else "") + markups[-1] + "."
+        else:
+            value = markups[0]
+        return {"shape": shape, "value": value, "links": [body for _, body in links], "targets": targets}
+
+
+def build_link_corpus(opts: argparse.Namespace) -> Dict[str, Any]:
+    """Notes, link values and the pathological recipes of one corpus."""
+    corpus = LinkCorpus(opts)
+    values = [corpus.value() for _ in range(opts.values)]
+    return {
+        "seed": opts.seed,
+        "options": {
+            "notes": opts.notes,
+            "values": opts.values,
+            "linksPerValue": opts.links_per_value,
+            "duplicateRate": opts.duplicate_rate,
+            "caseRate": opts.case_rate,
+            "unicodeRate": opts.unicode_rate,
+            "aliasRate": opts.alias_rate,
+            "headingRate": opts.heading_rate,
+            "nfdRate": opts.nfd_rate,
+        },
+        "stats": corpus.stats,
+        "notes": corpus.notes,
+        "values": values,
+        "lengths": opts.lengths,
+        "pathological": [
+            {"name": name, "prefix": prefix, "unit": unit, "suffix": suffix}
+            for name, prefix, unit, suffix in LINK_PATHOLOGICAL
+        ],
+    }
+
+
+def write_link_vault(root: Path, corpus: Dict[str, Any]) -> int:
+    """One note per corpus note; the first ``values`` carry a ``links`` value."""
+    values = corpus["values"]
+    written = 0
+    for index, note in enumerate(corpus["notes"]):
+        path = root / note["path"]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        frontmatter = {"links": values[index]["value"]} if index < len(values) else {}
+        path.write_text(f"---\n{dump_frontmatter_fast(frontmatter)}---\n\n# {note['name']}\n", encoding="utf-8")
+        written += 1
+    return written
+
+
+def link_corpus_main(argv: Optional[List[str]] = None) -> int:
+    """Emit exotic note names and dense link values with their expected targets."""
+    lparser = argparse.ArgumentParser(
+        prog="generate-test-files link-corpus",
+        description="Build a wikilink corpus (exotic names, duplicate basenames, every link shape and "
+                    "pathological inputs) with the expected bodies and targets of every value.",
+    )
+    lparser.add_argument("-o", "--output", default="links.json", help="Corpus JSON path (default: links.json)")
+    lparser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    lparser.add_argument("--notes", type=int, default=20_000, help="Link targets (default: 20000)")
+    lparser.add_argument("--values", type=int, default=50_000, help="Link values (default: 50000)")
+    lparser.add_argument("--links-per-value", type=int, default=4,
+                         help="Mean links per list, inline or plain value (default: 4)")
+    lparser.add_argument("--duplicate-rate", type=float, default=0.1,
+                         help="Notes reusing an earlier basename in another folder (default: 0.1)")
+    lparser.add_argument("--case-rate", type=float, default=0.3,
+                         help="Share of those duplicates differing only by case (default: 0.3)")
+    lparser.add_argument("--unicode-rate", type=float, default=0.5,
+                         help="Names built from non-Latin words (default: 0.5)")
+    lparser.add_argument("--alias-rate", type=float, default=0.3, help="Links with an |alias (default: 0.3)")
+    lparser.add_argument("--heading-rate", type=float, default=0.2,
+                         help="Links with a #heading or #^block anchor (default: 0.2)")
+    lparser.add_argument("--nfd-rate", type=float, default=0.02,
+                         help="Links written in NFD where the name is NFC (default: 0.02)")
+    lparser.add_argument("--lengths", type=int, nargs="+", default=DEFAULT_LINK_LENGTHS,
+                         help="Repetitions per pathological input (default: 32 128 512 2048)")
+    lparser.add_argument("--vault", help="Also write the notes, with their link values, into this folder")
+    opts = lparser.parse_args(argv)
+    rates = (opts.duplicate_rate, opts.case_rate, opts.unicode_rate, opts.alias_rate, opts.heading_rate, opts.nfd_rate)
+    if not all(0 <= rate <= 1 for rate in rates):
+        lparser.error("rates must be between 0 and 1")
+    if opts.notes < 1 or opts.values < 0 or opts.links_per_value < 1 or min(opts.lengths) < 1:
+        lparser.error("--notes, --links-per-value and --lengths must be >= 1, --values >= 0")
+    
+    started = time.perf_counter()
+    random.seed(opts.seed)  # random_text() for block anchors
+    corpus = build_link_corpus(opts)
+    output = Path(opts.output)
+    output.write_text(json.dumps(corpus, ensure_ascii=False) + "\n", encoding="utf-8")
+    written = write_link_vault(Path(opts.vault), corpus) if opts.vault else 0
+    
+    stats = corpus["stats"]
+    print(f"🔗 {stats['links']:,} links in {len(corpus['values']):,} values over {len(corpus['notes']):,} notes"
+          f" · {output} ({time.perf_counter() - started:.1f}s)", file=sys.stderr)
+    print(f"👯 {stats['duplicates']:,} duplicate basenames · {stats['caseCollisions']:,} case collisions"
+          f" · {stats['qualified']:,} folder-qualified · {stats['nfd']:,} NFD", file=sys.stderr)
+    if written:
+        print(f"📁 {written:,} notes written to {opts.vault}", file=sys.stderr)
+    return 0
+
+
+COMMANDS = {
+    "verify-yaml": verify_yaml_main,
+    "mutate": mutate_main,
+    "oracle": oracle_main,
+    "filter-corpus": filter_corpus_main,
+    "verify-export": verify_export_main,
+    "link-corpus": link_corpus_main,
+}
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] in COMMANDS:
+        sys.exit(COMMANDS[sys.argv[1]](sys.argv[2:]))
     main()
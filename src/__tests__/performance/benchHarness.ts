@@ -0,0 +1,276 @@
+/**
+ * Shared helpers for the performance suites (`npm run test:performance`).
+ *
+ * Suites run small by default so they stay cheap in CI. The runners in
+ * `scripts/bench-*.py` scale them up through environment variables:
+ *  - PP_BENCH_VAULT — folder of generated notes to ingest from disk
+ *  - PP_BENCH_SCALE — multiplier for synthetic fixture sizes
+ *  - PP_BENCH_OUT   — JSON file that receives the measurements
+ *  - PP_BENCH_REPEAT — timed runs per case, see `benchRepeat`
+ *  - PP_BENCH_CORPUS — per-suite input generated with the vault (filter-corpus
+ *    and link-corpus commands, --formulas, --view-workload and
+ *    --query-workload files, --multi-project plugin settings)
+ */
+
+import dayjs from "dayjs";
+import { array as A } from "fp-ts";
+import * as fs from "fs";
+import * as path from "path";
+import { PerformanceObserver, performance } from "perf_hooks";
+import * as v8 from "v8";
+import {
+  DataFieldType,
+  type DataField,
+  type DataFrame,
+  type DataRecord,
+} from "src/lib/dataframe/dataframe";
+import {
+  detectSchema,
+  standardizeRecords,
+} from "src/lib/datasources/frontmatter/datasource";
+import { parseRecords } from "src/lib/datasources/helpers";
+import { InMemFileSystem } from "src/lib/filesystem/inmem/filesystem";
+
+export const BENCH_VAULT = process.env.PP_BENCH_VAULT ?? "";
+export const BENCH_SCALE = Math.max(Number(process.env.PP_BENCH_SCALE ?? "1") || 1, 0);
+export const BENCH_OUT = process.env.PP_BENCH_OUT ?? "";
+export const BENCH_CORPUS = process.env.PP_BENCH_CORPUS ?? "";
+
+/** Per-test timeout: generous when a runner drives the suite at scale. */
+export const BENCH_TIMEOUT = BENCH_VAULT || BENCH_SCALE > 1 ? 60 * 60 * 1000 : 60 * 1000;
+
+export interface GcStats {
+  count: number;
+  totalMs: number;
+  maxMs: number;
+}
+
+export interface VaultNote {
+  path: string;
+  content: string;
+}
+
+/** Timed runs per case from PP_BENCH_REPEAT, `fallback` when unset; at least 1. */
+export function benchRepeat(fallback: number): number {
+  return Math.max(Number(process.env.PP_BENCH_REPEAT ?? fallback) || fallback, 1);
+}
+
+/** `value` rounded to `digits` decimals. */
+export function round(value: number, digits = 2): number {
+  const scale = 10 ** digits;
+  return Math.round(value * scale) / scale;
+}
+
+/** Nearest-rank percentile, `p` in [0, 1]; 0 for no values. */
+export function percentile(values: number[], p: number): number {
+  const sorted = [...values].sort((a, b) => a - b);
+  return sorted[Math.min(sorted.length - 1, Math.floor(p * sorted.length))] ?? 0;
+}
+
+export function median(values: number[]): number {
+  return percentile(values, 0.5);
+}
+
+/** log(t2/t1) / log(n2/n1): ~1 linear, ~2 quadratic (null below 1 ms). */
+export function growth(previousMs: number, ms: number, ratio: number): number | null {
+  if (previousMs < 1 || ratio <= 1) return null;
+  return round(Math.log(ms / previousMs) / Math.log(ratio));
+}
+
+/** Collects V8 GC pauses until `stop()` is called. */
+export function observeGc(): { stop: () => GcStats } {
+  const stats: GcStats = { count: 0, totalMs: 0, maxMs: 0 };
+  const record = (entries: PerformanceEntry[]) => {
+    for (const entry of entries) {
+      stats.count += 1;
+      stats.totalMs += entry.duration;
+      stats.maxMs = Math.max(stats.maxMs, entry.duration);
+    }
+  };
+  const observer = new PerformanceObserver((list) => record(list.getEntries()));
+  observer.observe({ entryTypes: ["gc"] });
+  return {
+    stop: () => {
+      record(observer.takeRecords());
+      observer.disconnect();
+      return { count: stats.count, totalMs: round(stats.totalMs), maxMs: round(stats.maxMs) };
+    },
+  };
+}
+
+/** Tracks the largest heapUsed seen at the points where `sample()` is called. */
+export function heapTracker(): { sample: () => void; peakMb: () => number } {
+  let peak = 0;
+  const sample = () => {
+    peak = Math.max(peak, process.memoryUsage().heapUsed);
+  };
+  sample();
+  return { sample, peakMb: () => round(peak / (1024 * 1024)) };
+}
+
+export function heapUsedMb(): number {
+  return round(process.memoryUsage().heapUsed / (1024 * 1024));
+}
+
+/** Heap usage around one V8 GC, as reported by `v8.GCProfiler` at runtime. */
+interface GcSample {
+  beforeGC: { heapStatistics: { usedHeapSize: number } };
+  afterGC: { heapStatistics: { usedHeapSize: number } };
+}
+
+export interface AllocationStats {
+  /** Estimated bytes allocated, in MiB (a lower bound). */
+  allocatedMb: number;
+  /** Largest heap growth over the starting heap seen at a GC or at the end, in MiB. */
+  peakMb: number;
+}
+
+/**
+ * Tracks allocations until `stop()` is called. The estimate is heap growth
+ * up to each GC plus growth since the last one. Survivors of a collection
+ * are not counted twice, so it is a lower bound.
+ */
+export function trackAllocations(): { stop: () => AllocationStats } {
+  const profiler = new v8.GCProfiler();
+  const startUsed = v8.getHeapStatistics().used_heap_size;
+  profiler.start();
+  return {
+    stop: () => {
+      const endUsed = v8.getHeapStatistics().used_heap_size;
+      const samples = (profiler.stop()?.statistics ?? []) as unknown as GcSample[];
+      let allocated = 0;
+      let previous = startUsed;
+      let peak = endUsed;
+      for (const sample of samples) {
+        const before = sample.beforeGC.heapStatistics.usedHeapSize;
+        allocated += Math.max(before - previous, 0);
+        peak = Math.max(peak, before);
+        previous = sample.afterGC.heapStatistics.usedHeapSize;
+      }
+      allocated += Math.max(endUsed - previous, 0);
+      const mb = 1024 * 1024;
+      return { allocatedMb: round(allocated / mb), peakMb: round(Math.max(peak - startUsed, 0) / mb) };
+    },
+  };
+}
+
+/** Runs a full GC when node was started with --expose-gc; no-op otherwise. */
+export function collectGarbage(): void {
+  (globalThis as { gc?: () => void }).gc?.();
+}
+
+/** Awaits `fn` and returns its result with the elapsed milliseconds. */
+export async function timed<T>(fn: () => T | Promise<T>): Promise<[T, number]> {
+  const start = performance.now();
+  const result = await fn();
+  return [result, round(performance.now() - start)];
+}
+
+const TASK_STATUSES = ["todo", "in-progress", "done", "cancelled"];
+const TASK_PRIORITIES = ["high", "medium", "low"];
+const TASK_TAGS = ["work", "home", "urgent", "review", "blocked"];
+
+/** Day zero of `syntheticTasks`; its dates are local midnights counted from here. */
+export const SYNTHETIC_START = "2025-01-01";
+
+/**
+ * Tasks with the fields of a default generated vault. Task i starts
+ * i % 120 days after SYNTHETIC_START and is due (i % 14) + 1 days later, or
+ * never when i % 10 === 0. It is done when i % 3 === 0, and its tags are the
+ * TASK_TAGS whose bit is set in i.
+ */
+export function syntheticTasks(count: number): DataFrame {
+  const start = dayjs(SYNTHETIC_START);
+  const records: DataRecord[] = [];
+  for (let i = 0; i < count; i++) {
+    const startDay = i % 120;
+    records.push({
+      id: `Tasks/Task ${i}.md`,
+      values: {
+        title: `Task ${i}`,
+        status: TASK_STATUSES[i % TASK_STATUSES.length],
+        priority: TASK_PRIORITIES[i % TASK_PRIORITIES.length],
+        progress: (i * 7) % 101,
+        done: i % 3 === 0,
+        date: start.toDate(),
+        startDate: start.add(startDay, "day").toDate(),
+        dueDate: i % 10 === 0 ? undefined : start.add(startDay + (i % 14) + 1, "day").toDate(),
+        tags: TASK_TAGS.filter((_, t) => (i >> t) & 1),
+      },
+    });
+  }
+  return { fields: [], records };
+}
+
+const WIDE_KINDS = [DataFieldType.String, DataFieldType.Number, DataFieldType.Date, DataFieldType.List, DataFieldType.Boolean];
+/** Strings that force every escaping branch of the CSV and Markdown writers. */
+const AWKWARD = ['plain', 'comma, inside', 'quote " inside', "line\nbreak", "pipe | inside", "tab\tinside"];
+
+/** `path` plus 63 columns cycling through strings, numbers, dates, lists and booleans. */
+export function syntheticWideFrame(count: number): DataFrame {
+  const fields: DataField[] = [{ name: "path", type: DataFieldType.String, identifier: false, derived: false, repeated: false, typeConfig: {} }];
+  for (let c = 0; c < 63; c++) {
+    const type = WIDE_KINDS[c % WIDE_KINDS.length]!;
+    fields.push({ name: `col${c}`, type, identifier: false, derived: false, repeated: type === DataFieldType.List, typeConfig: {} });
+  }
+  const base = Date.UTC(2025, 0, 1);
+  const records: DataRecord[] = [];
+  for (let i = 0; i < count; i++) {
+    const id = `Records/Note ${i}.md`;
+    const values: DataRecord["values"] = { path: id };
+    fields.slice(1).forEach((field, c) => {
+      if ((i + c) % 11 === 0) return;
+      switch (field.type) {
+        case DataFieldType.Number: values[field.name] = (i * 31 + c) / 4; break;
+        case DataFieldType.Date: values[field.name] = new Date(base + ((i + c) % 400) * 86_400_000); break;
+        case DataFieldType.List: values[field.name] = [`tag${i % 7}`, `tag${c % 5}`]; break;
+        case DataFieldType.Boolean: values[field.name] = (i + c) % 2 === 0; break;
+        default: values[field.name] = `${AWKWARD[(i + c) % AWKWARD.length]} ${i}`;
+      }
+    });
+    records.push({ id, values });
+  }
+  return { fields, records };
+}
+
+/** Every Markdown note under `root`, with vault-relative POSIX paths. */
+export function readVault(root: string): VaultNote[] {
+  const notes: VaultNote[] = [];
+  const walk = (dir: string) => {
+    for (const entry of fs.readdirSync(dir, { withFileTypes: true })) {
+      const full = path.join(dir, entry.name);
+      if (entry.isDirectory()) {
+        walk(full);
+      } else if (entry.name.endsWith(".md")) {
+        notes.push({
+          path: path.relative(root, full).split(path.sep).join("/"),
+          content: fs.readFileSync(full, "utf8"),
+        });
+      }
+    }
+  };
+  walk(root);
+  return notes.sort((a, b) => (a.path < b.path ? -1 : a.path > b.path ? 1 : 0));
+}
+
+/** Parses a generated vault through the frontmatter datasource into a DataFrame. */
+export async function loadVaultFrame(root: string): Promise<DataFrame> {
+  const fileSystem = new InMemFileSystem({});
+  for (const note of readVault(root)) {
+    await fileSystem.create(note.path, note.content);
+  }
+  const { right: records } = A.separate(await standardizeRecords(fileSystem.getAllFiles()));
+  const fields = detectSchema(records);
+  return { fields, records: parseRecords(records, fields) };
+}
+
+/** Merges `results` under `suite` into PP_BENCH_OUT (no-op when unset). */
+export function writeResults(suite: string, results: Record<string, unknown>): void {
+  if (!BENCH_OUT) return;
+  let existing: Record<string, unknown> = {};
+  if (fs.existsSync(BENCH_OUT)) {
+    existing = JSON.parse(fs.readFileSync(BENCH_OUT, "utf8")) as Record<string, unknown>;
+  }
+  existing[suite] = results;
+  fs.writeFileSync(BENCH_OUT, `${JSON.stringify(existing, null, 2)}\n`);
+}
@@ -0,0 +1,295 @@
+/**
+ * Cross-project relation benchmark — one frame per project through
+ * `resolveExternalFrame`, then `enrichFrameWithAllRelations` over every
+ * project, as the number of projects grows.
+ *
+ * With PP_BENCH_VAULT and PP_BENCH_CORPUS set (see scripts/bench-projects.py)
+ * the vault is a `--multi-project` vault and the corpus its plugin settings
+ * (<vault>.data.json); the run is a single rung and the runner strings the
+ * rungs of a project-count ladder together. Otherwise 2000 × PP_BENCH_SCALE
+ * synthetic notes are split into 10, 50, 100 and 250 projects of the same
+ * shape, one rung each.
+ *
+ * The settings go through `migrateSettings` like Plugin.loadData(). Each
+ * project's frame comes from `resolveExternalFrame` over one InMemFileSystem
+ * holding the whole vault, so relation fields carry `typeConfig.relation`
+ * from the project's fieldConfig. Enrichment then runs for every project
+ * with the map of its target frames, like View.svelte does for the open
+ * view. The resolver memoizes its lookup index per target frame. The cold
+ * pass therefore runs on fresh frame objects and builds every index once.
+ * The PP_BENCH_REPEAT warm passes reuse them; their median is reported.
+ */
+
+import { describe, expect, it, jest } from "@jest/globals";
+import { either as E } from "fp-ts";
+import * as fs from "fs";
+import type { DataFrame } from "src/lib/dataframe/dataframe";
+import {
+  derivedFieldName,
+  enrichFrameWithAllRelations,
+  normalizeRelationValue,
+} from "src/lib/engine/crossProjectResolver";
+import { resolveExternalFrame } from "src/lib/externalFrameResolver";
+import { InMemFileSystem } from "src/lib/filesystem/inmem/filesystem";
+import { migrateSettings } from "src/settings/settings";
+import {
+  BENCH_CORPUS,
+  BENCH_SCALE,
+  BENCH_TIMEOUT,
+  BENCH_VAULT,
+  benchRepeat,
+  collectGarbage,
+  percentile,
+  readVault,
+  round,
+  trackAllocations,
+  type VaultNote,
+  writeResults,
+} from "./benchHarness";
+
+// Generated vaults have to be parsed by the real YAML package.
+jest.unmock("yaml");
+
+const REPEAT = benchRepeat(3);
+
+/** Project counts of the synthetic ladder; the note count stays fixed. */
+const LADDER = [10, 50, 100, 250];
+
+/** Same names, in the same order, as CROSS_PROJECT_FIELDS in generate-test-files.py. */
+const CROSS_FIELDS = ["dependsOn", "blocks", "relatesTo"];
+const CROSS_RATE = 0.2;
+const STATUSES = ["todo", "doing", "done"];
+
+interface Latency {
+  totalMs: number;
+  p50Ms: number;
+  p95Ms: number;
+  maxMs: number;
+}
+
+/** mulberry32: a small seeded PRNG so the synthetic vault is stable. */
+function prng(seed: number): () => number {
+  let state = seed >>> 0;
+  return () => {
+    state = (state + 0x6d2b79f5) >>> 0;
+    let t = state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+/**
+ * A `--multi-project` vault in miniature: Zipf-sized folders, a `related`
+ * field into the own project and two cross-project fields, plus its settings.
+ */
+function syntheticVault(projects: number, total: number): { notes: VaultNote[]; settings: unknown } {
+  const random = prng(projects);
+  const weights = Array.from({ length: projects }, (_, p) => 1 / (p + 1));
+  const sum = weights.reduce((a, b) => a + b, 0);
+  const sizes = weights.map((w) => 1 + Math.floor((w / sum) * (total - projects)));
+  const key = (p: number) => `P${String(p + 1).padStart(String(projects).length, "0")}`;
+  const folder = (p: number) => `Projects/Project ${p}`;
+  const targets = sizes.map((_, p) =>
+    projects < 2 ? [] : CROSS_FIELDS.slice(0, 2).map(() => (p + 1 + Math.floor(random() * (projects - 1))) % projects)
+  );
+
+  const notes: VaultNote[] = [];
+  sizes.forEach((size, p) => {
+    for (let i = 0; i < size; i++) {
+      const fields = new Map<string, string[]>();
+      const links = Math.floor(-Math.log(1 - random()) * 3);
+      for (let l = 0; l < links; l++) {
+        const slot = targets[p]!.length && random() < CROSS_RATE ? Math.floor(random() * targets[p]!.length) : -1;
+        const target = slot < 0 ? p : targets[p]![slot]!;
+        const name = `${key(target)}-${1 + Math.floor(random() * sizes[target]!)}`;
+        const field = slot < 0 ? "related" : CROSS_FIELDS[slot]!;
+        fields.set(field, [...(fields.get(field) ?? []), name]);
+      }
+      const relations = [...fields].flatMap(([field, names]) => [
+        `${field}:`,
+        ...names.map((name) => `  - "[[${name}]]"`),
+      ]);
+      notes.push({
+        path: `${folder(p)}/${key(p)}-${i + 1}.md`,
+        content: [
+          "---",
+          `title: ${key(p)}-${i + 1}`,
+          `status: ${STATUSES[i % STATUSES.length]}`,
+          `score: ${Math.floor(random() * 100)}`,
+          ...relations,
+          "---",
+          "",
+        ].join("\n"),
+      });
+    }
+  });
+
+  const id = (p: number) => `project-${p}`;
+  const settings = {
+    version: 4,
+    projects: sizes.map((_, p) => ({
+      name: `Project ${p}`,
+      id: id(p),
+      fieldConfig: Object.fromEntries([
+        ["related", { relation: { targetProjectId: id(p) } }],
+        ...targets[p]!.map((target, slot) => [CROSS_FIELDS[slot]!, { relation: { targetProjectId: id(target) } }]),
+      ]),
+      views: [],
+      dataSource: { kind: "folder", config: { path: folder(p), recursive: false } },
+      newNotesFolder: folder(p),
+    })),
+    archives: [],
+    preferences: { projectSizeLimit: Math.max(1000, ...sizes) },
+  };
+  return { notes, settings };
+}
+
+function latency(samples: number[]): Latency {
+  return {
+    totalMs: round(samples.reduce((a, b) => a + b, 0), 3),
+    p50Ms: round(percentile(samples, 0.5), 3),
+    p95Ms: round(percentile(samples, 0.95), 3),
+    maxMs: round(Math.max(0, ...samples), 3),
+  };
+}
+
+/** Loads, enriches and counts one vault; the measurements of one rung. */
+async function measureRung(notes: VaultNote[], rawSettings: unknown) {
+  const migrated = migrateSettings(rawSettings);
+  if (E.isLeft(migrated)) throw migrated.left;
+  const { projects, preferences } = migrated.right;
+
+  const fileSystem = new InMemFileSystem({});
+  for (const note of notes) {
+    await fileSystem.create(note.path, note.content);
+  }
+
+  // One frame per project, as App's per-id external frame cache holds them
+  collectGarbage();
+  const frames = new Map<string, DataFrame>();
+  const loadSamples: number[] = [];
+  for (const project of projects) {
+    const start = performance.now();
+    const frame = await resolveExternalFrame(project.id, { fileSystem, preferences, projects });
+    loadSamples.push(performance.now() - start);
+    frames.set(project.id, frame ?? { fields: [], records: [] });
+  }
+
+  // (field, target id) per project, and how many projects link into each one
+  const relations = new Map(
+    projects.map((project) => [
+      project.id,
+      Object.entries(project.fieldConfig).flatMap(([field, config]) =>
+        config.relation ? [[field, config.relation.targetProjectId] as const] : []
+      ),
+    ])
+  );
+  const inDegree = new Map<string, number>();
+  for (const [id, fields] of relations) {
+    for (const target of new Set(fields.map(([, t]) => t).filter((t) => t !== id))) {
+      inDegree.set(target, (inDegree.get(target) ?? 0) + 1);
+    }
+  }
+
+  const enrichAll = (source: Map<string, DataFrame>) => {
+    const samples: number[] = [];
+    const enriched = new Map<string, DataFrame>();
+    for (const project of projects) {
+      const externals = new Map<string, DataFrame>();
+      for (const [, target] of relations.get(project.id)!) {
+        const frame = source.get(target);
+        if (frame) externals.set(target, frame);
+      }
+      const start = performance.now();
+      enriched.set(project.id, enrichFrameWithAllRelations(source.get(project.id)!, externals));
+      samples.push(performance.now() - start);
+    }
+    return { samples, enriched };
+  };
+
+  // Cold: fresh frame objects, so no lookup index is memoized yet
+  const fresh = new Map([...frames].map(([id, frame]) => [id, { ...frame }]));
+  collectGarbage();
+  const allocations = trackAllocations();
+  const cold = enrichAll(fresh);
+  const { allocatedMb } = allocations.stop();
+
+  const warmPasses = Array.from({ length: REPEAT }, () => enrichAll(fresh).samples);
+  const warmTotals = warmPasses.map((samples) => samples.reduce((a, b) => a + b, 0));
+  const medianPass = warmPasses[warmTotals.indexOf(percentile(warmTotals, 0.5))]!;
+
+  let links = 0;
+  let crossLinks = 0;
+  let resolved = 0;
+  let crossResolved = 0;
+  for (const project of projects) {
+    const frame = cold.enriched.get(project.id)!;
+    for (const [field, target] of relations.get(project.id)!) {
+      const cross = target !== project.id;
+      for (const record of frame.records) {
+        const count = normalizeRelationValue(record.values[field]).length;
+        const hits = (record.values[derivedFieldName(field)] as unknown[] | undefined)?.length ?? 0;
+        links += count;
+        resolved += hits;
+        if (cross) {
+          crossLinks += count;
+          crossResolved += hits;
+        }
+      }
+    }
+  }
+
+  const coldLatency = latency(cold.samples);
+  return {
+    projects: projects.length,
+    notes: notes.length,
+    largestProject: Math.max(0, ...[...frames.values()].map((f) => f.records.length)),
+    maxInDegree: Math.max(0, ...inDegree.values()),
+    links,
+    crossLinks,
+    crossShare: links ? round(crossLinks / links, 3) : 0,
+    resolved,
+    crossResolved,
+    load: latency(loadSamples),
+    cold: {
+      ...coldLatency,
+      msPerKiloLinks: links ? round((coldLatency.totalMs / links) * 1000, 3) : null,
+      allocatedMb,
+    },
+    warm: latency(medianPass),
+  };
+}
+
+describe("performance: cross-project relation enrichment", () => {
+  it(
+    "loads and enriches every project as projects multiply",
+    async () => {
+      const rungs = [];
+      if (BENCH_VAULT && BENCH_CORPUS) {
+        const settings = JSON.parse(fs.readFileSync(BENCH_CORPUS, "utf8")) as unknown;
+        rungs.push(await measureRung(readVault(BENCH_VAULT), settings));
+      } else {
+        const total = Math.round(2000 * BENCH_SCALE);
+        for (const projects of LADDER) {
+          const { notes, settings } = syntheticVault(projects, total);
+          rungs.push(await measureRung(notes, settings));
+        }
+      }
+
+      writeResults("crossProject", {
+        source: BENCH_VAULT || "synthetic",
+        repeat: REPEAT,
+        rungs,
+      });
+
+      for (const rung of rungs) {
+        expect(rung.load.totalMs).toBeGreaterThan(0);
+        // Every generated link names an existing note of its target project
+        expect(rung.resolved).toBe(rung.links);
+        expect(rung.crossResolved).toBe(rung.crossLinks);
+      }
+    },
+    BENCH_TIMEOUT
+  );
+});
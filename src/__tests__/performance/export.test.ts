@@ -0,0 +1,121 @@
+/**
+ * Export benchmark — `exportRecords` timed per format on DataFrames of
+ * growing size and width.
+ *
+ * With PP_BENCH_VAULT set (see scripts/bench-export.py) the frame is parsed
+ * from a generated vault. Otherwise a synthetic frame of 2000 ×
+ * PP_BENCH_SCALE rows and 64 columns keeps the suite CI-sized. Each cell
+ * records time, heap growth (peak and allocated) and output size. An export
+ * that throws, e.g. past V8's maximum string length, is recorded as an error
+ * instead of failing the suite. With PP_BENCH_EXPORT_DIR set, the full-size,
+ * full-width export of every format is written there for
+ * `generate-test-files.py verify-export`.
+ */
+
+import { describe, expect, it, jest } from "@jest/globals";
+import * as fs from "fs";
+import * as path from "path";
+import type { DataField, DataFrame } from "src/lib/dataframe/dataframe";
+import {
+  exportFileExtension,
+  exportRecords,
+  type ExportFormat,
+} from "src/lib/export/exportService";
+import {
+  BENCH_SCALE,
+  BENCH_TIMEOUT,
+  BENCH_VAULT,
+  collectGarbage,
+  loadVaultFrame,
+  round,
+  syntheticWideFrame,
+  timed,
+  trackAllocations,
+  writeResults,
+} from "./benchHarness";
+
+// Generated vaults have to be parsed by the real YAML package.
+jest.unmock("yaml");
+
+/** Where full-size exports are written for the streaming verifier. */
+const EXPORT_DIR = process.env.PP_BENCH_EXPORT_DIR ?? "";
+
+const FORMATS: ExportFormat[] = ["csv", "tsv", "json", "markdown"];
+/** Share of the records per row rung and column counts per width rung. */
+const ROW_LADDER = [0.125, 0.25, 0.5, 1];
+const WIDTHS = [8, 32, Infinity];
+
+/** `path` first, so every width can be matched back to its notes. */
+function columns(frame: DataFrame, width: number): DataField[] {
+  const pathField = frame.fields.find((f) => f.name === "path");
+  const rest = frame.fields.filter((f) => f !== pathField);
+  return [...(pathField ? [pathField] : []), ...rest].slice(0, width);
+}
+
+describe("performance: export", () => {
+  it(
+    "times exportRecords per format, row count and width",
+    async () => {
+      const frame = BENCH_VAULT
+        ? await loadVaultFrame(BENCH_VAULT)
+        : syntheticWideFrame(Math.round(2000 * BENCH_SCALE));
+      const widths = [...new Set(WIDTHS.map((w) => Math.min(w, frame.fields.length)))];
+      if (EXPORT_DIR) fs.mkdirSync(EXPORT_DIR, { recursive: true });
+
+      const cells = [];
+      const written: Record<string, string> = {};
+      for (const share of ROW_LADDER) {
+        const records = frame.records.slice(0, Math.max(1, Math.ceil(frame.records.length * share)));
+        for (const width of widths) {
+          const fields = columns(frame, width);
+          for (const format of FORMATS) {
+            collectGarbage();
+            const allocations = trackAllocations();
+            let output: string | null = null;
+            let ms = 0;
+            let error: string | null = null;
+            try {
+              [output, ms] = await timed(() => exportRecords(records, fields, format));
+            } catch (e) {
+              error = e instanceof Error ? `${e.name}: ${e.message}` : String(e);
+            }
+            const { allocatedMb, peakMb } = allocations.stop();
+            const outputMb = output === null ? null : round(Buffer.byteLength(output) / 1e6);
+            if (output !== null && EXPORT_DIR && share === 1 && width === frame.fields.length) {
+              const file = path.join(EXPORT_DIR, `export${exportFileExtension(format)}`);
+              fs.writeFileSync(file, output);
+              written[format] = file;
+            }
+            output = null;
+            cells.push({
+              format,
+              rows: records.length,
+              width: fields.length,
+              ms,
+              peakMb,
+              allocatedMb,
+              outputMb,
+              rowsPerSec: error || ms <= 0 ? null : Math.round((records.length / ms) * 1000),
+              error,
+            });
+          }
+        }
+      }
+
+      writeResults("export", {
+        source: BENCH_VAULT || "synthetic",
+        records: frame.records.length,
+        fields: frame.fields.length,
+        cells,
+        files: written,
+      });
+
+      expect(cells).toHaveLength(ROW_LADDER.length * widths.length * FORMATS.length);
+      if (!BENCH_VAULT) {
+        // CI-sized frames stay far below any string length limit
+        expect(cells.filter((c) => c.error)).toEqual([]);
+      }
+    },
+    BENCH_TIMEOUT
+  );
+});
@@ -0,0 +1,222 @@
+/**
+ * Filter operator benchmark — `applyFilter` timed per operator and per
+ * selectivity target.
+ *
+ * With PP_BENCH_VAULT and PP_BENCH_CORPUS set (see scripts/bench-filters.py)
+ * the records come from a generated vault and the conditions from
+ * `generate-test-files.py filter-corpus`. Otherwise every operator runs
+ * once over a small synthetic frame, and its expected match set comes from
+ * plain predicates over the way the frame was built. Relative dates resolve
+ * at the corpus' base date, or at a fixed synthetic "today". Either way the
+ * records `applyFilter` keeps must be exactly the expected set, and the
+ * reported selectivity is that of the timed runs.
+ */
+
+import { describe, expect, it, jest } from "@jest/globals";
+import dayjs from "dayjs";
+import * as fs from "fs";
+import type { DataFrame, DataRecord } from "src/lib/dataframe/dataframe";
+import { applyFilter } from "src/lib/engine/filterEvaluator";
+import type { FilterCondition, FilterDefinition, FilterOperator } from "src/settings/settings";
+import {
+  BENCH_CORPUS,
+  BENCH_SCALE,
+  BENCH_TIMEOUT,
+  BENCH_VAULT,
+  benchRepeat,
+  collectGarbage,
+  loadVaultFrame,
+  median,
+  SYNTHETIC_START,
+  syntheticTasks,
+  timed,
+  writeResults,
+} from "./benchHarness";
+
+// Generated vaults have to be parsed by the real YAML package.
+jest.unmock("yaml");
+
+/** Runs per case; the median is reported. */
+const REPEAT = benchRepeat(3);
+
+interface CorpusCase {
+  id: string;
+  condition: FilterCondition;
+  target: number | null;
+  selectivity: number;
+  matches: number;
+  expected: { include?: string[]; exclude?: string[] };
+  note?: string;
+}
+
+interface Corpus {
+  records: number;
+  today: string;
+  cases: CorpusCase[];
+}
+
+/** "Today" of synthetic runs, so relative-date operators have fixed answers. */
+const SYNTHETIC_TODAY = "2025-03-15";
+
+type Oracle = (values: DataRecord["values"]) => boolean;
+
+const START = new Date(`${SYNTHETIC_START}T00:00:00`);
+/** Whole days from SYNTHETIC_START to a local-midnight date; undefined for anything else. */
+const dayOf = (value: unknown) =>
+  value instanceof Date ? Math.round((value.getTime() - START.getTime()) / 86_400_000) : undefined;
+/** The day number of a 2025 date, `month` counted from 1. */
+const on = (month: number, date: number) => dayOf(new Date(2025, month - 1, date))!;
+
+/**
+ * One condition per operator for `syntheticTasks`, with the expected match
+ * set worked out by plain predicates over the record values rather than by
+ * the filter engine. Dates are compared as day numbers from SYNTHETIC_START:
+ * every due date lies in 2025 (at most day 133), and SYNTHETIC_TODAY is the
+ * Saturday of the ISO week of March 10–16.
+ */
+function syntheticCases(frame: DataFrame): CorpusCase[] {
+  const today = on(3, 15);
+  const title = (test: (title: string) => boolean): Oracle => (v) => test(String(v["title"]).toLowerCase());
+  const status = (...names: string[]): Oracle => (v) => names.includes(v["status"] as string);
+  const progress = (test: (n: number) => boolean): Oracle => (v) => test(v["progress"] as number);
+  const tags = (test: (tags: string[]) => boolean): Oracle => (v) => test(v["tags"] as string[]);
+  const due = (test: (day: number) => boolean): Oracle => (v) => {
+    const day = dayOf(v["dueDate"]);
+    return day !== undefined && test(day);
+  };
+  const not = (oracle: Oracle): Oracle => (v) => !oracle(v);
+
+  const conditions: Array<[FilterOperator, string, string | undefined, Oracle]> = [
+    ["is-empty", "dueDate", undefined, not(due(() => true))],
+    ["is-not-empty", "dueDate", undefined, due(() => true)],
+    ["is", "status", "done", status("done")],
+    ["is-any-of", "status", '["todo","done"]', status("todo", "done")],
+    ["is-not", "status", "done", not(status("done"))],
+    ["contains", "title", "12", title((t) => t.includes("12"))],
+    ["not-contains", "title", "12", title((t) => !t.includes("12"))],
+    ["starts-with", "title", "task 1", title((t) => t.startsWith("task 1"))],
+    ["ends-with", "title", "7", title((t) => t.endsWith("7"))],
+    ["regex", "title", "^Task [0-9]{2}$", title((t) => /^task \d\d$/.test(t))],
+    ["eq", "progress", "50", progress((n) => n === 50)],
+    ["neq", "progress", "50", progress((n) => n !== 50)],
+    ["lt", "progress", "10", progress((n) => n < 10)],
+    ["gt", "progress", "90", progress((n) => n > 90)],
+    ["lte", "progress", "10", progress((n) => n <= 10)],
+    ["gte", "progress", "90", progress((n) => n >= 90)],
+    ["is-checked", "done", undefined, (v) => v["done"] === true],
+    ["is-not-checked", "done", undefined, (v) => v["done"] === false],
+    ["is-on", "dueDate", SYNTHETIC_TODAY, due((d) => d === today)],
+    // A missing date is "not on" any day
+    ["is-not-on", "dueDate", SYNTHETIC_TODAY, not(due((d) => d === today))],
+    ["is-before", "dueDate", SYNTHETIC_TODAY, due((d) => d < today)],
+    ["is-after", "dueDate", SYNTHETIC_TODAY, due((d) => d > today)],
+    ["is-on-and-before", "dueDate", SYNTHETIC_TODAY, due((d) => d <= today)],
+    ["is-on-and-after", "dueDate", SYNTHETIC_TODAY, due((d) => d >= today)],
+    ["is-today", "dueDate", undefined, due((d) => d === today)],
+    ["is-this-week", "dueDate", undefined, due((d) => d >= on(3, 10) && d <= on(3, 16))],
+    ["is-this-month", "dueDate", undefined, due((d) => d >= on(3, 1) && d <= on(3, 31))],
+    ["is-this-quarter", "dueDate", undefined, due((d) => d <= on(3, 31))],
+    ["is-this-year", "dueDate", undefined, due(() => true)],
+    // Rolling windows include today: the past ones end on it, the next ones start on it
+    ["is-past-week", "dueDate", undefined, due((d) => d > today - 7 && d <= today)],
+    ["is-past-month", "dueDate", undefined, due((d) => d >= on(2, 15) && d <= today)],
+    ["is-past-year", "dueDate", undefined, due((d) => d <= today)],
+    ["is-next-week", "dueDate", undefined, due((d) => d >= today && d <= today + 7)],
+    ["is-next-month", "dueDate", undefined, due((d) => d >= today && d <= on(4, 15))],
+    ["is-next-year", "dueDate", undefined, due((d) => d >= today)],
+    ["is-last-n-days", "dueDate", "30", due((d) => d > today - 30 && d <= today)],
+    ["is-next-n-days", "dueDate", "30", due((d) => d >= today && d < today + 30)],
+    ["is-overdue", "dueDate", undefined, due((d) => d < today)],
+    ["is-upcoming", "dueDate", undefined, due((d) => d >= today)],
+    ["has-any-of", "tags", '["urgent"]', tags((t) => t.includes("urgent"))],
+    ["has-all-of", "tags", '["work","home"]', tags((t) => t.includes("work") && t.includes("home"))],
+    ["has-none-of", "tags", '["blocked"]', tags((t) => !t.includes("blocked"))],
+    ["has-keyword", "tags", "rev", tags((t) => t.some((tag) => tag.includes("rev")))],
+  ];
+  return conditions.map(([operator, field, value, oracle]) => {
+    const include = frame.records.filter((record) => oracle(record.values)).map((record) => record.id);
+    return {
+      id: operator,
+      condition: { field, operator, value, enabled: true },
+      target: null,
+      selectivity: frame.records.length ? include.length / frame.records.length : 0,
+      matches: include.length,
+      expected: { include },
+    };
+  });
+}
+
+/** Record ids the expected set says should match but didn't, or vice versa. */
+function mismatches(frame: DataFrame, matched: Set<string>, expected: CorpusCase["expected"]): number {
+  if (expected.include) {
+    const include = new Set(expected.include);
+    return frame.records.filter((r) => include.has(r.id) !== matched.has(r.id)).length;
+  }
+  const exclude = new Set(expected.exclude ?? []);
+  return frame.records.filter((r) => exclude.has(r.id) === matched.has(r.id)).length;
+}
+
+describe("performance: filter operators", () => {
+  it(
+    "times applyFilter per operator and selectivity",
+    async () => {
+      const corpus: Corpus | null =
+        BENCH_VAULT && BENCH_CORPUS
+          ? (JSON.parse(fs.readFileSync(BENCH_CORPUS, "utf8")) as Corpus)
+          : null;
+      const frame = corpus
+        ? await loadVaultFrame(BENCH_VAULT)
+        : syntheticTasks(Math.round(2000 * BENCH_SCALE));
+      const cases = corpus ? corpus.cases : syntheticCases(frame);
+      const baseDate = dayjs(corpus ? corpus.today : SYNTHETIC_TODAY);
+
+      const results = [];
+      const failures: string[] = [];
+      for (const testCase of cases) {
+        const filter: FilterDefinition = { conjunction: "and", conditions: [testCase.condition] };
+        collectGarbage();
+        const runs: number[] = [];
+        let matched = new Set<string>();
+        for (let i = 0; i < REPEAT; i++) {
+          const [filtered, ms] = await timed(() => applyFilter(frame, filter, baseDate));
+          matched = new Set(filtered.records.map((record) => record.id));
+          runs.push(ms);
+        }
+        const wrong = mismatches(frame, matched, testCase.expected);
+        if (wrong > 0) {
+          failures.push(`${testCase.id}: ${wrong} record(s) differ from the ${corpus ? "corpus" : "expected set"}`);
+        }
+        const ms = median(runs);
+        results.push({
+          id: testCase.id,
+          operator: testCase.condition.operator,
+          field: testCase.condition.field,
+          target: testCase.target,
+          selectivity: frame.records.length ? matched.size / frame.records.length : 0,
+          kept: matched.size,
+          ms,
+          nsPerRecord: frame.records.length ? Math.round((ms * 1e6) / frame.records.length) : 0,
+        });
+      }
+
+      // Operator × target matrix of median milliseconds; corpus ids are
+      // "<operator>@<target>%" or "<operator>#adversarial-<n>"
+      const matrix: Record<string, Record<string, number>> = {};
+      for (const result of results) {
+        const column = result.id.split(/[@#]/)[1] ?? "all";
+        (matrix[result.operator] ??= {})[column] = result.ms;
+      }
+      writeResults("filters", {
+        source: BENCH_VAULT || "synthetic",
+        records: frame.records.length,
+        repeat: REPEAT,
+        matrix,
+        cases: results,
+      });
+
+      expect(failures).toEqual([]);
+      if (corpus) expect(frame.records).toHaveLength(corpus.records);
+    },
+    BENCH_TIMEOUT
+  );
+});
@@ -0,0 +1,321 @@
+/**
+ * Formula and auto-field benchmark — what a Dashboard render spends in
+ * `applyFormulaFields`, `applyAutoFields` and the widget pipelines behind
+ * `executeTransformCached`.
+ *
+ * With PP_BENCH_VAULT and PP_BENCH_CORPUS set (see scripts/bench-formulas.py)
+ * the records come from a generated vault and the formula fields and widgets
+ * from its `--formulas` workload (<vault>.formulas.json). Otherwise a small
+ * hand-written set covering every family runs over a synthetic frame of
+ * 2000 × PP_BENCH_SCALE records.
+ *
+ * Each formula is timed on its own, in order, on half and on all of the
+ * records, so chained formulas see the fields they depend on. Both rungs are
+ * reported with the growth exponent: ~1 is linear, ~2 means every record
+ * rescans the frame. Renders then replay the view: formula fields, auto
+ * fields and every widget's pipeline. Every PP_BENCH_EDIT_EVERY renders one
+ * record is edited and the cache invalidated, as the dataFrame store does.
+ * The transform cache hit rate comes from `getTransformCacheStats()`.
+ */
+
+import { describe, expect, it, jest } from "@jest/globals";
+import * as fs from "fs";
+import * as path from "path";
+import { applyAutoFields, type FileStat } from "src/lib/dashboard-engine/applyAutoFields";
+import { applyFormulaFields } from "src/lib/dashboard-engine/applyFormulaFields";
+import {
+  executeTransformCached,
+  getTransformCacheStats,
+  invalidateAll,
+  resetTransformCacheStats,
+} from "src/lib/dashboard-engine/transformCache";
+import type { TransformPipeline } from "src/lib/dashboard-engine/transformTypes";
+import {
+  DataFieldType,
+  type DataField,
+  type DataFrame,
+} from "src/lib/dataframe/dataframe";
+import { evaluateFormulaWithError } from "src/lib/formula/extendedEvaluator";
+import type { FormulaFieldDef } from "src/ui/views/Dashboard/types";
+import {
+  BENCH_CORPUS,
+  BENCH_SCALE,
+  BENCH_TIMEOUT,
+  BENCH_VAULT,
+  benchRepeat,
+  collectGarbage,
+  growth,
+  loadVaultFrame,
+  median,
+  percentile,
+  round,
+  syntheticTasks,
+  timed,
+  trackAllocations,
+  writeResults,
+} from "./benchHarness";
+
+// Generated vaults have to be parsed by the real YAML package.
+jest.unmock("yaml");
+
+/** Runs per formula and rung; the median is reported. */
+const REPEAT = benchRepeat(1);
+const RENDERS = Math.max(Number(process.env.PP_BENCH_RENDERS ?? "20") || 20, 1);
+/** Renders between two simulated note edits (0 = never edit). */
+const EDIT_EVERY = Math.max(Number(process.env.PP_BENCH_EDIT_EVERY ?? "5") || 0, 0);
+
+const LADDER = [0.5, 1];
+/** Records whose results are checked for evaluation errors, per formula. */
+const ERROR_SAMPLE = 200;
+
+interface FormulaSpec extends FormulaFieldDef {
+  family: string;
+  calls: number;
+  columnRefs: number;
+  dependsOn: string[];
+}
+
+interface WidgetSpec {
+  id: string;
+  type: string;
+  transform: TransformPipeline;
+}
+
+/** The parts of a `--formulas` workload (<vault>.formulas.json) used here. */
+interface FormulaWorkload {
+  records: number;
+  formulas: FormulaSpec[];
+  dashboard: { formulaFields: FormulaFieldDef[]; widgets: WidgetSpec[] };
+}
+
+/** One or two formulas per family, as `--formulas` would write them. */
+function syntheticWorkload(records: number): FormulaWorkload {
+  const spec = (name: string, family: string, expression: string, resultType: FormulaFieldDef["resultType"], dependsOn: string[] = []): FormulaSpec => ({
+    name,
+    family,
+    expression,
+    resultType,
+    calls: (expression.match(/[A-Z][A-Z_]*\(/g) ?? []).length,
+    columnRefs: (expression.match(/@/g) ?? []).length,
+    dependsOn,
+  });
+  const formulas = [
+    spec("fx_math_00", "math", "ROUND(progress * 1.5, 2)", "number"),
+    spec("fx_math_01", "math", "MAX(progress, fx_math_00, 10)", "number", ["fx_math_00"]),
+    spec("fx_date_02", "date", 'DATE_BETWEEN(startDate, dueDate, "day")', "number"),
+    spec("fx_date_03", "date", 'DATE_ADD(startDate, ROUND(progress / 10, 0), "day")', "date"),
+    spec("fx_date_04", "date", "WORKDAYS(startDate, dueDate)", "number"),
+    spec("fx_string_05", "string", 'JOIN(" · ", UPPER(status), LEFT(title, 12))', "string"),
+    spec("fx_string_06", "string", 'REGEX_MATCH(title, "^Task [0-4]")', "boolean"),
+    spec("fx_rollup_07", "rollup", "(progress) / MAX(@progress)", "number"),
+    spec("fx_rollup_08", "rollup", "(progress > AVG(@progress))", "boolean"),
+    spec("fx_logic_09", "logic", "IF(AND(fx_rollup_08, (fx_date_02 > 7)), fx_math_01, IFBLANK(fx_date_04, 0))", "number",
+      ["fx_date_02", "fx_date_04", "fx_math_01", "fx_rollup_08"]),
+  ];
+  const byName = new Map(formulas.map((f) => [f.name, f]));
+  const withDependencies = (names: string[]) => {
+    const needed = new Set<string>();
+    const pending = [...names];
+    while (pending.length) {
+      const name = pending.pop()!;
+      if (!needed.has(name)) {
+        needed.add(name);
+        pending.push(...byName.get(name)!.dependsOn);
+      }
+    }
+    return formulas.filter((f) => needed.has(f.name)).map((f) => ({ name: f.name, expression: f.expression }));
+  };
+  return {
+    records,
+    formulas,
+    dashboard: {
+      formulaFields: formulas.map(({ name, expression, resultType }) => ({ name, expression, resultType })),
+      widgets: [
+        { id: "table", type: "data-table", transform: { steps: [{ type: "compute", columns: withDependencies(["fx_logic_09", "fx_string_05"]) }] } },
+        {
+          id: "chart",
+          type: "chart",
+          transform: {
+            steps: [
+              { type: "compute", columns: withDependencies(["fx_date_02"]) },
+              { type: "group-by", fields: ["status"] },
+              { type: "aggregate", columns: [{ sourceField: "fx_date_02", outputName: "fx_date_02_sum", function: "SUM" }] },
+            ],
+          },
+        },
+      ],
+    },
+  };
+}
+
+/** `created`/`modified` AutoTime fields, as a Database view adds them. */
+function withAutoFields(frame: DataFrame): DataFrame {
+  const autoTime = (name: string, source: "created" | "modified"): DataField => ({
+    name,
+    type: DataFieldType.AutoTime,
+    identifier: false,
+    derived: false,
+    repeated: false,
+    typeConfig: { autoTime: source },
+  });
+  return { ...frame, fields: [...frame.fields, autoTime("created", "created"), autoTime("modified", "modified")] };
+}
+
+/** File stats per record: from disk for a vault, derived from the index otherwise. */
+function fileStats(frame: DataFrame): Map<string, FileStat> {
+  const stats = new Map<string, FileStat>();
+  frame.records.forEach((record, i) => {
+    if (BENCH_VAULT) {
+      const stat = fs.statSync(path.join(BENCH_VAULT, record.id));
+      stats.set(record.id, { ctime: stat.birthtimeMs || stat.ctimeMs, mtime: stat.mtimeMs });
+    } else {
+      stats.set(record.id, { ctime: Date.UTC(2025, 0, 1) + i * 60_000, mtime: Date.UTC(2025, 6, 1) + i * 60_000 });
+    }
+  });
+  return stats;
+}
+
+/** The frame after a note edit: one record replaced, like dataFrame.updateRecord. */
+function editRecord(frame: DataFrame, edit: number): DataFrame {
+  if (frame.records.length === 0) return frame;
+  const index = (edit * 7919) % frame.records.length;
+  const records = [...frame.records];
+  const record = records[index]!;
+  const progress = record.values["progress"];
+  records[index] = {
+    ...record,
+    values: { ...record.values, progress: typeof progress === "number" ? (progress + 1) % 101 : edit },
+  };
+  return { ...frame, records };
+}
+
+describe("performance: formula fields and transform cache", () => {
+  it(
+    "times every formula per rung and replays renders through the transform cache",
+    async () => {
+      const workload: FormulaWorkload | null =
+        BENCH_VAULT && BENCH_CORPUS
+          ? (JSON.parse(fs.readFileSync(BENCH_CORPUS, "utf8")) as FormulaWorkload)
+          : null;
+      const frame = workload
+        ? await loadVaultFrame(BENCH_VAULT)
+        : syntheticTasks(Math.round(2000 * BENCH_SCALE));
+      const { formulas, dashboard } = workload ?? syntheticWorkload(frame.records.length);
+
+      // Per formula, in order, on each rung
+      const rungs = LADDER.map((share) => Math.max(1, Math.ceil(frame.records.length * share)));
+      const timings = new Map<string, number[]>();
+      let evaluated = frame;
+      for (const size of rungs) {
+        let current: DataFrame = { ...frame, records: frame.records.slice(0, size) };
+        for (const formula of formulas) {
+          collectGarbage();
+          const runs: number[] = [];
+          let next = current;
+          for (let i = 0; i < REPEAT; i++) {
+            [next, runs[i]] = await timed(() => applyFormulaFields(current, [formula]));
+          }
+          current = next;
+          const list = timings.get(formula.name) ?? [];
+          list.push(median(runs));
+          timings.set(formula.name, list);
+        }
+        evaluated = current;
+      }
+
+      const results = formulas.map((formula) => {
+        const ms = timings.get(formula.name)!;
+        const top = ms[ms.length - 1]!;
+        let errors = 0;
+        let nulls = 0;
+        for (const record of evaluated.records.slice(0, ERROR_SAMPLE)) {
+          if (evaluateFormulaWithError(formula.expression, record, frame).error) errors++;
+        }
+        for (const record of evaluated.records) {
+          if (record.values[formula.name] == null) nulls++;
+        }
+        return {
+          name: formula.name,
+          family: formula.family,
+          resultType: formula.resultType,
+          calls: formula.calls,
+          columnRefs: formula.columnRefs,
+          dependsOn: formula.dependsOn,
+          ms,
+          nsPerRecord: Math.round((top * 1e6) / Math.max(evaluated.records.length, 1)),
+          growth: growth(ms[0]!, top, rungs[rungs.length - 1]! / rungs[0]!),
+          nullRate: evaluated.records.length ? round(nulls / evaluated.records.length, 3) : 0,
+          errors,
+          expression: formula.expression,
+        };
+      });
+
+      // All formula fields at once, then auto fields, as a render does
+      collectGarbage();
+      const allocations = trackAllocations();
+      const [withFormulas, formulaMs] = await timed(() => applyFormulaFields(frame, dashboard.formulaFields));
+      const { allocatedMb, peakMb } = allocations.stop();
+      const stats = fileStats(frame);
+      const autoFrame = withAutoFields(withFormulas);
+      const [, autoMs] = await timed(() => applyAutoFields(autoFrame, (id) => stats.get(id) ?? null));
+
+      // Renders through the transform cache, with periodic edits
+      invalidateAll();
+      resetTransformCacheStats();
+      let source = frame;
+      let edits = 0;
+      const renders: Array<{ render: number; edited: boolean; formulaMs: number; autoMs: number; widgetsMs: number; ms: number }> = [];
+      for (let render = 0; render < RENDERS; render++) {
+        const edited = EDIT_EVERY > 0 && render > 0 && render % EDIT_EVERY === 0;
+        if (edited) {
+          invalidateAll();
+          source = editRecord(source, edits++);
+        }
+        const [viewFrame, formulaPass] = await timed(() => applyFormulaFields(source, dashboard.formulaFields));
+        const [, autoPass] = await timed(() => applyAutoFields(withAutoFields(viewFrame), (id) => stats.get(id) ?? null));
+        const [, widgetsMs] = await timed(() => {
+          for (const widget of dashboard.widgets) executeTransformCached(source, widget.transform);
+        });
+        renders.push({
+          render,
+          edited,
+          formulaMs: formulaPass,
+          autoMs: autoPass,
+          widgetsMs,
+          ms: round(formulaPass + autoPass + widgetsMs),
+        });
+      }
+      const cache = getTransformCacheStats();
+      const lookups = cache.hits + cache.misses;
+
+      writeResults("formulas", {
+        source: BENCH_VAULT || "synthetic",
+        records: frame.records.length,
+        rungs,
+        repeat: REPEAT,
+        formulas: results,
+        pass: { formulas: dashboard.formulaFields.length, formulaMs, autoMs, allocatedMb, peakMb },
+        renders: {
+          count: RENDERS,
+          editEvery: EDIT_EVERY,
+          widgets: dashboard.widgets.length,
+          p50Ms: percentile(renders.map((r) => r.ms), 0.5),
+          p95Ms: percentile(renders.map((r) => r.ms), 0.95),
+          timeline: renders,
+        },
+        transformCache: { ...cache, hitRate: lookups ? round(cache.hits / lookups, 3) : null },
+      });
+
+      expect(results.filter((r) => r.errors > 0).map((r) => r.name)).toEqual([]);
+      expect(withFormulas.fields.length).toBeGreaterThanOrEqual(frame.fields.length);
+      expect(lookups).toBe(RENDERS * dashboard.widgets.length);
+      if (!workload) {
+        // Two widgets fit the cache: every render after a miss is a hit
+        expect(cache.misses).toBe(dashboard.widgets.length * (1 + edits));
+      } else {
+        expect(frame.records).toHaveLength(workload.records);
+      }
+    },
+    BENCH_TIMEOUT
+  );
+});
@@ -0,0 +1,187 @@
+/**
+ * Vault ingestion benchmark — folder/frontmatter datasources and the
+ * FrontmatterReader, driven headlessly.
+ *
+ * Runs the real parse path (decodeFrontMatter → standardizeRecord →
+ * detectSchema → parseRecords) over an InMemFileSystem. With PP_BENCH_VAULT
+ * set (see scripts/bench-ingestion.py) the notes come from a generated vault
+ * on disk; otherwise a small synthetic vault keeps the suite CI-sized.
+ */
+
+import { describe, expect, it, jest } from "@jest/globals";
+import { array as A, either as E } from "fp-ts";
+import type { App, TFile } from "obsidian";
+import { FolderDataSource } from "src/lib/datasources/folder/datasource";
+import {
+  detectSchema,
+  standardizeRecords,
+} from "src/lib/datasources/frontmatter/datasource";
+import { parseRecords } from "src/lib/datasources/helpers";
+import { InMemFileSystem } from "src/lib/filesystem/inmem/filesystem";
+import { createFrontmatterReader } from "src/lib/frontmatter/reader";
+import { decodeFrontMatter } from "src/lib/metadata";
+import type {
+  ProjectDefinition,
+  ProjectsPluginPreferences,
+} from "src/settings/settings";
+import {
+  BENCH_SCALE,
+  BENCH_TIMEOUT,
+  BENCH_VAULT,
+  collectGarbage,
+  heapTracker,
+  heapUsedMb,
+  observeGc,
+  readVault,
+  timed,
+  type VaultNote,
+  writeResults,
+} from "./benchHarness";
+
+// src/__mocks__/yaml.js is a subset parser for unit tests; ingestion cost
+// has to be measured against the real one.
+jest.unmock("yaml");
+
+const prefs: ProjectsPluginPreferences = {
+  projectSizeLimit: Number.MAX_SAFE_INTEGER,
+  frontmatter: { quoteStrings: "PLAIN" },
+  locale: { firstDayOfWeek: "monday" },
+  commands: [],
+  linkBehavior: "open-editor",
+  mobileCalendarView: "month",
+  showViewTitles: true,
+  animationBehavior: "smooth",
+  disableHapticFeedback: false,
+  replaceObsidianProperties: false,
+};
+
+const project: ProjectDefinition = {
+  name: "Bench",
+  id: "bench",
+  fieldConfig: {},
+  views: [],
+  defaultName: "",
+  templates: [],
+  excludedNotes: [],
+  isDefault: false,
+  newNotesFolder: "",
+  dataSource: { kind: "folder", config: { path: "/", recursive: true } },
+};
+
+const STATUSES = ["todo", "in-progress", "done"];
+
+/** Deterministic stand-in for a generated vault (1000 notes × PP_BENCH_SCALE). */
+function syntheticVault(count: number): VaultNote[] {
+  const notes: VaultNote[] = [];
+  for (let i = 0; i < count; i++) {
+    const day = String((i % 28) + 1).padStart(2, "0");
+    notes.push({
+      path: `Tasks/Task ${i}.md`,
+      content: [
+        "---",
+        `title: Task ${i}`,
+        `status: ${STATUSES[i % STATUSES.length]}`,
+        `dueDate: 2025-03-${day}`,
+        `progress: ${(i * 7) % 101}`,
+        `done: ${i % 2 === 0}`,
+        "tags:",
+        "  - task",
+        `  - area-${i % 12}`,
+        `owner: "[[Person ${i % 50}]]"`,
+        "---",
+        "",
+        `# Task ${i}`,
+        "",
+        "- [ ] Prepare",
+        "",
+      ].join("\n"),
+    });
+  }
+  return notes;
+}
+
+describe("performance: vault ingestion", () => {
+  it(
+    "parses, builds and reads the vault",
+    async () => {
+      const gc = observeGc();
+      const heap = heapTracker();
+
+      const [notes, loadMs] = await timed(() =>
+        BENCH_VAULT ? readVault(BENCH_VAULT) : syntheticVault(Math.round(1000 * BENCH_SCALE))
+      );
+      const fileSystem = new InMemFileSystem({});
+      for (const note of notes) {
+        await fileSystem.create(note.path, note.content);
+      }
+      const files = fileSystem.getAllFiles();
+      const bytes = notes.reduce((sum, note) => sum + note.content.length, 0);
+      heap.sample();
+
+      collectGarbage();
+      const [standardized, parseMs] = await timed(() => standardizeRecords(files));
+      heap.sample();
+      const { left: failed, right: records } = A.separate(standardized);
+      const errors = failed.length;
+
+      const [frame, buildMs] = await timed(() => {
+        const fields = detectSchema(records);
+        return { fields, records: parseRecords(records, fields) };
+      });
+      heap.sample();
+
+      collectGarbage();
+      const source = new FolderDataSource(fileSystem, project, prefs);
+      const [queried, queryAllMs] = await timed(() => source.queryAll());
+      heap.sample();
+
+      // FrontmatterReader reads Obsidian's metadataCache; feed it the parsed
+      // frontmatter the cache would hold so only decodeValue is measured.
+      const cache = new Map<string, Record<string, unknown>>();
+      for (const note of notes) {
+        const fm = decodeFrontMatter(note.content);
+        cache.set(note.path, E.isRight(fm) ? fm.right : {});
+      }
+      const app = {
+        metadataCache: {
+          getFileCache: (file: TFile) => ({ frontmatter: cache.get(file.path) }),
+        },
+      } as unknown as App;
+      const reader = createFrontmatterReader(app);
+      const [readCount, readerMs] = await timed(async () => {
+        let n = 0;
+        for (const note of notes) {
+          const values = await reader.read({ path: note.path } as TFile);
+          n += Object.keys(values).length > 0 ? 1 : 0;
+        }
+        return n;
+      });
+      heap.sample();
+
+      const results = {
+        source: BENCH_VAULT || "synthetic",
+        notes: notes.length,
+        megabytes: Math.round((bytes / 1e6) * 100) / 100,
+        fields: frame.fields.length,
+        errors,
+        loadMs,
+        parseMs,
+        buildMs,
+        queryAllMs,
+        readerMs,
+        heapPeakMb: heap.peakMb(),
+        heapAfterMb: heapUsedMb(),
+        gc: gc.stop(),
+      };
+      writeResults("ingestion", results);
+
+      expect(frame.records).toHaveLength(records.length);
+      expect(queried.records).toHaveLength(records.length);
+      expect(readCount).toBeGreaterThan(0);
+      if (!BENCH_VAULT) {
+        expect(errors).toBe(0);
+      }
+    },
+    BENCH_TIMEOUT
+  );
+});
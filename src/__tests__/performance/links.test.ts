@@ -0,0 +1,304 @@
+/**
+ * Wikilink benchmark — link extraction and basename-to-path resolution per
+ * million links, plus the growth of the wikilink regular expressions on
+ * pathological inputs.
+ *
+ * With PP_BENCH_CORPUS set to a `generate-test-files.py link-corpus` file
+ * (see scripts/bench-links.py) the notes and link values come from it.
+ * Otherwise a synthetic corpus of 2000 × PP_BENCH_SCALE notes with the same
+ * features is used: exotic names, duplicate basenames, case collisions,
+ * aliases, anchors and folder-qualified links.
+ *
+ * Every extractor runs over every value. It is timed and its output is
+ * compared with the bodies the corpus expects, so differences in link
+ * semantics show up next to the cost. Resolution runs the basename index of
+ * the dashboard resolver and the inverse index with an Obsidian-like
+ * linkpath resolver. Each link is counted as resolved to the intended note,
+ * to another note, or not at all. Pathological inputs grow until one call
+ * takes longer than PP_BENCH_PATHOLOGICAL_MS.
+ */
+
+import { describe, expect, it } from "@jest/globals";
+import * as fs from "fs";
+import type { DataFrame } from "src/lib/dataframe/dataframe";
+import { buildRecordIndex } from "src/lib/dashboard-engine/relationResolver";
+import { normalizeRelationValue } from "src/lib/engine/crossProjectResolver";
+import { extractWikilinks, parseWikilink } from "src/lib/engine/wikilink";
+import { buildInverseIndex, lookupInverse } from "src/lib/relations/inverseIndex";
+import { parseRelationLinks } from "src/lib/relations/parseRelationLinks";
+import {
+  BENCH_CORPUS,
+  BENCH_SCALE,
+  BENCH_TIMEOUT,
+  benchRepeat,
+  collectGarbage,
+  growth,
+  median,
+  round,
+  writeResults,
+} from "./benchHarness";
+
+/** Passes per extractor; the median is reported. */
+const REPEAT = benchRepeat(3);
+/** A pathological input stops growing once one call takes this long. */
+const PATHOLOGICAL_MS = Math.max(Number(process.env.PP_BENCH_PATHOLOGICAL_MS ?? "500") || 500, 1);
+
+interface LinkValue {
+  shape: "single" | "list" | "inline" | "plain";
+  value: string | string[];
+  /** Bodies an extractor should return: no brackets, alias or anchor. */
+  links: string[];
+  /** Indices into `notes` of the intended targets. */
+  targets: number[];
+}
+
+/** The parts of a `link-corpus` file used here. */
+interface LinkCorpus {
+  notes: Array<{ path: string; name: string }>;
+  values: LinkValue[];
+  lengths: number[];
+  pathological: Array<{ name: string; prefix: string; unit: string; suffix: string }>;
+}
+
+const WORDS = ["Quarterly", "Review", "Планёрка", "Отчёт", "会議", "計画", "Café", "Überblick", "🚀", "Draft"];
+const SEPARATORS = [" ", " - ", " (", ") ", "'", " & ", ". ", " @"];
+const FOLDERS = ["Projects", "Archive", "Areas/Личное", "Wiki/参考"];
+const PATHOLOGICAL = [
+  { name: "unclosed-openers", prefix: "", unit: "[[", suffix: "" },
+  { name: "unclosed-body", prefix: "[[", unit: "a", suffix: "" },
+  { name: "alias-pipes", prefix: "[[a", unit: "|", suffix: "]" },
+  { name: "anchor-hashes", prefix: "[[a", unit: "#", suffix: "|b]" },
+  { name: "alias-chain", prefix: "[[", unit: "a|", suffix: "]]x" },
+];
+
+/** mulberry32: a small seeded PRNG so the synthetic corpus is stable. */
+function prng(seed: number): () => number {
+  let state = seed >>> 0;
+  return () => {
+    state = (state + 0x6d2b79f5) >>> 0;
+    let t = state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+/** A smaller `link-corpus`: same shapes, fewer scripts and separators. */
+function syntheticCorpus(count: number): LinkCorpus {
+  const random = prng(42);
+  const pick = <T>(items: readonly T[]): T => items[Math.floor(random() * items.length)]!;
+  const notes: LinkCorpus["notes"] = [];
+  for (let i = 0; i < count; i++) {
+    const original = notes.length > 0 && random() < 0.1 ? pick(notes) : undefined;
+    const name = original
+      ? random() < 0.3 ? original.name.toUpperCase() : original.name
+      : `${pick(WORDS)}${pick(SEPARATORS)}${pick(WORDS)} ${i}`;
+    const folders = FOLDERS.filter((f) => !original || !original.path.startsWith(`${f}/`));
+    notes.push({ path: `${pick(folders)}/${name}.md`, name });
+  }
+  const counts = new Map<string, number>();
+  for (const note of notes) counts.set(note.name, (counts.get(note.name) ?? 0) + 1);
+
+  const values: LinkValue[] = [];
+  for (let v = 0; v < count * 2; v++) {
+    const shape = pick(["single", "single", "list", "list", "inline", "plain"] as const);
+    const targets = Array.from({ length: shape === "single" ? 1 : 1 + Math.floor(random() * 6) }, () =>
+      Math.floor(random() * notes.length)
+    );
+    if (shape === "plain") {
+      const links = targets.map((t) => notes[t]!.name);
+      values.push({ shape, value: links.join(", "), links, targets });
+      continue;
+    }
+    const links: string[] = [];
+    const markups = targets.map((t) => {
+      const note = notes[t]!;
+      const body = counts.get(note.name)! > 1 && random() < 0.8 ? note.path.slice(0, -3) : note.name;
+      links.push(body);
+      const anchor = random() < 0.2 ? "#Summary" : "";
+      const alias = random() < 0.3 ? "|Отчёт" : "";
+      return `[[${body}${anchor}${alias}]]`;
+    });
+    const value = shape === "list" ? markups : shape === "inline" ? `See ${markups.join(" and ")}.` : markups[0]!;
+    values.push({ shape, value, links, targets });
+  }
+  return { notes, values, lengths: [32, 128, 512], pathological: PATHOLOGICAL };
+}
+
+function sameLinks(actual: string[], expected: string[]): boolean {
+  return actual.length === expected.length && actual.every((link, i) => link === expected[i]);
+}
+
+/** Each extractor as its callers apply it to a frontmatter value. */
+const EXTRACTORS: Record<string, (value: string | string[]) => string[]> = {
+  extractWikilinks: (value) => (Array.isArray(value) ? value.flatMap((item) => extractWikilinks(item)) : extractWikilinks(value)),
+  parseRelationLinks: (value) => parseRelationLinks(value),
+  normalizeRelationValue: (value) => normalizeRelationValue(value),
+  parseWikilink: (value) =>
+    (Array.isArray(value) ? value : [value]).flatMap((item) => {
+      const target = parseWikilink(item);
+      return target ? [target.path] : [];
+    }),
+};
+
+/**
+ * Stand-in for `metadataCache.getFirstLinkpathDest`: a path-qualified link
+ * matches the path, a bare one the basename, case-insensitively. Repeated
+ * basenames prefer the source's folder, then the shortest path.
+ */
+function linkpathResolver(notes: LinkCorpus["notes"]): (linktext: string, sourcePath: string) => string | null {
+  const byPath = new Map<string, string>();
+  const byName = new Map<string, string[]>();
+  for (const { path, name } of notes) {
+    byPath.set(path.slice(0, -3).toLowerCase(), path);
+    const paths = byName.get(name.toLowerCase());
+    if (paths) paths.push(path);
+    else byName.set(name.toLowerCase(), [path]);
+  }
+  for (const paths of byName.values()) paths.sort((a, b) => a.length - b.length || (a < b ? -1 : 1));
+  return (linktext, sourcePath) => {
+    const key = linktext.replace(/\.md$/i, "").toLowerCase();
+    if (key.includes("/")) return byPath.get(key) ?? null;
+    const paths = byName.get(key);
+    if (!paths) return null;
+    const folder = sourcePath.slice(0, sourcePath.lastIndexOf("/") + 1);
+    return paths.find((p) => p.startsWith(folder) && !p.slice(folder.length).includes("/")) ?? paths[0]!;
+  };
+}
+
+describe("performance: wikilink extraction and resolution", () => {
+  it(
+    "times extraction and resolution per million links and grows pathological inputs",
+    () => {
+      const corpus: LinkCorpus = BENCH_CORPUS
+        ? (JSON.parse(fs.readFileSync(BENCH_CORPUS, "utf8")) as LinkCorpus)
+        : syntheticCorpus(Math.round(2000 * BENCH_SCALE));
+      const { notes, values } = corpus;
+      const totalLinks = values.reduce((sum, v) => sum + v.links.length, 0);
+
+      // Extraction: every extractor over every value
+      const extraction = [];
+      for (const [name, extract] of Object.entries(EXTRACTORS)) {
+        const runs: number[] = [];
+        let outputs: string[][] = [];
+        for (let run = 0; run < REPEAT; run++) {
+          collectGarbage();
+          const start = performance.now();
+          outputs = values.map((v) => extract(v.value));
+          runs.push(performance.now() - start);
+        }
+        const ms = median(runs);
+        const differing: Record<string, number> = {};
+        outputs.forEach((links, i) => {
+          const value = values[i]!;
+          if (!sameLinks(links.map((l) => l.trim()), value.links)) {
+            differing[value.shape] = (differing[value.shape] ?? 0) + 1;
+          }
+        });
+        extraction.push({
+          name,
+          ms: round(ms, 3),
+          msPerMillionLinks: totalLinks ? round((ms / totalLinks) * 1e6, 3) : null,
+          linksPerSec: ms > 0 ? Math.round((totalLinks / ms) * 1000) : null,
+          differing,
+        });
+      }
+
+      // Resolution through the dashboard's basename index
+      const frame: DataFrame = { fields: [], records: notes.map((n) => ({ id: n.path, values: {} })) };
+      collectGarbage();
+      let start = performance.now();
+      const index = buildRecordIndex(frame);
+      const indexMs = performance.now() - start;
+      const recordIndex = { intended: 0, other: 0, unresolved: 0, ms: 0 };
+      start = performance.now();
+      for (const value of values) {
+        value.links.forEach((body, i) => {
+          const hit = index.get(body.toLowerCase());
+          if (!hit) recordIndex.unresolved++;
+          else if (hit.id === notes[value.targets[i]!]!.path) recordIndex.intended++;
+          else recordIndex.other++;
+        });
+      }
+      recordIndex.ms = round(performance.now() - start, 3);
+
+      // Resolution through the inverse index: value i is the `links` of a
+      // note of its own, next to note i so folder preference applies
+      const sources = values
+        .map((value, i) => ({ value, path: notes[i % notes.length]!.path.replace(/\.md$/, ` ${i}.md`) }))
+        .filter(({ value }) => value.shape === "single" || value.shape === "list");
+      const resolver = linkpathResolver(notes);
+      collectGarbage();
+      start = performance.now();
+      const inverse = buildInverseIndex(
+        sources.map(({ value, path }) => ({ path, frontmatter: { links: value.value } })),
+        { resolveLinkPath: resolver }
+      );
+      const inverseMs = performance.now() - start;
+      const inverseLinks = { intended: 0, other: 0, unresolved: 0 };
+      for (const { value, path } of sources) {
+        value.targets.forEach((target, i) => {
+          const resolved = resolver(value.links[i]!, path);
+          if (!resolved) inverseLinks.unresolved++;
+          else if (lookupInverse(inverse, notes[target]!.path).some((e) => e.sourcePath === path)) inverseLinks.intended++;
+          else inverseLinks.other++;
+        });
+      }
+      const sourceLinks = sources.reduce((sum, s) => sum + s.value.links.length, 0);
+
+      // Pathological inputs: grow each until one call exceeds the budget
+      const pathological = [];
+      for (const recipe of corpus.pathological) {
+        for (const [name, extract] of Object.entries(EXTRACTORS)) {
+          const rungs: Array<{ length: number; ms: number }> = [];
+          for (const length of corpus.lengths) {
+            const input = recipe.prefix + recipe.unit.repeat(length) + recipe.suffix;
+            const t0 = performance.now();
+            extract(input);
+            const ms = performance.now() - t0;
+            rungs.push({ length, ms: round(ms, 3) });
+            if (ms > PATHOLOGICAL_MS) break;
+          }
+          const last = rungs[rungs.length - 1]!;
+          const before = rungs[rungs.length - 2];
+          pathological.push({
+            input: recipe.name,
+            extractor: name,
+            rungs,
+            growth: before ? growth(before.ms, last.ms, last.length / before.length) : null,
+            overBudget: last.ms > PATHOLOGICAL_MS,
+          });
+        }
+      }
+
+      writeResults("links", {
+        source: BENCH_CORPUS || "synthetic",
+        notes: notes.length,
+        values: values.length,
+        links: totalLinks,
+        extraction,
+        resolution: {
+          recordIndex: {
+            buildMs: round(indexMs, 3),
+            lookupMsPerMillionLinks: totalLinks ? round((recordIndex.ms / totalLinks) * 1e6, 3) : null,
+            ...recordIndex,
+          },
+          inverseIndex: {
+            buildMs: round(inverseMs, 3),
+            msPerMillionLinks: sourceLinks ? round((inverseMs / sourceLinks) * 1e6, 3) : null,
+            links: sourceLinks,
+            ...inverseLinks,
+          },
+        },
+        pathologicalBudgetMs: PATHOLOGICAL_MS,
+        pathological,
+      });
+
+      expect(extraction).toHaveLength(Object.keys(EXTRACTORS).length);
+      expect(recordIndex.intended + recordIndex.other + recordIndex.unresolved).toBe(totalLinks);
+      // The canonical extractor returns exactly the bodies written in brackets
+      expect(extraction[0]!.differing["list"] ?? 0).toBe(0);
+    },
+    BENCH_TIMEOUT
+  );
+});
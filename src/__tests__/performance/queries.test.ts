@@ -0,0 +1,522 @@
+/**
+ * Query benchmark — per-query latency percentiles of native queries and of
+ * the Dataview bridge, on cold and warm runs.
+ *
+ * With PP_BENCH_VAULT and PP_BENCH_CORPUS set (see scripts/bench-queries.py)
+ * the notes come from a `--query-workload` vault and the suite from its
+ * <vault>.queries.json. Otherwise a synthetic vault of 2000 × PP_BENCH_SCALE
+ * items with the same fields runs a smaller suite.
+ *
+ * Native queries run the real path: `executeNativeQuery` over an
+ * InMemFileSystem (folder/tag source → applyFilter → applySort →
+ * applyLimit), the relation join through `enrichFrameWithRelations` with the
+ * project filter as the target sub-base, and `groupRecords`. Joined queries
+ * filter, then sort and limit, as DQL does.
+ *
+ * The Dataview engine needs a running Obsidian, so the Dataview side is
+ * measured from the plugin's end: the result Dataview would hand back
+ * (TABLE rows with Link and DateTime-like values, or TASK list items) is
+ * built from the vault beforehand. Only `DataviewDataSource.queryAll()` is
+ * timed: standardizeValues → detectSchema → parseRecords. Queries over
+ * inline fields or tasks exist only on this side; the native sources read
+ * frontmatter only.
+ *
+ * A cold round loads the vault into a new file system and runs every query
+ * once. The first round also pays for JIT warm-up. PP_BENCH_COLD_RUNS
+ * rounds are followed by PP_BENCH_WARM_RUNS runs of every query on the last
+ * file system.
+ */
+
+import { describe, expect, it, jest } from "@jest/globals";
+import * as fs from "fs";
+import type { DataFrame, DataRecord, DataValue, Optional } from "src/lib/dataframe/dataframe";
+import { DataviewDataSource } from "src/lib/datasources/dataview/datasource";
+import {
+  applyLimit,
+  applySort,
+  executeNativeQuery,
+  type NativeQuery,
+  type NativeQuerySource,
+} from "src/lib/datasources/native-query";
+import { derivedFieldName, enrichFrameWithRelations } from "src/lib/engine/crossProjectResolver";
+import { applyFilter } from "src/lib/engine/filterEvaluator";
+import { InMemFileSystem } from "src/lib/filesystem/inmem/filesystem";
+import type { FilterDefinition, SortDefinition } from "src/settings/base/settings";
+import type {
+  ProjectDefinition,
+  ProjectsPluginPreferences,
+} from "src/settings/settings";
+import { groupRecords } from "src/ui/views/Dashboard/widgets/DatabaseCall/groupRows";
+import {
+  BENCH_CORPUS,
+  BENCH_SCALE,
+  BENCH_TIMEOUT,
+  BENCH_VAULT,
+  collectGarbage,
+  percentile,
+  readVault,
+  round,
+  type VaultNote,
+  writeResults,
+} from "./benchHarness";
+
+// Generated vaults have to be parsed by the real YAML package.
+jest.unmock("yaml");
+
+const COLD_RUNS = Math.max(Number(process.env.PP_BENCH_COLD_RUNS ?? "3") || 3, 1);
+const WARM_RUNS = Math.max(Number(process.env.PP_BENCH_WARM_RUNS ?? "10") || 10, 1);
+const ID_COLUMN = "File";
+
+const prefs: ProjectsPluginPreferences = {
+  projectSizeLimit: Number.MAX_SAFE_INTEGER,
+  frontmatter: { quoteStrings: "PLAIN" },
+  locale: { firstDayOfWeek: "monday" },
+  commands: [],
+  linkBehavior: "open-editor",
+  mobileCalendarView: "month",
+  showViewTitles: true,
+  animationBehavior: "smooth",
+  disableHapticFeedback: false,
+  replaceObsidianProperties: false,
+};
+
+/** One entry of <vault>.queries.json (see QUERY WORKLOAD in the generator). */
+interface QuerySpec {
+  name: string;
+  family: string;
+  expected: number;
+  from: NativeQuerySource;
+  where: FilterDefinition | null;
+  join: { field: string; from: NativeQuerySource; where: FilterDefinition } | null;
+  sort: SortDefinition | null;
+  limit: number | null;
+  groupBy: string | null;
+  columns: string[];
+  native: boolean;
+  dataview: "table" | "task";
+  dql: string;
+}
+
+interface QueryWorkload {
+  today: string;
+  items: number;
+  queries: QuerySpec[];
+}
+
+interface Latency {
+  p50Ms: number;
+  p95Ms: number;
+  p99Ms: number;
+  maxMs: number;
+}
+
+const STATUSES = ["todo", "doing", "review", "done", "blocked"];
+const PRIORITIES = ["low", "medium", "high", "urgent"];
+const AREAS = ["Engineering", "Design", "Marketing", "Sales"];
+
+/** mulberry32: a small seeded PRNG so the synthetic vault is stable. */
+function prng(seed: number): () => number {
+  let state = seed >>> 0;
+  return () => {
+    state = (state + 0x6d2b79f5) >>> 0;
+    let t = state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+const condition = (field: string, operator: string, value?: string) =>
+  ({ field, operator, value, enabled: true }) as FilterDefinition["conditions"][number];
+
+/** A `--query-workload` vault in miniature, with a suite of one query per family. */
+function syntheticWorkload(items: number): { notes: VaultNote[]; workload: QueryWorkload } {
+  const random = prng(7);
+  const pick = <T>(values: readonly T[]): T => values[Math.floor(random() * values.length)]!;
+  const today = "2025-03-15";
+  const day = (offset: number) => new Date(Date.parse(today) + offset * 86_400_000).toISOString().slice(0, 10);
+  const projects = Math.max(1, Math.round(items / 100));
+  const notes: VaultNote[] = [];
+  for (let p = 0; p < projects; p++) {
+    notes.push({
+      path: `Projects/Project ${p}.md`,
+      content: `---\ntitle: Project ${p}\ntype: project\nstatus: ${p % 3 === 0 ? "paused" : "active"}\ntags:\n  - project\n---\n`,
+    });
+  }
+  for (let i = 0; i < items; i++) {
+    const area = AREAS[i % AREAS.length]!;
+    const tag = `q/${area.toLowerCase()}`;
+    const tasks = Array.from({ length: Math.floor(random() * 4) }, () =>
+      `- [${random() < 0.4 ? "x" : " "}] Step [due:: ${day(Math.floor(random() * 361) - 180)}] [priority:: ${pick(PRIORITIES)}] #${tag}`
+    );
+    notes.push({
+      path: `Work/${area}/Item ${i}.md`,
+      content: [
+        "---",
+        `title: Item ${i}`,
+        `status: ${pick(STATUSES)}`,
+        `priority: ${pick(PRIORITIES)}`,
+        `score: ${Math.floor(random() * 10_000)}`,
+        `due: ${day(Math.floor(random() * 361) - 180)}`,
+        `project: "[[Project ${Math.floor(random() * projects)}]]"`,
+        "tags:",
+        `  - ${tag}`,
+        "---",
+        "",
+        `effort:: ${pick([1, 2, 3, 5, 8, 13])}`,
+        "",
+        ...tasks,
+        "",
+      ].join("\n"),
+    });
+  }
+  const work: NativeQuerySource = { kind: "folder", path: "Work", recursive: true };
+  const spec = (name: string, family: string, expected: number, clauses: Partial<QuerySpec>): QuerySpec => ({
+    name, family, expected, from: work, where: null, join: null, sort: null, limit: null, groupBy: null,
+    columns: [], native: true, dataview: "table", dql: "", ...clauses,
+  });
+  const queries = [
+    spec("score-lt-0.01", "selectivity", 0.01, {
+      where: { conditions: [condition("score", "lt", "100")] },
+      sort: { criteria: [{ field: "due", order: "asc", enabled: true }] },
+      columns: ["score", "due", "status"],
+    }),
+    spec("full-scan", "scan", 1, { columns: ["status"] }),
+    spec("tag-area", "source", 1 / AREAS.length, {
+      from: { kind: "tag", tag: "q/design", hierarchy: false },
+      columns: ["status"],
+    }),
+    spec("join-active-open", "join", 0.8 * (2 / 3), {
+      where: { conditions: [condition("status", "is-not", "done")] },
+      join: {
+        field: "project",
+        from: { kind: "folder", path: "Projects", recursive: false },
+        where: { conditions: [condition("status", "is", "active")] },
+      },
+      columns: ["project"],
+    }),
+    spec("group-status", "group", 0.5, {
+      where: { conditions: [condition("score", "lt", "5000")] },
+      groupBy: "status",
+    }),
+    spec("inline-effort", "inline", 1 / 3, {
+      where: { conditions: [condition("effort", "gte", "8")] },
+      columns: ["effort"],
+      native: false,
+    }),
+    spec("tasks-open-overdue", "task", 0.6 * (180 / 361), {
+      where: { conditions: [condition("completed", "is-not-checked"), condition("due", "is-before", today)] },
+      native: false,
+      dataview: "task",
+    }),
+  ];
+  return { notes, workload: { today, items, queries } };
+}
+
+function latency(samples: number[]): Latency {
+  return {
+    p50Ms: round(percentile(samples, 0.5), 3),
+    p95Ms: round(percentile(samples, 0.95), 3),
+    p99Ms: round(percentile(samples, 0.99), 3),
+    maxMs: round(Math.max(...samples), 3),
+  };
+}
+
+async function loadFileSystem(notes: VaultNote[]): Promise<InMemFileSystem> {
+  const fileSystem = new InMemFileSystem({});
+  for (const note of notes) {
+    await fileSystem.create(note.path, note.content);
+  }
+  return fileSystem;
+}
+
+interface NativeResult {
+  frame: DataFrame;
+  groups: number | null;
+}
+
+/** FROM → WHERE → (join) → SORT → LIMIT → GROUP BY through the plugin's own code. */
+async function runNative(spec: QuerySpec, fileSystem: InMemFileSystem): Promise<NativeResult> {
+  const deps = { fileSystem, preferences: prefs };
+  const query: NativeQuery = {
+    from: spec.from,
+    ...(spec.where ? { where: spec.where } : {}),
+    ...(!spec.join && spec.sort ? { sort: spec.sort } : {}),
+    ...(!spec.join && spec.limit ? { limit: spec.limit } : {}),
+  };
+  let frame = await executeNativeQuery(query, deps);
+  if (spec.join) {
+    const targets = await executeNativeQuery({ from: spec.join.from }, deps);
+    const joined = enrichFrameWithRelations(
+      frame,
+      spec.join.field,
+      { targetProjectId: "join", targetSubBaseFilter: spec.join.where },
+      targets
+    );
+    const derived = derivedFieldName(spec.join.field);
+    frame = {
+      ...joined,
+      records: joined.records.filter((r) => ((r.values[derived] as unknown[] | undefined)?.length ?? 0) > 0),
+    };
+    if (spec.sort) frame = applySort(frame, spec.sort);
+    if (spec.limit) frame = applyLimit(frame, spec.limit);
+  }
+  const groups = spec.groupBy
+    ? groupRecords(frame.records, {
+        field: spec.groupBy,
+        sortOrder: "asc",
+        hiddenGroups: [],
+        collapsedGroups: [],
+        showEmptyGroups: false,
+      }).length
+    : null;
+  return { frame, groups };
+}
+
+// ── Dataview results as the Dataview plugin would return them ──────────
+
+const INLINE_LINE_RE = /^([\w-]+):: (.+)$/gm;
+const INLINE_BRACKET_RE = /\[([\w-]+):: ([^\]]+)\]/g;
+const TASK_RE = /^- \[([ x])\] (.*)$/gm;
+const ISO_DAY_RE = /^\d{4}-\d{2}-\d{2}$/;
+
+/** Minimal stand-ins for Dataview's Link and Luxon's DateTime. */
+function dvLink(path: string): object {
+  const display = path.split("/").at(-1)!.replace(/\.md$/, "");
+  return { path, display, embed: false, type: "file", toString: () => `[[${path}|${display}]]` };
+}
+
+function dvValue(value: Optional<DataValue> | undefined): unknown {
+  if (value instanceof Date) return { ts: value.getTime() };
+  if (Array.isArray(value)) return value.map((v) => dvValue(v));
+  if (typeof value === "string") {
+    const link = /^\[\[([^\]|]+)(?:\|[^\]]*)?\]\]$/.exec(value);
+    if (link) return dvLink(link[1]!);
+  }
+  return value;
+}
+
+function inlineValue(raw: string): Optional<DataValue> {
+  const text = raw.trim();
+  if (/^-?\d+(\.\d+)?$/.test(text)) return Number(text);
+  if (ISO_DAY_RE.test(text)) return new Date(text);
+  return text;
+}
+
+/** Inline fields of a note body, as Dataview adds them to the page. */
+function inlineFields(content: string): Record<string, Optional<DataValue>> {
+  const fields: Record<string, Optional<DataValue>> = {};
+  for (const re of [INLINE_LINE_RE, INLINE_BRACKET_RE]) {
+    for (const match of content.matchAll(re)) {
+      fields[match[1]!] ??= inlineValue(match[2]!);
+    }
+  }
+  return fields;
+}
+
+/** Task list items of a note, with their annotations as Dataview reads them. */
+function taskRecords(path: string, content: string): DataRecord[] {
+  const tasks: DataRecord[] = [];
+  for (const match of content.matchAll(TASK_RE)) {
+    const done = match[1] === "x";
+    const values: Record<string, Optional<DataValue>> = { text: match[2]!, completed: done, checked: done };
+    for (const field of match[2]!.matchAll(INLINE_BRACKET_RE)) {
+      values[field[1]!] = inlineValue(field[2]!);
+    }
+    tasks.push({ id: `${path}#${tasks.length}`, values });
+  }
+  return tasks;
+}
+
+function inFrom(from: NativeQuerySource, note: VaultNote): boolean {
+  if (from.kind === "folder") return note.path.startsWith(`${from.path}/`);
+  return note.content.includes(`#${from.tag}`) || note.content.includes(`- ${from.tag}\n`);
+}
+
+/**
+ * The result object `api.query()` resolves to for ``spec``. Rows come from
+ * the native result where there is one; inline-field and task queries are
+ * evaluated here on pages and tasks read from the note bodies.
+ */
+function dataviewResult(spec: QuerySpec, notes: VaultNote[], native: NativeResult | null, base: DataFrame): unknown {
+  if (spec.dataview === "task") {
+    const tasks = notes.filter((n) => inFrom(spec.from, n)).flatMap((n) => taskRecords(n.path, n.content));
+    const frame = applyFilter({ fields: [], records: tasks }, spec.where ?? { conditions: [] });
+    return {
+      type: "task",
+      values: frame.records.map((t) => {
+        const path = t.id.slice(0, t.id.lastIndexOf("#"));
+        return {
+          ...Object.fromEntries(Object.entries(t.values).map(([k, v]) => [k, dvValue(v)])),
+          link: dvLink(path),
+          path,
+          status: t.values["completed"] ? "x" : " ",
+          tags: [],
+          annotated: true,
+          symbol: "-",
+        };
+      }),
+    };
+  }
+  let records: DataRecord[];
+  if (native) {
+    records = native.frame.records;
+  } else {
+    const content = new Map(notes.map((n) => [n.path, n.content]));
+    const pages = base.records.map((r) => ({ ...r, values: { ...r.values, ...inlineFields(content.get(r.id) ?? "") } }));
+    records = applyFilter({ fields: base.fields, records: pages }, spec.where ?? { conditions: [] }).records;
+  }
+  if (spec.groupBy) {
+    const counts = new Map<string, number>();
+    for (const r of records) {
+      const key = String(r.values[spec.groupBy] ?? "");
+      counts.set(key, (counts.get(key) ?? 0) + 1);
+    }
+    return { type: "table", headers: [ID_COLUMN, "count"], values: [...counts].map(([key, n]) => [key, n]) };
+  }
+  return {
+    type: "table",
+    headers: [ID_COLUMN, ...spec.columns],
+    values: records.map((r) => [dvLink(r.id), ...spec.columns.map((c) => dvValue(r.values[c]))]),
+  };
+}
+
+function dataviewSource(spec: QuerySpec, result: unknown): DataviewDataSource {
+  const project: ProjectDefinition = {
+    name: spec.name,
+    id: `bench-${spec.name}`,
+    fieldConfig: {},
+    views: [],
+    defaultName: "",
+    templates: [],
+    excludedNotes: [],
+    isDefault: false,
+    newNotesFolder: "",
+    dataSource: { kind: "dataview", config: { query: spec.dql } },
+  };
+  const api = {
+    settings: { tableIdColumnName: ID_COLUMN },
+    query: async () => ({ successful: true, value: result }),
+  };
+  // eslint-disable-next-line @typescript-eslint/no-explicit-any
+  return new DataviewDataSource({} as any, project, prefs, api as any);
+}
+
+describe("performance: native and Dataview queries", () => {
+  it(
+    "reports per-query latency percentiles on cold and warm runs",
+    async () => {
+      const { notes, workload } = BENCH_VAULT && BENCH_CORPUS
+        ? {
+            notes: readVault(BENCH_VAULT),
+            workload: JSON.parse(fs.readFileSync(BENCH_CORPUS, "utf8")) as QueryWorkload,
+          }
+        : syntheticWorkload(Math.round(2000 * BENCH_SCALE));
+      const specs = workload.queries;
+
+      // Dataview results are built from a first, untimed native pass
+      let fileSystem = await loadFileSystem(notes);
+      const builders = new Map<string, () => unknown>();
+      const nativeRows = new Map<string, { rows: number; groups: number | null }>();
+      const bases = new Map<string, DataFrame>();
+      for (const spec of specs) {
+        const native = spec.native ? await runNative(spec, fileSystem) : null;
+        if (native) nativeRows.set(spec.name, { rows: native.frame.records.length, groups: native.groups });
+        const key = JSON.stringify(spec.from);
+        if (!native && !bases.has(key)) {
+          bases.set(key, await executeNativeQuery({ from: spec.from }, { fileSystem, preferences: prefs }));
+        }
+        const base = bases.get(key) ?? { fields: [], records: [] };
+        builders.set(spec.name, () => dataviewResult(spec, notes, native, base));
+      }
+      const annotatedTasks = notes.reduce((sum, n) => sum + [...n.content.matchAll(TASK_RE)].length, 0);
+
+      const samples = new Map(specs.map((s) => [s.name, { nativeCold: [] as number[], nativeWarm: [] as number[], dvCold: [] as number[], dvWarm: [] as number[] }]));
+      const dataviewRows = new Map<string, number>();
+      const warmResults = new Map<string, unknown>();
+
+      // Cold: a freshly loaded file system and fresh result objects per round
+      for (let round = 0; round < COLD_RUNS; round++) {
+        fileSystem = await loadFileSystem(notes);
+        collectGarbage();
+        for (const spec of specs) {
+          const sample = samples.get(spec.name)!;
+          if (spec.native) {
+            const start = performance.now();
+            await runNative(spec, fileSystem);
+            sample.nativeCold.push(performance.now() - start);
+          }
+          const result = builders.get(spec.name)!();
+          warmResults.set(spec.name, result);
+          const source = dataviewSource(spec, result);
+          const start = performance.now();
+          const frame = await source.queryAll();
+          sample.dvCold.push(performance.now() - start);
+          dataviewRows.set(spec.name, frame.records.length);
+        }
+      }
+
+      // Warm: the same file system, sources and result objects, repeatedly
+      const sources = new Map(specs.map((s) => [s.name, dataviewSource(s, warmResults.get(s.name))]));
+      for (let run = 0; run < WARM_RUNS; run++) {
+        for (const spec of specs) {
+          const sample = samples.get(spec.name)!;
+          if (spec.native) {
+            const start = performance.now();
+            await runNative(spec, fileSystem);
+            sample.nativeWarm.push(performance.now() - start);
+          }
+          const start = performance.now();
+          await sources.get(spec.name)!.queryAll();
+          sample.dvWarm.push(performance.now() - start);
+        }
+      }
+
+      const queries = specs.map((spec) => {
+        const sample = samples.get(spec.name)!;
+        const native = nativeRows.get(spec.name);
+        const rows = native?.rows ?? dataviewRows.get(spec.name) ?? 0;
+        const base = spec.dataview === "task" ? annotatedTasks : workload.items;
+        return {
+          name: spec.name,
+          family: spec.family,
+          dql: spec.dql,
+          expected: spec.expected,
+          selectivity: base ? Math.round((rows / base) * 1e6) / 1e6 : null,
+          native: native
+            ? {
+                rows: native.rows,
+                groups: native.groups,
+                cold: latency(sample.nativeCold),
+                warm: latency(sample.nativeWarm),
+              }
+            : null,
+          dataview: {
+            rows: dataviewRows.get(spec.name) ?? 0,
+            cold: latency(sample.dvCold),
+            warm: latency(sample.dvWarm),
+          },
+        };
+      });
+
+      writeResults("queries", {
+        source: BENCH_VAULT || "synthetic",
+        notes: notes.length,
+        items: workload.items,
+        tasks: annotatedTasks,
+        coldRuns: COLD_RUNS,
+        warmRuns: WARM_RUNS,
+        queries,
+      });
+
+      expect(queries).toHaveLength(specs.length);
+      for (const query of queries) {
+        if (query.native && !specs.find((s) => s.name === query.name)!.groupBy) {
+          // The bridge turns every row Dataview returns into a record
+          expect(query.dataview.rows).toBe(query.native.rows);
+        }
+      }
+    },
+    BENCH_TIMEOUT
+  );
+});
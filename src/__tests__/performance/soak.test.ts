@@ -0,0 +1,644 @@
+/**
+ * Soak benchmark — one long-lived session under a seeded stream of edits and
+ * view queries, sampling the retained heap and the size of the session-wide
+ * caches at fixed intervals, to catch leaks and unbounded caches.
+ *
+ * With PP_BENCH_VAULT set (see scripts/bench-soak.py) the session starts from
+ * a generated `--relations` vault. Otherwise it starts from 2000 ×
+ * PP_BENCH_SCALE synthetic Projects, Team and Clients notes of the same shape.
+ *
+ * The session is wired like the plugin. `invalidateAll` is registered on the
+ * dataFrame store as in App.svelte. Every edit reaches the store the way
+ * registerFileEvents applies vault events. An inverse-index store listens to
+ * a metadata cache kept in step with the vault. The op stream mirrors
+ * `generate-test-files.py mutate` (edit, rename, delete, create and retarget,
+ * weighted by PP_BENCH_MIX). Every PP_BENCH_QUERY_EVERY ops a view opens: it
+ * subscribes to both stores, runs the dashboard pipelines through
+ * `executeTransformCached` twice (the second time from the cache), looks up
+ * backlinks and unsubscribes.
+ *
+ * Every PP_BENCH_SAMPLE_OPS ops a view runs, the coalesced index rebuild is
+ * let through, a full GC is forced and a sample is taken: V8 heap statistics,
+ * transform cache size and counters, inverse-index targets and entries, and
+ * metadata-cache listeners. The run stops after PP_BENCH_SOAK_MINUTES, or
+ * after PP_BENCH_SOAK_OPS ops. The first PP_BENCH_WARMUP share of samples is
+ * skipped, and a least-squares trend is fitted to each metric over the rest.
+ * A metric that grows by more than PP_BENCH_GROWTH_LIMIT of its mean over
+ * that window is reported as unbounded.
+ */
+
+import { describe, expect, it, jest } from "@jest/globals";
+import { array as A } from "fp-ts";
+import type { App, TFile } from "obsidian";
+import { get } from "svelte/store";
+import * as v8 from "v8";
+import { parse, stringify } from "yaml";
+import {
+  executeTransformCached,
+  getTransformCacheSize,
+  getTransformCacheStats,
+  invalidateAll,
+  invalidateTransformCache,
+  resetTransformCacheStats,
+} from "src/lib/dashboard-engine/transformCache";
+import type { TransformPipeline } from "src/lib/dashboard-engine/transformTypes";
+import type { DataField, DataFrame } from "src/lib/dataframe/dataframe";
+import {
+  detectSchema,
+  standardizeRecords,
+} from "src/lib/datasources/frontmatter/datasource";
+import { parseRecords } from "src/lib/datasources/helpers";
+import type { IFile } from "src/lib/filesystem/filesystem";
+import { InMemFileSystem } from "src/lib/filesystem/inmem/filesystem";
+import {
+  buildInverseIndex,
+  lookupInverse,
+  type InverseIndex,
+} from "src/lib/relations/inverseIndex";
+import { createInverseIndexStore } from "src/lib/relations/inverseIndexStore";
+import {
+  __clearDataFrameInvalidationCallbacks,
+  dataFrame,
+  registerDataFrameInvalidation,
+} from "src/lib/stores/dataframe";
+import {
+  BENCH_SCALE,
+  BENCH_TIMEOUT,
+  BENCH_VAULT,
+  collectGarbage,
+  readVault,
+  type VaultNote,
+  writeResults,
+} from "./benchHarness";
+
+// Generated vaults have to be parsed by the real YAML package.
+jest.unmock("yaml");
+
+const MINUTES = Math.max(Number(process.env.PP_BENCH_SOAK_MINUTES ?? "0") || 0, 0);
+/** Op budget; unlimited when only a duration is given. */
+const OPS =
+  Number(process.env.PP_BENCH_SOAK_OPS ?? "") || (MINUTES > 0 ? Infinity : Math.round(4000 * BENCH_SCALE));
+const SAMPLE_OPS = Math.max(Number(process.env.PP_BENCH_SAMPLE_OPS ?? "200") || 200, 1);
+const QUERY_EVERY = Math.max(Number(process.env.PP_BENCH_QUERY_EVERY ?? "10") || 10, 1);
+const SEED = Number(process.env.PP_BENCH_SEED ?? "42") || 0;
+/** Share of the samples left out of the trend while caches and JIT settle. */
+const WARMUP = Math.min(Math.max(Number(process.env.PP_BENCH_WARMUP ?? "0.25") || 0, 0), 0.9);
+const GROWTH_LIMIT = Math.max(Number(process.env.PP_BENCH_GROWTH_LIMIT ?? "0.1") || 0.1, 0);
+const SOAK_TIMEOUT = Math.max(BENCH_TIMEOUT, MINUTES * 90 * 1000 + 10 * 60 * 1000);
+
+/** Same ops and default weights as MUTATION_OPS / DEFAULT_MUTATION_MIX in generate-test-files.py. */
+const OPS_NAMES = ["edit", "rename", "delete", "create", "retarget"] as const;
+const DEFAULT_MIX = "edit=0.6,rename=0.1,delete=0.1,create=0.1,retarget=0.1";
+/** Frontmatter keys of the `--relations` folders that hold [[wikilinks]]. */
+const RELATION_KEYS = ["assignee", "client", "dependsOn", "members", "reviewer", "manager", "accountManager"];
+
+/** Value pools of generate-test-files.py, so edits keep a field's shape. */
+const STATUSES = [
+  ["inbox", "todo", "in-progress", "done", "cancelled"],
+  ["scheduled", "completed", "cancelled", "active", "paused"],
+];
+const PRIORITIES = ["high", "medium", "low"];
+const TAGS = ["project", "epic", "milestone", "urgent", "review", "blocked", "team", "client"];
+const ROLES = ["Backend Developer", "Designer", "Product Manager", "QA Engineer"];
+
+const WIKILINK = /^\[\[([^\]|#]+)(?:[#|][^\]]*)?\]\]$/;
+
+/** What a dashboard over the vault asks for, as in the Dashboard widgets. */
+const PIPELINES: TransformPipeline[] = [
+  {
+    steps: [
+      {
+        type: "filter",
+        conditions: {
+          conjunction: "and",
+          conditions: [{ field: "status", operator: "is", value: "active", enabled: true }],
+        },
+      },
+    ],
+  },
+  {
+    steps: [
+      { type: "group-by", fields: ["status"] },
+      {
+        type: "aggregate",
+        columns: [
+          { sourceField: "budget", outputName: "budget", function: "SUM" },
+          { sourceField: "progress", outputName: "progress", function: "AVG" },
+        ],
+      },
+    ],
+  },
+  { steps: [{ type: "compute", columns: [{ name: "burn", expression: "spent / budget" }] }] },
+  { steps: [{ type: "pivot", categoryField: "priority", valueField: "hours", aggregation: "SUM" }] },
+  {
+    steps: [
+      { type: "group-by", fields: ["startDate"], dateGrouping: { field: "startDate", granularity: "month" } },
+    ],
+  },
+];
+
+type Op = (typeof OPS_NAMES)[number];
+type Frontmatter = Record<string, unknown>;
+
+interface Sample {
+  t: number;
+  ops: number;
+  notes: number;
+  heapUsedMb: number;
+  heapTotalMb: number;
+  externalMb: number;
+  rssMb: number;
+  transformCache: number;
+  transformHits: number;
+  transformMisses: number;
+  transformEvictions: number;
+  indexTargets: number;
+  indexEntries: number;
+  entriesPerNote: number;
+  listeners: number;
+}
+
+/** Metrics whose trend decides whether the session stays bounded. */
+const BOUNDED: Array<keyof Sample> = ["heapUsedMb", "transformCache", "entriesPerNote", "listeners"];
+
+/** mulberry32: a small seeded PRNG so the op stream is stable. */
+function prng(seed: number): () => number {
+  let state = seed >>> 0;
+  return () => {
+    state = (state + 0x6d2b79f5) >>> 0;
+    let t = state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+const random = prng(SEED);
+const choice = <T>(items: readonly T[]): T => items[Math.floor(random() * items.length)]!;
+const randomText = (length: number) =>
+  Array.from({ length }, () => choice([..."abcdefghijklmnopqrstuvwxyz0123456789"])).join("");
+const randomDate = () =>
+  `2026-${String(1 + Math.floor(random() * 12)).padStart(2, "0")}-${String(1 + Math.floor(random() * 28)).padStart(2, "0")}`;
+
+/** Parses `op=weight,...` like parse_mix in generate-test-files.py. */
+function parseMix(spec: string): Array<[Op, number]> {
+  const mix = new Map<Op, number>(OPS_NAMES.map((op) => [op, 0]));
+  for (const part of spec.split(",")) {
+    const [op, weight] = part.split("=").map((s) => s.trim());
+    if (!mix.has(op as Op)) {
+      throw new Error(`Unknown mutation op '${op}' (expected one of ${OPS_NAMES.join(", ")})`);
+    }
+    mix.set(op as Op, Number(weight) || 0);
+  }
+  return [...mix];
+}
+
+const MIX = parseMix(process.env.PP_BENCH_MIX ?? DEFAULT_MIX);
+
+function pickOp(): Op {
+  const total = MIX.reduce((sum, [, weight]) => sum + weight, 0);
+  let roll = random() * total;
+  for (const [op, weight] of MIX) {
+    roll -= weight;
+    if (roll < 0) return op;
+  }
+  return MIX[MIX.length - 1]![0];
+}
+
+/** A new value of the same shape, like mutated_value(); undefined when there is none. */
+function mutatedValue(value: unknown): unknown {
+  if (typeof value === "boolean") return !value;
+  if (typeof value === "number") {
+    return value >= 0 && value <= 100
+      ? Math.floor(random() * 101)
+      : Math.max(0, Math.round(value * (0.75 + random() * 0.5)));
+  }
+  if (typeof value === "string") {
+    if (WIKILINK.test(value)) return undefined;
+    if (/^\d{4}-\d{2}-\d{2}$/.test(value)) return randomDate();
+    if (/^\d{2}:\d{2}$/.test(value)) return `${String(Math.floor(random() * 24)).padStart(2, "0")}:00`;
+    const pool = [...STATUSES, PRIORITIES].find((values) => values.includes(value));
+    if (pool) return choice(pool);
+    if (value.startsWith("#")) return `#${Math.floor(random() * 0xffffff).toString(16).padStart(6, "0")}`;
+    return undefined;
+  }
+  if (Array.isArray(value) && value.every((item) => typeof item === "string" && !WIKILINK.test(item))) {
+    return TAGS.filter(() => random() < 0.3);
+  }
+  return undefined;
+}
+
+function splitFrontmatter(content: string): [Frontmatter, string] {
+  if (!content.startsWith("---\n")) return [{}, content];
+  const end = content.indexOf("\n---\n", 4);
+  if (end === -1) return [{}, content];
+  const data = parse(content.slice(4, end + 1)) as unknown;
+  return [data && typeof data === "object" && !Array.isArray(data) ? (data as Frontmatter) : {}, content.slice(end + 5)];
+}
+
+const joinFrontmatter = (frontmatter: Frontmatter, body: string) => `---\n${stringify(frontmatter)}---\n${body}`;
+
+const folderOf = (path: string) => path.slice(0, Math.max(path.lastIndexOf("/"), 0));
+const stemOf = (path: string) => path.slice(path.lastIndexOf("/") + 1).replace(/\.md$/, "");
+
+/** A `--relations` vault in miniature: Projects linking Team and Clients notes. */
+function syntheticVault(total: number): VaultNote[] {
+  const people = Math.max(1, Math.round(total * 0.1));
+  const clients = Math.max(1, Math.round(total * 0.05));
+  const projects = Math.max(1, total - people - clients);
+  const link = (prefix: string, count: number) => `[[${prefix} ${Math.floor(random() * count)}]]`;
+  const note = (folder: string, title: string, frontmatter: Frontmatter): VaultNote => ({
+    path: `${folder}/${title}.md`,
+    content: joinFrontmatter({ ...frontmatter, title }, `\n# ${title}\n`),
+  });
+
+  const notes: VaultNote[] = [];
+  for (let i = 0; i < people; i++) {
+    notes.push(note("Team", `Person ${i}`, { role: ROLES[i % ROLES.length], manager: link("Person", people), tags: ["team"] }));
+  }
+  for (let i = 0; i < clients; i++) {
+    const budget = 1000 * (10 + Math.floor(random() * 200));
+    notes.push(note("Clients", `Client ${i}`, {
+      accountManager: link("Person", people),
+      budget,
+      spent: Math.floor(random() * budget),
+      status: choice(STATUSES[1]!),
+      tags: ["client"],
+    }));
+  }
+  for (let i = 0; i < projects; i++) {
+    const budget = 1000 * (10 + Math.floor(random() * 200));
+    notes.push(note("Projects", `Project ${i}`, {
+      assignee: link("Person", people),
+      budget,
+      client: link("Client", clients),
+      ...(i > 0 && random() < 0.3 ? { dependsOn: [link("Project", i)] } : {}),
+      hours: Math.floor(random() * 2000),
+      members: Array.from({ length: 1 + Math.floor(random() * 3) }, () => link("Person", people)),
+      priority: choice(PRIORITIES),
+      progress: Math.floor(random() * 101),
+      reviewer: link("Person", people),
+      spent: Math.floor(random() * budget),
+      startDate: randomDate(),
+      status: choice(STATUSES[1]!),
+      tags: TAGS.filter(() => random() < 0.3),
+    }));
+  }
+  return notes;
+}
+
+interface Listener {
+  event: string;
+  callback: (...args: unknown[]) => void;
+  ref: object;
+}
+
+/**
+ * The session's notes: the file system, a metadata cache kept in step with it
+ * and index-addressable paths, like VaultState in generate-test-files.py
+ * (swap-remove keeps deletes O(1) and every seeded choice reproducible).
+ */
+class SoakVault {
+  readonly fileSystem = new InMemFileSystem({});
+  readonly paths: string[] = [];
+  readonly listeners: Listener[] = [];
+  private readonly index = new Map<string, number>();
+  private readonly stems = new Map<string, string>();
+  private readonly frontmatter = new Map<string, Frontmatter>();
+
+  /** The subset of Obsidian's App used by createInverseIndexStore. */
+  readonly app = {
+    vault: {
+      getMarkdownFiles: () => this.paths.map((path) => ({ path }) as unknown as TFile),
+    },
+    metadataCache: {
+      getFileCache: (file: TFile) => {
+        const frontmatter = this.frontmatter.get(file.path);
+        return frontmatter ? { frontmatter } : null;
+      },
+      getFirstLinkpathDest: (linktext: string) => {
+        const path = this.stems.get(linktext);
+        return path ? ({ path } as unknown as TFile) : null;
+      },
+      on: (event: string, callback: (...args: unknown[]) => void) => {
+        const ref = {};
+        this.listeners.push({ event, callback, ref });
+        return ref;
+      },
+      offref: (ref: object) => {
+        const i = this.listeners.findIndex((listener) => listener.ref === ref);
+        if (i >= 0) this.listeners.splice(i, 1);
+      },
+    },
+  } as unknown as App;
+
+  get size(): number {
+    return this.paths.length;
+  }
+
+  has(path: string): boolean {
+    return this.index.has(path);
+  }
+
+  pick(): string {
+    return this.paths[Math.floor(random() * this.paths.length)]!;
+  }
+
+  /** Pick a note from the same folder as `stem` when it resolves. */
+  pickLike(stem: string, attempts = 8): string {
+    const target = this.stems.get(stem);
+    let path = this.pick();
+    for (let i = 1; i < attempts && target !== undefined && folderOf(path) !== folderOf(target); i++) {
+      path = this.pick();
+    }
+    return path;
+  }
+
+  file(path: string): IFile {
+    return this.fileSystem.getFile(path)!;
+  }
+
+  async read(path: string): Promise<[Frontmatter, string]> {
+    return splitFrontmatter(await this.file(path).read());
+  }
+
+  async add(path: string, content: string): Promise<IFile> {
+    const file = await this.fileSystem.create(path, content);
+    this.index.set(path, this.paths.length);
+    this.paths.push(path);
+    this.stems.set(stemOf(path), path);
+    this.frontmatter.set(path, splitFrontmatter(content)[0]);
+    return file;
+  }
+
+  async write(path: string, frontmatter: Frontmatter, body: string): Promise<IFile> {
+    const file = this.file(path);
+    await file.write(joinFrontmatter(frontmatter, body));
+    this.frontmatter.set(path, frontmatter);
+    return file;
+  }
+
+  async remove(path: string): Promise<void> {
+    await this.fileSystem.delete(path);
+    this.stems.delete(stemOf(path));
+    this.frontmatter.delete(path);
+    const i = this.index.get(path)!;
+    this.index.delete(path);
+    const last = this.paths.pop()!;
+    if (last !== path) {
+      this.paths[i] = last;
+      this.index.set(last, i);
+    }
+  }
+
+  emit(event: string, path?: string): void {
+    for (const listener of [...this.listeners]) {
+      if (listener.event === event) listener.callback(path ? { path } : undefined);
+    }
+  }
+
+  /** What a from-scratch inverse index is built from. */
+  inputs() {
+    return this.paths.map((path) => ({ path, frontmatter: this.frontmatter.get(path) ?? null }));
+  }
+}
+
+/** FrontMatterDataSource.queryFiles without a project: one frame over `files`. */
+async function queryFiles(files: IFile[], predefined: DataField[] = []): Promise<DataFrame> {
+  const { right: records } = A.separate(await standardizeRecords(files));
+  let fields = detectSchema(records);
+  for (const field of predefined) {
+    fields = fields.map((f) => (f.name !== field.name ? f : { ...f, type: field.type }));
+  }
+  return { fields, records: parseRecords(records, fields) };
+}
+
+/** Applies one op to the vault, the dataFrame store and the metadata cache; false when there is nothing to do. */
+async function applyOp(op: Op, vault: SoakVault): Promise<boolean> {
+  const path = vault.pick();
+  const changed = async (file: IFile) => {
+    dataFrame.merge(await queryFiles([file], get(dataFrame).fields));
+    vault.emit("changed", file.path);
+  };
+
+  if (op === "edit") {
+    const [frontmatter, body] = await vault.read(path);
+    const fields = Object.keys(frontmatter).filter((key) => key !== "title");
+    if (!fields.length) return false;
+    const field = choice(fields);
+    const value = mutatedValue(frontmatter[field]);
+    if (value === undefined) return false;
+    await changed(await vault.write(path, { ...frontmatter, [field]: value }, body));
+    return true;
+  }
+
+  if (op === "rename" || op === "create") {
+    const name = `${stemOf(path).replace(/_[^_]*$/, "")}_${randomText(6)}.md`;
+    const newPath = folderOf(path) ? `${folderOf(path)}/${name}` : name;
+    if (vault.has(newPath)) return false;
+    const content = await vault.file(path).read();
+    if (op === "rename") {
+      await vault.remove(path);
+      dataFrame.deleteRecord(path);
+      vault.emit("deleted", path);
+      await changed(await vault.add(newPath, content));
+    } else {
+      // A note shaped like its neighbour, as create draws one of the folder's type
+      const [frontmatter, body] = splitFrontmatter(content);
+      await changed(await vault.add(newPath, joinFrontmatter({ ...frontmatter, title: stemOf(newPath) }, body)));
+    }
+    return true;
+  }
+
+  if (op === "delete") {
+    if (vault.size <= 1) return false;
+    await vault.remove(path);
+    dataFrame.deleteRecord(path);
+    vault.emit("deleted", path);
+    return true;
+  }
+
+  // retarget: point one wikilink in frontmatter at another live note
+  const [frontmatter, body] = await vault.read(path);
+  const slots: Array<[string, number | null]> = [];
+  for (const [field, value] of Object.entries(frontmatter)) {
+    if (typeof value === "string" && WIKILINK.test(value)) {
+      slots.push([field, null]);
+    } else if (Array.isArray(value)) {
+      value.forEach((item, i) => {
+        if (typeof item === "string" && WIKILINK.test(item)) slots.push([field, i]);
+      });
+    }
+  }
+  if (!slots.length) return false;
+  const [field, position] = choice(slots);
+  const current = frontmatter[field] as string | string[];
+  const old = position === null ? (current as string) : (current as string[])[position]!;
+  const link = `[[${stemOf(vault.pickLike(WIKILINK.exec(old)![1]!))}]]`;
+  const value = position === null ? link : (current as string[]).map((item, i) => (i === position ? link : item));
+  await changed(await vault.write(path, { ...frontmatter, [field]: value }, body));
+  return true;
+}
+
+function countEntries(index: InverseIndex): number {
+  let entries = 0;
+  for (const list of index.values()) entries += list.length;
+  return entries;
+}
+
+const mb = (bytes: number) => Math.round((bytes / (1024 * 1024)) * 100) / 100;
+const settle = () => new Promise((resolve) => setTimeout(resolve, 50));
+
+/**
+ * Least-squares slope of `metric` against ops over the samples after the
+ * warm-up; `growth` is the fitted rise over that window relative to its mean.
+ */
+function trend(samples: Sample[], metric: keyof Sample) {
+  const window = samples.slice(Math.floor(samples.length * WARMUP));
+  if (window.length < 4) return null;
+  const xs = window.map((s) => s.ops);
+  const ys = window.map((s) => s[metric]);
+  const mean = (values: number[]) => values.reduce((a, b) => a + b, 0) / values.length;
+  const mx = mean(xs);
+  const my = mean(ys);
+  let sxy = 0;
+  let sxx = 0;
+  xs.forEach((x, i) => {
+    sxy += (x - mx) * (ys[i]! - my);
+    sxx += (x - mx) ** 2;
+  });
+  const slope = sxx ? sxy / sxx : 0;
+  const rise = slope * (xs[xs.length - 1]! - xs[0]!);
+  const growth = my > 0 ? rise / my : rise > 0 ? 1 : 0;
+  return {
+    first: ys[0]!,
+    last: ys[ys.length - 1]!,
+    max: Math.max(...ys),
+    perKiloOps: Math.round(slope * 1000 * 10000) / 10000,
+    growth: Math.round(growth * 10000) / 10000,
+    unbounded: growth > GROWTH_LIMIT,
+  };
+}
+
+describe("performance: soak", () => {
+  it(
+    "keeps the retained heap and session caches bounded under edits and view queries",
+    async () => {
+      const vault = new SoakVault();
+      const notes = BENCH_VAULT ? readVault(BENCH_VAULT) : syntheticVault(Math.round(2000 * BENCH_SCALE));
+      for (const note of notes) {
+        await vault.add(note.path, note.content);
+      }
+
+      invalidateTransformCache();
+      resetTransformCacheStats();
+      const unregister = registerDataFrameInvalidation(invalidateAll);
+      dataFrame.set(await queryFiles(vault.fileSystem.getAllFiles()));
+      const store = createInverseIndexStore(vault.app, { keys: RELATION_KEYS });
+      vault.emit("resolved");
+
+      let views = 0;
+      let backlinks = 0;
+      const openView = () => {
+        const unsubscribe = [dataFrame.subscribe(() => {}), store.subscribe(() => {})];
+        const frame = get(dataFrame);
+        for (const pipeline of PIPELINES) executeTransformCached(frame, pipeline);
+        for (const pipeline of PIPELINES) executeTransformCached(frame, pipeline);
+        const index = get(store);
+        for (let i = 0; i < 5; i++) backlinks += lookupInverse(index, vault.pick()).length;
+        unsubscribe.forEach((fn) => fn());
+        views++;
+      };
+
+      const samples: Sample[] = [];
+      const started = performance.now();
+      const sample = async (ops: number) => {
+        openView();
+        await settle();
+        collectGarbage();
+        const heap = v8.getHeapStatistics();
+        const stats = getTransformCacheStats();
+        const index = get(store);
+        const entries = countEntries(index);
+        samples.push({
+          t: Math.round(performance.now() - started) / 1000,
+          ops,
+          notes: vault.size,
+          heapUsedMb: mb(heap.used_heap_size),
+          heapTotalMb: mb(heap.total_heap_size),
+          externalMb: mb(heap.external_memory),
+          rssMb: mb(process.memoryUsage().rss),
+          transformCache: getTransformCacheSize(),
+          transformHits: stats.hits,
+          transformMisses: stats.misses,
+          transformEvictions: stats.evictions,
+          indexTargets: index.size,
+          indexEntries: entries,
+          entriesPerNote: Math.round((entries / Math.max(vault.size, 1)) * 1000) / 1000,
+          listeners: vault.listeners.length,
+        });
+        resetTransformCacheStats();
+      };
+
+      const counts = Object.fromEntries(OPS_NAMES.map((op) => [op, 0])) as Record<Op, number>;
+      const deadline = MINUTES > 0 ? started + MINUTES * 60 * 1000 : Infinity;
+      let ops = 0;
+      await sample(0);
+      while (ops < OPS && performance.now() < deadline) {
+        const op = pickOp();
+        if (await applyOp(op, vault)) counts[op]++;
+        ops++;
+        if (ops % SAMPLE_OPS === 0) {
+          await sample(ops);
+        } else if (ops % QUERY_EVERY === 0) {
+          openView();
+        }
+      }
+      if (ops % SAMPLE_OPS !== 0) await sample(ops);
+
+      // The live index and the store must still match the vault after the run
+      store.rebuild();
+      const fresh = buildInverseIndex(vault.inputs(), {
+        keys: RELATION_KEYS,
+        resolveLinkPath: (linktext, sourcePath) =>
+          vault.app.metadataCache.getFirstLinkpathDest(linktext, sourcePath)?.path ?? null,
+      });
+      const liveEntries = countEntries(get(store));
+      const frameRecords = get(dataFrame).records.length;
+
+      store.destroy();
+      unregister();
+      __clearDataFrameInvalidationCallbacks();
+      invalidateTransformCache();
+      dataFrame.set({ fields: [], records: [] });
+
+      const growth = Object.fromEntries(BOUNDED.map((metric) => [metric, trend(samples, metric)]));
+      const unbounded = BOUNDED.filter((metric) => growth[metric]?.unbounded);
+      writeResults("soak", {
+        source: BENCH_VAULT || "synthetic",
+        seed: SEED,
+        minutes: MINUTES,
+        ops,
+        applied: counts,
+        views,
+        backlinks,
+        sampleOps: SAMPLE_OPS,
+        queryEvery: QUERY_EVERY,
+        warmup: WARMUP,
+        growthLimit: GROWTH_LIMIT,
+        gcExposed: typeof (globalThis as { gc?: unknown }).gc === "function",
+        elapsedS: Math.round(performance.now() - started) / 1000,
+        growth,
+        unbounded,
+        samples,
+      });
+
+      expect(samples.length).toBeGreaterThanOrEqual(2);
+      expect(frameRecords).toBe(vault.size);
+      expect(liveEntries).toBe(countEntries(fresh));
+      // The transform cache holds at most one entry per pipeline between edits
+      expect(Math.max(...samples.map((s) => s.transformCache))).toBeLessThanOrEqual(PIPELINES.length);
+    },
+    SOAK_TIMEOUT
+  );
+});
@@ -0,0 +1,302 @@
+/**
+ * Sub-base partition and cross-project rollup benchmark — `partitionBySubBases`
+ * and `computeCrossProjectRollupColumn` timed on a growing ladder.
+ *
+ * With PP_BENCH_VAULT set to a `--rollup-workload` vault (see
+ * scripts/bench-rollups.py), each rung takes a growing share of its Projects
+ * together with the Ledger entries that link to them. Otherwise a synthetic
+ * ledger of the same shape is used, with 2000 × PP_BENCH_SCALE entries at the
+ * top rung. Every measurement reports time, GC pauses and estimated bytes
+ * allocated. It also reports the growth exponent against the previous rung:
+ * ~1 is linear, ~2 is quadratic.
+ */
+
+import { describe, expect, it, jest } from "@jest/globals";
+import {
+  DataFieldType,
+  type DataField,
+  type DataFrame,
+  type DataRecord,
+} from "src/lib/dataframe/dataframe";
+import { createSubBase, type SubBaseDefinition } from "src/lib/database/subBase";
+import { partitionBySubBases } from "src/lib/database/subBasePartition";
+import { normalizeRelationValue } from "src/lib/engine/crossProjectResolver";
+import { computeCrossProjectRollupColumn } from "src/lib/engine/crossProjectRollup";
+import type { RollupFieldConfig } from "src/settings/base/settings";
+import {
+  BENCH_SCALE,
+  BENCH_TIMEOUT,
+  BENCH_VAULT,
+  collectGarbage,
+  growth,
+  loadVaultFrame,
+  observeGc,
+  timed,
+  trackAllocations,
+  writeResults,
+} from "./benchHarness";
+
+// Generated vaults have to be parsed by the real YAML package.
+jest.unmock("yaml");
+
+/** Share of the projects in each rung; the last rung is the whole ledger. */
+const LADDER = [0.125, 0.25, 0.5, 1];
+
+/** Same kinds, in the same order, as ROLLUP_KINDS in generate-test-files.py. */
+const KINDS = ["expense", "timesheet", "invoice", "budget", "milestone", "purchase-order"];
+const STATUSES = ["draft", "submitted", "approved", "rejected"];
+
+/** Rollups from Projects over their `entries`; `scope` narrows the targets to one sub-base. */
+const ROLLUPS: Array<{ id: string; config: RollupFieldConfig; scope?: string }> = [
+  { id: "sum-amount", config: { relationField: "entries", targetField: "amount", function: "sum" } },
+  {
+    id: "sum-hours@timesheet",
+    config: { relationField: "entries", targetField: "hours", function: "sum" },
+    scope: "timesheet",
+  },
+  {
+    id: "median-amount@expense",
+    config: { relationField: "entries", targetField: "amount", function: "median" },
+    scope: "expense",
+  },
+  { id: "count-unique-date", config: { relationField: "entries", targetField: "date", function: "count_unique" } },
+];
+
+interface Ledger {
+  projects: DataFrame;
+  entries: DataFrame;
+}
+
+interface Measurement {
+  ms: number;
+  allocatedMb: number;
+  gcCount: number;
+  gcMs: number;
+}
+
+const field = (name: string, type: DataFieldType, repeated = false): DataField => ({
+  name,
+  type,
+  identifier: name === "name",
+  derived: false,
+  repeated,
+  typeConfig: {},
+});
+
+/** mulberry32: a small seeded PRNG so the synthetic ledger is stable. */
+function prng(seed: number): () => number {
+  let state = seed >>> 0;
+  return () => {
+    state = (state + 0x6d2b79f5) >>> 0;
+    let t = state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+/** Index into a Zipf(s) distribution over `size` ranks. */
+function zipfPicker(size: number, s: number, random: () => number): () => number {
+  const cumulative: number[] = [];
+  let running = 0;
+  for (let rank = 0; rank < size; rank++) {
+    running += 1 / (rank + 1) ** s;
+    cumulative.push(running);
+  }
+  return () => {
+    const target = random() * running;
+    let lo = 0;
+    let hi = size - 1;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if (cumulative[mid]! < target) lo = mid + 1;
+      else hi = mid;
+    }
+    return lo;
+  };
+}
+
+/** Stand-in for a `--rollup-workload` vault: skewed blocks and partitions. */
+function syntheticLedger(count: number): Ledger {
+  const random = prng(42);
+  const projectCount = Math.max(1, Math.round(count / 200));
+  const pickProject = zipfPicker(projectCount, 1.1, random);
+  const pickKind = zipfPicker(KINDS.length, 1.2, random);
+  const links: string[][] = Array.from({ length: projectCount }, () => []);
+  const base = Date.UTC(2025, 0, 1);
+
+  const entries: DataRecord[] = [];
+  for (let i = 0; i < count; i++) {
+    const project = pickProject();
+    const status = STATUSES[i % STATUSES.length]!;
+    links[project]!.push(`[[Entry ${i}]]`);
+    entries.push({
+      id: `Ledger/Entry ${i}.md`,
+      values: {
+        name: `Entry ${i}`,
+        type: KINDS[pickKind()],
+        project: `[[Project ${project}]]`,
+        amount: i % 20 === 0 ? undefined : Math.round(Math.exp(5 + random() * 2.4) * 100) / 100,
+        hours: Math.ceil(random() * 32) / 4,
+        date: new Date(base + Math.floor(random() * 455) * 86_400_000),
+        status,
+        approved: status === "approved",
+      },
+    });
+  }
+  const projects: DataRecord[] = links.map((entryLinks, i) => ({
+    id: `Projects/Project ${i}.md`,
+    values: {
+      name: `Project ${i}`,
+      type: "project",
+      budget: 5_000 + ((i * 7919) % 495_000),
+      entries: entryLinks.slice(0, 1000),
+    },
+  }));
+  return {
+    projects: {
+      fields: [field("name", DataFieldType.String), field("type", DataFieldType.String),
+        field("budget", DataFieldType.Number), field("entries", DataFieldType.Relation, true)],
+      records: projects,
+    },
+    entries: {
+      fields: [field("name", DataFieldType.String), field("type", DataFieldType.String),
+        field("project", DataFieldType.Relation), field("amount", DataFieldType.Number),
+        field("hours", DataFieldType.Number), field("date", DataFieldType.Date),
+        field("status", DataFieldType.String), field("approved", DataFieldType.Boolean)],
+      records: entries,
+    },
+  };
+}
+
+async function vaultLedger(root: string): Promise<Ledger> {
+  const frame = await loadVaultFrame(root);
+  return {
+    projects: { fields: frame.fields, records: frame.records.filter((r) => r.id.startsWith("Projects/")) },
+    entries: { fields: frame.fields, records: frame.records.filter((r) => r.id.startsWith("Ledger/")) },
+  };
+}
+
+function baseName(id: string): string {
+  return id.slice(id.lastIndexOf("/") + 1).replace(/\.md$/, "").toLowerCase();
+}
+
+/** The first `share` of the projects and every entry that links to one of them. */
+function rung(ledger: Ledger, share: number): Ledger {
+  const projects = ledger.projects.records.slice(0, Math.max(1, Math.ceil(ledger.projects.records.length * share)));
+  const names = new Set(projects.map((r) => baseName(r.id)));
+  const entries = ledger.entries.records.filter((r) =>
+    normalizeRelationValue(r.values["project"]).some((link) => names.has(link.toLowerCase()))
+  );
+  return {
+    projects: { ...ledger.projects, records: projects },
+    entries: { ...ledger.entries, records: entries },
+  };
+}
+
+/** Projects frame whose `entries` relation only surfaces entries of `kind`. */
+function scoped(projects: DataFrame, kind: string | undefined): DataFrame {
+  if (!kind) return projects;
+  const filter = { conjunction: "and" as const, conditions: [{ field: "type", operator: "is" as const, value: kind, enabled: true }] };
+  const fields = projects.fields.some((f) => f.name === "entries")
+    ? projects.fields
+    : [...projects.fields, field("entries", DataFieldType.Relation, true)];
+  return {
+    ...projects,
+    fields: fields.map((f) =>
+      f.name === "entries"
+        ? { ...f, typeConfig: { ...f.typeConfig, relation: { targetProjectId: "ledger", targetSubBaseFilter: filter } } }
+        : f
+    ),
+  };
+}
+
+/** One sub-base per entry type plus Projects, each sorted like a ledger table. */
+function subBasesFor(entries: DataFrame): SubBaseDefinition[] {
+  const kinds = [...new Set(entries.records.map((r) => r.values["type"]).filter((v): v is string => typeof v === "string"))];
+  return ["project", ...kinds.sort()].map((kind) =>
+    createSubBase(kind, kind, {
+      filter: { conjunction: "and", conditions: [{ field: "type", operator: "is", value: kind, enabled: true }] },
+      sort: {
+        criteria: [
+          { field: "date", order: "desc", enabled: true },
+          { field: "amount", order: "asc", enabled: true },
+        ],
+      },
+    })
+  );
+}
+
+async function measure<T>(fn: () => T): Promise<[T, Measurement]> {
+  collectGarbage();
+  const allocations = trackAllocations();
+  const gc = observeGc();
+  const [result, ms] = await timed(fn);
+  const { allocatedMb } = allocations.stop();
+  const { count, totalMs } = gc.stop();
+  return [result, { ms, allocatedMb, gcCount: count, gcMs: totalMs }];
+}
+
+describe("performance: sub-base partition and cross-project rollup", () => {
+  it(
+    "times partitionBySubBases and computeCrossProjectRollupColumn per rung",
+    async () => {
+      const ledger = BENCH_VAULT
+        ? await vaultLedger(BENCH_VAULT)
+        : syntheticLedger(Math.round(2000 * BENCH_SCALE));
+
+      const rungs = [];
+      let previous: { size: number; partition: Measurement; rollups: Record<string, Measurement> } | undefined;
+      for (const share of LADDER) {
+        const { projects, entries } = rung(ledger, share);
+        const size = projects.records.length + entries.records.length;
+        const ratio = previous ? size / previous.size : 0;
+
+        const view: DataFrame = { fields: entries.fields, records: [...projects.records, ...entries.records] };
+        const subBases = subBasesFor(entries);
+        const [partitions, partition] = await measure(() => partitionBySubBases(view, subBases));
+        const sizes: Record<string, number> = {};
+        for (const [id, { frame }] of partitions) sizes[id] = frame.records.length;
+
+        const rollups: Record<string, Measurement> = {};
+        const rollupResults: Record<string, Measurement & { growth: number | null; errors: number }> = {};
+        for (const { id, config, scope } of ROLLUPS) {
+          const thisFrame = scoped(projects, scope);
+          const [column, measurement] = await measure(() =>
+            computeCrossProjectRollupColumn(thisFrame, config, entries)
+          );
+          expect(column.size).toBe(projects.records.length);
+          let errors = 0;
+          for (const result of column.values()) errors += result.errors.length;
+          const before = previous?.rollups[id];
+          rollups[id] = measurement;
+          rollupResults[id] = { ...measurement, growth: before ? growth(before.ms, measurement.ms, ratio) : null, errors };
+        }
+
+        rungs.push({
+          share,
+          projects: projects.records.length,
+          entries: entries.records.length,
+          partition: { ...partition, growth: previous ? growth(previous.partition.ms, partition.ms, ratio) : null, sizes },
+          rollups: rollupResults,
+        });
+        previous = { size, partition, rollups };
+      }
+
+      writeResults("subBaseRollup", {
+        source: BENCH_VAULT || "synthetic",
+        ladder: LADDER,
+        rungs,
+      });
+
+      const top = rungs[rungs.length - 1]!;
+      expect(top.projects).toBe(ledger.projects.records.length);
+      // Every entry lands in exactly one type partition
+      const partitioned = Object.entries(top.partition.sizes)
+        .filter(([id]) => id !== "project")
+        .reduce((sum, [, n]) => sum + n, 0);
+      expect(partitioned).toBe(top.entries);
+    },
+    BENCH_TIMEOUT
+  );
+});
@@ -0,0 +1,404 @@
+/**
+ * Table and Board frame-budget benchmark — the per-frame work of scrolling a
+ * virtualized Table (`computeVirtualScroll` plus the visible cells) and of
+ * panning a wide Board (`getColumns` grouping plus its visible columns),
+ * against a 16 ms frame budget.
+ *
+ * With PP_BENCH_VAULT and PP_BENCH_CORPUS set (see scripts/bench-views.py)
+ * the cards come from a `--view-workload` vault and the scroll traces from
+ * its <vault>.views.json. Otherwise 2000 × PP_BENCH_SCALE synthetic cards
+ * over 300 columns and synthetic traces of the same kinds are used.
+ *
+ * Table frames window the rows at the row height of PP_BENCH_DENSITY and
+ * estimate the wrapped height of every visible cell. Rows whose content is
+ * taller than the fixed row height are reported as clipped. Board frames
+ * window the cards of the visible columns. Every PP_BENCH_EDIT_EVERY frames
+ * one card moves to another column and the columns are regrouped, as
+ * BoardView does on every record change. `getColumns` is also timed alone
+ * on the same cards spread over a growing number of columns.
+ */
+
+import { describe, expect, it, jest } from "@jest/globals";
+import * as fs from "fs";
+import {
+  computeVirtualScroll,
+  getRowHeight,
+} from "src/lib/dashboard-engine/virtualScroll";
+import {
+  DataFieldType,
+  type DataField,
+  type DataFrame,
+  type DataRecord,
+  type DataValue,
+  type Optional,
+} from "src/lib/dataframe/dataframe";
+import { getColumns } from "src/ui/views/Board/board";
+import {
+  BENCH_CORPUS,
+  BENCH_SCALE,
+  BENCH_TIMEOUT,
+  BENCH_VAULT,
+  benchRepeat,
+  collectGarbage,
+  growth,
+  loadVaultFrame,
+  median,
+  percentile,
+  round,
+  writeResults,
+} from "./benchHarness";
+
+// Generated vaults have to be parsed by the real YAML package.
+jest.unmock("yaml");
+
+const FRAME_BUDGET_MS = 16;
+const DENSITY = (process.env.PP_BENCH_DENSITY ?? "default") as "compact" | "default" | "expanded";
+/** Board frames between two card moves (0 = never edit). */
+const EDIT_EVERY = Math.max(Number(process.env.PP_BENCH_EDIT_EVERY ?? "30") || 0, 0);
+/** Runs per `getColumns` rung; the median is reported. */
+const REPEAT = benchRepeat(3);
+
+/** Share of the Board columns per `getColumns` rung. */
+const COLUMN_LADDER = [0.125, 0.25, 0.5, 1];
+/** Rough text metrics for wrapped-height estimates. */
+const CHAR_PX = 7;
+const LINE_PX = 20;
+const CELL_PADDING_PX = 16;
+const TITLE_WIDTH_PX = 360;
+const CELL_WIDTH_PX = 180;
+/** Height of a Board card with title, tags and a few properties. */
+const CARD_HEIGHT_PX = 96;
+
+interface ScrollTrace {
+  name: string;
+  axis: "x" | "y";
+  frames: number[];
+}
+
+/** The parts of a `--view-workload` file (<vault>.views.json) used here. */
+interface ViewWorkload {
+  records: number;
+  groupBy: string;
+  rowHeight: number;
+  columnWidth: number;
+  viewport: { width: number; height: number };
+  columns: Array<{ id: string; share: number }>;
+  traces: ScrollTrace[];
+}
+
+interface FrameTimes {
+  frames: number;
+  p50Ms: number;
+  p95Ms: number;
+  p99Ms: number;
+  maxMs: number;
+  overBudget: number;
+}
+
+const STAGES = ["Intake", "Triage", "Discovery", "Design", "Review", "Build", "Code Review", "QA"];
+const WORDS = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor".split(" ");
+
+const field = (name: string, type: DataFieldType, repeated = false): DataField => ({
+  name,
+  type,
+  identifier: false,
+  derived: false,
+  repeated,
+  typeConfig: {},
+});
+
+/** mulberry32: a small seeded PRNG so the synthetic cards are stable. */
+function prng(seed: number): () => number {
+  let state = seed >>> 0;
+  return () => {
+    state = (state + 0x6d2b79f5) >>> 0;
+    let t = state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+function words(random: () => number, count: number): string {
+  return Array.from({ length: count }, () => WORDS[Math.floor(random() * WORDS.length)]).join(" ");
+}
+
+/** Offsets per frame as `scroll_trace()` in generate-test-files.py draws them. */
+function syntheticTrace(kind: "wheel" | "fling" | "drag", limit: number, frames: number, random: () => number): number[] {
+  let position = 0;
+  let velocity = 0;
+  let target = 0;
+  let scrolling = false;
+  let burst = 0;
+  const trace: number[] = [];
+  for (let f = 0; f < frames; f++) {
+    if (kind === "wheel") {
+      if (burst === 0) {
+        scrolling = !scrolling;
+        burst = scrolling ? 20 + Math.floor(random() * 41) : 5 + Math.floor(random() * 16);
+        velocity = scrolling ? (random() < 0.75 ? 100 : -100) : 0;
+      }
+      burst--;
+      position += velocity;
+    } else if (kind === "fling") {
+      if (Math.abs(velocity) < 50 / 60) velocity = ((4000 + random() * 8000) / 60) * (random() < 0.8 ? 1 : -1);
+      position += velocity;
+      velocity *= 0.95;
+    } else {
+      if (Math.abs(target - position) < 1) {
+        target = random() * limit;
+        velocity = (target - position) / (3 + Math.floor(random() * 6));
+      }
+      position += Math.abs(target - position) > Math.abs(velocity) ? velocity : target - position;
+    }
+    if (position <= 0 || position >= limit) {
+      position = Math.min(Math.max(position, 0), limit);
+      if (kind === "fling") velocity = -velocity;
+    }
+    trace.push(Math.floor(position));
+  }
+  return trace;
+}
+
+/** Cards shaped like a `--view-workload` vault, with its workload file. */
+function synthetic(count: number): { frame: DataFrame; workload: ViewWorkload } {
+  const random = prng(42);
+  const columnCount = 300;
+  const columns = Array.from({ length: columnCount }, (_, i) => `${String(i + 1).padStart(3, "0")} ${STAGES[i % STAGES.length]}`);
+  const weights = columns.map((_, i) => 1 / ((i * 7919) % columnCount + 1));
+  const total = weights.reduce((a, b) => a + b, 0);
+  const cumulative: number[] = [];
+  let running = 0;
+  for (const weight of weights) cumulative.push((running += weight));
+  const pick = () => {
+    const target = random() * total;
+    const index = cumulative.findIndex((c) => c >= target);
+    return columns[index < 0 ? columnCount - 1 : index]!;
+  };
+
+  const records: DataRecord[] = [];
+  for (let i = 0; i < count; i++) {
+    const lines = Math.floor(-Math.log(1 - random()) * 3);
+    records.push({
+      id: `Card ${i}.md`,
+      values: {
+        title: words(random, 6 + Math.floor(random() * 20)),
+        status: pick(),
+        tags: Array.from({ length: Math.floor(random() * 16) }, (_, t) => `tag/${WORDS[(i + t) % WORDS.length]}-${t}`),
+        estimate: [1, 2, 3, 5, 8, 13][i % 6],
+        description: lines ? Array.from({ length: lines }, () => words(random, 8 + Math.floor(random() * 12))).join("\n") : undefined,
+      },
+    });
+  }
+  const viewport = { width: 1600, height: 900 };
+  const tableLimit = Math.max(count * 36 - viewport.height, 0);
+  const boardLimit = Math.max(columnCount * 270 - viewport.width, 0);
+  return {
+    frame: {
+      fields: [
+        field("title", DataFieldType.String),
+        field("status", DataFieldType.String),
+        field("tags", DataFieldType.List, true),
+        field("estimate", DataFieldType.Number),
+        field("description", DataFieldType.String),
+      ],
+      records,
+    },
+    workload: {
+      records: count,
+      groupBy: "status",
+      rowHeight: 36,
+      columnWidth: 270,
+      viewport,
+      columns: columns.map((id, i) => ({ id, share: weights[i]! / total })),
+      traces: [
+        ...(["wheel", "fling", "drag"] as const).map((kind) => ({
+          name: `table-${kind}`,
+          axis: "y" as const,
+          frames: syntheticTrace(kind, tableLimit, 600, random),
+        })),
+        { name: "board-pan", axis: "x", frames: syntheticTrace("fling", boardLimit, 600, random) },
+      ],
+    },
+  };
+}
+
+function frameTimes(times: number[]): FrameTimes {
+  return {
+    frames: times.length,
+    p50Ms: round(percentile(times, 0.5), 3),
+    p95Ms: round(percentile(times, 0.95), 3),
+    p99Ms: round(percentile(times, 0.99), 3),
+    maxMs: round(Math.max(0, ...times), 3),
+    overBudget: times.filter((t) => t > FRAME_BUDGET_MS).length,
+  };
+}
+
+function cellText(value: Optional<DataValue>): string {
+  if (value === null || value === undefined) return "";
+  if (Array.isArray(value)) return value.map(cellText).join(", ");
+  if (value instanceof Date) return value.toISOString().slice(0, 10);
+  return String(value);
+}
+
+/** Lines `text` wraps to in a cell `width` pixels wide. */
+function wrappedLines(text: string, width: number): number {
+  const perLine = Math.max(1, Math.floor((width - CELL_PADDING_PX) / CHAR_PX));
+  let lines = 0;
+  for (const line of text.split("\n")) lines += Math.max(1, Math.ceil(line.length / perLine));
+  return lines;
+}
+
+/** Pixel height a row needs to show every cell without clipping. */
+function contentHeight(record: DataRecord, fields: DataField[]): number {
+  let lines = 1;
+  for (const f of fields) {
+    lines = Math.max(lines, wrappedLines(cellText(record.values[f.name]), f.name === "title" ? TITLE_WIDTH_PX : CELL_WIDTH_PX));
+  }
+  return lines * LINE_PX + CELL_PADDING_PX;
+}
+
+/** The Board after a card moves to another column, like a drag and drop. */
+function moveCard(records: DataRecord[], groupBy: string, columns: string[], edit: number): DataRecord[] {
+  if (records.length === 0 || columns.length === 0) return records;
+  const index = (edit * 7919) % records.length;
+  const moved = [...records];
+  const record = moved[index]!;
+  moved[index] = { ...record, values: { ...record.values, [groupBy]: columns[(edit * 31) % columns.length] } };
+  return moved;
+}
+
+describe("performance: table and board frame budget", () => {
+  it(
+    "replays scroll traces through computeVirtualScroll and the Board grouping",
+    async () => {
+      let frame: DataFrame;
+      let workload: ViewWorkload;
+      if (BENCH_VAULT && BENCH_CORPUS) {
+        frame = await loadVaultFrame(BENCH_VAULT);
+        workload = JSON.parse(fs.readFileSync(BENCH_CORPUS, "utf8")) as ViewWorkload;
+      } else {
+        ({ frame, workload } = synthetic(Math.round(2000 * BENCH_SCALE)));
+      }
+      const records = frame.records;
+      const rowHeight = getRowHeight(DENSITY);
+      const containerHeight = workload.viewport.height;
+      const fields = frame.fields;
+
+      // Table: every vertical trace, rescaled from the default row height
+      const table = [];
+      for (const trace of workload.traces.filter((t) => t.axis === "y")) {
+        collectGarbage();
+        const scale = rowHeight / workload.rowHeight;
+        const times: number[] = [];
+        let visible = 0;
+        let clipped = 0;
+        for (const offset of trace.frames) {
+          const start = performance.now();
+          const state = computeVirtualScroll(offset * scale, { itemCount: records.length, rowHeight, containerHeight });
+          for (const record of records.slice(state.startIndex, state.endIndex)) {
+            if (contentHeight(record, fields) > rowHeight) clipped++;
+          }
+          times.push(performance.now() - start);
+          visible += state.visibleCount;
+          expect(state.visibleCount).toBeLessThanOrEqual(Math.ceil(containerHeight / rowHeight) + 11);
+        }
+        table.push({
+          name: trace.name,
+          ...frameTimes(times),
+          meanVisibleRows: Math.round(visible / Math.max(trace.frames.length, 1)),
+          clippedShare: visible ? round(clipped / visible, 3) : 0,
+        });
+      }
+      let contentHeightPx = 0;
+      for (const record of records) contentHeightPx += contentHeight(record, fields);
+
+      // Board: getColumns with the same cards over a growing number of columns
+      const groupField = frame.fields.find((f) => f.name === workload.groupBy) ?? field(workload.groupBy, DataFieldType.String);
+      const columnIds = workload.columns.map((c) => c.id);
+      const columnIndex = new Map(columnIds.map((id, i) => [id, i]));
+      const ladder = [];
+      let previous: { columns: number; ms: number } | undefined;
+      for (const share of COLUMN_LADDER) {
+        const width = Math.max(1, Math.round(columnIds.length * share));
+        const spread = records.map((r) => {
+          const index = columnIndex.get(String(r.values[workload.groupBy]));
+          return index === undefined ? r : { ...r, values: { ...r.values, [workload.groupBy]: columnIds[index % width] } };
+        });
+        const runs: number[] = [];
+        let columns = 0;
+        for (let run = 0; run < REPEAT; run++) {
+          collectGarbage();
+          const start = performance.now();
+          columns = getColumns(spread, {}, groupField, undefined, true).length;
+          runs.push(performance.now() - start);
+        }
+        const ms = median(runs);
+        ladder.push({
+          columns,
+          ms: round(ms, 3),
+          growth: previous ? growth(previous.ms, ms, columns / previous.columns) : null,
+        });
+        previous = { columns, ms };
+      }
+
+      // Board pan: visible columns, each windowed, regrouped after every card move
+      collectGarbage();
+      const grouped = getColumns(records, {}, groupField, undefined, true);
+      let current = records;
+      let columns = grouped;
+      const pan = workload.traces.find((t) => t.axis === "x");
+      const panTimes: number[] = [];
+      let edits = 0;
+      let windowedCards = 0;
+      (pan?.frames ?? []).forEach((offset, f) => {
+        const start = performance.now();
+        if (EDIT_EVERY && f > 0 && f % EDIT_EVERY === 0) {
+          current = moveCard(current, workload.groupBy, columnIds, ++edits);
+          columns = getColumns(current, {}, groupField, undefined, true);
+        }
+        const first = Math.floor(offset / workload.columnWidth);
+        const last = Math.min(columns.length, Math.ceil((offset + workload.viewport.width) / workload.columnWidth));
+        for (const column of columns.slice(first, last)) {
+          windowedCards += computeVirtualScroll(0, {
+            itemCount: column.records.length,
+            rowHeight: CARD_HEIGHT_PX,
+            containerHeight,
+          }).visibleCount;
+        }
+        panTimes.push(performance.now() - start);
+      });
+
+      writeResults("views", {
+        source: BENCH_VAULT || "synthetic",
+        records: records.length,
+        fields: fields.length,
+        density: DENSITY,
+        rowHeight,
+        budgetMs: FRAME_BUDGET_MS,
+        table: {
+          traces: table,
+          fixedHeightPx: records.length * rowHeight,
+          contentHeightPx,
+        },
+        board: {
+          columns: grouped.length,
+          largestColumn: Math.max(0, ...grouped.map((c) => c.records.length)),
+          getColumns: ladder,
+          pan: {
+            ...frameTimes(panTimes),
+            edits,
+            // Board renders every card; windowing would keep these alive
+            meanWindowedCards: Math.round(windowedCards / Math.max(panTimes.length, 1)),
+            renderedCards: records.length,
+          },
+        },
+      });
+
+      expect(table.length).toBeGreaterThan(0);
+      expect(columns.reduce((sum, c) => sum + c.records.length, 0)).toBe(records.length);
+      expect(ladder[ladder.length - 1]!.columns).toBe(grouped.length);
+    },
+    BENCH_TIMEOUT
+  );
+});
@@ -54,7 +54,10 @@ export {
   invalidateAll,
   invalidateTransformCache,
   getTransformCacheSize,
+  getTransformCacheStats,
+  resetTransformCacheStats,
 } from "./transformCache";
+export type { TransformCacheStats } from "./transformCache";
 export { executeTransform, evaluateExpression } from "./transformExecutor";
 export type {
   TransformPipeline,
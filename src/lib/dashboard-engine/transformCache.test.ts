@@ -6,6 +6,8 @@ import {
   invalidateAll,
   invalidatePipelineCache,
   getTransformCacheSize,
+  getTransformCacheStats,
+  resetTransformCacheStats,
 } from "./transformCache";
 import type { DataFrame } from "src/lib/dataframe/dataframe";
 import { DataFieldType } from "src/lib/dataframe/dataframe";
@@ -171,4 +173,28 @@ describe("transformCache", () => {
     invalidateAll();
     expect(getTransformCacheSize()).toBe(0);
   });
+
+  test("stats count hits and misses", () => {
+    resetTransformCacheStats();
+    const frame = makeFrame();
+    executeTransformCached(frame, simplePipeline);
+    executeTransformCached(frame, simplePipeline);
+    executeTransformCached(frame, simplePipeline);
+
+    expect(getTransformCacheStats()).toEqual({ hits: 2, misses: 1, expired: 0, evictions: 0, size: 1 });
+  });
+
+  test("stats count evictions and survive invalidation", () => {
+    resetTransformCacheStats();
+    for (let n = 1; n <= 21; n++) executeTransformCached(makeFrame(n), simplePipeline);
+    expect(getTransformCacheStats().evictions).toBe(1);
+
+    invalidateAll();
+    const stats = getTransformCacheStats();
+    expect(stats.misses).toBe(21);
+    expect(stats.size).toBe(0);
+
+    resetTransformCacheStats();
+    expect(getTransformCacheStats()).toEqual({ hits: 0, misses: 0, expired: 0, evictions: 0, size: 0 });
+  });
 });
@@ -37,6 +37,18 @@ const MAX_CACHE_ENTRIES = 20;
 
 const cache = new Map<string, CacheEntry>();
 
+/** Lookup counters since the last `resetTransformCacheStats()` (for diagnostics). */
+export interface TransformCacheStats {
+  readonly hits: number;
+  /** Misses, including entries found but past their TTL. */
+  readonly misses: number;
+  readonly expired: number;
+  readonly evictions: number;
+  readonly size: number;
+}
+
+const stats = { hits: 0, misses: 0, expired: 0, evictions: 0 };
+
 /**
  * Execute a transform pipeline with caching.
  * Returns cached result if source data and pipeline haven't changed.
@@ -55,8 +67,11 @@ export function executeTransformCached(
 
   const existing = cache.get(key);
   if (existing && (now - existing.timestamp) < CACHE_TTL_MS) {
+    stats.hits++;
     return existing.result;
   }
+  stats.misses++;
+  if (existing) stats.expired++;
 
   const result = executeTransform(source, pipeline, context);
 
@@ -106,6 +121,24 @@ export function getTransformCacheSize(): number {
   return cache.size;
 }
 
+/**
+ * Get hit/miss/eviction counters and the current size (for diagnostics).
+ * Invalidation empties the cache but does not reset the counters.
+ */
+export function getTransformCacheStats(): TransformCacheStats {
+  return { ...stats, size: cache.size };
+}
+
+/**
+ * Reset the counters returned by `getTransformCacheStats()`.
+ */
+export function resetTransformCacheStats(): void {
+  stats.hits = 0;
+  stats.misses = 0;
+  stats.expired = 0;
+  stats.evictions = 0;
+}
+
 // ── Internal ─────────────────────────────────────────────────
 
 function computeCacheKey(
@@ -200,5 +233,6 @@ function evictOldest(): void {
 
   if (oldestKey) {
     cache.delete(oldestKey);
+    stats.evictions++;
   }
 }
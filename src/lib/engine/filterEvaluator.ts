@@ -216,13 +216,18 @@ export function evaluateFilter(
   return matchesFilterConditions(filter, record, baseDateCtx, opts);
 }
 
+/**
+ * Keep the records of `frame` that match `filter`. Relative-date operators
+ * resolve against `baseDateCtx` (default: now).
+ */
 export function applyFilter(
   frame: DataFrame,
-  filter: FilterDefinition
+  filter: FilterDefinition,
+  baseDateCtx?: Dayjs
 ): DataFrame {
   return produce(frame, (draft) => {
     draft.records = draft.records.filter((record) =>
-      matchesFilterConditions(filter, record)
+      matchesFilterConditions(filter, record, baseDateCtx)
     );
   });
 }